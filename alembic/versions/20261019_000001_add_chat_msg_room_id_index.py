@@ -0,0 +1,28 @@
+"""Add (room_id, id) index on chat_msg for cursor pagination
+
+Revision ID: 20261019_000001
+Revises: 20241227_000001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_000001'
+down_revision: Union[str, None] = '20241227_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (room_id, id) 가 room_id 단독 인덱스를 대체 (FK 인덱스 역할도 겸함)
+    op.create_index('idx_room_msg_id', 'chat_msg', ['room_id', 'id'])
+    op.drop_index('idx_room_id', table_name='chat_msg')
+
+
+def downgrade() -> None:
+    op.create_index('idx_room_id', 'chat_msg', ['room_id'])
+    op.drop_index('idx_room_msg_id', table_name='chat_msg')
@@ -0,0 +1,56 @@
+"""Add denormalized activity columns to chat_room
+
+Revision ID: 20261019_000002
+Revises: 20261019_000001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_000002'
+down_revision: Union[str, None] = '20261019_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('chat_room', sa.Column('last_message_id', sa.Integer(), nullable=True))
+    op.add_column('chat_room', sa.Column('last_message_at', sa.DateTime(), nullable=True))
+    op.add_column('chat_room', sa.Column('message_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('chat_room', sa.Column('preview_enc', sa.LargeBinary(), nullable=True))
+    op.add_column('chat_room', sa.Column('preview_iv', sa.LargeBinary(), nullable=True))
+
+    # 기존 방 백필: 마지막 메시지/개수, 미리보기는 마지막 메시지 암호문을 그대로 사용 (조회 시 잘라서 노출)
+    op.execute(
+        """
+        UPDATE chat_room r
+        LEFT JOIN (
+            SELECT room_id, MAX(id) AS last_id, COUNT(*) AS cnt
+            FROM chat_msg
+            GROUP BY room_id
+        ) m ON m.room_id = r.room_id
+        LEFT JOIN chat_msg lm ON lm.id = m.last_id
+        SET r.last_message_id = m.last_id,
+            r.message_count = COALESCE(m.cnt, 0),
+            r.last_message_at = COALESCE(lm.created_at, r.created_at),
+            r.updated_at = COALESCE(lm.created_at, r.updated_at),
+            r.preview_enc = lm.content_enc,
+            r.preview_iv = lm.iv
+        """
+    )
+
+    op.create_index('idx_account_last_message', 'chat_room', ['account_id', 'last_message_at', 'room_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_account_last_message', table_name='chat_room')
+    op.drop_column('chat_room', 'preview_iv')
+    op.drop_column('chat_room', 'preview_enc')
+    op.drop_column('chat_room', 'message_count')
+    op.drop_column('chat_room', 'last_message_at')
+    op.drop_column('chat_room', 'last_message_id')
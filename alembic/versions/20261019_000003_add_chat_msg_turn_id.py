@@ -0,0 +1,29 @@
+"""Add write-behind turn_id to chat_msg
+
+Revision ID: 20261019_000003
+Revises: 20261019_000002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_000003'
+down_revision: Union[str, None] = '20261019_000002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # write-behind 로 저장된 턴의 유저 메시지에만 채워진다 (기존 행은 NULL)
+    op.add_column('chat_msg', sa.Column('turn_id', sa.String(32), nullable=True))
+    op.create_index('uq_chat_msg_turn_id', 'chat_msg', ['turn_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_chat_msg_turn_id', table_name='chat_msg')
+    op.drop_column('chat_msg', 'turn_id')
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.auth.adapter.input.web.dependencies import (
-    get_optional_jwt_payload,
-    get_optional_session,
+    get_jwt_service,
+    get_session_usecase,
+    resolve_account_id,
 )
-from app.auth.application.port.jwt_token_port import TokenPayload
+from app.auth.application.usecase.session_usecase import SessionUseCase
 from app.auth.domain.entity.session import Session
+from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
 from app.config.database.session import get_db_session
 
 from app.account.adapter.input.web.response.update_mbti_gender_response import UpdateMbtiGenderResponse
@@ -30,16 +32,16 @@ router = APIRouter(prefix="/account", tags=["account"])
 # =============================
 # 인증 관련
 # =============================
-def get_current_account_id(
-    jwt_payload: TokenPayload | None = Depends(get_optional_jwt_payload),
-    session: Session | None = Depends(get_optional_session),
+async def get_current_account_id(
+    request: Request,
+    jwt_service: JWTTokenService = Depends(get_jwt_service),
+    session_usecase: SessionUseCase = Depends(get_session_usecase),
 ) -> int:
-
-    if jwt_payload:
-        return jwt_payload.account_id
-    if session:
-        return session.account_id
-    raise HTTPException(status_code=401, detail="Not authenticated")
+    # JWT 가 있으면 JWT 로만 판단하고, 세션은 JWT 가 없을 때만 조회 (요청당 한 번)
+    account_id = await resolve_account_id(request, jwt_service, session_usecase)
+    if account_id is None:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return account_id
 
 
 # =============================
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 from app.account.domain.entity.account import Account
+from app.account.domain.entity.account_profile import AccountProfile
 
 
 class AccountRepositoryPort(ABC):
@@ -26,6 +27,18 @@ class AccountRepositoryPort(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_profile(self, account_id: int) -> Optional[AccountProfile]:
+        """Find the profile fields of an account (may be served from cache).
+
+        Args:
+            account_id: The account's unique identifier.
+
+        Returns:
+            The AccountProfile if found, None otherwise.
+        """
+        pass
+
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[Account]:
         """Find an account by email address.
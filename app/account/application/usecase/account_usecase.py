@@ -112,6 +112,9 @@ class AccountUseCase:
     def update_my_mbti_gender(self, account_id: int, gender: Optional[Gender] = None, mbti: Optional[Mbti] = None,) -> Account:
         """Update the authenticated user's MBTI and/or gender.
 
+        The repository save also invalidates the cached profile on every
+        worker, so the next chat turn sees the new values.
+
         Args:
             account_id: The account's unique identifier.
             gender: New gender (optional).
@@ -6,10 +6,12 @@ from app.account.domain.entity.account_enums import (
     AccountRole,
     AccountStatus,
 )
+from app.account.domain.entity.account_profile import AccountProfile
 
 __all__ = [
     "Account",
     "AccountPlan",
+    "AccountProfile",
     "AccountRole",
     "AccountStatus",
 ]
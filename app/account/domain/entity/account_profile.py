@@ -0,0 +1,55 @@
+"""Account profile - Read model for per-request account checks."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from app.account.domain.entity.account_enums import (
+    AccountPlan,
+    AccountRole,
+    AccountStatus, Gender, Mbti,
+)
+
+
+@dataclass(frozen=True)
+class AccountProfile:
+    """The account fields read on hot paths (admin checks, chat prompts).
+
+    Immutable so one cached instance can be shared across requests.
+    """
+
+    account_id: int
+    role: AccountRole = AccountRole.USER
+    plan: AccountPlan = AccountPlan.FREE
+    mbti: Optional[Mbti] = None
+    gender: Optional[Gender] = None
+    status: AccountStatus = AccountStatus.ACTIVE
+
+    def is_active(self) -> bool:
+        """Check if the account is active."""
+        return self.status == AccountStatus.ACTIVE
+
+    def is_admin(self) -> bool:
+        """Check if the user has admin role."""
+        return self.role == AccountRole.ADMIN
+
+    def to_dict(self) -> dict:
+        """Serialize to a compact dict (enum values only)."""
+        return {
+            "r": self.role.value,
+            "p": self.plan.value,
+            "m": self.mbti.value if self.mbti else None,
+            "g": self.gender.value if self.gender else None,
+            "s": self.status.value,
+        }
+
+    @classmethod
+    def from_dict(cls, account_id: int, data: dict) -> "AccountProfile":
+        """Deserialize from to_dict() output."""
+        return cls(
+            account_id=account_id,
+            role=AccountRole(data["r"]),
+            plan=AccountPlan(data["p"]),
+            mbti=Mbti(data["m"]) if data.get("m") else None,
+            gender=Gender(data["g"]) if data.get("g") else None,
+            status=AccountStatus(data["s"]),
+        )
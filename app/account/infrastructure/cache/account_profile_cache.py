@@ -0,0 +1,230 @@
+"""Two-tier read-through cache of account profiles."""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import redis
+
+from app.account.domain.entity.account_profile import AccountProfile
+from app.config.redis_config import get_redis
+from app.config.redis_pubsub import RedisSubscriber
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AccountProfileCache:
+    """Account profiles cached in-process and in Redis.
+
+    Lookups try the worker's LRU first, then Redis, then the loader
+    (a DB query), filling both tiers on the way back:
+    - invalidate() replaces the Redis entry with a short-lived tombstone
+      and publishes the account ID; every worker drops its local copy
+      when the event arrives.
+    - Redis is filled with SET NX and never while a tombstone exists, so
+      a reader that loaded the row before another worker's commit cannot
+      write the old role/status/plan back after the invalidation.
+    - The local tier is only used while the pub/sub subscription is up.
+      It is cleared on (re)subscribe and on disconnect, because
+      invalidations may have been missed in between.
+    - A load that overlaps an invalidation is returned but not kept
+      locally.
+    Redis errors fall back to the loader, so the DB stays the source of
+    truth.
+
+    Callers are sync (repository, threadpool dependencies), so this uses
+    the sync Redis client; the pub/sub handler runs on the subscriber
+    thread.
+    """
+
+    CHANNEL = "account:profile:events"
+    KEY_PREFIX = "account:profile:"
+    TOMBSTONE = "-"
+
+    def __init__(
+        self,
+        redis_factory=get_redis,
+        ttl_seconds: Optional[int] = None,
+        local_ttl_seconds: Optional[float] = None,
+        local_max_entries: Optional[int] = None,
+        tombstone_seconds: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            redis_factory: Returns the sync Redis client (resolved per call).
+            ttl_seconds: Lifetime of Redis entries.
+            local_ttl_seconds: Lifetime of in-process entries.
+            local_max_entries: Size of the in-process LRU.
+            tombstone_seconds: How long an invalidation blocks Redis
+                fills. Must exceed the slowest profile load.
+            enabled: Defaults to ACCOUNT_PROFILE_CACHE_ENABLED. When off,
+                get() always calls the loader.
+        """
+        self._redis_factory = redis_factory
+        self._ttl = ttl_seconds or settings.ACCOUNT_PROFILE_CACHE_TTL_SECONDS
+        self._local_ttl = local_ttl_seconds or settings.ACCOUNT_PROFILE_LOCAL_TTL_SECONDS
+        self._local_max = local_max_entries or settings.ACCOUNT_PROFILE_LOCAL_MAX_ENTRIES
+        self._tombstone_ms = int(
+            (tombstone_seconds or settings.ACCOUNT_PROFILE_CACHE_TOMBSTONE_SECONDS) * 1000
+        )
+        self.enabled = settings.ACCOUNT_PROFILE_CACHE_ENABLED if enabled is None else enabled
+        self._local: "OrderedDict[int, tuple[float, AccountProfile]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped on every invalidation seen by this worker
+        self._subscribed = False
+        self.stats = {"local_hits": 0, "redis_hits": 0, "loads": 0, "invalidations": 0, "redis_errors": 0}
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._redis_factory()
+
+    def attach(self, subscriber: RedisSubscriber) -> None:
+        """Register with the worker's pub/sub subscriber (before it starts)."""
+        subscriber.subscribe(
+            self.CHANNEL,
+            self._on_event,
+            on_connect=self._on_connect,
+            on_disconnect=self._on_disconnect,
+        )
+
+    def get(
+        self,
+        account_id: int,
+        loader: Callable[[int], Optional[AccountProfile]],
+    ) -> Optional[AccountProfile]:
+        """Cached profile, loading it with ``loader`` on a miss.
+
+        Missing accounts (loader returns None) are not cached.
+        """
+        if not self.enabled:
+            return loader(account_id)
+
+        if self._subscribed:
+            profile = self._get_local(account_id)
+            if profile is not None:
+                self.stats["local_hits"] += 1
+                return profile
+
+        generation = self._generation
+        profile, tombstoned = self._get_redis(account_id)
+        if profile is not None:
+            self.stats["redis_hits"] += 1
+        else:
+            profile = loader(account_id)
+            self.stats["loads"] += 1
+            if profile is None:
+                return None
+            if not tombstoned:
+                self._set_redis(profile)
+
+        if self._subscribed and generation == self._generation:
+            self._set_local(profile)
+        return profile
+
+    def invalidate(self, account_id: int) -> None:
+        """Drop the profile everywhere (call after the DB commit)."""
+        self._drop_local(account_id)
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.set(f"{self.KEY_PREFIX}{account_id}", self.TOMBSTONE, px=self._tombstone_ms)
+            pipe.publish(self.CHANNEL, str(account_id))
+            pipe.execute()
+        except (redis.RedisError, OSError) as e:
+            self.stats["redis_errors"] += 1
+            logger.warning("account profile invalidation failed for %s: %r", account_id, e)
+
+    # ------------------------------------------------------------------
+    # In-process tier
+    # ------------------------------------------------------------------
+    def _get_local(self, account_id: int) -> Optional[AccountProfile]:
+        with self._lock:
+            entry = self._local.get(account_id)
+            if entry is None:
+                return None
+            expires_at, profile = entry
+            if expires_at <= time.monotonic():
+                del self._local[account_id]
+                return None
+            self._local.move_to_end(account_id)
+            return profile
+
+    def _set_local(self, profile: AccountProfile) -> None:
+        with self._lock:
+            self._local[profile.account_id] = (time.monotonic() + self._local_ttl, profile)
+            self._local.move_to_end(profile.account_id)
+            while len(self._local) > self._local_max:
+                self._local.popitem(last=False)
+
+    def _drop_local(self, account_id: int) -> None:
+        with self._lock:
+            self._generation += 1
+            self._local.pop(account_id, None)
+
+    def _clear_local(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._local.clear()
+
+    # ------------------------------------------------------------------
+    # Redis tier
+    # ------------------------------------------------------------------
+    def _get_redis(self, account_id: int) -> tuple[Optional[AccountProfile], bool]:
+        """(cached profile, whether a tombstone blocks filling)."""
+        try:
+            data = self.client.get(f"{self.KEY_PREFIX}{account_id}")
+        except (redis.RedisError, OSError) as e:
+            self.stats["redis_errors"] += 1
+            logger.warning("account profile cache read failed for %s: %r", account_id, e)
+            return None, True
+        if not data:
+            return None, False
+        if data == self.TOMBSTONE:
+            return None, True
+        try:
+            return AccountProfile.from_dict(account_id, json.loads(data)), False
+        except (ValueError, KeyError, TypeError):
+            logger.warning("ignoring malformed account profile cache entry for %s", account_id)
+            return None, True
+
+    def _set_redis(self, profile: AccountProfile) -> None:
+        # NX: never overwrite a tombstone or a value filled by a newer load
+        try:
+            self.client.set(
+                f"{self.KEY_PREFIX}{profile.account_id}",
+                json.dumps(profile.to_dict(), separators=(",", ":")),
+                ex=self._ttl,
+                nx=True,
+            )
+        except (redis.RedisError, OSError) as e:
+            self.stats["redis_errors"] += 1
+            logger.warning("account profile cache write failed for %s: %r", profile.account_id, e)
+
+    # ------------------------------------------------------------------
+    # Synchronization (subscriber thread)
+    # ------------------------------------------------------------------
+    def _on_event(self, data: str) -> None:
+        try:
+            account_id = int(data)
+        except (TypeError, ValueError):
+            logger.warning("ignoring malformed account profile event: %r", data)
+            return
+        self._drop_local(account_id)
+        self.stats["invalidations"] += 1
+
+    def _on_connect(self) -> None:
+        self._clear_local()
+        self._subscribed = True
+
+    def _on_disconnect(self) -> None:
+        self._subscribed = False
+        self._clear_local()
+
+
+# Worker-level singleton (attached to redis_subscriber in the app lifespan)
+account_profile_cache = AccountProfileCache()
@@ -6,12 +6,17 @@ from sqlalchemy.orm import Session as DBSession
 from app.config.database.session import get_db_session
 
 from app.account.domain.entity.account import Account
+from app.account.domain.entity.account_profile import AccountProfile
 from app.account.domain.entity.account_enums import (
     AccountPlan,
     AccountRole,
     AccountStatus, Gender, Mbti,
 )
 from app.account.application.port.account_repository_port import AccountRepositoryPort
+from app.account.infrastructure.cache.account_profile_cache import (
+    AccountProfileCache,
+    account_profile_cache,
+)
 from app.account.infrastructure.orm.account_model import AccountModel
 
 
@@ -21,13 +26,20 @@ class AccountRepositoryImpl(AccountRepositoryPort):
     This adapter implements the application port using SQLAlchemy for persistence.
     """
 
-    def __init__(self, db_session: Optional[DBSession] = None):
+    def __init__(
+        self,
+        db_session: Optional[DBSession] = None,
+        profile_cache: Optional[AccountProfileCache] = None,
+    ):
         """Initialize with a database session.
 
         Args:
             db_session: SQLAlchemy database session.
+            profile_cache: Cache for find_profile(). Uses the worker-wide
+                cache if not provided.
         """
         self._session: DBSession = db_session or get_db_session()
+        self._profile_cache = profile_cache or account_profile_cache
 
     def find_by_id(self, account_id: int) -> Optional[Account]:
         """Find an account by its ID."""
@@ -38,6 +50,34 @@ class AccountRepositoryImpl(AccountRepositoryPort):
         )
         return self._to_entity(model) if model else None
 
+    def find_profile(self, account_id: int) -> Optional[AccountProfile]:
+        """Find the profile fields of an account (read-through cache)."""
+        return self._profile_cache.get(account_id, self._load_profile)
+
+    def _load_profile(self, account_id: int) -> Optional[AccountProfile]:
+        """Load only the profile columns."""
+        row = (
+            self._session.query(
+                AccountModel.role,
+                AccountModel.plan,
+                AccountModel.mbti,
+                AccountModel.gender,
+                AccountModel.status,
+            )
+            .filter(AccountModel.id == account_id)
+            .first()
+        )
+        if row is None:
+            return None
+        return AccountProfile(
+            account_id=account_id,
+            role=AccountRole.from_string(row.role) if row.role else AccountRole.USER,
+            plan=AccountPlan.from_string(row.plan) if row.plan else AccountPlan.FREE,
+            mbti=Mbti.from_string(row.mbti) if row.mbti else None,
+            gender=Gender.from_string(row.gender) if row.gender else None,
+            status=AccountStatus.from_string(row.status) if row.status else AccountStatus.ACTIVE,
+        )
+
 
     def find_by_email(self, email: str) -> Optional[Account]:
         """Find an account by email address."""
@@ -83,6 +123,8 @@ class AccountRepositoryImpl(AccountRepositoryPort):
                 model.gender = account.gender.value if account.gender else None
 
                 self._session.commit()
+                # Profile fields may have changed: drop cached copies on every worker
+                self._profile_cache.invalidate(account.id)
                 self._session.refresh(model)
                 return self._to_entity(model)
             else:
@@ -1,5 +1,14 @@
-"""Auth API dependencies - FastAPI dependency injection."""
+"""Auth API dependencies - FastAPI dependency injection.
 
+Stateless auth services are created once per worker at import time.
+Their providers are ``async def`` so FastAPI returns them without a
+threadpool hop. The decoded JWT is cached on ``request.state`` so one
+request validates its token only once, however many dependencies ask.
+Session and blacklist lookups use the async Redis client, so the auth
+dependencies run on the event loop as well.
+"""
+
+import secrets
 from typing import Generator, Optional
 
 from fastapi import Depends, HTTPException, Request, status
@@ -7,15 +16,18 @@ from sqlalchemy.orm import Session as DBSession
 
 from app.account.application.usecase.account_usecase import AccountUseCase
 from app.auth.application.port.jwt_token_port import TokenPayload
+from app.auth.application.port.token_blacklist_port import TokenBlacklistPort
 from app.auth.application.usecase.csrf_usecase import CSRFUseCase
 from app.auth.application.usecase.auth_usecase import AuthUseCase
 from app.auth.application.usecase.session_usecase import SessionUseCase
 from app.auth.domain.entity.session import Session
+from app.auth.infrastructure.cache.cached_token_blacklist import token_blacklist_cache
 from app.auth.infrastructure.cache.session_repository_impl import SessionRepositoryImpl
 from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
 from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
 from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
 from app.config.database.session import SessionLocal
+from app.config.settings import settings
 
 
 def get_db() -> Generator[DBSession, None, None]:
@@ -27,9 +39,26 @@ def get_db() -> Generator[DBSession, None, None]:
         db.close()
 
 
-def get_session_repository() -> SessionRepositoryImpl:
+def _build_token_blacklist() -> TokenBlacklistPort:
+    """Worker's in-memory copy when AUTH_BLACKLIST_CACHE_ENABLED, Redis otherwise."""
+    if settings.AUTH_BLACKLIST_CACHE_ENABLED:
+        return token_blacklist_cache
+    return TokenBlacklistImpl()
+
+
+# Worker-level singletons (Redis clients are resolved per call)
+_session_repository = SessionRepositoryImpl()
+_session_usecase = SessionUseCase(_session_repository)
+_csrf_usecase = CSRFUseCase()
+_token_blacklist = _build_token_blacklist()
+_jwt_service = JWTTokenService(blacklist=_token_blacklist)
+
+_UNRESOLVED = object()
+
+
+async def get_session_repository() -> SessionRepositoryImpl:
     """Get session repository dependency."""
-    return SessionRepositoryImpl()
+    return _session_repository
 
 
 def get_account_repository(
@@ -39,16 +68,14 @@ def get_account_repository(
     return AccountRepositoryImpl(db)
 
 
-def get_csrf_usecase() -> CSRFUseCase:
+async def get_csrf_usecase() -> CSRFUseCase:
     """Get CSRF usecase dependency."""
-    return CSRFUseCase()
+    return _csrf_usecase
 
 
-def get_session_usecase(
-    session_repo: SessionRepositoryImpl = Depends(get_session_repository),
-) -> SessionUseCase:
+async def get_session_usecase() -> SessionUseCase:
     """Get session usecase dependency."""
-    return SessionUseCase(session_repo)
+    return _session_usecase
 
 
 def get_account_usecase(
@@ -58,16 +85,63 @@ def get_account_usecase(
     return AccountUseCase(account_repo)
 
 
-def get_token_blacklist() -> TokenBlacklistImpl:
+async def get_token_blacklist() -> TokenBlacklistPort:
     """Get token blacklist dependency."""
-    return TokenBlacklistImpl()
+    return _token_blacklist
 
 
-def get_jwt_service(
-    blacklist: TokenBlacklistImpl = Depends(get_token_blacklist),
-) -> JWTTokenService:
+async def get_jwt_service() -> JWTTokenService:
     """Get JWT token service dependency with blacklist support."""
-    return JWTTokenService(blacklist=blacklist)
+    return _jwt_service
+
+
+def extract_access_token(request: Request) -> Optional[str]:
+    """Access token from the cookie, or from a Bearer Authorization header."""
+    token = request.cookies.get("access_token")
+
+    if not token:
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            token = auth_header[7:]
+
+    return token or None
+
+
+async def resolve_jwt_payload(request: Request, jwt_service: JWTTokenService) -> Optional[TokenPayload]:
+    """Validate the request's JWT once and cache the result on request.state.
+
+    Returns:
+        TokenPayload if a valid token is present, None otherwise.
+    """
+    cached = getattr(request.state, "jwt_payload", _UNRESOLVED)
+    if cached is not _UNRESOLVED:
+        return cached
+
+    token = extract_access_token(request)
+    payload = await jwt_service.validate_token(token) if token else None
+    request.state.jwt_payload = payload
+    return payload
+
+
+async def resolve_account_id(
+    request: Request,
+    jwt_service: JWTTokenService,
+    session_usecase: SessionUseCase,
+) -> Optional[int]:
+    """Authenticated account ID in a single pass.
+
+    The JWT decides when one is present (valid or not). The legacy
+    session cookie is consulted only for requests without a JWT.
+    """
+    if extract_access_token(request):
+        payload = await resolve_jwt_payload(request, jwt_service)
+        return payload.account_id if payload else None
+
+    session_id = request.cookies.get("session_id")
+    if not session_id:
+        return None
+    session = await session_usecase.validate_session(session_id)
+    return session.account_id if session else None
 
 
 def get_auth_usecase(
@@ -80,7 +154,7 @@ def get_auth_usecase(
     return AuthUseCase(session_usecase, csrf_usecase, account_usecase, jwt_service)
 
 
-def get_current_session(
+async def get_current_session(
     request: Request,
     session_usecase: SessionUseCase = Depends(get_session_usecase),
 ) -> Session:
@@ -99,7 +173,7 @@ def get_current_session(
             detail="Not authenticated",
         )
 
-    session = session_usecase.validate_session(session_id)
+    session = await session_usecase.validate_session(session_id)
 
     if not session:
         raise HTTPException(
@@ -110,7 +184,7 @@ def get_current_session(
     return session
 
 
-def get_optional_session(
+async def get_optional_session(
     request: Request,
     session_usecase: SessionUseCase = Depends(get_session_usecase),
 ) -> Session | None:
@@ -123,10 +197,10 @@ def get_optional_session(
     if not session_id:
         return None
 
-    return session_usecase.validate_session(session_id)
+    return await session_usecase.validate_session(session_id)
 
 
-def get_current_jwt_payload(
+async def get_current_jwt_payload(
     request: Request,
     jwt_service: JWTTokenService = Depends(get_jwt_service),
 ) -> TokenPayload:
@@ -137,21 +211,13 @@ def get_current_jwt_payload(
     Raises:
         HTTPException: 401 if not authenticated or token invalid.
     """
-    # Try to get token from cookie first, then from Authorization header
-    token = request.cookies.get("access_token")
-
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-
-    if not token:
+    if not extract_access_token(request):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
         )
 
-    payload = jwt_service.validate_token(token)
+    payload = await resolve_jwt_payload(request, jwt_service)
 
     if not payload:
         raise HTTPException(
@@ -162,7 +228,7 @@ def get_current_jwt_payload(
     return payload
 
 
-def get_optional_jwt_payload(
+async def get_optional_jwt_payload(
     request: Request,
     jwt_service: JWTTokenService = Depends(get_jwt_service),
 ) -> Optional[TokenPayload]:
@@ -170,26 +236,16 @@ def get_optional_jwt_payload(
 
     Unlike get_current_jwt_payload, this doesn't raise an error if not authenticated.
     """
-    token = request.cookies.get("access_token")
-
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-
-    if not token:
-        return None
-
-    return jwt_service.validate_token(token)
+    return await resolve_jwt_payload(request, jwt_service)
 
 
 def verify_admin_role(
     jwt_payload: TokenPayload = Depends(get_current_jwt_payload),
     account_repo: AccountRepositoryImpl = Depends(get_account_repository),
 ) -> int:
-    account = account_repo.find_by_id(jwt_payload.account_id)
+    profile = account_repo.find_profile(jwt_payload.account_id)
 
-    if not account or not account.is_admin():
+    if not profile or not profile.is_admin():
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="관리자 권한이 필요합니다",
@@ -219,7 +275,7 @@ def verify_csrf(
     return True
 
 
-def verify_jwt_csrf(
+async def verify_jwt_csrf(
     request: Request,
     jwt_service: JWTTokenService = Depends(get_jwt_service),
 ) -> bool:
@@ -230,14 +286,7 @@ def verify_jwt_csrf(
     Raises:
         HTTPException: 403 if CSRF validation fails.
     """
-    # Get token
-    token = request.cookies.get("access_token")
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-
-    if not token:
+    if not extract_access_token(request):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="No access token provided",
@@ -252,8 +301,9 @@ def verify_jwt_csrf(
             detail="CSRF token not provided",
         )
 
-    # Validate CSRF token against JWT
-    if not jwt_service.validate_csrf(token, header_csrf):
+    # Validate CSRF token against the JWT already decoded for this request
+    payload = await resolve_jwt_payload(request, jwt_service)
+    if payload is None or not secrets.compare_digest(payload.csrf_token, header_csrf):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="CSRF token validation failed",
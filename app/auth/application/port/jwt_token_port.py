@@ -53,7 +53,7 @@ class JWTTokenPort(ABC):
         pass
 
     @abstractmethod
-    def validate_token(self, token: str) -> Optional[TokenPayload]:
+    async def validate_token(self, token: str) -> Optional[TokenPayload]:
         """Validate a JWT token and extract payload.
 
         Args:
@@ -65,7 +65,7 @@ class JWTTokenPort(ABC):
         pass
 
     @abstractmethod
-    def validate_csrf(self, token: str, csrf_token: str) -> bool:
+    async def validate_csrf(self, token: str, csrf_token: str) -> bool:
         """Validate that the CSRF token matches the one in the JWT.
 
         Args:
@@ -78,7 +78,7 @@ class JWTTokenPort(ABC):
         pass
 
     @abstractmethod
-    def refresh_token(self, token: str) -> Optional[TokenPair]:
+    async def refresh_token(self, token: str) -> Optional[TokenPair]:
         """Refresh an existing token if still valid.
 
         Args:
@@ -90,7 +90,7 @@ class JWTTokenPort(ABC):
         pass
 
     @abstractmethod
-    def blacklist_token(self, token: str) -> bool:
+    async def blacklist_token(self, token: str) -> bool:
         """Add a token to the blacklist to prevent reuse.
 
         Args:
@@ -68,3 +68,21 @@ class OAuthProviderPort(ABC):
             OAuthException: If fetching user info fails.
         """
         pass
+
+    @abstractmethod
+    async def authenticate(self, code: str) -> OAuthUserInfo:
+        """Complete the callback: exchange the code and identify the user.
+
+        Providers that return an OpenID Connect ID token may read the
+        user from its verified claims instead of the userinfo endpoint.
+
+        Args:
+            code: The authorization code from OAuth callback.
+
+        Returns:
+            User information from the OAuth provider.
+
+        Raises:
+            OAuthException: If token exchange or fetching user info fails.
+        """
+        pass
@@ -10,10 +10,11 @@ class SessionRepositoryPort(ABC):
     """Port (interface) for session repository.
 
     Sessions are stored server-side (e.g., in Redis) with TTL-based expiration.
+    All methods are awaited from request handlers.
     """
 
     @abstractmethod
-    def save(self, session: Session) -> None:
+    async def save(self, session: Session) -> None:
         """Save a session.
 
         Args:
@@ -22,7 +23,7 @@ class SessionRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def find_by_id(self, session_id: str) -> Optional[Session]:
+    async def find_by_id(self, session_id: str) -> Optional[Session]:
         """Find a session by its ID.
 
         Args:
@@ -34,7 +35,7 @@ class SessionRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def delete(self, session_id: str) -> None:
+    async def delete(self, session_id: str) -> None:
         """Delete a session.
 
         Args:
@@ -43,7 +44,7 @@ class SessionRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def extend_ttl(self, session_id: str, ttl_seconds: int) -> bool:
+    async def extend_ttl(self, session_id: str, ttl_seconds: int) -> bool:
         """Extend the TTL of a session.
 
         Args:
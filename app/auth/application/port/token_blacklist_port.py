@@ -8,10 +8,11 @@ class TokenBlacklistPort(ABC):
 
     Defines the interface for blacklisting and checking JWT tokens.
     Used to invalidate tokens before their natural expiration (e.g., on logout).
+    Methods are coroutines so implementations can use the async Redis client.
     """
 
     @abstractmethod
-    def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
+    async def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
         """Add a token ID to the blacklist.
 
         Args:
@@ -21,7 +22,7 @@ class TokenBlacklistPort(ABC):
         pass
 
     @abstractmethod
-    def is_blacklisted(self, jti: str) -> bool:
+    async def is_blacklisted(self, jti: str) -> bool:
         """Check if a token ID is blacklisted.
 
         Args:
@@ -33,7 +34,7 @@ class TokenBlacklistPort(ABC):
         pass
 
     @abstractmethod
-    def remove_from_blacklist(self, jti: str) -> None:
+    async def remove_from_blacklist(self, jti: str) -> None:
         """Remove a token ID from the blacklist.
 
         Args:
@@ -77,11 +77,8 @@ class AuthUseCase:
         """
         provider = OAuthProviderFactory.get_provider(provider_name)
 
-        # Exchange code for access token
-        access_token = await provider.exchange_code_for_token(code)
-
-        # Get user info from provider
-        user_info = await provider.get_user_info(access_token)
+        # Exchange code and get user info (from the ID token when verifiable)
+        user_info = await provider.authenticate(code)
 
         # Get or create account
         account = self._account_usecase.get_or_create_account(
@@ -93,7 +90,7 @@ class AuthUseCase:
         csrf_token = self._csrf_usecase.generate_token()
 
         # Create session with CSRF token
-        session = self._session_usecase.create_session(
+        session = await self._session_usecase.create_session(
             account_id=account.id,
             csrf_token=csrf_token,
         )
@@ -127,11 +124,8 @@ class AuthUseCase:
         sso_type = SSOLoginType.from_string(provider_name)
         provider = OAuthProviderFactory.get_provider(sso_type.value)
 
-        # Exchange code for access token
-        access_token = await provider.exchange_code_for_token(code)
-
-        # Get user info from provider
-        user_info = await provider.get_user_info(access_token)
+        # Exchange code and get user info (from the ID token when verifiable)
+        user_info = await provider.authenticate(code)
 
         # Get or create account
         account = self._account_usecase.get_or_create_account(
@@ -147,7 +141,7 @@ class AuthUseCase:
 
         return token_pair
 
-    def validate_jwt(self, token: str) -> Optional[TokenPayload]:
+    async def validate_jwt(self, token: str) -> Optional[TokenPayload]:
         """Validate a JWT token.
 
         Args:
@@ -158,9 +152,9 @@ class AuthUseCase:
         """
         if self._jwt_service is None:
             return None
-        return self._jwt_service.validate_token(token)
+        return await self._jwt_service.validate_token(token)
 
-    def validate_jwt_csrf(self, token: str, csrf_token: str) -> bool:
+    async def validate_jwt_csrf(self, token: str, csrf_token: str) -> bool:
         """Validate JWT CSRF token.
 
         Args:
@@ -172,9 +166,9 @@ class AuthUseCase:
         """
         if self._jwt_service is None:
             return False
-        return self._jwt_service.validate_csrf(token, csrf_token)
+        return await self._jwt_service.validate_csrf(token, csrf_token)
 
-    def refresh_jwt(self, token: str) -> Optional[TokenPair]:
+    async def refresh_jwt(self, token: str) -> Optional[TokenPair]:
         """Refresh a JWT token.
 
         Args:
@@ -185,17 +179,17 @@ class AuthUseCase:
         """
         if self._jwt_service is None:
             return None
-        return self._jwt_service.refresh_token(token)
+        return await self._jwt_service.refresh_token(token)
 
-    def logout(self, session_id: str) -> None:
+    async def logout(self, session_id: str) -> None:
         """Logout by destroying session.
 
         Args:
             session_id: The session ID to destroy.
         """
-        self._session_usecase.destroy_session(session_id)
+        await self._session_usecase.destroy_session(session_id)
 
-    def blacklist_jwt(self, token: str) -> bool:
+    async def blacklist_jwt(self, token: str) -> bool:
         """Blacklist a JWT token to prevent reuse.
 
         Args:
@@ -206,9 +200,9 @@ class AuthUseCase:
         """
         if self._jwt_service is None:
             return False
-        return self._jwt_service.blacklist_token(token)
+        return await self._jwt_service.blacklist_token(token)
 
-    def validate_session(self, session_id: str) -> Session | None:
+    async def validate_session(self, session_id: str) -> Session | None:
         """Validate a session.
 
         Args:
@@ -217,7 +211,7 @@ class AuthUseCase:
         Returns:
             The session if valid, None otherwise.
         """
-        return self._session_usecase.validate_session(session_id)
+        return await self._session_usecase.validate_session(session_id)
 
     def get_supported_providers(self) -> list[str]:
         """Get list of supported OAuth providers.
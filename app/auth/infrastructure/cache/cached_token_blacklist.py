@@ -0,0 +1,169 @@
+"""In-process token blacklist cache kept current through Redis pub/sub."""
+
+import json
+import logging
+import time
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.auth.application.port.token_blacklist_port import TokenBlacklistPort
+from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
+from app.config.redis_config import get_async_redis, get_redis
+from app.config.redis_pubsub import RedisSubscriber
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CachedTokenBlacklist(TokenBlacklistPort):
+    """Per-worker copy of the Redis blacklist for JWT validation.
+
+    Revoked JTIs are held in memory with their expiry time, so
+    is_blacklisted() needs no Redis round-trip once the cache is ready:
+    - On (re)subscribe the full blacklist is loaded with SCAN, and the
+      same load runs periodically to repair anything missed.
+    - add/remove publish an event that every worker applies.
+    - Until the cache is loaded, or while the subscription is down,
+      lookups fall back to Redis EXISTS (same as TokenBlacklistImpl).
+
+    Redis keys are unchanged (blacklist:{jti}), so workers with and
+    without the cache can run side by side. Request-path writes use the
+    async client; the reload runs on the subscriber thread with the
+    sync client.
+    """
+
+    CHANNEL = "auth:blacklist:events"
+    SCAN_COUNT = 1000
+
+    def __init__(
+        self,
+        redis_factory=get_redis,
+        reconcile_seconds: Optional[int] = None,
+        async_redis_factory=get_async_redis,
+    ):
+        """Initialize with Redis client factories.
+
+        Args:
+            redis_factory: Returns the sync Redis client for the reload
+                (resolved per call).
+            reconcile_seconds: Interval of the full reload from Redis.
+            async_redis_factory: Returns the async Redis client used by
+                the TokenBlacklistPort methods.
+        """
+        self._redis_factory = redis_factory
+        self._async_redis_factory = async_redis_factory
+        self._reconcile_seconds = reconcile_seconds or settings.AUTH_BLACKLIST_RECONCILE_SECONDS
+        self._revoked: dict[str, float] = {}  # jti -> 만료 시각 (epoch seconds)
+        self._ready = False
+        self.stats = {"local_hits": 0, "redis_fallbacks": 0, "events": 0, "reconciles": 0}
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._redis_factory()
+
+    @property
+    def async_client(self) -> aioredis.Redis:
+        return self._async_redis_factory()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def attach(self, subscriber: RedisSubscriber) -> None:
+        """Register with the worker's pub/sub subscriber (before it starts)."""
+        subscriber.subscribe(
+            self.CHANNEL,
+            self._on_event,
+            on_connect=self.reconcile,
+            on_disconnect=self._mark_stale,
+        )
+        subscriber.add_periodic(self.reconcile, self._reconcile_seconds)
+
+    # ------------------------------------------------------------------
+    # TokenBlacklistPort
+    # ------------------------------------------------------------------
+    async def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
+        """Store the JTI in Redis and broadcast it to every worker."""
+        expires_at = time.time() + ttl_seconds
+        pipe = self.async_client.pipeline(transaction=True)
+        pipe.set(f"{TokenBlacklistImpl.KEY_PREFIX}{jti}", "1", ex=ttl_seconds)
+        pipe.publish(self.CHANNEL, json.dumps({"op": "add", "jti": jti, "exp": expires_at}))
+        await pipe.execute()
+        self._revoked[jti] = expires_at
+
+    async def is_blacklisted(self, jti: str) -> bool:
+        """Check the in-memory copy, or Redis while the cache is not ready."""
+        if not self._ready:
+            self.stats["redis_fallbacks"] += 1
+            return await TokenBlacklistImpl(self.async_client).is_blacklisted(jti)
+
+        self.stats["local_hits"] += 1
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            self._revoked.pop(jti, None)
+            return False
+        return True
+
+    async def remove_from_blacklist(self, jti: str) -> None:
+        """Delete the JTI in Redis and broadcast the removal."""
+        pipe = self.async_client.pipeline(transaction=True)
+        pipe.delete(f"{TokenBlacklistImpl.KEY_PREFIX}{jti}")
+        pipe.publish(self.CHANNEL, json.dumps({"op": "remove", "jti": jti}))
+        await pipe.execute()
+        self._revoked.pop(jti, None)
+
+    # ------------------------------------------------------------------
+    # Synchronization (subscriber thread)
+    # ------------------------------------------------------------------
+    def reconcile(self) -> None:
+        """Reload every blacklist key with its remaining TTL from Redis."""
+        r = self.client
+        now = time.time()
+        revoked: dict[str, float] = {}
+        prefix_len = len(TokenBlacklistImpl.KEY_PREFIX)
+        batch = []
+        for key in r.scan_iter(match=f"{TokenBlacklistImpl.KEY_PREFIX}*", count=self.SCAN_COUNT):
+            batch.append(key)
+            if len(batch) >= self.SCAN_COUNT:
+                self._load_ttls(r, batch, revoked, now, prefix_len)
+                batch = []
+        if batch:
+            self._load_ttls(r, batch, revoked, now, prefix_len)
+
+        self._revoked = revoked
+        self._ready = True
+        self.stats["reconciles"] += 1
+
+    @staticmethod
+    def _load_ttls(r: redis.Redis, keys: list, revoked: dict, now: float, prefix_len: int) -> None:
+        pipe = r.pipeline(transaction=False)
+        for key in keys:
+            pipe.pttl(key)
+        for key, ttl_ms in zip(keys, pipe.execute()):
+            if ttl_ms == -2:  # SCAN 이후 만료됨
+                continue
+            # TTL 없는 키(-1)는 만료 없이 유지
+            revoked[key[prefix_len:]] = now + ttl_ms / 1000 if ttl_ms >= 0 else float("inf")
+
+    def _on_event(self, data: str) -> None:
+        try:
+            event = json.loads(data)
+            if event["op"] == "add":
+                self._revoked[event["jti"]] = float(event["exp"])
+            elif event["op"] == "remove":
+                self._revoked.pop(event["jti"], None)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("ignoring malformed blacklist event: %r", data)
+            return
+        self.stats["events"] += 1
+
+    def _mark_stale(self) -> None:
+        self._ready = False
+
+
+# Worker-level singleton (attached to redis_subscriber in the app lifespan)
+token_blacklist_cache = CachedTokenBlacklist()
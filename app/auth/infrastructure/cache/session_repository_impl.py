@@ -1,13 +1,15 @@
 """Session repository implementation using Redis."""
 
 import json
+from datetime import datetime, timedelta
 from typing import Optional
 
-import redis
+import redis.asyncio as aioredis
+from redis.exceptions import ResponseError
 
 from app.auth.application.port.session_repository_port import SessionRepositoryPort
 from app.auth.domain.entity.session import Session
-from app.config.redis_config import get_redis
+from app.config.redis_config import get_async_redis
 from app.config.settings import settings
 
 
@@ -16,75 +18,136 @@ class SessionRepositoryImpl(SessionRepositoryPort):
 
     Sessions are stored in Redis with TTL-based expiration.
     Key format: session:{session_id}
+    Value: hash with short fields
+        a: account ID
+        c: created_at (epoch seconds)
+        t: CSRF token (omitted when None)
+
+    The key's TTL is the session's expiry, so extending a session is a
+    single EXPIRE and reads fetch the hash and PTTL in one round-trip.
+    Sessions written by earlier releases as JSON strings are still read
+    and rewritten in the hash format on first access.
     """
 
     KEY_PREFIX = "session:"
 
     def __init__(
         self,
-        redis_client: Optional[redis.Redis] = None,
+        redis_client: Optional[aioredis.Redis] = None,
         ttl_seconds: Optional[int] = None,
     ):
         """Initialize with Redis client and TTL.
 
         Args:
-            redis_client: Redis client instance. Uses default if not provided.
+            redis_client: Async Redis client instance. Uses the shared
+                client (resolved per call) if not provided.
             ttl_seconds: Session TTL in seconds. Uses settings default if not provided.
         """
-        self._redis = redis_client or get_redis()
+        self._redis_client = redis_client
         self._ttl = ttl_seconds or settings.SESSION_TTL_SECONDS
 
+    @property
+    def _redis(self) -> aioredis.Redis:
+        """Injected client, or the shared client at call time."""
+        if self._redis_client is not None:
+            return self._redis_client
+        return get_async_redis()
+
     def _make_key(self, session_id: str) -> str:
         """Create Redis key for session."""
         return f"{self.KEY_PREFIX}{session_id}"
 
-    def save(self, session: Session) -> None:
-        """Save a session to Redis with TTL."""
-        key = self._make_key(session.session_id)
-        data = json.dumps(session.to_dict())
-        self._redis.setex(key, self._ttl, data)
+    async def save(self, session: Session) -> None:
+        """Save a session to Redis with TTL.
 
-    def find_by_id(self, session_id: str) -> Optional[Session]:
+        The TTL is the time left until session.expires_at, capped at the
+        configured session TTL.
+        """
+        key = self._make_key(session.session_id)
+        ttl = self._ttl
+        if session.expires_at is not None:
+            ttl = min(ttl, int((session.expires_at - datetime.now()).total_seconds()))
+        if ttl <= 0:
+            await self._redis.delete(key)
+            return
+
+        fields = {"a": session.account_id, "c": int(session.created_at.timestamp())}
+        if session.csrf_token is not None:
+            fields["t"] = session.csrf_token
+
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.delete(key)  # 이전 필드나 JSON 형식 값을 남기지 않는다
+        pipe.hset(key, mapping=fields)
+        pipe.expire(key, ttl)
+        await pipe.execute()
+
+    async def find_by_id(self, session_id: str) -> Optional[Session]:
         """Find a session by its ID."""
         key = self._make_key(session_id)
-        data = self._redis.get(key)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hgetall(key)
+        pipe.pttl(key)
+        fields, ttl_ms = await pipe.execute(raise_on_error=False)
 
-        if data is None:
+        if isinstance(fields, ResponseError):
+            # WRONGTYPE: JSON string written by an earlier release
+            return await self._find_legacy(session_id)
+
+        if not fields or ttl_ms == -2:
             return None
 
         try:
-            session_dict = json.loads(data)
-            session = Session.from_dict(session_dict)
+            return Session(
+                session_id=session_id,
+                account_id=int(fields["a"]),
+                created_at=datetime.fromtimestamp(int(fields["c"])),
+                expires_at=datetime.now() + timedelta(milliseconds=ttl_ms) if ttl_ms >= 0 else None,
+                csrf_token=fields.get("t"),
+            )
+        except (KeyError, ValueError):
+            # Invalid session data, clean up
+            await self.delete(session_id)
+            return None
+
+    async def _find_legacy(self, session_id: str) -> Optional[Session]:
+        """Read a JSON session and rewrite it as a hash."""
+        key = self._make_key(session_id)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.pttl(key)
+        data, ttl_ms = await pipe.execute()
 
-            # Double-check expiration (Redis TTL + session expiration)
-            if session.is_expired():
-                self.delete(session_id)
-                return None
+        if data is None:
+            return None
 
-            return session
+        try:
+            session = Session.from_dict(json.loads(data))
         except (json.JSONDecodeError, KeyError, ValueError):
-            # Invalid session data, clean up
-            self.delete(session_id)
+            await self.delete(session_id)
             return None
 
-    def delete(self, session_id: str) -> None:
-        """Delete a session from Redis."""
-        key = self._make_key(session_id)
-        self._redis.delete(key)
+        if ttl_ms >= 0:
+            key_expiry = datetime.now() + timedelta(milliseconds=ttl_ms)
+            if session.expires_at is None or key_expiry < session.expires_at:
+                session.expires_at = key_expiry
 
-    def extend_ttl(self, session_id: str, ttl_seconds: int) -> bool:
-        """Extend the TTL of a session."""
-        key = self._make_key(session_id)
+        # Double-check expiration (Redis TTL + session expiration)
+        if session.is_expired():
+            await self.delete(session_id)
+            return None
 
-        # Check if session exists
-        if not self._redis.exists(key):
-            return False
+        await self.save(session)
+        return session
 
-        # Update session expiration and save
-        session = self.find_by_id(session_id)
-        if session:
-            session.extend(hours=ttl_seconds // 3600)
-            self.save(session)
-            return True
+    async def delete(self, session_id: str) -> None:
+        """Delete a session from Redis."""
+        key = self._make_key(session_id)
+        await self._redis.delete(key)
+
+    async def extend_ttl(self, session_id: str, ttl_seconds: int) -> bool:
+        """Extend the TTL of a session.
 
-        return False
+        A single EXPIRE: it fails atomically when the session is gone.
+        """
+        key = self._make_key(session_id)
+        return bool(await self._redis.expire(key, ttl_seconds))
@@ -2,10 +2,10 @@
 
 from typing import Optional
 
-import redis
+import redis.asyncio as aioredis
 
 from app.auth.application.port.token_blacklist_port import TokenBlacklistPort
-from app.config.redis_config import get_redis
+from app.config.redis_config import get_async_redis
 
 
 class TokenBlacklistImpl(TokenBlacklistPort):
@@ -21,19 +21,27 @@ class TokenBlacklistImpl(TokenBlacklistPort):
 
     KEY_PREFIX = "blacklist:"
 
-    def __init__(self, redis_client: Optional[redis.Redis] = None):
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
         """Initialize with Redis client.
 
         Args:
-            redis_client: Redis client instance. Uses default if not provided.
+            redis_client: Async Redis client instance. Uses the shared
+                client (resolved per call) if not provided.
         """
-        self._redis = redis_client or get_redis()
+        self._redis_client = redis_client
+
+    @property
+    def _redis(self) -> aioredis.Redis:
+        """Injected client, or the shared client at call time."""
+        if self._redis_client is not None:
+            return self._redis_client
+        return get_async_redis()
 
     def _make_key(self, jti: str) -> str:
         """Create Redis key for blacklisted token."""
         return f"{self.KEY_PREFIX}{jti}"
 
-    def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
+    async def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
         """Add a token ID to the blacklist.
 
         Args:
@@ -41,9 +49,9 @@ class TokenBlacklistImpl(TokenBlacklistPort):
             ttl_seconds: Time-to-live in seconds (should match token expiry).
         """
         key = self._make_key(jti)
-        self._redis.setex(key, ttl_seconds, "1")
+        await self._redis.set(key, "1", ex=ttl_seconds)
 
-    def is_blacklisted(self, jti: str) -> bool:
+    async def is_blacklisted(self, jti: str) -> bool:
         """Check if a token ID is blacklisted.
 
         Args:
@@ -53,13 +61,13 @@ class TokenBlacklistImpl(TokenBlacklistPort):
             True if the token is blacklisted, False otherwise.
         """
         key = self._make_key(jti)
-        return self._redis.exists(key) > 0
+        return await self._redis.exists(key) > 0
 
-    def remove_from_blacklist(self, jti: str) -> None:
+    async def remove_from_blacklist(self, jti: str) -> None:
         """Remove a token ID from the blacklist.
 
         Args:
             jti: The JWT ID (jti claim) to remove.
         """
         key = self._make_key(jti)
-        self._redis.delete(key)
+        await self._redis.delete(key)
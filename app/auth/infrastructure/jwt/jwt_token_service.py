@@ -105,7 +105,7 @@ class JWTTokenService(JWTTokenPort):
             expires_at=expires_at,
         )
 
-    def validate_token(self, token: str) -> Optional[TokenPayload]:
+    async def validate_token(self, token: str) -> Optional[TokenPayload]:
         """Validate a JWT token and extract payload.
 
         Checks:
@@ -128,7 +128,7 @@ class JWTTokenService(JWTTokenPort):
             jti = payload["jti"]
 
             # Check if token is blacklisted
-            if self._blacklist and self._blacklist.is_blacklisted(jti):
+            if self._blacklist and await self._blacklist.is_blacklisted(jti):
                 return None
 
             return TokenPayload(
@@ -148,7 +148,7 @@ class JWTTokenService(JWTTokenPort):
         except (KeyError, ValueError):
             return None
 
-    def blacklist_token(self, token: str) -> bool:
+    async def blacklist_token(self, token: str) -> bool:
         """Add a token to the blacklist.
 
         Args:
@@ -176,12 +176,12 @@ class JWTTokenService(JWTTokenPort):
             # Calculate remaining TTL (or minimum 1 second)
             ttl_seconds = max(int((exp - now).total_seconds()), 1)
 
-            self._blacklist.add_to_blacklist(jti, ttl_seconds)
+            await self._blacklist.add_to_blacklist(jti, ttl_seconds)
             return True
         except (jwt.InvalidTokenError, KeyError, ValueError):
             return False
 
-    def validate_csrf(self, token: str, csrf_token: str) -> bool:
+    async def validate_csrf(self, token: str, csrf_token: str) -> bool:
         """Validate that the CSRF token matches the one in the JWT.
 
         Args:
@@ -191,12 +191,12 @@ class JWTTokenService(JWTTokenPort):
         Returns:
             True if CSRF tokens match, False otherwise.
         """
-        payload = self.validate_token(token)
+        payload = await self.validate_token(token)
         if payload is None:
             return False
         return secrets.compare_digest(payload.csrf_token, csrf_token)
 
-    def refresh_token(self, token: str) -> Optional[TokenPair]:
+    async def refresh_token(self, token: str) -> Optional[TokenPair]:
         """Refresh an existing token if still valid.
 
         Args:
@@ -205,7 +205,7 @@ class JWTTokenService(JWTTokenPort):
         Returns:
             New TokenPair if refresh successful, None otherwise.
         """
-        payload = self.validate_token(token)
+        payload = await self.validate_token(token)
         if payload is None:
             return None
 
@@ -1,13 +1,20 @@
 """Base OAuth provider - Abstract base for OAuth implementations."""
 
+import logging
 from abc import abstractmethod
 from typing import Optional
 from urllib.parse import urlencode
 
 import httpx
+import jwt
 
 from app.auth.application.port.oauth_provider_port import OAuthProviderPort, OAuthUserInfo
+from app.auth.infrastructure.oauth.http_client import OAuthHttpClient, oauth_http_client
+from app.auth.infrastructure.oauth.jwks_cache import get_jwks_cache
 from app.common.domain.exceptions import OAuthException
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
 
 
 class BaseOAuthProvider(OAuthProviderPort):
@@ -15,6 +22,11 @@ class BaseOAuthProvider(OAuthProviderPort):
 
     Provides common functionality for OAuth 2.0 authorization code flow.
     Subclasses must implement provider-specific details.
+    HTTP calls go through the shared pooled client (OAuthHttpClient).
+
+    Providers that set JWKS_URL read the user from the OpenID Connect ID
+    token returned by the token endpoint, verified locally against the
+    cached key set, and skip the userinfo call.
     """
 
     # Override these in subclasses
@@ -22,12 +34,18 @@ class BaseOAuthProvider(OAuthProviderPort):
     TOKEN_URL: str = ""
     USERINFO_URL: str = ""
     SCOPES: list[str] = []
+    TIMEOUT: httpx.Timeout = httpx.Timeout(5.0, connect=3.0)
+    JWKS_URL: str = ""  # Empty: no ID token verification
+    ID_TOKEN_ISSUERS: tuple[str, ...] = ()
+    ID_TOKEN_ALGORITHMS: list[str] = ["RS256"]
+    ID_TOKEN_LEEWAY_SECONDS: int = 60
 
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         redirect_uri: str,
+        http_client: Optional[OAuthHttpClient] = None,
     ):
         """Initialize OAuth provider.
 
@@ -35,10 +53,13 @@ class BaseOAuthProvider(OAuthProviderPort):
             client_id: OAuth client ID.
             client_secret: OAuth client secret.
             redirect_uri: Callback URL after authorization.
+            http_client: Pooled HTTP client. Uses the worker-wide client
+                if not provided.
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        self.http_client = http_client or oauth_http_client
 
     def get_authorization_url(self, state: str) -> str:
         """Get the OAuth authorization URL."""
@@ -59,6 +80,57 @@ class BaseOAuthProvider(OAuthProviderPort):
 
     async def exchange_code_for_token(self, code: str) -> str:
         """Exchange authorization code for access token."""
+        token_data = await self._exchange_code(code)
+        return token_data.get("access_token", "")
+
+    async def authenticate(self, code: str) -> OAuthUserInfo:
+        """Exchange the code, then identify the user.
+
+        Uses the verified ID token when there is one; falls back to the
+        userinfo endpoint when it is missing, fails verification or
+        lacks the needed claims.
+        """
+        token_data = await self._exchange_code(code)
+
+        id_token = token_data.get("id_token")
+        if id_token and self.JWKS_URL and settings.OAUTH_ID_TOKEN_VERIFY_ENABLED:
+            claims = await self._verify_id_token(id_token)
+            user_info = self._user_info_from_claims(claims) if claims else None
+            if user_info is not None:
+                return user_info
+
+        return await self.get_user_info(token_data.get("access_token", ""))
+
+    async def _verify_id_token(self, id_token: str) -> Optional[dict]:
+        """Verified ID token claims, or None if the token cannot be trusted."""
+        try:
+            kid = jwt.get_unverified_header(id_token).get("kid")
+            key = await get_jwks_cache(self.JWKS_URL, self.http_client).get_key(kid)
+            if key is None:
+                logger.warning("%s ID token signed with unknown key %r", self.provider_name, kid)
+                return None
+            return jwt.decode(
+                id_token,
+                key.key,
+                algorithms=self.ID_TOKEN_ALGORITHMS,
+                audience=self.client_id,
+                issuer=self.ID_TOKEN_ISSUERS,
+                leeway=self.ID_TOKEN_LEEWAY_SECONDS,
+                options={"require": ["exp", "iat", "iss", "aud", "sub"]},
+            )
+        except jwt.PyJWTError as e:
+            logger.warning("%s ID token verification failed: %s", self.provider_name, e)
+            return None
+
+    def _user_info_from_claims(self, claims: dict) -> Optional[OAuthUserInfo]:
+        """Map verified ID token claims to user info. Override in subclasses.
+
+        Returns None when the claims are not enough (userinfo is used).
+        """
+        return None
+
+    async def _exchange_code(self, code: str) -> dict:
+        """Exchange authorization code at the token endpoint (full response)."""
         data = {
             "client_id": self.client_id,
             "client_secret": self.client_secret,
@@ -67,26 +139,25 @@ class BaseOAuthProvider(OAuthProviderPort):
             "grant_type": "authorization_code",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.TOKEN_URL,
-                    data=data,
-                    headers={"Accept": "application/json"},
-                )
-                response.raise_for_status()
-                token_data = response.json()
-                return token_data.get("access_token", "")
-            except httpx.HTTPStatusError as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Token exchange failed: {e.response.status_code}",
-                )
-            except Exception as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Token exchange failed: {str(e)}",
-                )
+        try:
+            response = await self.http_client.client.post(
+                self.TOKEN_URL,
+                data=data,
+                headers={"Accept": "application/json"},
+                timeout=self.TIMEOUT,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Token exchange failed: {e.response.status_code}",
+            )
+        except Exception as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Token exchange failed: {str(e)}",
+            )
 
     @abstractmethod
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
@@ -102,22 +173,22 @@ class BaseOAuthProvider(OAuthProviderPort):
         """Fetch user info from provider's userinfo endpoint."""
         url = url or self.USERINFO_URL
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    url,
-                    headers={"Authorization": f"Bearer {access_token}"},
-                    params=params,
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Failed to fetch user info: {e.response.status_code}",
-                )
-            except Exception as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Failed to fetch user info: {str(e)}",
-                )
+        try:
+            response = await self.http_client.client.get(
+                url,
+                headers={"Authorization": f"Bearer {access_token}"},
+                params=params,
+                timeout=self.TIMEOUT,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Failed to fetch user info: {e.response.status_code}",
+            )
+        except Exception as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Failed to fetch user info: {str(e)}",
+            )
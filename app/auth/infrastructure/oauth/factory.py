@@ -13,6 +13,7 @@ class OAuthProviderFactory:
     """Factory for creating OAuth providers.
 
     Uses a registry pattern for easy addition of new providers.
+    Providers are stateless, so one instance per name is created and reused.
     """
 
     # Provider registry: name -> provider class
@@ -23,6 +24,9 @@ class OAuthProviderFactory:
         "meta": MetaOAuthProvider,
     }
 
+    # Provider instances: name -> provider (created on first use)
+    _instances: Dict[str, OAuthProviderPort] = {}
+
     @classmethod
     def get_provider(cls, provider_name: str) -> OAuthProviderPort:
         """Get an OAuth provider instance by name.
@@ -31,18 +35,23 @@ class OAuthProviderFactory:
             provider_name: Name of the provider (e.g., "google", "kakao", "naver", "meta").
 
         Returns:
-            An instance of the OAuth provider.
+            The cached instance of the OAuth provider.
 
         Raises:
             UnsupportedOAuthProviderException: If provider is not supported.
         """
         provider_name = provider_name.lower()
+        provider = cls._instances.get(provider_name)
+        if provider is not None:
+            return provider
+
         provider_class = cls._providers.get(provider_name)
 
         if provider_class is None:
             raise UnsupportedOAuthProviderException(provider_name)
 
-        return provider_class()
+        provider = cls._instances[provider_name] = provider_class()
+        return provider
 
     @classmethod
     def register_provider(
@@ -57,6 +66,7 @@ class OAuthProviderFactory:
             provider_class: The provider class to register.
         """
         cls._providers[name.lower()] = provider_class
+        cls._instances.pop(name.lower(), None)
 
     @classmethod
     def get_supported_providers(cls) -> list[str]:
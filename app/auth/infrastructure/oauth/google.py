@@ -1,5 +1,7 @@
 """Google OAuth provider implementation."""
 
+from typing import Optional
+
 from app.auth.application.port.oauth_provider_port import OAuthUserInfo
 from app.auth.infrastructure.oauth.base import BaseOAuthProvider
 from app.config.settings import settings
@@ -9,13 +11,15 @@ class GoogleOAuthProvider(BaseOAuthProvider):
     """Google OAuth 2.0 provider.
 
     Implements OAuth authorization code flow for Google Sign-In.
-    Uses OpenID Connect for user info.
+    Uses OpenID Connect: the user is read from the verified ID token.
     """
 
     AUTHORIZE_URL = "https://accounts.google.com/o/oauth2/v2/auth"
     TOKEN_URL = "https://oauth2.googleapis.com/token"
     USERINFO_URL = "https://www.googleapis.com/oauth2/v3/userinfo"
     SCOPES = ["openid", "email", "profile"]
+    JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+    ID_TOKEN_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
 
     def __init__(self):
         """Initialize Google OAuth provider with settings."""
@@ -37,6 +41,19 @@ class GoogleOAuthProvider(BaseOAuthProvider):
             "prompt": "consent",  # Always show consent screen
         }
 
+    def _user_info_from_claims(self, claims: dict) -> Optional[OAuthUserInfo]:
+        """Get user info from Google ID token claims."""
+        email = claims.get("email", "")
+        if not email:
+            return None
+
+        return OAuthUserInfo(
+            email=email,
+            name=claims.get("name", email.split("@")[0]),
+            picture=claims.get("picture"),
+            provider=self.provider_name,
+        )
+
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
         """Get user info from Google."""
         data = await self._fetch_user_info(access_token)
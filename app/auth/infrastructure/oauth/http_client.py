@@ -0,0 +1,90 @@
+"""Shared HTTP client for OAuth provider calls."""
+
+import logging
+import ssl
+from typing import Optional, Union
+
+import httpx
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class OAuthHttpClient:
+    """Worker-wide pooled ``httpx.AsyncClient`` for OAuth providers.
+
+    One client serves every provider, so token exchanges and userinfo
+    calls reuse keep-alive connections instead of paying a new TCP and
+    TLS handshake per login. HTTP/2 is offered through ALPN and used
+    only by providers whose servers accept it; others stay on HTTP/1.1.
+    Timeouts are per request (see BaseOAuthProvider.TIMEOUT).
+
+    The client is created on first use (or by start() in the app
+    lifespan) and closed by aclose() at shutdown.
+    """
+
+    def __init__(
+        self,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        verify: Union[bool, ssl.SSLContext] = True,
+    ):
+        """Initialize client settings (nothing is connected yet).
+
+        Args:
+            http2: Offer HTTP/2. Defaults to OAUTH_HTTP2_ENABLED; ignored
+                when the ``h2`` package is not installed.
+            max_connections: Pool size across all providers.
+            keepalive_expiry: Seconds an idle connection is kept.
+            verify: TLS verification (CA bundle context for tests).
+        """
+        self._http2 = settings.OAUTH_HTTP2_ENABLED if http2 is None else http2
+        self._max_connections = max_connections or settings.OAUTH_HTTP_MAX_CONNECTIONS
+        self._keepalive_expiry = keepalive_expiry or settings.OAUTH_HTTP_KEEPALIVE_SECONDS
+        self._verify = verify
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client, created on first use."""
+        if self._client is None:
+            self.start()
+        return self._client
+
+    def start(self) -> None:
+        """Create the client (called from the app lifespan)."""
+        if self._client is not None:
+            return
+        http2 = self._http2
+        if http2 and not _http2_available():
+            logger.warning("OAUTH_HTTP2_ENABLED but the h2 package is missing; using HTTP/1.1")
+            http2 = False
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            verify=self._verify,
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections,
+                keepalive_expiry=self._keepalive_expiry,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections (called at shutdown)."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+
+# Worker-level singleton (started and closed in the app lifespan)
+oauth_http_client = OAuthHttpClient()
@@ -0,0 +1,130 @@
+"""JWKS cache for local OpenID Connect ID-token verification."""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Optional
+
+import httpx
+import jwt
+
+from app.auth.infrastructure.oauth.http_client import OAuthHttpClient, oauth_http_client
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class JWKSCache:
+    """Signing keys of one OAuth provider, fetched from its JWKS URL.
+
+    - Keys are kept for the response's Cache-Control max-age (or
+      OAUTH_JWKS_TTL_SECONDS). Once 80% of that has passed, lookups
+      keep using the cached keys and a refresh runs in the background.
+    - An unknown ``kid`` means the provider rotated its keys: the set is
+      re-fetched immediately, at most once per
+      OAUTH_JWKS_MIN_REFRESH_SECONDS so forged kids cannot hammer the
+      provider.
+    - A failed fetch keeps the previous keys; with no keys at all the
+      next attempt waits the same minimum interval, and callers fall
+      back to the userinfo endpoint meanwhile.
+    Concurrent callers share one in-flight fetch.
+    """
+
+    REFRESH_AHEAD_RATIO = 0.8
+    FETCH_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+
+    def __init__(
+        self,
+        url: str,
+        http_client: Optional[OAuthHttpClient] = None,
+        ttl_seconds: Optional[float] = None,
+        min_refresh_seconds: Optional[float] = None,
+    ):
+        """Initialize an empty cache (keys are fetched on first use).
+
+        Args:
+            url: The provider's JWKS endpoint.
+            http_client: Pooled HTTP client. Uses the worker-wide client
+                if not provided.
+            ttl_seconds: Lifetime when the response has no max-age.
+            min_refresh_seconds: Minimum interval between fetches
+                triggered by unknown key IDs.
+        """
+        self.url = url
+        self.http_client = http_client or oauth_http_client
+        self._ttl = ttl_seconds or settings.OAUTH_JWKS_TTL_SECONDS
+        self._min_refresh = min_refresh_seconds or settings.OAUTH_JWKS_MIN_REFRESH_SECONDS
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._fetched_at = float("-inf")
+        self._refresh_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.stats = {"hits": 0, "fetches": 0, "rotations": 0, "errors": 0}
+
+    async def get_key(self, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        """Signing key for ``kid``, or None if the provider does not list it."""
+        now = time.monotonic()
+        if not self._keys:
+            if now - self._fetched_at >= self._min_refresh:
+                await self.refresh()
+        elif now >= self._refresh_at:
+            self._refresh_in_background()
+
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._fetched_at >= self._min_refresh:
+            self.stats["rotations"] += 1
+            await self.refresh()
+            key = self._keys.get(kid)
+        if key is not None:
+            self.stats["hits"] += 1
+        return key
+
+    async def refresh(self) -> None:
+        """Fetch the key set now (shares a fetch already in progress)."""
+        requested_at = time.monotonic()
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._fetched_at >= requested_at:
+                return  # fetched by another caller while we waited
+            try:
+                response = await self.http_client.client.get(self.url, timeout=self.FETCH_TIMEOUT)
+                response.raise_for_status()
+                key_set = jwt.PyJWKSet.from_dict(response.json())
+            except Exception as e:
+                self.stats["errors"] += 1
+                # failures count toward the refetch interval, including background refreshes
+                self._fetched_at = time.monotonic()
+                self._refresh_at = self._fetched_at + self._min_refresh
+                logger.warning("JWKS fetch from %s failed, keeping %d cached keys: %r", self.url, len(self._keys), e)
+                return
+
+            ttl = self._ttl
+            match = _MAX_AGE.search(response.headers.get("cache-control", ""))
+            if match:
+                ttl = max(int(match.group(1)), self._min_refresh)
+
+            fetched_at = time.monotonic()
+            self._keys = {key.key_id: key for key in key_set.keys if key.key_id}
+            self._fetched_at = fetched_at
+            self._refresh_at = fetched_at + ttl * self.REFRESH_AHEAD_RATIO
+            self.stats["fetches"] += 1
+
+    def _refresh_in_background(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self.refresh())
+
+
+# One cache per JWKS URL (worker-level)
+_caches: Dict[str, JWKSCache] = {}
+
+
+def get_jwks_cache(url: str, http_client: Optional[OAuthHttpClient] = None) -> JWKSCache:
+    """Shared cache for a JWKS URL."""
+    cache = _caches.get(url)
+    if cache is None:
+        cache = _caches[url] = JWKSCache(url, http_client)
+    return cache
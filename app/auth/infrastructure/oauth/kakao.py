@@ -1,5 +1,9 @@
 """Kakao OAuth provider implementation."""
 
+from typing import Optional
+
+import httpx
+
 from app.auth.application.port.oauth_provider_port import OAuthUserInfo
 from app.auth.infrastructure.oauth.base import BaseOAuthProvider
 from app.config.settings import settings
@@ -9,13 +13,17 @@ class KakaoOAuthProvider(BaseOAuthProvider):
     """Kakao OAuth 2.0 provider.
 
     Implements OAuth authorization code flow for Kakao Sign-In.
-    Uses Kakao Login API for authentication.
+    Uses Kakao Login API for authentication, or the OpenID Connect ID
+    token when KAKAO_OIDC_ENABLED.
     """
 
     AUTHORIZE_URL = "https://kauth.kakao.com/oauth/authorize"
     TOKEN_URL = "https://kauth.kakao.com/oauth/token"
     USERINFO_URL = "https://kapi.kakao.com/v2/user/me"
     SCOPES = ["profile_nickname", "account_email"]
+    TIMEOUT = httpx.Timeout(3.0, connect=2.0)  # Domestic endpoints
+    OIDC_JWKS_URL = "https://kauth.kakao.com/.well-known/jwks.json"
+    ID_TOKEN_ISSUERS = ("https://kauth.kakao.com",)
 
     def __init__(self):
         """Initialize Kakao OAuth provider with settings."""
@@ -24,6 +32,10 @@ class KakaoOAuthProvider(BaseOAuthProvider):
             client_secret=settings.KAKAO_CLIENT_SECRET,
             redirect_uri=settings.KAKAO_REDIRECT_URI,
         )
+        # OpenID Connect must be enabled in Kakao Developers before asking for it
+        if settings.KAKAO_OIDC_ENABLED:
+            self.SCOPES = ["openid", *self.SCOPES]
+            self.JWKS_URL = self.OIDC_JWKS_URL
 
     @property
     def provider_name(self) -> str:
@@ -36,6 +48,23 @@ class KakaoOAuthProvider(BaseOAuthProvider):
             "prompt": "login",  # Always show login screen
         }
 
+    def _user_info_from_claims(self, claims: dict) -> Optional[OAuthUserInfo]:
+        """Get user info from Kakao ID token claims.
+
+        Returns None when the token has no email claim (email consent not
+        granted), so the caller falls back to the userinfo endpoint.
+        """
+        email = claims.get("email", "")
+        if not email:
+            return None
+
+        return OAuthUserInfo(
+            email=email,
+            name=claims.get("nickname") or f"kakao_{claims.get('sub', '')}",
+            picture=claims.get("picture"),
+            provider=self.provider_name,
+        )
+
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
         """Get user info from Kakao.
 
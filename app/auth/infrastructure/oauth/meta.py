@@ -1,3 +1,7 @@
+from typing import Optional
+
+import httpx
+
 from app.auth.application.port.oauth_provider_port import OAuthUserInfo
 from app.auth.infrastructure.oauth.base import BaseOAuthProvider
 from app.config.settings import settings
@@ -12,17 +16,41 @@ class MetaOAuthProvider(BaseOAuthProvider):
     # 보통 email은 퍼미션 필요 (승인/상태에 따라 빈 값 가능)
     SCOPES = ["email", "public_profile"]
 
+    # Graph API 는 응답이 느린 경우가 있어 여유 있게
+    TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+    # OpenID Connect (META_OIDC_ENABLED 일 때만 openid 스코프 요청)
+    OIDC_JWKS_URL = "https://www.facebook.com/.well-known/oauth/openid/jwks/"
+    ID_TOKEN_ISSUERS = ("https://www.facebook.com",)
+
     def __init__(self):
         super().__init__(
             client_id=settings.META_CLIENT_ID,
             client_secret=settings.META_CLIENT_SECRET,
             redirect_uri=settings.META_REDIRECT_URI,
         )
+        if settings.META_OIDC_ENABLED:
+            self.SCOPES = ["openid", *self.SCOPES]
+            self.JWKS_URL = self.OIDC_JWKS_URL
 
     @property
     def provider_name(self) -> str:
         return "meta"
 
+    def _user_info_from_claims(self, claims: dict) -> Optional[OAuthUserInfo]:
+        # ID 토큰의 picture 는 URL 문자열
+        # email 이 없으면 None: 계정은 email 로 식별되므로 userinfo 조회로 대체한다
+        email = claims.get("email", "")
+        if not email:
+            return None
+
+        return OAuthUserInfo(
+            email=email,
+            name=claims.get("name", "") or email.split("@")[0],
+            picture=claims.get("picture"),
+            provider=self.provider_name,
+        )
+
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
         # Facebook은 fields 쿼리 파라미터로 요청
         data = await self._fetch_user_info(
@@ -1,5 +1,7 @@
 """Naver OAuth provider implementation."""
 
+import httpx
+
 from app.auth.application.port.oauth_provider_port import OAuthUserInfo
 from app.auth.infrastructure.oauth.base import BaseOAuthProvider
 from app.config.settings import settings
@@ -15,6 +17,7 @@ class NaverOAuthProvider(BaseOAuthProvider):
     TOKEN_URL = "https://nid.naver.com/oauth2.0/token"
     USERINFO_URL = "https://openapi.naver.com/v1/nid/me"
     SCOPES = []
+    TIMEOUT = httpx.Timeout(3.0, connect=2.0)  # Domestic endpoints
 
     def __init__(self):
         """Initialize Naver OAuth provider with settings."""
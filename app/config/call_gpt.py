@@ -6,6 +6,8 @@ from typing import Optional, AsyncIterator, List, Any
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 
+from app.config.settings import settings
+
 load_dotenv()
 
 # 환경 변수 검증
@@ -30,11 +32,18 @@ def get_async_client() -> AsyncOpenAI:
     return _async_client
 
 
-async def _create_chat_completion_stream(prompt: str, file_urls: list[str] = None) -> AsyncIterator[str]:
+async def _create_chat_completion_stream(
+    prompt: str,
+    file_urls: list[str] = None,
+    model: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+) -> AsyncIterator[str]:
     """비동기 방식으로 GPT API를 호출합니다.
     
     Args:
         prompt: 사용자 프롬프트
+        model: 사용할 모델 (기본값: LLM_DEFAULT_MODEL)
+        max_tokens: 최대 응답 토큰 (기본값: MAX_TOKENS 환경 변수)
         
     Returns:
         GPT 응답 텍스트
@@ -71,9 +80,9 @@ async def _create_chat_completion_stream(prompt: str, file_urls: list[str] = Non
     ]
     try:
         response = await client.chat.completions.create(
-            model="gpt-4.1",
+            model=model or settings.LLM_DEFAULT_MODEL,
             messages=messages,
-            max_tokens=MAX_TOKENS,
+            max_tokens=max_tokens or MAX_TOKENS,
             temperature=0,
             stream=True
         )
@@ -90,11 +99,18 @@ class CallGPT:
     """OpenAI GPT API를 비동기로 호출하는 클래스."""
 
     @staticmethod
-    async def call_gpt(prompt: str, file_urls: list[str] = None) -> AsyncIterator[str]:
+    async def call_gpt(
+        prompt: str,
+        file_urls: list[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
         """비동기 방식으로 GPT API를 호출합니다.
         
         Args:
             prompt: 사용자 프롬프트
+            model: 사용할 모델 (기본값: LLM_DEFAULT_MODEL)
+            max_tokens: 최대 응답 토큰 (기본값: MAX_TOKENS 환경 변수)
             
         Returns:
             GPT 응답 텍스트
@@ -104,7 +120,7 @@ class CallGPT:
             Exception: OpenAI API 호출 실패 시
         """
         try:
-            async for chunk in _create_chat_completion_stream(prompt, file_urls):
+            async for chunk in _create_chat_completion_stream(prompt, file_urls, model, max_tokens):
                 yield chunk
         except Exception as e:
             raise Exception(f"CallGPT 중계 에러: {str(e)}")
@@ -7,13 +7,17 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 
 load_dotenv()
 
-password = urllib.parse.quote_plus(os.getenv("MYSQL_PASSWORD"))
+# DATABASE_URL 이 주어지면 우선 사용 (부하 테스트용 SQLite 등)
+DATABASE_URL = os.getenv("DATABASE_URL")
 
-DATABASE_URL = (
-    f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{password}"
-    f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
-    f"?charset=utf8mb4"
-)
+if not DATABASE_URL:
+    password = urllib.parse.quote_plus(os.getenv("MYSQL_PASSWORD"))
+
+    DATABASE_URL = (
+        f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{password}"
+        f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
+        f"?charset=utf8mb4"
+    )
 
 engine = create_engine(
     DATABASE_URL,
@@ -0,0 +1,251 @@
+# app/config/prescreen.py
+"""사용자 메시지 사전 스크리닝 엔진.
+
+prescreen_patterns.yaml 의 키워드를 Aho-Corasick 오토마톤으로 컴파일하여
+메시지를 한 번만 순회하면서 위기/정체성 변경/상담 외 주제 키워드를 찾고,
+개인정보(PII)는 하나로 합친 정규식으로 탐지/마스킹한다.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Iterable, Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+
+class PrescreenFlag(str, Enum):
+    CRISIS = "crisis"
+    IDENTITY_CHANGE = "identity_change"
+    OFF_TOPIC = "off_topic"
+    PII = "pii"
+
+
+@dataclass(frozen=True)
+class PrescreenResult:
+    flags: frozenset = frozenset()
+    matches: tuple = ()
+    masked_text: Optional[str] = None  # PII 가 발견된 경우에만 채워짐
+
+    def has(self, flag: PrescreenFlag) -> bool:
+        return flag in self.flags
+
+
+_EMPTY_RESULT = PrescreenResult()
+
+
+# 오탐 방지용 예외 표현 라벨 (예: '자살골' 안의 '자살')
+_EXCLUDE_LABEL = "exclude"
+
+
+def _compact(text: str) -> str:
+    """대소문자/공백 차이를 무시하기 위한 정규화"""
+    return "".join(text.lower().split())
+
+
+class AhoCorasick:
+    """여러 키워드를 한 번의 순회로 찾는 Aho-Corasick 오토마톤"""
+
+    def __init__(self, patterns: Iterable[tuple[str, str]]):
+        # patterns: (keyword, label)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple] = [()]
+
+        for keyword, label in patterns:
+            if keyword:
+                self._add(keyword, label)
+        self._build_failure_links()
+
+    def _add(self, keyword: str, label: str) -> None:
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + ((label, keyword),)
+
+    def _build_failure_links(self) -> None:
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, text: str) -> list:
+        """(끝 위치, label, keyword) 목록. 끝 위치는 키워드 마지막 글자의 인덱스"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        found = []
+        for end, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.extend((end, label, keyword) for label, keyword in out[state])
+        return found
+
+
+@dataclass
+class _CompiledPatterns:
+    automaton: AhoCorasick
+    pii_regex: Optional[re.Pattern]
+    responses: dict = field(default_factory=dict)
+
+
+class PrescreenEngine:
+    """
+    prescreen_patterns.yaml 을 로드하는 싱글톤 엔진.
+    파일 변경 시각을 주기적으로 확인하여 재시작 없이 패턴을 다시 컴파일한다.
+    """
+
+    _instance = None
+    RELOAD_CHECK_INTERVAL = 2.0  # seconds
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, config_path: Optional[Path] = None):
+        if getattr(self, "_compiled", None) is not None:
+            return
+
+        project_root = Path(__file__).parent.parent.parent  # app/config에서 3단계 위로
+        self._path = config_path or project_root / "prescreen_patterns.yaml"
+        self._lock = threading.Lock()
+        self._mtime = 0.0
+        self._next_check = 0.0
+        self._compiled: Optional[_CompiledPatterns] = None
+        self._load()
+
+    def _load(self) -> None:
+        with open(self._path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+
+        keywords = config.get("keywords", {}) or {}
+        # 라벨 오타는 scan() 마다 ValueError 가 나므로 로드 시점에 거부한다 (재로드면 기존 패턴 유지)
+        keyword_labels = {flag.value for flag in PrescreenFlag} - {PrescreenFlag.PII.value}
+        unknown = sorted(set(keywords) - keyword_labels)
+        if unknown:
+            raise ValueError(f"unknown prescreen keyword labels {unknown} in {self._path}")
+        # 공백만 다른 키워드는 정규화 후 하나로 합친다. 예외 표현도 같은 오토마톤에서 함께 찾는다
+        patterns = list(dict.fromkeys(
+            [(_compact(keyword), label) for label, words in keywords.items() for keyword in (words or [])]
+            + [(_compact(phrase), _EXCLUDE_LABEL) for phrase in (config.get("exclusions") or [])]
+        ))
+
+        pii = config.get("pii", {}) or {}
+        pii_regex = (
+            re.compile("|".join(f"(?P<{name}>{regex})" for name, regex in pii.items()))
+            if pii else None
+        )
+
+        self._compiled = _CompiledPatterns(
+            automaton=AhoCorasick(patterns),
+            pii_regex=pii_regex,
+            responses=config.get("responses", {}) or {},
+        )
+        self._mtime = os.stat(self._path).st_mtime
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.RELOAD_CHECK_INTERVAL
+
+        try:
+            mtime = os.stat(self._path).st_mtime
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            try:
+                self._load()
+                logger.info("prescreen patterns reloaded from %s", self._path)
+            except Exception as e:
+                # 잘못된 YAML 이면 기존 패턴을 유지
+                self._mtime = mtime
+                logger.error("prescreen patterns reload failed: %s", e)
+
+    def scan(self, message: str) -> PrescreenResult:
+        if not message:
+            return _EMPTY_RESULT
+
+        self._maybe_reload()
+        compiled = self._compiled
+
+        matches = self._keyword_matches(compiled.automaton.scan(_compact(message)))
+        flags = {PrescreenFlag(label) for label, _ in matches}
+
+        masked_text = None
+        pii_hits = []
+        masked = self._mask(compiled, message, pii_hits)
+        if pii_hits:
+            flags.add(PrescreenFlag.PII)
+            matches.extend(pii_hits)
+            masked_text = masked
+
+        if not flags:
+            return _EMPTY_RESULT
+
+        return PrescreenResult(flags=frozenset(flags), matches=tuple(matches), masked_text=masked_text)
+
+    @staticmethod
+    def _keyword_matches(hits: list) -> list:
+        # 예외 표현 구간 안에 완전히 들어가는 키워드는 버린다
+        excluded = [(end - len(keyword) + 1, end) for end, label, keyword in hits if label == _EXCLUDE_LABEL]
+        return [
+            (label, keyword)
+            for end, label, keyword in hits
+            if label != _EXCLUDE_LABEL
+            and not any(start <= end - len(keyword) + 1 and end <= stop for start, stop in excluded)
+        ]
+
+    def mask_pii(self, text: str) -> str:
+        """키워드 검사 없이 개인정보만 마스킹 (첨부 파일 텍스트 등)"""
+        if not text:
+            return text
+        self._maybe_reload()
+        return self._mask(self._compiled, text, [])
+
+    @staticmethod
+    def _mask(compiled: _CompiledPatterns, text: str, hits: list) -> str:
+        if compiled.pii_regex is None:
+            return text
+
+        def _replace(m: re.Match) -> str:
+            hits.append((PrescreenFlag.PII.value, m.lastgroup))
+            return f"[{m.lastgroup}]"
+
+        return compiled.pii_regex.sub(_replace, text)
+
+    def get_response(self, key: str) -> str:
+        return self._compiled.responses.get(key, "")
+
+
+# 싱글톤 인스턴스
+prescreen_engine = PrescreenEngine()
@@ -1,6 +1,7 @@
 import os
 
 import redis
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,8 +11,13 @@ REDIS_PORT = int(os.getenv("REDIS_PORT"))
 REDIS_DB = int(os.getenv("REDIS_DB"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
 
+# 비동기 클라이언트 커넥션 풀 (워커당). 풀이 모두 사용 중이면 POOL_TIMEOUT 초까지 빈 연결을 기다린다.
+REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", "32"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "2.0"))
+
 # Redis 인스턴스 생성 (Singleton)
 _redis_instance = None
+_async_redis_instance = None
 
 def get_redis() -> redis.Redis:
     global _redis_instance
@@ -24,3 +30,30 @@ def get_redis() -> redis.Redis:
             decode_responses=True
         )
     return _redis_instance
+
+
+def get_async_redis() -> aioredis.Redis:
+    """
+    요청 처리(이벤트 루프)용 비동기 Redis 클라이언트 (Singleton).
+    연결은 처음 사용한 이벤트 루프에 묶이므로 lifespan 종료 시 close_async_redis() 로 정리한다.
+    """
+    global _async_redis_instance
+    if _async_redis_instance is None:
+        pool = aioredis.BlockingConnectionPool(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD,
+            decode_responses=True,
+            max_connections=REDIS_POOL_SIZE,
+            timeout=REDIS_POOL_TIMEOUT,
+        )
+        _async_redis_instance = aioredis.Redis(connection_pool=pool)
+    return _async_redis_instance
+
+
+async def close_async_redis() -> None:
+    global _async_redis_instance
+    if _async_redis_instance is not None:
+        client, _async_redis_instance = _async_redis_instance, None
+        await client.aclose(close_connection_pool=True)
@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import redis
+
+from app.config.redis_config import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Subscription:
+    handler: Callable[[str], None]
+    on_connect: Optional[Callable[[], None]] = None
+    on_disconnect: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class _Periodic:
+    fn: Callable[[], None]
+    interval: float
+    next_run: float = field(default=0.0)
+
+
+class RedisSubscriber:
+    """
+    워커 프로세스의 Redis pub/sub 구독 (백그라운드 스레드 하나로 모든 채널 처리).
+
+    - 구독 확인을 받은 뒤 on_connect 를 호출한다. 재연결 후에도 호출되므로
+      끊긴 동안 놓친 메시지는 on_connect 에서 전체 상태를 다시 읽어 보정한다.
+    - 연결이 끊기면 on_disconnect 를 호출하고 RECONNECT_SECONDS 뒤 다시 구독한다.
+    - add_periodic 으로 등록한 작업(주기적 정합성 보정 등)도 같은 스레드에서 실행한다.
+    """
+
+    POLL_SECONDS = 1.0
+    RECONNECT_SECONDS = 1.0
+
+    def __init__(self, redis_factory=get_redis):
+        self._redis_factory = redis_factory
+        self._subscriptions: dict[str, list[_Subscription]] = {}
+        self._periodic: list[_Periodic] = []
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._redis_factory()
+
+    def subscribe(
+            self,
+            channel: str,
+            handler: Callable[[str], None],
+            on_connect: Optional[Callable[[], None]] = None,
+            on_disconnect: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """start() 전에 등록한다"""
+        self._subscriptions.setdefault(channel, []).append(_Subscription(handler, on_connect, on_disconnect))
+
+    def add_periodic(self, fn: Callable[[], None], interval_seconds: float) -> None:
+        self._periodic.append(_Periodic(fn, interval_seconds, time.monotonic() + interval_seconds))
+
+    def publish(self, channel: str, message: str) -> None:
+        self.client.publish(channel, message)
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if not self._subscriptions or self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="redis-subscriber", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            pubsub = self.client.pubsub()
+            try:
+                self._subscribe_all(pubsub)
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(ignore_subscribe_messages=True, timeout=self.POLL_SECONDS)
+                    if message is not None:
+                        self._dispatch(message)
+                    self._run_periodic()
+            except (redis.ConnectionError, redis.TimeoutError, OSError) as e:
+                logger.warning("redis subscriber disconnected: %r", e)
+                self._notify("on_disconnect")
+                self._stopped.wait(self.RECONNECT_SECONDS)
+            finally:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+    def _subscribe_all(self, pubsub) -> None:
+        pubsub.subscribe(*self._subscriptions)
+        confirmed = set()
+        deadline = time.monotonic() + 10
+        while confirmed != set(self._subscriptions):
+            if time.monotonic() > deadline:
+                raise redis.TimeoutError("subscribe confirmation timed out")
+            message = pubsub.get_message(timeout=self.POLL_SECONDS)
+            if message and message["type"] == "subscribe":
+                confirmed.add(message["channel"])
+        # 구독이 확정된 뒤 상태를 읽어야 그 사이의 변경을 놓치지 않는다
+        self._notify("on_connect")
+
+    def _dispatch(self, message: dict) -> None:
+        if message["type"] != "message":
+            return
+        for subscription in self._subscriptions.get(message["channel"], ()):
+            try:
+                subscription.handler(message["data"])
+            except Exception:
+                logger.exception("redis subscriber handler failed on %s", message["channel"])
+
+    def _notify(self, hook: str) -> None:
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                callback = getattr(subscription, hook)
+                if callback is None:
+                    continue
+                try:
+                    callback()
+                except (redis.ConnectionError, redis.TimeoutError, OSError):
+                    raise
+                except Exception:
+                    logger.exception("redis subscriber %s callback failed", hook)
+
+    def _run_periodic(self) -> None:
+        now = time.monotonic()
+        for task in self._periodic:
+            if now < task.next_run:
+                continue
+            task.next_run = now + task.interval
+            try:
+                task.fn()
+            except (redis.ConnectionError, redis.TimeoutError, OSError):
+                raise
+            except Exception:
+                logger.exception("redis subscriber periodic task failed")
+
+
+# 워커 단위 싱글톤 인스턴스 (lifespan 에서 start/stop)
+redis_subscriber = RedisSubscriber()
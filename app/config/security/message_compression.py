@@ -0,0 +1,113 @@
+import zlib
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+# 압축 페이로드 = 헤더 1바이트 + 본문
+#   0     : 압축하지 않은 원문 (짧거나 압축 이득이 없는 메시지)
+#   1     : 사전 없는 raw deflate
+#   2 이상 : 해당 id 의 사전(zdict)을 쓴 raw deflate
+# 사전 id 는 한 번 행이 쓰이면 내용을 바꿀 수 없다. 사전은 운영 메시지 표본(복호화한 말뭉치)으로
+# 학습한 것만 새 id 로 DICTIONARY_FILES 에 추가하고 ACTIVE_DICTIONARY_ID 를 그 id 로 바꾼다.
+RAW = 0
+DEFLATE = 1
+DICTIONARY_FILES: dict[int, str] = {}
+ACTIVE_DICTIONARY_ID: Optional[int] = None  # None: 사전 없이 압축
+
+DEFAULT_MIN_BYTES = 128
+DEFAULT_LEVEL = 6
+MAX_DICTIONARY_SIZE = 32 * 1024  # deflate 윈도우 크기
+
+
+@lru_cache(maxsize=None)
+def load_dictionary(dictionary_id: int) -> bytes:
+    filename = DICTIONARY_FILES.get(dictionary_id) if dictionary_id > DEFLATE else None
+    if filename is None:
+        raise ValueError(f"Unknown compression dictionary id: {dictionary_id}")
+    return (Path(__file__).parent / filename).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def _decompressor_template(dictionary_id: int):
+    # 사전을 미리 적재한 객체를 copy() 해서 메시지마다 32KB 사전을 다시 읽지 않는다
+    return zlib.decompressobj(-15, zdict=load_dictionary(dictionary_id))
+
+
+class MessageCompressor:
+    """
+    암호화 전 메시지 압축 (zlib raw deflate, 사전이 등록되어 있으면 사전 사용).
+    사전을 쓰면 짧은 한국어 상담 문장도 자주 쓰이는 어절이 사전에 있어 압축 이득이 커진다.
+    """
+
+    def __init__(
+            self,
+            min_bytes: int = DEFAULT_MIN_BYTES,
+            level: int = DEFAULT_LEVEL,
+            dictionary_id: Optional[int] = ACTIVE_DICTIONARY_ID,
+    ):
+        self.min_bytes = min_bytes
+        self.level = level
+        self.dictionary_id = dictionary_id
+        self.dictionary = load_dictionary(dictionary_id) if dictionary_id is not None else None
+        self._header = bytes((dictionary_id if dictionary_id is not None else DEFLATE,))
+        if self.dictionary is not None:
+            self._template = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=self.dictionary)
+        else:
+            self._template = zlib.compressobj(level, zlib.DEFLATED, -15)
+
+    def pack(self, data: bytes) -> bytes:
+        if len(data) >= self.min_bytes:
+            compressor = self._template.copy()
+            body = compressor.compress(data) + compressor.flush()
+            if len(body) < len(data):
+                return self._header + body
+        return bytes((RAW,)) + data
+
+    @staticmethod
+    def unpack(payload: bytes) -> bytes:
+        header, body = payload[0], payload[1:]
+        if header == RAW:
+            return body
+        if header == DEFLATE:
+            return zlib.decompress(body, -15)
+        decompressor = _decompressor_template(header).copy()
+        return decompressor.decompress(body) + decompressor.flush()
+
+
+def train_dictionary(samples: Iterable[str], size: int = MAX_DICTIONARY_SIZE, max_words: int = 4) -> bytes:
+    """
+    말뭉치에서 zlib 사전을 만든다.
+    여러 메시지에 반복해서 나오는 어절 n-gram 을 (등장 메시지 수 x 길이) 점수로 골라 size 까지 채우고,
+    deflate 는 가까운 위치의 일치를 더 짧게 표현하므로 점수가 높은 조각을 사전 끝쪽에 둔다.
+    """
+    document_frequency: Counter = Counter()
+    for sample in samples:
+        words = sample.split()
+        grams = set()
+        for n in range(1, max_words + 1):
+            for i in range(len(words) - n + 1):
+                grams.add(" ".join(words[i:i + n]))
+        document_frequency.update(grams)
+
+    scored = sorted(
+        ((count * len(gram.encode("utf-8")), gram) for gram, count in document_frequency.items() if count > 1),
+        reverse=True,
+    )
+
+    chosen: list[str] = []
+    joined = ""  # 이미 고른 조각에 포함된 n-gram 은 건너뛴다
+    used = 0
+    for _, gram in scored:
+        if gram in joined:
+            continue
+        piece = (gram + " ").encode("utf-8")
+        if used + len(piece) > size:
+            continue
+        chosen.append(gram)
+        joined += gram + "\n"
+        used += len(piece)
+        if size - used < 8:
+            break
+
+    return "".join(gram + " " for gram in reversed(chosen)).encode("utf-8")
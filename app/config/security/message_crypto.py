@@ -1,15 +1,69 @@
 import base64
 import os
+from typing import Iterable, Optional
 
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from app.config.security.message_compression import DEFAULT_MIN_BYTES, MessageCompressor
+
+# enc_version 별 암호화 방식
+ENC_VERSION_CBC = 1  # 기존: AES-256-CBC + PKCS7, 환경변수 AES_IV 고정 (읽기 전용)
+ENC_VERSION_GCM = 2  # AES-256-GCM, 메시지별 랜덤 96-bit nonce (iv 컬럼에 저장), 패딩 없음
+ENC_VERSION_GCM_ZLIB = 3  # 압축 페이로드(message_compression: 헤더 + raw deflate, 사전은 선택) 를 AES-256-GCM 으로 암호화
+
+# enc_version = key_id * KEY_VERSION_STRIDE + 방식
+# key_id 0 은 AES_KEY (기존 행의 1, 2 가 그대로 유지됨), 1 이상은 AES_KEYRING 의 키
+KEY_VERSION_STRIDE = 10
+LEGACY_KEY_ID = 0
+
+GCM_NONCE_SIZE = 12
+CBC_IV_SIZE = 16
+
+
+def make_enc_version(key_id: int, scheme: int) -> int:
+    return key_id * KEY_VERSION_STRIDE + scheme
+
+
+def split_enc_version(enc_version: int) -> tuple[int, int]:
+    """(key_id, 방식)"""
+    return divmod(enc_version, KEY_VERSION_STRIDE)
+
+
+def _load_keyring(raw: str) -> dict[int, bytes]:
+    """AES_KEYRING="1:<base64 key>,2:<base64 key>" 형식의 추가 키 목록"""
+    keys = {}
+    for entry in filter(None, (part.strip() for part in raw.split(","))):
+        key_id, _, key_b64 = entry.partition(":")
+        try:
+            key_id = int(key_id)
+            key = base64.b64decode(key_b64)
+        except Exception as e:
+            raise ValueError(f"Invalid AES_KEYRING entry {entry[:8]!r}...: {e}")
+        if key_id <= LEGACY_KEY_ID:
+            raise ValueError(f"AES_KEYRING key id must be >= 1 (0 is AES_KEY), got {key_id}")
+        if len(key) != 32:
+            raise ValueError(f"AES_KEYRING key {key_id} must be 32 bytes (got {len(key)} bytes)")
+        keys[key_id] = key
+    return keys
 
 
 class AESEncryption:
+    """
+    채팅 메시지 암호화 엔진.
+
+    새 메시지는 활성 키(AES_ACTIVE_KEY_ID)와 AES-GCM 으로 암호화하고, 복호화는 enc_version 에서
+    키와 방식을 골라 이전 키/기존 CBC 행도 그대로 읽는다 (키 교체 중에도 조회 가능).
+    키 스케줄(AESGCM/AES 알고리즘 객체)은 생성 시 한 번만 만들어 재사용한다.
 
+    MESSAGE_COMPRESSION_ENABLED 이면 메시지를 압축한 뒤 암호화한다(ENC_VERSION_GCM_ZLIB).
+    짧은 메시지는 압축 없이 헤더만 붙으므로 enc_version 은 메시지 길이와 무관하게 하나로 유지된다.
+    """
 
-    def __init__(self):
+    def __init__(self, compression: Optional[bool] = None):
 
         key_b64 = os.getenv("AES_KEY")
         iv_b64 = os.getenv("AES_IV")
@@ -31,39 +85,84 @@ class AESEncryption:
                 f"Failed to initialize encryption: Key must be 32 bytes for AES-256 "
                 f"(got {len(self.key)} bytes). Please check your AES_KEY in .env"
             )
-        if len(self.iv) != 16:
+        if len(self.iv) != CBC_IV_SIZE:
             raise ValueError(
                 f"Failed to initialize encryption: IV must be 16 bytes "
                 f"(got {len(self.iv)} bytes). Please check your AES_IV in .env"
             )
 
-        self.version = 1
-
-    def encrypt(self, plaintext: str) -> tuple[bytes, bytes]:
-        padder = padding.PKCS7(128).padder()
-        padded_data = padder.update(plaintext.encode('utf-8')) + padder.finalize()
-
-        cipher = Cipher(
-            algorithms.AES(self.key),
-            modes.CBC(self.iv),
-            backend=default_backend()
-        )
-        encryptor = cipher.encryptor()
-        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
-
-        return encrypted_data, self.iv
-
-    def decrypt(self, ciphertext: bytes, iv: bytes = None) -> str:
-
-        if iv is None:
+        keys = {LEGACY_KEY_ID: self.key, **_load_keyring(os.getenv("AES_KEYRING", ""))}
+        self.active_key_id = int(os.getenv("AES_ACTIVE_KEY_ID") or LEGACY_KEY_ID)
+        if self.active_key_id not in keys:
+            raise ValueError(f"AES_ACTIVE_KEY_ID {self.active_key_id} is not in AES_KEYRING")
+
+        # CBC 는 key 0 으로 쓰인 기존 행에만 존재한다
+        self._gcm = {key_id: AESGCM(key) for key_id, key in keys.items()}
+        self._aesgcm = self._gcm[self.active_key_id]
+        self._aes = algorithms.AES(self.key)
+        self._backend = default_backend()
+
+        if compression is None:
+            compression = os.getenv("MESSAGE_COMPRESSION_ENABLED", "false").lower() in ("1", "true", "yes")
+        self.compressor = MessageCompressor(
+            min_bytes=int(os.getenv("MESSAGE_COMPRESSION_MIN_BYTES") or DEFAULT_MIN_BYTES)
+        ) if compression else None
+        scheme = ENC_VERSION_GCM_ZLIB if self.compressor else ENC_VERSION_GCM
+        self.version = make_enc_version(self.active_key_id, scheme)
+
+    # ------------------------------------------------------------------
+    # 단건
+    # ------------------------------------------------------------------
+    def encrypt(self, plaintext: str, versioned: bool = True) -> tuple[bytes, bytes]:
+        """
+        (ciphertext + GCM tag, nonce) 반환. nonce 는 iv 컬럼에 저장한다.
+        versioned=False: enc_version 을 함께 저장하지 않는 값(채팅방 미리보기)이므로 압축하지 않는다.
+        """
+        data = plaintext.encode('utf-8')
+        if versioned and self.compressor:
+            data = self.compressor.pack(data)
+        nonce = os.urandom(GCM_NONCE_SIZE)
+        return self._aesgcm.encrypt(nonce, data, None), nonce
+
+    def decrypt(self, ciphertext: bytes, iv: bytes = None, enc_version: Optional[int] = None) -> str:
+        """
+        enc_version 이 없으면(미리보기 등 버전 컬럼이 없는 값) iv 길이로 방식을 판단하고,
+        GCM 이면 태그 검증에 성공하는 키를 찾는다.
+        """
+        if enc_version is None:
+            if iv and len(iv) == GCM_NONCE_SIZE:
+                return self._decrypt_any_key(ciphertext, iv)[1]
+            return self._decrypt_cbc(ciphertext, iv)
+
+        key_id, scheme = split_enc_version(enc_version)
+        if scheme == ENC_VERSION_GCM:
+            return self._aesgcm_for(key_id).decrypt(iv, ciphertext, None).decode('utf-8')
+        if scheme == ENC_VERSION_GCM_ZLIB:
+            return MessageCompressor.unpack(self._aesgcm_for(key_id).decrypt(iv, ciphertext, None)).decode('utf-8')
+        if scheme == ENC_VERSION_CBC and key_id == LEGACY_KEY_ID:
+            return self._decrypt_cbc(ciphertext, iv)
+        raise ValueError(f"Unsupported enc_version: {enc_version}")
+
+    def _aesgcm_for(self, key_id: int) -> AESGCM:
+        try:
+            return self._gcm[key_id]
+        except KeyError:
+            raise ValueError(f"Unknown encryption key id: {key_id} (check AES_KEYRING)")
+
+    def _decrypt_any_key(self, ciphertext: bytes, iv: bytes) -> tuple[int, str]:
+        """버전 정보가 없는 GCM 암호문: 활성 키부터 태그 검증에 성공하는 키로 복호화"""
+        for key_id in sorted(self._gcm, key=lambda k: k != self.active_key_id):
+            try:
+                return key_id, self._gcm[key_id].decrypt(iv, ciphertext, None).decode('utf-8')
+            except InvalidTag:
+                continue
+        raise ValueError("No key in the keyring can decrypt the ciphertext")
+
+    def _decrypt_cbc(self, ciphertext: bytes, iv: Optional[bytes]) -> str:
+        if not iv or len(iv) != CBC_IV_SIZE:
             iv = self.iv
 
-        cipher = Cipher(
-            algorithms.AES(self.key),
-            modes.CBC(iv),
-            backend=default_backend()
-        )
-        decryptor = cipher.decryptor()
+        decryptor = Cipher(self._aes, modes.CBC(iv), backend=self._backend).decryptor()
         decrypted_padded = decryptor.update(ciphertext) + decryptor.finalize()
 
         unpadder = padding.PKCS7(128).unpadder()
@@ -71,8 +170,68 @@ class AESEncryption:
 
         return decrypted_data.decode('utf-8')
 
+    # ------------------------------------------------------------------
+    # 일괄 (히스토리 로드 등에서 asyncio.to_thread 로 한 번에 실행)
+    # ------------------------------------------------------------------
+    def encrypt_many(self, plaintexts: Iterable[str]) -> list[tuple[bytes, bytes]]:
+        encrypt = self._aesgcm.encrypt
+        pack = self.compressor.pack if self.compressor else None
+        result = []
+        for plaintext in plaintexts:
+            data = plaintext.encode('utf-8')
+            if pack:
+                data = pack(data)
+            nonce = os.urandom(GCM_NONCE_SIZE)
+            result.append((encrypt(nonce, data, None), nonce))
+        return result
+
+    def decrypt_many(
+            self,
+            items: Iterable[tuple[bytes, Optional[bytes], Optional[int]]],
+            on_error: Optional[str] = None,
+    ) -> list[Optional[str]]:
+        """
+        items: (ciphertext, iv, enc_version)
+        복호화에 실패한 항목은 예외 대신 on_error 값으로 채운다.
+        """
+        result = []
+        for ciphertext, iv, enc_version in items:
+            if not ciphertext:
+                result.append("")
+                continue
+            try:
+                result.append(self.decrypt(ciphertext, iv, enc_version))
+            except Exception:
+                result.append(on_error)
+        return result
+
+    # ------------------------------------------------------------------
+    # 키 교체
+    # ------------------------------------------------------------------
+    def reencrypt(
+            self,
+            ciphertext: bytes,
+            iv: Optional[bytes],
+            enc_version: Optional[int],
+            versioned: bool = True,
+    ) -> Optional[tuple[bytes, bytes, Optional[int]]]:
+        """
+        활성 키/방식으로 다시 암호화한 (ciphertext, nonce, enc_version). 이미 활성 키/방식이면 None.
+        versioned=False 는 enc_version 컬럼이 없는 값(미리보기): 압축하지 않고 반환 버전도 None.
+        """
+        if versioned and enc_version == self.version:
+            return None
+        if enc_version is None and iv and len(iv) == GCM_NONCE_SIZE:
+            key_id, plaintext = self._decrypt_any_key(ciphertext, iv)
+            if not versioned and key_id == self.active_key_id:
+                return None
+        else:
+            plaintext = self.decrypt(ciphertext, iv, enc_version)
+        ciphertext, nonce = self.encrypt(plaintext, versioned=versioned)
+        return ciphertext, nonce, self.version if versioned else None
+
     def get_iv(self) -> bytes:
         return self.iv
 
     def get_version(self) -> int:
-        return self.version
\ No newline at end of file
+        return self.version
@@ -20,6 +20,8 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = ""
+    REDIS_POOL_SIZE: int = 32  # Async client connections per worker
+    REDIS_POOL_TIMEOUT: float = 2.0  # Seconds to wait for a free pooled connection
 
     # CORS
     CORS_ALLOWED_FRONTEND_URL: str
@@ -44,6 +46,18 @@ class Settings(BaseSettings):
     META_CLIENT_SECRET: str = ""
     META_REDIRECT_URI: str = ""
 
+    # OAuth - shared HTTP client (per-provider timeouts live on the provider classes)
+    OAUTH_HTTP2_ENABLED: bool = True  # Offer HTTP/2 via ALPN (needs the h2 package)
+    OAUTH_HTTP_MAX_CONNECTIONS: int = 20  # Pooled connections per worker, all providers
+    OAUTH_HTTP_KEEPALIVE_SECONDS: float = 60.0  # Idle time before a pooled connection is closed
+
+    # OAuth - OpenID Connect ID tokens (verified locally against the provider's JWKS)
+    OAUTH_ID_TOKEN_VERIFY_ENABLED: bool = True  # False: always call the userinfo endpoint
+    OAUTH_JWKS_TTL_SECONDS: float = 3600.0  # Key set lifetime when the response has no max-age
+    OAUTH_JWKS_MIN_REFRESH_SECONDS: float = 60.0  # Minimum interval between refetches for unknown kids
+    KAKAO_OIDC_ENABLED: bool = False  # Request the openid scope (enable OpenID Connect in Kakao Developers first)
+    META_OIDC_ENABLED: bool = False  # Request the openid scope (OpenID Connect must be enabled for the app)
+
     # Security
     CSRF_SECRET_KEY: str
     COOKIE_SECURE: bool = False  # Set True in production (HTTPS)
@@ -54,6 +68,15 @@ class Settings(BaseSettings):
     JWT_ENCRYPTION_KEY: str = ""  # Key for AES encryption of user-specific keys
     JWT_EXPIRY_HOURS: int = 12  # Token validity period in hours
     JWT_HTTPONLY: bool = True  # HttpOnly flag for JWT cookie
+    AUTH_BLACKLIST_CACHE_ENABLED: bool = False  # Per-worker blacklist copy synced via Redis pub/sub
+    AUTH_BLACKLIST_RECONCILE_SECONDS: int = 300  # Full reload interval of the blacklist copy
+
+    # Account profile cache (role/plan/MBTI/gender/status; in-process + Redis, invalidated via pub/sub)
+    ACCOUNT_PROFILE_CACHE_ENABLED: bool = False
+    ACCOUNT_PROFILE_CACHE_TTL_SECONDS: int = 600  # Redis entry lifetime (bounds staleness if an event is lost)
+    ACCOUNT_PROFILE_LOCAL_TTL_SECONDS: float = 60.0  # In-process entry lifetime
+    ACCOUNT_PROFILE_LOCAL_MAX_ENTRIES: int = 10000  # In-process LRU size per worker
+    ACCOUNT_PROFILE_CACHE_TOMBSTONE_SECONDS: float = 5.0  # No Redis fills for this long after an invalidation
 
     # Environment
     ENVIRONMENT: str = "local"  # local, staging, production
@@ -64,6 +87,54 @@ class Settings(BaseSettings):
     # Frontend URL for redirects after OAuth
     FRONTEND_URL: str
 
+    # LLM 비용 추정 (USD / 1K tokens)
+    LLM_INPUT_COST_PER_1K: float = 0.002
+    LLM_OUTPUT_COST_PER_1K: float = 0.008
+
+    # LLM 모델 라우팅 (짧은 인사/맞장구는 빠른 모델로, opt-in)
+    LLM_DEFAULT_MODEL: str = "gpt-4.1"
+    LLM_FAST_MODEL: str = "gpt-4.1-mini"
+    MODEL_ROUTING_ENABLED: bool = False
+
+    # Response Cache (첫 턴 응답 캐시, opt-in)
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_TTL_SECONDS: int = 86400
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2000
+    RESPONSE_CACHE_SIMILARITY_THRESHOLD: float = 0.9
+
+    # FAQ short-circuit (LLM 호출 전 FAQ 매칭, opt-in)
+    FAQ_SHORTCUT_ENABLED: bool = False
+    FAQ_SHORTCUT_THRESHOLD: float = 0.8
+    FAQ_INDEX_REFRESH_SECONDS: int = 300
+
+    # 공개 FAQ 목록 캐시 (전역 버전 키 + 워커 내 캐시, opt-in). ETag / 304 는 캐시와 무관하게 항상 적용
+    FAQ_LIST_CACHE_ENABLED: bool = False
+    FAQ_LIST_CACHE_TTL_SECONDS: int = 300  # 버전 변경이 없어도 이 시간 뒤 다시 읽음 (조회수 반영)
+    FAQ_LIST_VERSION_POLL_SECONDS: float = 1.0  # 다른 워커의 변경이 반영되기까지의 최대 지연
+    FAQ_LIST_CACHE_MAX_ENTRIES: int = 256
+
+    # FAQ 조회수 버퍼 (Redis HINCRBY 후 주기적으로 일괄 UPDATE, opt-in)
+    FAQ_VIEW_BUFFER_ENABLED: bool = False
+    FAQ_VIEW_FLUSH_SECONDS: float = 10.0  # DB 의 view_count 가 늦게 반영되는 최대 시간
+
+    # 대화 저장 write-behind (Redis Stream + 백그라운드 워커, opt-in)
+    CHAT_WRITE_BEHIND_ENABLED: bool = False
+    CHAT_WRITE_BEHIND_BATCH_SIZE: int = 100
+    CHAT_WRITE_BEHIND_MAX_ATTEMPTS: int = 5
+    CHAT_WRITE_BEHIND_RETRY_SECONDS: int = 5
+
+    # 채팅방 메타데이터 캐시 (소유자/상태/제목/head 메시지, Redis 공유 + 요청 단위 memo, opt-in)
+    ROOM_META_CACHE_ENABLED: bool = False
+    ROOM_META_CACHE_TTL_SECONDS: int = 300
+    ROOM_META_CACHE_TOMBSTONE_SECONDS: float = 2.0  # 무효화 후 이 시간 동안은 캐시를 채우지 않음
+
+    # 메시지 암호화 키 교체 시 재암호화 작업 (AES_KEYRING / AES_ACTIVE_KEY_ID 변경 후 실행)
+    CHAT_REENCRYPT_CHUNK_SIZE: int = 1000
+    CHAT_REENCRYPT_WORKERS: int = 4
+    CHAT_REENCRYPT_PAUSE_MS: int = 50
+    CHAT_REENCRYPT_REPLICA_DATABASE_URL: str = ""  # 비어 있으면 복제 지연 확인 생략
+    CHAT_REENCRYPT_MAX_REPLICA_LAG_SECONDS: int = 5
+
     # Qdrant Vector DB
     QDRANT_HOST: str = "localhost"
     QDRANT_PORT: int = 6333
@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends, Body, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, Body, HTTPException, UploadFile, File, Query
 import uuid
 
 from app.account.adapter.input.web.account_router import get_current_account_id
+from app.auth.adapter.input.web.dependencies import verify_admin_role
 from app.config.database.session import get_db_session
 from sqlalchemy.orm import Session
 
 # 전역 객체는 상태가 없는 것들만 유지
-from app.config.call_gpt import CallGPT
+from app.config.call_gpt import MAX_TOKENS, CallGPT
 from app.config.s3_service import S3Service
 from app.conversation.adapter.input.web.request.chat_feedback_request import ChatFeedbackRequest
+from app.conversation.adapter.input.web.response.chat_room_response import ChatRoomPageResponse
 from app.conversation.application.usecase.end_chat_usecase import EndChatUseCase
 from app.conversation.application.usecase.get_chat_room_status_usecase import GetChatRoomStatusUseCase
 from app.conversation.application.usecase.delete_chat_usecase import DeleteChatUseCase
@@ -20,10 +22,32 @@ from app.conversation.infrastructure.repository.chat_room_repository_impl import
 from app.conversation.infrastructure.repository.usage_meter_impl import UsageMeterImpl
 from app.config.security.message_crypto import AESEncryption
 from app.conversation.adapter.output.stream.stream_adapter import StreamAdapter
+from app.conversation.application.policy.model_routing_policy import ModelRoutingPolicy, ModelRoutingStats
+from app.conversation.infrastructure.cache.response_cache_impl import InMemoryResponseCache
+from app.conversation.infrastructure.queue.chat_write_behind_impl import chat_write_behind
+from app.conversation.infrastructure.job.chat_reencryption_job import ReencryptionCheckpoint
+from app.faq.infrastructure.index.faq_match_index import faq_match_index
+from app.config.prescreen import prescreen_engine
+from app.config.settings import settings
+
+DEFAULT_HISTORY_PAGE_SIZE = 30
+MAX_HISTORY_PAGE_SIZE = 100
+DEFAULT_ROOM_PAGE_SIZE = 20
+MAX_ROOM_PAGE_SIZE = 100
 
 crypto_service = AESEncryption()
 llm_chat_port = CallGPT()
 usage_meter = UsageMeterImpl()
+response_cache = InMemoryResponseCache() if settings.RESPONSE_CACHE_ENABLED else None
+faq_matcher = faq_match_index if settings.FAQ_SHORTCUT_ENABLED else None
+model_router = ModelRoutingPolicy(
+    default_model=settings.LLM_DEFAULT_MODEL,
+    fast_model=settings.LLM_FAST_MODEL,
+    enabled=settings.MODEL_ROUTING_ENABLED,
+    max_tokens=MAX_TOKENS,
+)
+model_routing_stats = ModelRoutingStats()
+write_behind = chat_write_behind if settings.CHAT_WRITE_BEHIND_ENABLED else None
 
 conversation_router = APIRouter(tags=["conversation"])
 
@@ -49,26 +73,42 @@ async def upload_file(
 
 @conversation_router.get("/rooms")
 async def get_my_rooms(
+        limit: int | None = Query(default=None, ge=1, le=MAX_ROOM_PAGE_SIZE, description="페이지 크기"),
+        cursor: str | None = Query(default=None, description="이전 응답의 next_cursor"),
         account_id: int = Depends(get_current_account_id),
         db: Session = Depends(get_db_session)  # 1. 세션 주입 필요
 ):
     # 2. 레포지토리에 현재 세션을 넣어서 생성
     room_repo = ChatRoomRepositoryImpl(db)
-    uc = GetChatRoomsUseCase(room_repo)
+    uc = GetChatRoomsUseCase(room_repo, crypto_service)
 
-    rooms = await uc.execute(account_id)
-    return rooms
+    # 페이지 파라미터가 없으면 기존 전체 목록 응답 유지
+    if limit is None and cursor is None:
+        rooms = await uc.execute(account_id)
+        return rooms
+
+    try:
+        page = await uc.execute_page(account_id, limit=limit or DEFAULT_ROOM_PAGE_SIZE, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
+    return ChatRoomPageResponse(**page)
 
 
 @conversation_router.post("/chat/stream-auto")
 async def stream_chat_auto(
         account_id: int = Depends(get_current_account_id),
-        message: str = Body(..., embed=True),
+        message: str | None = Body(default=None, embed=True),
         room_id: str | None = Body(default=None, embed=True),
         file_urls: list[str] = Body(default=[], embed=True),
         contents_type: str = Body(default="TEXT", embed=True),
+        parent_message_id: int | None = Body(default=None, embed=True),
+        regenerate_message_id: int | None = Body(default=None, embed=True),
         db: Session = Depends(get_db_session)
 ):
+    """
+    parent_message_id 가 있으면 해당 메시지 아래로 분기(메시지 수정 후 재질문)하고,
+    regenerate_message_id 가 있으면 해당 유저 메시지의 응답만 다시 생성합니다 (message 는 무시).
+    """
     from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
     from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
     from app.conversation.application.usecase.stream_chat_usecase import StreamChatUsecase
@@ -82,6 +122,15 @@ async def stream_chat_auto(
     # 프론트에서 'null' 문자열이 오거나 아예 없을 때를 대비
     is_new_room = room_id is None or room_id == "" or room_id == "null"
 
+    if message is None:
+        if regenerate_message_id is None:
+            raise HTTPException(status_code=422, detail="message 는 필수입니다.")
+        message = ""
+    if parent_message_id is not None and regenerate_message_id is not None:
+        raise HTTPException(status_code=400, detail="parent_message_id 와 regenerate_message_id 는 함께 사용할 수 없습니다.")
+    if is_new_room and (parent_message_id is not None or regenerate_message_id is not None):
+        raise HTTPException(status_code=400, detail="분기/재생성은 기존 채팅방에서만 가능합니다.")
+
     if is_new_room:
         current_room_id = str(uuid.uuid4())
         title_preview = message[:20].replace("\n", " ")
@@ -97,10 +146,17 @@ async def stream_chat_auto(
     else:
         current_room_id = room_id
         # 기존 방 존재 여부 확인
-        room_exists = await chat_room_repo.find_by_id(current_room_id)
+        room_exists = await chat_room_repo.find_meta(current_room_id)
         if not room_exists:
             raise HTTPException(status_code=404, detail="Room not found")
 
+        # 분기/재생성 대상은 스트리밍 시작 전에 검증 (스트림 도중에는 상태 코드를 바꿀 수 없음)
+        target_id = parent_message_id if parent_message_id is not None else regenerate_message_id
+        if target_id is not None:
+            target = await chat_message_repo.find_in_room(current_room_id, target_id)
+            if target is None or (regenerate_message_id is not None and str(target.role).upper() != "USER"):
+                raise HTTPException(status_code=404, detail="Message not found")
+
     # 2. UseCase 생성 (이미 검증된 current_room_id 사용)
     usecase = StreamChatUsecase(
         chat_room_repo=chat_room_repo,
@@ -109,7 +165,13 @@ async def stream_chat_auto(
         llm_chat_port=llm_chat_port,
         usage_meter=usage_meter,
         crypto_service=crypto_service,
-        s3_service=s3_service
+        s3_service=s3_service,
+        response_cache=response_cache,
+        faq_matcher=faq_matcher,
+        prescreen=prescreen_engine,
+        model_router=model_router,
+        routing_stats=model_routing_stats,
+        write_behind=write_behind,
     )
 
     generator = usecase.execute(
@@ -118,11 +180,62 @@ async def stream_chat_auto(
         message=message,
         contents_type=contents_type,
         file_urls=file_urls,
+        parent_message_id=parent_message_id,
+        regenerate_message_id=regenerate_message_id,
     )
 
     return StreamAdapter.to_streaming_response(generator)
 
 
+@conversation_router.get("/admin/response-cache/stats")
+async def get_response_cache_stats(
+        admin_id: int = Depends(verify_admin_role),
+):
+    """첫 턴 응답 캐시의 hit rate / 절감 지연시간 / 절감 비용 (워커 단위)"""
+    if response_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **response_cache.stats()}
+
+
+@conversation_router.get("/admin/model-routing/stats")
+async def get_model_routing_stats(
+        admin_id: int = Depends(verify_admin_role),
+):
+    """모델 라우팅 결과별 호출 수 / 평균 TTFT / 평균 응답 시간 (워커 단위)"""
+    return {"enabled": model_router.enabled, **model_routing_stats.stats()}
+
+
+@conversation_router.get("/admin/faq-shortcut/stats")
+async def get_faq_shortcut_stats(
+        admin_id: int = Depends(verify_admin_role),
+):
+    """FAQ short-circuit 로 회피한 LLM 호출 수 (워커 단위)"""
+    if faq_matcher is None:
+        return {"enabled": False}
+    return {"enabled": True, **faq_matcher.stats()}
+
+
+@conversation_router.get("/admin/write-behind/stats")
+async def get_write_behind_stats(
+        admin_id: int = Depends(verify_admin_role),
+):
+    """write-behind 스트림 길이 / 미확인(ack 전) 항목 수 / DLQ 적재 수"""
+    if write_behind is None:
+        return {"enabled": False}
+    return {"enabled": True, **write_behind.stats()}
+
+
+@conversation_router.get("/admin/reencryption/stats")
+async def get_reencryption_stats(
+        admin_id: int = Depends(verify_admin_role),
+):
+    """활성 키로의 재암호화 작업 진행 상황 (단계 / 커서 / 처리 건수)"""
+    return {
+        "active_key_id": crypto_service.active_key_id,
+        **ReencryptionCheckpoint(crypto_service.get_version()).load(),
+    }
+
+
 # 피드백 생성 (POST)
 @conversation_router.post("/feedback")
 async def add_feedback(
@@ -206,41 +319,68 @@ async def get_room_status(
 @conversation_router.get("/rooms/{room_id}/messages")
 async def get_room_messages(
         room_id: str,
+        before: int | None = Query(default=None, description="이 메시지 id 이전(과거) 페이지"),
+        after: int | None = Query(default=None, description="이 메시지 id 이후(최신) 페이지"),
+        limit: int | None = Query(default=None, ge=1, le=MAX_HISTORY_PAGE_SIZE, description="페이지 크기"),
         account_id: int = Depends(get_current_account_id),
         db: Session = Depends(get_db_session)
 ):
+    """
+    커서 파라미터(before/after/limit)가 없으면 기존처럼 방 전체 메시지 목록을 반환하고,
+    하나라도 있으면 해당 페이지만 복호화/URL 서명하여 커서와 함께 반환합니다.
+    """
     from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+    if before is not None and after is not None:
+        raise HTTPException(status_code=400, detail="before 와 after 는 함께 사용할 수 없습니다.")
+
     chat_message_repo = ChatMessageRepositoryImpl(db)
     s3_service = S3Service()
+    uc = GetChatMessagesUseCase(chat_message_repo, crypto_service, write_behind=write_behind)
+
+    if before is None and after is None and limit is None:
+        messages = await uc.execute(room_id, account_id)
+        return [_to_message_response(msg, s3_service) for msg in messages]
+
+    page = await uc.execute_page(
+        room_id, account_id, limit=limit or DEFAULT_HISTORY_PAGE_SIZE, before=before, after=after
+    )
+    page["messages"] = [_to_message_response(msg, s3_service) for msg in page["messages"]]
+    return page
+
+
+@conversation_router.get("/rooms/{room_id}/messages/path")
+async def get_room_message_path(
+        room_id: str,
+        head_id: int | None = Query(default=None, description="이 메시지까지의 분기 경로 (없으면 현재 활성 분기)"),
+        account_id: int = Depends(get_current_account_id),
+        db: Session = Depends(get_db_session)
+):
+    """
+    분기된 대화에서 head 메시지부터 루트까지의 경로만 반환합니다 (다른 분기의 메시지 제외).
+    """
+    from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+
+    room = await ChatRoomRepositoryImpl(db).find_meta(room_id)
+    if room is None:
+        raise HTTPException(status_code=404, detail="Room not found")
+
+    s3_service = S3Service()
+    uc = GetChatMessagesUseCase(ChatMessageRepositoryImpl(db), crypto_service, write_behind=write_behind)
+    messages = await uc.execute_path(room_id, account_id, head_id=head_id, room_head_id=room.last_message_id)
+    return [_to_message_response(msg, s3_service) for msg in messages]
+
+
+def _to_message_response(msg: dict, s3_service) -> dict:
+    raw_urls = msg.get("file_urls", [])
+
+    converted_urls = []
+    if raw_urls and isinstance(raw_urls, list):
+        converted_urls = [s3_service.get_signed_url(u) for u in raw_urls]
 
-    uc = GetChatMessagesUseCase(chat_message_repo, crypto_service)
-    messages = await uc.execute(room_id, account_id)
-
-    result = []
-    for msg in messages:
-        if isinstance(msg, dict):
-            role = msg.get("role")
-            content = msg.get("content")
-            message_id = msg.get("message_id") or msg.get("id")
-            user_feedback = msg.get("user_feedback")
-            raw_urls = msg.get("file_urls", [])
-        else:
-            role = getattr(msg, "role", None)
-            content = getattr(msg, "content", None)
-            message_id = getattr(msg, "message_id", getattr(msg, "id", None))
-            user_feedback = getattr(msg, "user_feedback", None)
-            raw_urls = getattr(msg, "file_urls", [])
-
-        converted_urls = []
-        if raw_urls and isinstance(raw_urls, list):
-            converted_urls = [s3_service.get_signed_url(u) for u in raw_urls]
-
-        result.append({
-            "message_id": message_id,
-            "role": role,
-            "content": content,
-            "user_feedback": user_feedback,
-            "file_urls": converted_urls
-        })
-
-    return result
\ No newline at end of file
+    return {
+        "message_id": msg.get("message_id"),
+        "role": msg.get("role"),
+        "content": msg.get("content"),
+        "user_feedback": msg.get("user_feedback"),
+        "file_urls": converted_urls
+    }
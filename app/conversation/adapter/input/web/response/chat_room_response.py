@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -7,3 +9,20 @@ class ChatRoomResponse(BaseModel):
     title: str
     status: str
     created_at: datetime
+
+
+class ChatRoomSummaryResponse(BaseModel):
+    room_id: str
+    title: Optional[str] = None
+    status: Optional[str] = None
+    category: Optional[str] = None
+    created_at: Optional[datetime] = None
+    last_message_at: Optional[datetime] = None
+    message_count: int = 0
+    preview: Optional[str] = None
+
+
+class ChatRoomPageResponse(BaseModel):
+    rooms: List[ChatRoomSummaryResponse]
+    has_more: bool
+    next_cursor: Optional[str] = None
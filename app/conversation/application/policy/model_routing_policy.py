@@ -0,0 +1,111 @@
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.conversation.application.policy.usage_policy import UsagePolicy
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    model: str
+    max_tokens: Optional[int]  # None 이면 MAX_TOKENS 환경 변수 사용
+    reason: str
+
+
+class ModelRoutingPolicy:
+    """
+    요금제/메시지 복잡도에 따라 턴마다 사용할 모델과 max_tokens 를 결정한다.
+    짧은 인사/맞장구는 빠른 모델로, 나머지는 기본 모델로 보낸다.
+    요금제/빠른 경로의 상한은 전역 상한(max_tokens, 보통 MAX_TOKENS 환경 변수)을 넘지 않는다.
+    """
+
+    # 인사/맞장구/감사 표현만으로 이루어진 메시지 (공백 제거 후 전체 일치)
+    TRIVIAL_RE = re.compile(
+        r"(?:안녕(?:하세요|하십니까)?|반가워|반갑습니다|하이|헬로|hi|hello|hey|ㅎㅇ|"
+        r"응|웅|네|넵|예|그래|알겠어|알겠습니다|알았어|오케이|ok|okay|ㅇㅇ|ㅇㅋ|"
+        r"고마워|고맙습니다|감사해|감사합니다|땡큐|thx|thanks|ㄱㅅ|좋아|좋네|맞아|그렇구나|"
+        r"요|[ㅋㅎㅠㅜ~!.?^])+",
+        re.IGNORECASE,
+    )
+    TRIVIAL_MAX_CHARS = 20
+    FAST_MAX_TOKENS = 300
+
+    # 히스토리가 깊거나 메시지가 길면 맥락 유지를 위해 항상 기본 모델
+    DEEP_HISTORY_DEPTH = 20
+    LONG_MESSAGE_TOKENS = 500
+
+    # 요금제별 응답 길이 상한 (None 은 환경 변수 기본값)
+    PLAN_MAX_TOKENS = {
+        "FREE": 800,
+        "PRO": None,
+        "TEAM": None,
+    }
+
+    def __init__(self, default_model: str, fast_model: str, enabled: bool = True, max_tokens: Optional[int] = None):
+        self.default_model = default_model
+        self.fast_model = fast_model
+        self.enabled = enabled
+        self.max_tokens = max_tokens
+
+    def _cap(self, max_tokens: Optional[int]) -> Optional[int]:
+        # 상한이 전역 값보다 크면 오히려 유료 요금제보다 길게 답하게 되므로 전역 값으로 줄인다
+        if max_tokens is None or self.max_tokens is None:
+            return max_tokens
+        return min(max_tokens, self.max_tokens)
+
+    def route(
+            self,
+            plan: Optional[str],
+            message: str,
+            history_depth: int,
+            has_images: bool,
+    ) -> ModelRoute:
+        plan_max_tokens = self._cap(self.PLAN_MAX_TOKENS.get(plan or "FREE"))
+
+        if not self.enabled:
+            return ModelRoute(self.default_model, None, "disabled")
+        if has_images:
+            return ModelRoute(self.default_model, plan_max_tokens, "images")
+        if UsagePolicy.calculate_token(message) >= self.LONG_MESSAGE_TOKENS:
+            return ModelRoute(self.default_model, plan_max_tokens, "long_message")
+        if history_depth >= self.DEEP_HISTORY_DEPTH:
+            return ModelRoute(self.default_model, plan_max_tokens, "deep_history")
+
+        compact = "".join(message.split())
+        if len(compact) <= self.TRIVIAL_MAX_CHARS and self.TRIVIAL_RE.fullmatch(compact):
+            return ModelRoute(self.fast_model, self._cap(self.FAST_MAX_TOKENS), "trivial")
+
+        return ModelRoute(self.default_model, plan_max_tokens, "default")
+
+
+class ModelRoutingStats:
+    """라우팅 결과별 호출 수와 지연시간(TTFT/전체) 집계 (워커 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[tuple, dict] = defaultdict(
+            lambda: {"calls": 0, "ttft_ms_total": 0.0, "total_ms_total": 0.0}
+        )
+
+    def record(self, route: ModelRoute, ttft_ms: float, total_ms: float) -> None:
+        with self._lock:
+            bucket = self._buckets[(route.model, route.reason)]
+            bucket["calls"] += 1
+            bucket["ttft_ms_total"] += ttft_ms
+            bucket["total_ms_total"] += total_ms
+
+    def stats(self) -> dict:
+        with self._lock:
+            routes = [
+                {
+                    "model": model,
+                    "reason": reason,
+                    "calls": b["calls"],
+                    "avg_ttft_ms": round(b["ttft_ms_total"] / b["calls"], 1),
+                    "avg_total_ms": round(b["total_ms_total"] / b["calls"], 1),
+                }
+                for (model, reason), b in self._buckets.items()
+            ]
+        return {"routes": sorted(routes, key=lambda r: -r["calls"])}
@@ -1,4 +1,23 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from app.conversation.domain.chat_message.entity import ChatMessage
+
+
+class ChatHistoryRow(NamedTuple):
+    """히스토리 조회용 경량 행 (ORM 객체 대신 필요한 컬럼만 투영)"""
+    id: int
+    room_id: str
+    account_id: int
+    role: str
+    content_enc: bytes
+    iv: bytes
+    enc_version: Optional[int]
+    contents_type: Optional[str]
+    file_urls: Optional[list]
+    created_at: datetime
+    satisfaction: Optional[object]  # Satisfaction enum (피드백 없으면 None)
 
 
 class ChatMessageRepositoryPort(ABC):
@@ -8,9 +27,52 @@ class ChatMessageRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def find_by_room_id(self, room_id: str):
+    async def save_turn(self, user: dict, assistant: dict, parent_id: Optional[int]):
+        """한 턴의 유저/AI 메시지를 한 번에 저장하고 (user, assistant) 를 반환"""
+        pass
+
+    @abstractmethod
+    async def find_saved_turn_ids(self, room_id: str, turn_ids: list[str]) -> set[str]:
+        """turn_ids 중 이미 저장된 write-behind 턴의 id"""
+        pass
+
+    @abstractmethod
+    async def find_in_room(self, room_id: str, message_id: int):
+        """방에 속한 메시지 한 건 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    async def find_path(self, room_id: str, head_id: int) -> list[ChatMessage]:
+        """head 에서 parent_id 를 따라 루트까지의 활성 경로 (루트 -> head 순서)"""
+        pass
+
+    @abstractmethod
+    async def find_history_path(self, room_id: str, account_id: int, head_id: int) -> list[ChatHistoryRow]:
+        """활성 경로만 피드백과 함께 투영 조회 (루트 -> head 순서)"""
+        pass
+
+    @abstractmethod
+    async def find_by_room_id(self, room_id: str) -> list[ChatMessage]:
+        """방 전체 메시지 (id 오름차순)"""
         pass
 
     @abstractmethod
     async def find_by_room_id_with_feedback(self, room_id: str, account_id: int):
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def find_history(self, room_id: str, account_id: int) -> list[ChatHistoryRow]:
+        """메시지 + 본인 피드백 + 첨부 정보를 단일 쿼리로 조회"""
+        pass
+
+    @abstractmethod
+    async def find_history_page(
+            self,
+            room_id: str,
+            account_id: int,
+            limit: int,
+            before: Optional[int] = None,
+            after: Optional[int] = None,
+    ) -> tuple[list[ChatHistoryRow], bool]:
+        """id 커서 기반 히스토리 페이지 조회 (id 오름차순 행, 추가 페이지 존재 여부)"""
+        pass
@@ -1,5 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class ChatRoomSummaryRow(NamedTuple):
+    """채팅방 목록 조회용 경량 행"""
+    room_id: str
+    title: Optional[str]
+    status: Optional[str]
+    category: Optional[str]
+    created_at: datetime
+    last_message_id: Optional[int]
+    last_message_at: Optional[datetime]
+    message_count: int
+    preview_enc: Optional[bytes]
+    preview_iv: Optional[bytes]
+
+
+class ChatRoomMeta(NamedTuple):
+    """소유자 확인 / 상태 / head 조회용 채팅방 메타데이터"""
+    room_id: str
+    account_id: int
+    status: Optional[str]
+    title: Optional[str]
+    last_message_id: Optional[int]
 
 
 class ChatRoomRepositoryPort(ABC):
@@ -20,6 +44,11 @@ class ChatRoomRepositoryPort(ABC):
     async def find_by_id(self, room_id: str):
         pass
 
+    @abstractmethod
+    async def find_meta(self, room_id: str) -> Optional[ChatRoomMeta]:
+        """채팅방 메타데이터 (캐시 사용, 같은 요청 안에서는 한 번만 로드)"""
+        pass
+
     @abstractmethod
     async def end_room(self, room_id: str) -> None:
         pass
@@ -34,4 +63,27 @@ class ChatRoomRepositoryPort(ABC):
 
     @abstractmethod
     async def find_status_by_room_id(self, room_id: str, account_id: int) -> str:
-        ...
\ No newline at end of file
+        ...
+
+    @abstractmethod
+    async def touch_activity(
+        self,
+        room_id: str,
+        last_message_id: int,
+        last_message_at: datetime,
+        added_count: int,
+        preview_enc: Optional[bytes],
+        preview_iv: Optional[bytes],
+    ) -> None:
+        """메시지 저장 시 방의 활동 정보를 단일 UPDATE 로 갱신 (commit 은 호출자 트랜잭션에 맡김)"""
+        pass
+
+    @abstractmethod
+    async def find_page_by_account_id(
+        self,
+        account_id: int,
+        limit: int,
+        cursor: Optional[tuple[datetime, str]] = None,
+    ) -> tuple[list[ChatRoomSummaryRow], bool]:
+        """최근 활동순 keyset 페이지 조회 (행 목록, 다음 페이지 존재 여부)"""
+        pass
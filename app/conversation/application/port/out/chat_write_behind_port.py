@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class PendingChatMessage:
+    """DB 반영 전 write-behind 큐에 있는 메시지 (암호문 그대로)"""
+    role: str
+    content_enc: bytes
+    iv: bytes
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class PendingTurn:
+    """
+    한 턴(유저 메시지 + AI 응답)의 저장/방 활동 갱신/사용량 기록 이벤트.
+    parent_id 는 DB 반영 시점의 채팅방 head 로 채워진다.
+    """
+    turn_id: str
+    room_id: str
+    account_id: int
+    contents_type: str
+    enc_version: int
+    user: PendingChatMessage
+    assistant: PendingChatMessage
+    preview_enc: bytes
+    preview_iv: bytes
+    input_length: int
+    output_length: int
+    file_urls: List[str] = field(default_factory=list)
+
+
+class ChatWriteBehindPort(ABC):
+    """
+    스트리밍이 끝난 턴을 DB 대신 내구성 있는 큐에 적재하고,
+    별도 워커가 일괄 저장하는 write-behind 포트
+    """
+
+    @abstractmethod
+    async def enqueue(self, turn: PendingTurn) -> None:
+        """턴을 큐와 방별 대기 목록에 원자적으로 적재"""
+        pass
+
+    @abstractmethod
+    async def pending_for_room(self, room_id: str) -> List[PendingTurn]:
+        """아직 DB 에 반영되지 않은 방의 턴 (작성 순)"""
+        pass
+
+    @abstractmethod
+    async def drain_room(self, room_id: str, chat_room_repo, chat_message_repo) -> List[PendingTurn]:
+        """
+        방의 대기 턴을 주어진 세션으로 즉시 반영하고 커밋.
+        다음 턴의 parent_id(채팅방 head)가 정확하도록 새 턴 처리 전에 호출한다.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Optional[dict]:
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class FaqMatch:
+    faq_id: int
+    question: str
+    answer: str
+    score: float
+
+
+class FaqMatcherPort(ABC):
+    """
+    LLM 호출 전에 공개 FAQ 로 답할 수 있는 질문인지 판별하는 포트
+    """
+
+    @abstractmethod
+    def match(self, message: str) -> Optional[FaqMatch]:
+        """임계값 이상으로 일치하는 FAQ 가 있으면 반환"""
+        pass
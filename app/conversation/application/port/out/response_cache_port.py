@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """캐시에 저장된 첫 턴 응답"""
+    answer: str
+    generation_ms: float
+    prompt_tokens: int
+    completion_tokens: int
+    exact: bool = True
+
+
+class ResponseCachePort(ABC):
+    """
+    히스토리/첨부파일이 없는 첫 턴 질문에 대한 응답 캐시.
+    variant 는 MBTI/성별 등 프롬프트 분기를 구분하는 값이다.
+    """
+
+    @abstractmethod
+    def lookup(self, message: str, variant: str) -> Optional[CachedResponse]:
+        pass
+
+    @abstractmethod
+    def store(
+        self,
+        message: str,
+        variant: str,
+        answer: str,
+        generation_ms: float,
+        prompt_tokens: int,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """hit rate, 절감 지연시간, 절감 비용 리포트"""
+        pass
@@ -3,7 +3,7 @@ class DeleteChatUseCase:
         self.chat_room_repo = chat_room_repo
 
     async def execute(self, room_id: str, account_id: int) -> bool:
-        room = await self.chat_room_repo.find_by_id(room_id)
+        room = await self.chat_room_repo.find_meta(room_id)
 
         if not room:
             return False
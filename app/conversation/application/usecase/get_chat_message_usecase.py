@@ -1,59 +1,133 @@
-from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
+import asyncio
+from typing import Optional
+
+from fastapi import HTTPException
+
+from app.conversation.application.port.out.chat_message_repository_port import ChatHistoryRow
 from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
 from app.config.security.message_crypto import AESEncryption
 
+# 이 개수 이상이면 복호화를 스레드 풀에서 일괄 처리 (이벤트 루프 점유 방지)
+DECRYPT_OFFLOAD_THRESHOLD = 64
+DECRYPT_ERROR_TEXT = "[복호화 오류]"
+
+
 class GetChatMessagesUseCase:
-    def __init__(self, chat_message_repo: ChatMessageRepositoryImpl, crypto_service: AESEncryption):
+    def __init__(self, chat_message_repo: ChatMessageRepositoryImpl, crypto_service: AESEncryption, write_behind=None):
         self.chat_message_repo = chat_message_repo
         self.crypto_service = crypto_service
+        self.write_behind = write_behind
 
     async def execute(self, room_id: str, account_id: int):
         """
         채팅방의 메시지를 조회하고 복호화하여 반환합니다.
         """
-        # 1. DB에서 해당 방의 모든 메시지 조회
-        messages = await self.chat_message_repo.find_by_room_id(room_id)
-        decrypted = []
-
-        for m in messages:
-            content_text = ""
-
-            fb = self.chat_message_repo.db.query(ChatFeedbackOrm).filter(
-                ChatFeedbackOrm.message_id == getattr(m, 'id', None),
-                ChatFeedbackOrm.account_id == account_id
-            ).first()
-            user_feedback_value = fb.satisfaction.value if fb else None
-
-            # ORM 객체(m)에서 직접 컬럼에 접근 (getattr를 활용해 안전하게 추출)
-            # m.content_enc, m.iv, m.message_id 등의 필드명을 가정합니다.
-            content_enc = getattr(m, 'content_enc', None)
-            iv = getattr(m, 'iv', None)
-
-            # 2. 메시지 복호화 로직
-            if not content_enc:
-                content_text = ""
-            else:
-                try:
-                    target_iv = iv if (iv and len(iv) == 16) else None
-                    content_text = self.crypto_service.decrypt(
-                        ciphertext=content_enc,
-                        iv=target_iv
-                    )
-                except Exception as e:
-                    msg_id = getattr(m, 'message_id', getattr(m, 'id', 'unknown'))
-                    content_text = "[복호화 오류]"
-
-            # 3. 반환 데이터 조립
-            decrypted.append({
-                "message_id": getattr(m, 'message_id', getattr(m, 'id', None)),
-                "room_id": m.room_id,
-                "account_id": m.account_id,
-                "role": m.role.value if hasattr(m.role, 'value') else str(m.role),
-                "content": content_text,
-                "contents_type": getattr(m, 'contents_type', getattr(m, 'content_type', 'TEXT')),
-                "created_at": m.created_at,
-                "user_feedback": user_feedback_value,
-                "file_urls": getattr(m, 'file_urls', []) or [],
-            })
-
-        return decrypted
\ No newline at end of file
+        # 1. 메시지 + 본인 피드백을 단일 쿼리로 조회 (메시지별 피드백 쿼리 없음)
+        rows = await self.chat_message_repo.find_history(room_id, account_id)
+        return await self._to_dicts(rows + await self._pending_rows(room_id, account_id))
+
+    async def execute_path(
+            self,
+            room_id: str,
+            account_id: int,
+            head_id: Optional[int],
+            room_head_id: Optional[int],
+    ) -> list:
+        """
+        head_id(없으면 채팅방 head)에서 루트까지의 활성 경로만 조회/복호화합니다.
+        """
+        if head_id is None:
+            if room_head_id is None:
+                # 활동 컬럼이 채워지기 전의 기존 방: 분기가 없으므로 전체 목록과 동일
+                return await self.execute(room_id, account_id)
+            rows = await self.chat_message_repo.find_history_path(room_id, account_id, room_head_id)
+            # 현재 활성 분기 끝에만 아직 DB 에 반영되지 않은 메시지를 덧붙인다
+            rows += await self._pending_rows(room_id, account_id)
+        else:
+            rows = await self.chat_message_repo.find_history_path(room_id, account_id, head_id)
+            if not rows:
+                raise HTTPException(status_code=404, detail="Message not found")
+        return await self._to_dicts(rows)
+
+    async def execute_page(
+            self,
+            room_id: str,
+            account_id: int,
+            limit: int,
+            before: Optional[int] = None,
+            after: Optional[int] = None,
+    ) -> dict:
+        """
+        id 커서 기반으로 한 페이지만 조회/복호화합니다.
+        before/after 가 모두 없으면 가장 최신 페이지를 반환합니다.
+        """
+        rows, has_more = await self.chat_message_repo.find_history_page(
+            room_id, account_id, limit=limit, before=before, after=after
+        )
+        messages = await self._to_dicts(rows)
+
+        if after is not None:
+            # 최신 방향으로 읽은 경우: 이전 페이지는 항상 존재 (after 커서 자체가 이전 메시지)
+            has_older, has_newer = True, has_more
+        else:
+            has_older, has_newer = has_more, before is not None
+
+        page = {
+            "messages": messages,
+            "has_older": has_older,
+            "has_newer": has_newer,
+            "before_cursor": messages[0]["message_id"] if messages else before,
+            "after_cursor": messages[-1]["message_id"] if messages else after,
+        }
+
+        # 최신 페이지에만 아직 DB 에 반영되지 않은 메시지를 덧붙인다 (커서는 DB 메시지 기준 유지)
+        if not has_newer:
+            messages.extend(await self._to_dicts(await self._pending_rows(room_id, account_id)))
+        return page
+
+    async def _pending_rows(self, room_id: str, account_id: int) -> list:
+        """write-behind 대기 턴을 히스토리 행 형태로 변환 (message_id 는 아직 없음)"""
+        if self.write_behind is None:
+            return []
+        rows = []
+        for turn in await self.write_behind.pending_for_room(room_id):
+            if turn.account_id != account_id:
+                continue
+            for msg, file_urls in ((turn.user, turn.file_urls), (turn.assistant, [])):
+                rows.append(ChatHistoryRow(
+                    id=None,
+                    room_id=turn.room_id,
+                    account_id=turn.account_id,
+                    role=msg.role,
+                    content_enc=msg.content_enc,
+                    iv=msg.iv,
+                    enc_version=turn.enc_version,
+                    contents_type=turn.contents_type,
+                    file_urls=file_urls,
+                    created_at=msg.created_at,
+                    satisfaction=None,
+                ))
+        return rows
+
+    async def _to_dicts(self, rows: list) -> list[dict]:
+        # 메시지 복호화 로직 (enc_version 별 방식 선택은 crypto_service 가 처리)
+        items = [(m.content_enc, m.iv, m.enc_version) for m in rows]
+        if len(items) >= DECRYPT_OFFLOAD_THRESHOLD:
+            texts = await asyncio.to_thread(self.crypto_service.decrypt_many, items, DECRYPT_ERROR_TEXT)
+        else:
+            texts = self.crypto_service.decrypt_many(items, DECRYPT_ERROR_TEXT)
+        return [self._to_dict(m, text) for m, text in zip(rows, texts)]
+
+    @staticmethod
+    def _to_dict(m, content_text: str) -> dict:
+        return {
+            "message_id": m.id,
+            "room_id": m.room_id,
+            "account_id": m.account_id,
+            "role": m.role,
+            "content": content_text,
+            "contents_type": m.contents_type or "TEXT",
+            "created_at": m.created_at,
+            "user_feedback": m.satisfaction.value if m.satisfaction else None,
+            "file_urls": m.file_urls or [],
+        }
@@ -1,10 +1,83 @@
+import base64
+from datetime import datetime
+from typing import Optional
+
 from app.conversation.application.port.out.chat_room_repository_port import ChatRoomRepositoryPort
+from app.conversation.domain.chat_room.policy import ChatRoomPolicy
 
 
 class GetChatRoomsUseCase:
 
-    def __init__(self, chat_room_repo: ChatRoomRepositoryPort):
+    def __init__(self, chat_room_repo: ChatRoomRepositoryPort, crypto_service=None):
         self.chat_room_repo = chat_room_repo
+        self.crypto_service = crypto_service
 
     async def execute(self, account_id: int):
-        return await self.chat_room_repo.find_by_account_id(account_id)
\ No newline at end of file
+        rooms = await self.chat_room_repo.find_by_account_id(account_id)
+        # ORM 객체 대신 응답 필드만 담은 dict 반환 (암호화된 미리보기 바이트가 직렬화되지 않도록)
+        return [
+            {
+                "room_id": r.room_id,
+                "account_id": r.account_id,
+                "title": r.title,
+                "category": r.category,
+                "division": r.division,
+                "out_api": r.out_api,
+                "status": r.status,
+                "created_at": r.created_at,
+                "updated_at": r.updated_at,
+                "last_message_at": r.last_message_at,
+                "message_count": r.message_count or 0,
+                "preview": self._decrypt_preview(r.preview_enc, r.preview_iv),
+            }
+            for r in rooms
+        ]
+
+    async def execute_page(self, account_id: int, limit: int, cursor: Optional[str] = None) -> dict:
+        """최근 활동순 채팅방 한 페이지 + 다음 페이지 커서"""
+        rows, has_more = await self.chat_room_repo.find_page_by_account_id(
+            account_id, limit=limit, cursor=self.decode_cursor(cursor) if cursor else None
+        )
+
+        rooms = [
+            {
+                "room_id": r.room_id,
+                "title": r.title,
+                "status": r.status,
+                "category": r.category,
+                "created_at": r.created_at,
+                "last_message_at": r.last_message_at,
+                "message_count": r.message_count,
+                "preview": self._decrypt_preview(r.preview_enc, r.preview_iv),
+            }
+            for r in rows
+        ]
+
+        next_cursor = None
+        if has_more and rows and rows[-1].last_message_at is not None:
+            next_cursor = self.encode_cursor(rows[-1].last_message_at, rows[-1].room_id)
+
+        return {"rooms": rooms, "has_more": has_more, "next_cursor": next_cursor}
+
+    def _decrypt_preview(self, preview_enc: Optional[bytes], preview_iv: Optional[bytes]) -> Optional[str]:
+        if not preview_enc or self.crypto_service is None:
+            return None
+        try:
+            # 마이그레이션으로 채운 미리보기는 메시지 전문이므로 길이를 맞춘다
+            return ChatRoomPolicy.preview_of(self.crypto_service.decrypt(ciphertext=preview_enc, iv=preview_iv))
+        except Exception:
+            return None
+
+    @staticmethod
+    def encode_cursor(last_message_at: datetime, room_id: str) -> str:
+        raw = f"{last_message_at.isoformat()}|{room_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            last_at, room_id = raw.split("|", 1)
+            return datetime.fromisoformat(last_at), room_id
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError("invalid cursor") from e
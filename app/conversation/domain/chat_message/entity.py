@@ -1,39 +1,38 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List
 
 from .enums import MessageRole, ContentType
 from .value_object import EncryptedContent
 
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
 
+
+@dataclass(slots=True)
 class ChatMessage:
     """
     chat_msg 테이블에 1:1 대응
+    읽기 경로에서는 ORM 객체 대신 필요한 컬럼만 투영하여 생성한다 (__slots__, 식별자 맵/계측 없음).
     """
 
-    def __init__(
-        self,
-        message_id: int | None,
-        room_id: str,
-        account_id: int,
-        role: MessageRole,
-        content: EncryptedContent,
-        content_type: ContentType,
-        created_at: datetime,
-        parent_id: int | None = None,
-        updated_at: datetime | None = None,
-        file_urls: List[str] | None = None,
-    ):
-        self.message_id = message_id
-        self.room_id = room_id
-        self.account_id = account_id
-        self.role = role
-
-        self.content = content
-        self.content_type = content_type
-        self.file_urls = file_urls if file_urls is not None else []
-        self.created_at = created_at
-        self.parent_id = parent_id
-        self.updated_at = updated_at
+    message_id: int | None
+    room_id: str
+    account_id: int
+    role: MessageRole
+    content: EncryptedContent
+    content_type: ContentType
+    created_at: datetime
+    parent_id: int | None = None
+    updated_at: datetime | None = None
+    file_urls: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.file_urls is None:
+            self.file_urls = []
+
+    @property
+    def is_assistant(self) -> bool:
+        return self.role is MessageRole.ASSISTANT
 
     def has_files(self) -> bool:
         """첨부된 파일이 있는지 확인"""
@@ -41,10 +40,8 @@ class ChatMessage:
 
     def get_image_urls(self) -> List[str]:
         """이미지 파일만 필터링"""
-        image_extensions = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
-        return [url for url in self.file_urls if url.lower().endswith(image_extensions)]
+        return [url for url in self.file_urls if url.lower().endswith(_IMAGE_EXTENSIONS)]
 
     def get_document_urls(self) -> List[str]:
         """이미지 외의 문서 파일만 필터링"""
-        image_urls = self.get_image_urls()
-        return [url for url in self.file_urls if url not in image_urls]
\ No newline at end of file
+        return [url for url in self.file_urls if not url.lower().endswith(_IMAGE_EXTENSIONS)]
@@ -2,6 +2,13 @@ class ChatRoomPolicy:
     """
     채팅방 생성/유지 관련 순수 규칙
     """
+    # 채팅방 목록에 노출할 마지막 메시지 미리보기 길이(문자 수)
+    PREVIEW_LENGTH = 50
+
     @staticmethod
     def can_create_room(current_room_count: int, max_allowed: int) -> bool:
-        return current_room_count < max_allowed
\ No newline at end of file
+        return current_room_count < max_allowed
+
+    @classmethod
+    def preview_of(cls, text: str) -> str:
+        return text[:cls.PREVIEW_LENGTH]
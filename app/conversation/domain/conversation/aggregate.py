@@ -1,36 +1,43 @@
+_LLM_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+
 class Conversation:
-    def __init__(self, room, messages):
+    def __init__(self, room, messages, head_id: int | None = None):
+        # messages: 루트 -> head 순서의 ChatMessage 엔티티 (head_id 가 주어지면 해당 메시지 아래로 분기)
         self.room = room
         self.messages = messages
+        self.head_id = head_id
 
     def get_last_id(self) -> int | None:
         """현재 방의 마지막 메시지 ID 추출 (다음 메시지의 부모)"""
+        if self.head_id is not None:
+            return self.head_id
+        # 채팅방 head(last_message_id)가 기준, 활동 컬럼이 채워지기 전의 방만 메시지에서 계산
+        head = getattr(self.room, "last_message_id", None)
+        if head is not None:
+            return head
         if not self.messages:
             return None
-        # ORM 객체의 id 필드 기준
-        return max([m.id for m in self.messages])
+        return self.messages[-1].message_id
 
     def is_active(self) -> bool:
         # ChatRoomOrm의 status 필드 확인
         return getattr(self.room, "status", "ACTIVE") == "ACTIVE"
 
+    def _decrypted(self, crypto_service):
+        """경로의 메시지를 한 번에 복호화하여 (메시지, 평문) 쌍으로 반환 (실패한 메시지는 제외)"""
+        texts = crypto_service.decrypt_many(
+            (m.content.content_enc, m.content.iv, m.content.enc_version) for m in self.messages
+        )
+        return [(m, text) for m, text in zip(self.messages, texts) if text is not None]
+
     def get_prompt_context(self, crypto_service) -> str:
         """기존 메시지들을 복호화하여 프롬프트 텍스트로 변환"""
         context = ""
-        # ID 순서대로 정렬하여 대화 흐름 보장
-        sorted_msgs = sorted(self.messages, key=lambda x: x.id)
-        for m in sorted_msgs:
-            try:
-                # 필드명은 content_enc와 iv로 매칭
-                decrypted_txt = crypto_service.decrypt(
-                    ciphertext=m.content_enc,
-                    iv=m.iv if (m.iv and len(m.iv) == 16) else None
-                )
-                role_label = "상담사" if str(m.role).upper() == "ASSISTANT" else "사용자"
-                file_note = f" [첨부파일 {len(m.file_urls)}개]" if getattr(m, 'file_urls', None) else ""
-                context += f"{role_label}: {decrypted_txt}{file_note}\n"
-            except Exception:
-                continue
+        for m, decrypted_txt in self._decrypted(crypto_service):
+            role_label = "상담사" if m.is_assistant else "사용자"
+            file_note = f" [첨부파일 {len(m.file_urls)}개]" if m.file_urls else ""
+            context += f"{role_label}: {decrypted_txt}{file_note}\n"
         return context
 
     def to_llm_payload(self, crypto_service) -> list:
@@ -38,36 +45,23 @@ class Conversation:
         이미지는 'image_url' 객체로, 텍스트는 'text' 객체로 변환.
         """
         ai_context = []
-        sorted_msgs = sorted(self.messages, key=lambda x: x.id)
-
-        for m in sorted_msgs:
-            try:
-                decrypted_txt = crypto_service.decrypt(
-                    ciphertext=m.content_enc,
-                    iv=m.iv if (m.iv and len(m.iv) == 16) else None
-                )
-                role = "assistant" if str(m.role).upper() == "ASSISTANT" else "user"
-
-                file_urls = getattr(m, 'file_urls', [])
-
-                if role == "user":
-                    user_content = [{"type": "text", "text": decrypted_txt}]
 
-                    for url in file_urls:
-                        if any(url.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.webp']):
-                            user_content.append({
-                                "type": "image_url",
-                                "image_url": {"url": url}
-                            })
-                        else:
-                            user_content[0]["text"] += f"\n(첨부파일 경로: {url})"
+        for m, decrypted_txt in self._decrypted(crypto_service):
+            if not m.is_assistant:
+                user_content = [{"type": "text", "text": decrypted_txt}]
 
-                    ai_context.append({"role": "user", "content": user_content})
+                for url in m.file_urls:
+                    if url.lower().endswith(_LLM_IMAGE_EXTENSIONS):
+                        user_content.append({
+                            "type": "image_url",
+                            "image_url": {"url": url}
+                        })
+                    else:
+                        user_content[0]["text"] += f"\n(첨부파일 경로: {url})"
 
-                else:
-                    ai_context.append({"role": "assistant", "content": decrypted_txt})
+                ai_context.append({"role": "user", "content": user_content})
 
-            except Exception:
-                continue
+            else:
+                ai_context.append({"role": "assistant", "content": decrypted_txt})
 
-        return ai_context
\ No newline at end of file
+        return ai_context
@@ -0,0 +1,210 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.config.anonymizer import Anonymizer
+from app.config.settings import settings
+from app.conversation.application.policy.usage_policy import UsagePolicy
+from app.conversation.application.port.out.response_cache_port import CachedResponse, ResponseCachePort
+
+_PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class _Entry:
+    variant: str
+    normalized: str
+    shingles: frozenset
+    answer: str
+    generation_ms: float
+    prompt_tokens: int
+    completion_tokens: int
+    expires_at: float
+
+
+class InMemoryResponseCache(ResponseCachePort):
+    """
+    프로세스 내 LRU + TTL 응답 캐시.
+
+    - 키: 익명화/정규화된 메시지 + 프롬프트 variant(MBTI/성별)
+    - 정확 일치는 해시 조회, 근사 중복은 같은 variant 안에서 문자 3-gram Jaccard 유사도로 찾는다.
+      (variant, 3-gram) 역색인으로 겹치는 3-gram 이 있는 항목만 후보로 세므로 전체 항목을 훑지 않는다.
+    - TTL 이 고정이므로 저장 순서가 곧 만료 순서다. 만료는 저장 순서 dict 의 앞에서부터만 꺼낸다.
+    """
+
+    SHINGLE_SIZE = 3
+
+    def __init__(
+        self,
+        ttl_seconds: int | None = None,
+        max_entries: int | None = None,
+        similarity_threshold: float | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds or settings.RESPONSE_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or settings.RESPONSE_CACHE_MAX_ENTRIES
+        self.similarity_threshold = similarity_threshold or settings.RESPONSE_CACHE_SIMILARITY_THRESHOLD
+
+        self._anonymizer = Anonymizer()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()  # LRU 순서
+        self._expiry: "OrderedDict[str, float]" = OrderedDict()  # 저장(만료) 순서
+        self._shingle_index: dict[tuple[str, str], set[str]] = {}
+        self._lock = threading.Lock()
+
+        self._lookups = 0
+        self._exact_hits = 0
+        self._near_hits = 0
+        self._latency_saved_ms = 0.0
+        self._cost_saved_usd = 0.0
+
+    # ------------------------------------------------------------------
+    # 키 생성
+    # ------------------------------------------------------------------
+    def _normalize(self, message: str) -> str:
+        text = self._anonymizer.anonymize(message.strip().lower())
+        text = _PUNCT_RE.sub(" ", text)
+        return _SPACE_RE.sub(" ", text).strip()
+
+    @staticmethod
+    def _make_key(variant: str, normalized: str) -> str:
+        return hashlib.sha256(f"{variant}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def _shingles(self, normalized: str) -> frozenset:
+        compact = normalized.replace(" ", "")
+        n = self.SHINGLE_SIZE
+        if len(compact) <= n:
+            return frozenset([compact])
+        return frozenset(compact[i:i + n] for i in range(len(compact) - n + 1))
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+    def lookup(self, message: str, variant: str) -> Optional[CachedResponse]:
+        normalized = self._normalize(message)
+        if not normalized:
+            return None
+
+        key = self._make_key(variant, normalized)
+        now = time.monotonic()
+
+        with self._lock:
+            self._lookups += 1
+            self._evict_expired(now)
+
+            entry = self._entries.get(key)
+            exact = entry is not None
+            if entry is None:
+                entry = self._find_near_duplicate(variant, self._shingles(normalized))
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(self._make_key(entry.variant, entry.normalized))
+            if exact:
+                self._exact_hits += 1
+            else:
+                self._near_hits += 1
+            self._latency_saved_ms += entry.generation_ms
+            self._cost_saved_usd += self._estimate_cost(entry.prompt_tokens, entry.completion_tokens)
+
+            return CachedResponse(
+                answer=entry.answer,
+                generation_ms=entry.generation_ms,
+                prompt_tokens=entry.prompt_tokens,
+                completion_tokens=entry.completion_tokens,
+                exact=exact,
+            )
+
+    def store(
+        self,
+        message: str,
+        variant: str,
+        answer: str,
+        generation_ms: float,
+        prompt_tokens: int,
+    ) -> None:
+        normalized = self._normalize(message)
+        if not normalized or not answer:
+            return
+
+        key = self._make_key(variant, normalized)
+        entry = _Entry(
+            variant=variant,
+            normalized=normalized,
+            shingles=self._shingles(normalized),
+            answer=answer,
+            generation_ms=generation_ms,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=UsagePolicy.calculate_token(answer),
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._expiry[key] = entry.expires_at
+            for shingle in entry.shingles:
+                self._shingle_index.setdefault((variant, shingle), set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _find_near_duplicate(self, variant: str, shingles: frozenset) -> Optional[_Entry]:
+        # 겹치는 3-gram 수(교집합 크기)를 역색인으로 세고, Jaccard = 교집합 / (|A| + |B| - 교집합)
+        overlaps: dict[str, int] = {}
+        for shingle in shingles:
+            for key in self._shingle_index.get((variant, shingle), ()):
+                overlaps[key] = overlaps.get(key, 0) + 1
+
+        best, best_score = None, 0.0
+        for key, overlap in overlaps.items():
+            entry = self._entries[key]
+            score = overlap / (len(shingles) + len(entry.shingles) - overlap)
+            if score > best_score:
+                best, best_score = entry, score
+        return best if best_score >= self.similarity_threshold else None
+
+    def _evict_expired(self, now: float) -> None:
+        while self._expiry:
+            key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        del self._expiry[key]
+        for shingle in entry.shingles:
+            keys = self._shingle_index.get((entry.variant, shingle))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._shingle_index[(entry.variant, shingle)]
+
+    @staticmethod
+    def _estimate_cost(prompt_tokens: int, completion_tokens: int) -> float:
+        return (
+            prompt_tokens / 1000 * settings.LLM_INPUT_COST_PER_1K
+            + completion_tokens / 1000 * settings.LLM_OUTPUT_COST_PER_1K
+        )
+
+    # ------------------------------------------------------------------
+    # 리포트
+    # ------------------------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self._exact_hits + self._near_hits
+            return {
+                "entries": len(self._entries),
+                "lookups": self._lookups,
+                "hits": hits,
+                "exact_hits": self._exact_hits,
+                "near_hits": self._near_hits,
+                "hit_rate": round(hits / self._lookups, 4) if self._lookups else 0.0,
+                "latency_saved_ms": round(self._latency_saved_ms, 1),
+                "cost_saved_usd": round(self._cost_saved_usd, 4),
+            }
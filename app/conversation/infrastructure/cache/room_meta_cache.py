@@ -0,0 +1,137 @@
+import json
+import logging
+from typing import Callable, Iterable, Optional
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config.redis_config import get_async_redis, get_redis
+from app.config.settings import settings
+from app.conversation.application.port.out.chat_room_repository_port import ChatRoomMeta
+
+logger = logging.getLogger(__name__)
+
+_DIRTY_KEY = "room_meta_dirty"
+
+
+class RoomMetaCache:
+    """
+    채팅방 메타데이터(소유자/상태/제목/head 메시지) Redis 캐시. 모든 워커가 공유한다.
+
+    - 조회: GET → 없으면 loader(DB) 결과를 SET NX 로 채운다.
+    - 무효화: 커밋 직후 키를 짧은 TTL 의 tombstone 으로 덮어쓴다 (invalidate_after_commit).
+      tombstone 이 있는 동안은 DB 를 읽고 캐시를 채우지 않으며, 채우기는 NX 이므로
+      커밋 전에 옛 값을 읽은 요청이 tombstone 이후에 옛 head 를 다시 써넣을 수 없다.
+    - Redis 오류 시 DB 조회로 대체한다.
+    조회는 비동기 클라이언트, 무효화는 커밋 이벤트(동기)에서 동기 클라이언트로 실행한다.
+    """
+
+    KEY_PREFIX = "room:meta:"
+    TOMBSTONE = "-"
+
+    def __init__(
+        self,
+        redis_factory=get_redis,
+        async_redis_factory=get_async_redis,
+        ttl_seconds: Optional[int] = None,
+        tombstone_seconds: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self._redis_factory = redis_factory
+        self._async_redis_factory = async_redis_factory
+        self._ttl = ttl_seconds or settings.ROOM_META_CACHE_TTL_SECONDS
+        self._tombstone_ms = int((tombstone_seconds or settings.ROOM_META_CACHE_TOMBSTONE_SECONDS) * 1000)
+        self.enabled = settings.ROOM_META_CACHE_ENABLED if enabled is None else enabled
+        self.stats = {"hits": 0, "loads": 0, "invalidations": 0, "redis_errors": 0}
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._redis_factory()
+
+    @property
+    def async_client(self) -> aioredis.Redis:
+        return self._async_redis_factory()
+
+    async def get(self, room_id: str, loader: Callable[[str], Optional[ChatRoomMeta]]) -> Optional[ChatRoomMeta]:
+        """캐시된 메타데이터, 없으면 loader 로 읽어 채운다 (없는 방은 캐시하지 않음)"""
+        if not self.enabled:
+            return loader(room_id)
+
+        key = f"{self.KEY_PREFIX}{room_id}"
+        try:
+            data = await self.async_client.get(key)
+        except (redis.RedisError, OSError) as e:
+            self.stats["redis_errors"] += 1
+            logger.warning("room meta cache read failed for %s: %r", room_id, e)
+            return loader(room_id)
+
+        if data and data != self.TOMBSTONE:
+            try:
+                meta = self._decode(room_id, data)
+                self.stats["hits"] += 1
+                return meta
+            except (ValueError, KeyError, TypeError):
+                logger.warning("ignoring malformed room meta cache entry for %s", room_id)
+
+        meta = loader(room_id)
+        self.stats["loads"] += 1
+        if meta is None or data == self.TOMBSTONE:
+            return meta
+        try:
+            await self.async_client.set(key, self._encode(meta), ex=self._ttl, nx=True)
+        except (redis.RedisError, OSError) as e:
+            self.stats["redis_errors"] += 1
+            logger.warning("room meta cache write failed for %s: %r", room_id, e)
+        return meta
+
+    def invalidate_after_commit(self, session: Session, room_id: str) -> None:
+        """session 의 다음 커밋 직후 room_id 를 무효화한다 (롤백되면 취소)"""
+        if not self.enabled:
+            return
+        session.info.setdefault(_DIRTY_KEY, {}).setdefault(self, set()).add(room_id)
+        if not event.contains(session, "after_commit", _on_commit):
+            event.listen(session, "after_commit", _on_commit)
+            event.listen(session, "after_rollback", _on_rollback)
+
+    def invalidate(self, room_ids: Iterable[str]) -> None:
+        room_ids = list(room_ids)
+        if not room_ids:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for room_id in room_ids:
+                pipe.set(f"{self.KEY_PREFIX}{room_id}", self.TOMBSTONE, px=self._tombstone_ms)
+            pipe.execute()
+            self.stats["invalidations"] += len(room_ids)
+        except (redis.RedisError, OSError) as e:
+            # 남은 캐시는 TTL 이 지나면 사라진다
+            self.stats["redis_errors"] += 1
+            logger.warning("room meta invalidation failed for %s: %r", room_ids, e)
+
+    @staticmethod
+    def _encode(meta: ChatRoomMeta) -> str:
+        return json.dumps(
+            {"a": meta.account_id, "s": meta.status, "t": meta.title, "h": meta.last_message_id},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def _decode(room_id: str, data: str) -> ChatRoomMeta:
+        fields = json.loads(data)
+        return ChatRoomMeta(room_id, fields["a"], fields["s"], fields["t"], fields["h"])
+
+
+def _on_commit(session: Session) -> None:
+    for cache, room_ids in session.info.pop(_DIRTY_KEY, {}).items():
+        cache.invalidate(room_ids)
+
+
+def _on_rollback(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
+
+
+# 워커 단위 싱글톤 인스턴스
+room_meta_cache = RoomMetaCache()
@@ -0,0 +1,350 @@
+"""
+메시지 암호화 키 교체 후 chat_msg 와 채팅방 미리보기를 활성 키로 다시 암호화하는 작업.
+
+실행: python -m app.conversation.infrastructure.job.chat_reencryption_job [--max-chunks N] [--reset]
+
+1. AES_KEYRING 에 새 키를 추가하고 AES_ACTIVE_KEY_ID 를 바꿔 배포한다 (이전 키는 keyring 에 유지).
+   이후 새 메시지는 새 키로 쓰이고, 기존 행은 enc_version 의 key id 로 이전 키를 골라 계속 읽힌다.
+2. 이 작업을 실행한다. 진행 위치는 Redis 에 체크포인트로 남으므로 중단 후 다시 실행하면 이어서 처리한다.
+3. --reset 으로 한 번 더 실행해 updated=0 이 확인되면 (배포 전 write-behind 큐에 있던 턴 포함)
+   이전 키를 keyring 에서 제거한다.
+"""
+
+import argparse
+import json
+import logging
+import math
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Optional
+
+import redis
+from sqlalchemy import bindparam, create_engine, null, or_, select, text, update
+
+from app.config.redis_config import get_redis
+from app.config.security.message_crypto import AESEncryption
+from app.config.settings import settings
+from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+
+logger = logging.getLogger(__name__)
+
+PHASE_MESSAGES = "chat_msg"
+PHASE_PREVIEWS = "chat_room"
+PHASE_DONE = "done"
+
+
+class ReencryptionBusyError(Exception):
+    """다른 프로세스가 재암호화 작업을 실행 중"""
+
+
+class ReencryptionCheckpoint:
+    """
+    대상 enc_version 별 진행 상황 (Redis 해시).
+    phase 와 단계별 keyset 커서(마지막으로 처리한 id / room_id)를 청크마다 저장한다.
+    """
+
+    KEY = "chat:reencrypt:{version}"
+    LOCK_KEY = "chat:reencrypt:lock"
+    LOCK_TTL_MS = 120_000
+    COUNTERS = ("scanned", "updated", "skipped", "failed")
+
+    def __init__(self, target_version: int, redis_factory=get_redis):
+        self.target_version = target_version
+        self._redis_factory = redis_factory
+        self.key = self.KEY.format(version=target_version)
+        self._token: Optional[str] = None
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._redis_factory()
+
+    def load(self) -> dict:
+        raw = self.client.hgetall(self.key)
+        state = {
+            "target_version": self.target_version,
+            "phase": raw.get("phase", PHASE_MESSAGES),
+            "message_cursor": int(raw.get("message_cursor", 0)),
+            "room_cursor": raw.get("room_cursor", ""),
+            "started_at": raw.get("started_at"),
+            "updated_at": raw.get("updated_at"),
+        }
+        for counter in self.COUNTERS:
+            state[counter] = int(raw.get(counter, 0))
+        return state
+
+    def save(self, state: dict) -> None:
+        state["updated_at"] = datetime.utcnow().isoformat()
+        state["started_at"] = state.get("started_at") or state["updated_at"]
+        self.client.hset(self.key, mapping={k: v for k, v in state.items() if v is not None})
+
+    def reset(self) -> None:
+        self.client.delete(self.key)
+
+    def acquire(self) -> None:
+        token = uuid.uuid4().hex
+        if not self.client.set(self.LOCK_KEY, token, nx=True, px=self.LOCK_TTL_MS):
+            raise ReencryptionBusyError(self.LOCK_KEY)
+        self._token = token
+
+    def refresh(self) -> None:
+        """청크마다 락 TTL 연장 (중단된 프로세스의 락은 TTL 로 풀린다)"""
+        if self._token and self.client.get(self.LOCK_KEY) == self._token:
+            self.client.pexpire(self.LOCK_KEY, self.LOCK_TTL_MS)
+
+    def release(self) -> None:
+        if self._token is None:
+            return
+        with self.client.pipeline(transaction=True) as pipe:
+            try:
+                pipe.watch(self.LOCK_KEY)
+                if pipe.get(self.LOCK_KEY) == self._token:
+                    pipe.multi()
+                    pipe.delete(self.LOCK_KEY)
+                    pipe.execute()
+            except redis.WatchError:
+                pass
+        self._token = None
+
+
+class ReplicaLagProbe:
+    """MySQL 복제본의 지연(초). 복제가 멈춰 값이 없으면 None."""
+
+    QUERIES = (
+        ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+        ("SHOW SLAVE STATUS", "Seconds_Behind_Master"),  # MySQL 8.0.22 이전
+    )
+
+    def __init__(self, database_url: str):
+        self.engine = create_engine(database_url, pool_pre_ping=True, pool_size=1, max_overflow=0)
+
+    def lag_seconds(self) -> Optional[float]:
+        with self.engine.connect() as conn:
+            for query, column in self.QUERIES:
+                try:
+                    row = conn.execute(text(query)).mappings().first()
+                except Exception:
+                    continue
+                if row is None:
+                    return 0.0  # 복제본이 아닌 서버: 지연 없음으로 취급
+                value = row.get(column)
+                return None if value is None else float(value)
+        return None
+
+
+class ChatReencryptionJob:
+    """
+    chat_msg 를 id keyset 청크로 읽어(stream_results) 워커 스레드에서 이전 키로 복호화 후 활성 키로 암호화하고,
+    청크 단위 executemany UPDATE + 커밋 후 체크포인트를 저장한다.
+    UPDATE 는 읽을 때의 iv 와 같을 때만 적용되어 동시에 실행된 다른 갱신을 덮어쓰지 않는다.
+    """
+
+    def __init__(
+            self,
+            crypto: AESEncryption,
+            session_factory: Callable,
+            checkpoint: Optional[ReencryptionCheckpoint] = None,
+            lag_probe: Optional[ReplicaLagProbe] = None,
+            chunk_size: int | None = None,
+            workers: int | None = None,
+            pause_ms: int | None = None,
+            max_replica_lag: float | None = None,
+    ):
+        self.crypto = crypto
+        self.session_factory = session_factory
+        self.target_version = crypto.get_version()
+        self.checkpoint = checkpoint or ReencryptionCheckpoint(self.target_version)
+        self.lag_probe = lag_probe
+        self.chunk_size = chunk_size or settings.CHAT_REENCRYPT_CHUNK_SIZE
+        self.workers = workers or settings.CHAT_REENCRYPT_WORKERS
+        self.pause_seconds = (settings.CHAT_REENCRYPT_PAUSE_MS if pause_ms is None else pause_ms) / 1000
+        self.max_replica_lag = max_replica_lag or settings.CHAT_REENCRYPT_MAX_REPLICA_LAG_SECONDS
+        self.slice_size = max(1, math.ceil(self.chunk_size / self.workers))
+
+    def run(self, max_chunks: Optional[int] = None) -> dict:
+        self.checkpoint.acquire()
+        try:
+            state = self.checkpoint.load()
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="reencrypt") as pool:
+                chunks = 0
+                while state["phase"] != PHASE_DONE and (max_chunks is None or chunks < max_chunks):
+                    self._throttle()
+                    if state["phase"] == PHASE_MESSAGES:
+                        finished = self._message_chunk(pool, state)
+                    else:
+                        finished = self._preview_chunk(pool, state)
+                    if finished:
+                        state["phase"] = PHASE_PREVIEWS if state["phase"] == PHASE_MESSAGES else PHASE_DONE
+                    self.checkpoint.save(state)
+                    self.checkpoint.refresh()
+                    chunks += 1
+                    if self.pause_seconds:
+                        time.sleep(self.pause_seconds)
+            return state
+        finally:
+            self.checkpoint.release()
+
+    # ------------------------------------------------------------------
+    # chat_msg
+    # ------------------------------------------------------------------
+    def _message_chunk(self, pool: ThreadPoolExecutor, state: dict) -> bool:
+        t = ChatMessageOrm.__table__
+        stmt = (
+            select(t.c.id, t.c.content_enc, t.c.iv, t.c.enc_version)
+            .where(t.c.id > state["message_cursor"])
+            .where(or_(t.c.enc_version.is_(None), t.c.enc_version != self.target_version))
+            .order_by(t.c.id)
+            .limit(self.chunk_size)
+        )
+        db = self.session_factory()
+        try:
+            # 서버 측 커서로 받은 만큼 워커에 넘겨 조회와 암호화를 겹친다
+            result = db.execute(stmt.execution_options(yield_per=self.slice_size))
+            futures = [pool.submit(self._reencrypt_slice, part) for part in result.partitions()]
+            updates, scanned, last_id = [], 0, None
+            for future in futures:
+                part_updates, part_scanned, part_failed, part_last = future.result()
+                updates.extend(part_updates)
+                scanned += part_scanned
+                state["failed"] += part_failed
+                last_id = part_last
+
+            if updates:
+                db.execute(
+                    update(t)
+                    .where(t.c.id == bindparam("b_id"))
+                    .where(t.c.iv == bindparam("b_old_iv"))
+                    .values(content_enc=bindparam("b_enc"), iv=bindparam("b_iv"), enc_version=bindparam("b_ver")),
+                    updates,
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        state["scanned"] += scanned
+        state["updated"] += len(updates)
+        state["skipped"] += scanned - len(updates)
+        if last_id is not None:
+            state["message_cursor"] = last_id
+        logger.info("re-encrypt chat_msg up to id %s: %d/%d rows updated", last_id, len(updates), scanned)
+        return scanned < self.chunk_size
+
+    def _reencrypt_slice(self, rows, versioned: bool = True) -> tuple[list, int, int, Optional[int]]:
+        updates, failed, last_id = [], 0, None
+        for row_id, content_enc, iv, enc_version in rows:
+            last_id = row_id
+            try:
+                result = self.crypto.reencrypt(content_enc, iv, enc_version, versioned=versioned)
+            except Exception as e:
+                # 복호화할 수 없는 행은 그대로 두고 다음으로 진행 (로그로 남긴다)
+                logger.warning("re-encrypt %s failed: %r", row_id, e)
+                failed += 1
+                continue
+            if result is None:
+                continue
+            new_enc, new_iv, new_version = result
+            updates.append({
+                "b_id": row_id, "b_old_iv": iv,
+                "b_enc": new_enc, "b_iv": new_iv, "b_ver": new_version,
+            })
+        return updates, len(rows), failed, last_id
+
+    # ------------------------------------------------------------------
+    # chat_room 미리보기 (enc_version 컬럼이 없어 키를 판별하며 처리)
+    # ------------------------------------------------------------------
+    def _preview_chunk(self, pool: ThreadPoolExecutor, state: dict) -> bool:
+        t = ChatRoomOrm.__table__
+        stmt = (
+            select(t.c.room_id, t.c.preview_enc, t.c.preview_iv, null().label("enc_version"))
+            .where(t.c.room_id > state["room_cursor"])
+            .where(t.c.preview_enc.is_not(None))
+            .order_by(t.c.room_id)
+            .limit(self.chunk_size)
+        )
+        db = self.session_factory()
+        try:
+            result = db.execute(stmt.execution_options(yield_per=self.slice_size))
+            futures = [pool.submit(self._reencrypt_slice, part, False) for part in result.partitions()]
+            updates, scanned, last_room = [], 0, None
+            for future in futures:
+                part_updates, part_scanned, part_failed, part_last = future.result()
+                updates.extend(part_updates)
+                scanned += part_scanned
+                state["failed"] += part_failed
+                last_room = part_last
+
+            if updates:
+                db.execute(
+                    update(t)
+                    .where(t.c.room_id == bindparam("b_id"))
+                    .where(t.c.preview_iv == bindparam("b_old_iv"))
+                    .values(preview_enc=bindparam("b_enc"), preview_iv=bindparam("b_iv")),
+                    [{k: v for k, v in u.items() if k != "b_ver"} for u in updates],
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        state["scanned"] += scanned
+        state["updated"] += len(updates)
+        state["skipped"] += scanned - len(updates)
+        if last_room is not None:
+            state["room_cursor"] = last_room
+        logger.info("re-encrypt chat_room previews up to %s: %d/%d rows updated", last_room, len(updates), scanned)
+        return scanned < self.chunk_size
+
+    # ------------------------------------------------------------------
+    # 부하 조절
+    # ------------------------------------------------------------------
+    def _throttle(self) -> None:
+        """복제 지연이 한도를 넘거나 알 수 없으면 따라잡을 때까지 대기"""
+        if self.lag_probe is None:
+            return
+        while True:
+            lag = self.lag_probe.lag_seconds()
+            if lag is not None and lag <= self.max_replica_lag:
+                return
+            logger.info("re-encrypt paused: replica lag %s s (max %s s)", lag, self.max_replica_lag)
+            self.checkpoint.refresh()
+            time.sleep(min(max(lag or 0.0, 1.0), 30.0))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-chunks", type=int, help="이번 실행에서 처리할 최대 청크 수 (이후 재실행 시 이어서 처리)")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 지우고 처음부터 다시 검사")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from app.config.database.session import SessionLocal, engine
+
+    engine.echo = False
+    crypto = AESEncryption()
+    replica_url = settings.CHAT_REENCRYPT_REPLICA_DATABASE_URL
+    job = ChatReencryptionJob(
+        crypto,
+        SessionLocal,
+        lag_probe=ReplicaLagProbe(replica_url) if replica_url else None,
+    )
+    if args.reset:
+        job.checkpoint.reset()
+
+    try:
+        state = job.run(max_chunks=args.max_chunks)
+    except ReencryptionBusyError:
+        logger.error("another re-encryption job is running")
+        return 1
+    print(json.dumps(state, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,4 +1,5 @@
 from sqlalchemy import Column, String, Integer, DateTime, LargeBinary, ForeignKey, Index, JSON
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.config.database.session import Base
 
@@ -20,6 +21,8 @@ class ChatMessageOrm(Base):
     contents_type = Column(String(20))
     file_urls = Column(JSON, nullable=True, default=list)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # write-behind 로 저장된 턴의 id (유저 메시지에만 기록, 재전달된 턴을 다시 저장하지 않기 위함)
+    turn_id = Column(String(32), nullable=True)
 
     # 추가: 부모 메시지 ID (자기 자신을 참조)
     parent_id = Column(
@@ -28,12 +31,19 @@ class ChatMessageOrm(Base):
         nullable=True
     )
 
+    # 같은 flush 안에서 부모 INSERT 후 생성된 id 로 parent_id 를 채우기 위한 관계
+    parent = relationship("ChatMessageOrm", remote_side=[id], foreign_keys=[parent_id])
+
     # --- 인덱스 설정 ---
     __table_args__ = (
         # 1. 특정 방의 메시지를 전체 조회할 때 사용
-        Index('idx_room_id', 'room_id'),
+        #    (id 커서 페이지네이션도 같은 인덱스로 처리)
+        Index('idx_room_msg_id', 'room_id', 'id'),
 
         # 2. 멀티 에이전트 구조에서 부모-자식 관계를 빠르게 조회
         Index('idx_room_parent_id', 'room_id', 'parent_id'),
 
+        # 3. write-behind 턴 중복 저장 방지 (NULL 은 중복 허용)
+        Index('uq_chat_msg_turn_id', 'turn_id', unique=True),
+
     )
\ No newline at end of file
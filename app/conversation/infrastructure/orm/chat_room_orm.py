@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Index
+from sqlalchemy import Column, String, Integer, DateTime, Index, LargeBinary
 from sqlalchemy.orm import relationship
 
 from app.config.database.session import Base
@@ -18,6 +18,13 @@ class ChatRoomOrm(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow)
 
+    # 메시지 저장 시 함께 갱신되는 활동 정보 (목록 조회 시 메시지 테이블을 읽지 않도록 비정규화)
+    last_message_id = Column(Integer, nullable=True)
+    last_message_at = Column(DateTime, nullable=True)
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    preview_enc = Column(LargeBinary, nullable=True)
+    preview_iv = Column(LargeBinary, nullable=True)
+
     messages = relationship(
         "ChatMessageOrm",
         backref="room",
@@ -31,4 +38,7 @@ class ChatRoomOrm(Base):
 
             # 2. 특정 카테고리나 상태(ACTIVE)별로 필터링해서 볼 경우
             Index('idx_status_category', 'status', 'category'),
+
+            # 3. 최근 활동순 채팅방 목록 keyset 페이지네이션
+            Index('idx_account_last_message', 'account_id', 'last_message_at', 'room_id'),
         )
\ No newline at end of file
@@ -0,0 +1,391 @@
+import asyncio
+import base64
+import json
+import logging
+import socket
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.config.redis_config import get_async_redis, get_redis
+from app.config.settings import settings
+from app.conversation.application.port.out.chat_write_behind_port import (
+    ChatWriteBehindPort,
+    PendingChatMessage,
+    PendingTurn,
+)
+from app.conversation.domain.conversation.aggregate import Conversation
+
+logger = logging.getLogger(__name__)
+
+
+class RoomBusyError(Exception):
+    """다른 워커/요청이 같은 방의 대기 턴을 반영 중"""
+
+
+def _json_default(value):
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"not serializable: {type(value)!r}")
+
+
+def _dumps(turn: PendingTurn) -> str:
+    return json.dumps(asdict(turn), default=_json_default, ensure_ascii=False)
+
+
+def _load_message(data: dict) -> PendingChatMessage:
+    return PendingChatMessage(
+        role=data["role"],
+        content_enc=base64.b64decode(data["content_enc"]),
+        iv=base64.b64decode(data["iv"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
+
+
+def _loads(raw: str) -> PendingTurn:
+    data = json.loads(raw)
+    return PendingTurn(
+        turn_id=data["turn_id"],
+        room_id=data["room_id"],
+        account_id=data["account_id"],
+        contents_type=data["contents_type"],
+        enc_version=data["enc_version"],
+        user=_load_message(data["user"]),
+        assistant=_load_message(data["assistant"]),
+        preview_enc=base64.b64decode(data["preview_enc"]),
+        preview_iv=base64.b64decode(data["preview_iv"]),
+        input_length=data["input_length"],
+        output_length=data["output_length"],
+        file_urls=data.get("file_urls") or [],
+    )
+
+
+class RedisChatWriteBehind(ChatWriteBehindPort):
+    """
+    Redis Stream 기반 write-behind 큐.
+
+    - 스트림(chat:write_behind): 워커가 consumer group 으로 읽는 (room_id, turn_id) 이벤트
+    - 방별 해시(chat:write_behind:pending:{room_id}): 아직 DB 에 없는 턴 본문, 조회 시 병합용
+    스트림 이벤트와 해시 항목은 MULTI 로 함께 적재되고, 해시에서 지워진 턴은 반영이 끝난 것으로 본다.
+    전달은 at-least-once 이므로 DB 반영은 turn_id 로 멱등하게 한다: 커밋 후 해시 삭제/ack 전에 중단되어
+    다시 반영되는 턴은 같은 트랜잭션 안에서 이미 저장된 것을 확인하고 건너뛴다 (chat_msg.turn_id 유니크).
+    요청 경로(enqueue / pending_for_room / drain_room)는 이벤트 루프에서 바로 await 되므로
+    비동기 클라이언트를 쓰고, 워커 전용 메서드(read_batch 등)는 동기 클라이언트를 쓴다.
+    """
+
+    STREAM_KEY = "chat:write_behind"
+    DLQ_KEY = "chat:write_behind:dlq"
+    GROUP = "chat-writers"
+    PENDING_KEY = "chat:write_behind:pending:{room_id}"
+    ATTEMPTS_KEY = "chat:write_behind:attempts"
+    LOCK_KEY = "chat:write_behind:lock:{room_id}"
+    LOCK_TTL_MS = 30_000
+    LOCK_POLL_SECONDS = 0.05
+
+    def __init__(self, redis_factory=get_redis, async_redis_factory=get_async_redis, max_attempts: int | None = None):
+        self._redis_factory = redis_factory
+        self._async_redis_factory = async_redis_factory
+        self.max_attempts = max_attempts or settings.CHAT_WRITE_BEHIND_MAX_ATTEMPTS
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._redis_factory()
+
+    @property
+    def async_client(self) -> aioredis.Redis:
+        return self._async_redis_factory()
+
+    # ------------------------------------------------------------------
+    # 적재 / 조회
+    # ------------------------------------------------------------------
+    async def enqueue(self, turn: PendingTurn) -> None:
+        async with self.async_client.pipeline(transaction=True) as pipe:
+            pipe.hset(self.PENDING_KEY.format(room_id=turn.room_id), turn.turn_id, _dumps(turn))
+            pipe.xadd(self.STREAM_KEY, {"room_id": turn.room_id, "turn_id": turn.turn_id})
+            await pipe.execute()
+
+    async def pending_for_room(self, room_id: str) -> List[PendingTurn]:
+        return self._sorted_turns(await self.async_client.hgetall(self.PENDING_KEY.format(room_id=room_id)))
+
+    @staticmethod
+    def _sorted_turns(raw: dict) -> List[PendingTurn]:
+        if not raw:
+            return []
+        turns = [_loads(v) for v in raw.values()]
+        turns.sort(key=lambda t: t.user.created_at)
+        return turns
+
+    # ------------------------------------------------------------------
+    # DB 반영
+    # ------------------------------------------------------------------
+    async def drain_room(
+            self,
+            room_id: str,
+            chat_room_repo,
+            chat_message_repo,
+            wait_seconds: float = 5.0,
+    ) -> List[PendingTurn]:
+        pending_key = self.PENDING_KEY.format(room_id=room_id)
+        if not await self.async_client.hlen(pending_key):
+            return []
+
+        token = await self._acquire(room_id, wait_seconds)
+        try:
+            turns = self._sorted_turns(await self.async_client.hgetall(pending_key))
+            if not turns:
+                return []
+            await self._apply(room_id, turns, chat_room_repo, chat_message_repo)
+            await self.async_client.hdel(pending_key, *[t.turn_id for t in turns])
+            return turns
+        finally:
+            await self._release(room_id, token)
+
+    @staticmethod
+    async def _apply(room_id: str, turns: List[PendingTurn], chat_room_repo, chat_message_repo) -> None:
+        room = await chat_room_repo.find_by_id(room_id)
+        if room is None:
+            # 대기 중에 삭제된 방: 저장할 곳이 없으므로 버린다
+            logger.warning("write-behind room %s deleted, dropping %d turn(s)", room_id, len(turns))
+            return
+
+        # 이전 반영이 커밋 후 해시 삭제/ack 전에 중단된 턴은 이미 저장되어 있다 (방 활동 정보도 함께 커밋됨)
+        saved = await chat_message_repo.find_saved_turn_ids(room_id, [t.turn_id for t in turns])
+        turns = [t for t in turns if t.turn_id not in saved]
+        if not turns:
+            return
+
+        # 활동 컬럼이 비어 있는 기존 방만 메시지에서 head 를 계산
+        messages = [] if room.last_message_id is not None else await chat_message_repo.find_by_room_id(room_id)
+        head = Conversation(room=room, messages=messages).get_last_id()
+
+        try:
+            for turn in turns:
+                common = dict(
+                    room_id=turn.room_id,
+                    account_id=turn.account_id,
+                    enc_version=turn.enc_version,
+                    contents_type=turn.contents_type,
+                )
+                _, saved_assistant = await chat_message_repo.save_turn(
+                    user=dict(
+                        role=turn.user.role,
+                        content_enc=turn.user.content_enc,
+                        iv=turn.user.iv,
+                        created_at=turn.user.created_at,
+                        file_urls=turn.file_urls,
+                        turn_id=turn.turn_id,
+                        **common,
+                    ),
+                    assistant=dict(
+                        role=turn.assistant.role,
+                        content_enc=turn.assistant.content_enc,
+                        iv=turn.assistant.iv,
+                        created_at=turn.assistant.created_at,
+                        file_urls=[],
+                        **common,
+                    ),
+                    parent_id=head,
+                )
+                head = saved_assistant.id
+
+            last = turns[-1]
+            await chat_room_repo.touch_activity(
+                room_id=room_id,
+                last_message_id=head,
+                last_message_at=last.assistant.created_at,
+                added_count=2 * len(turns),
+                preview_enc=last.preview_enc,
+                preview_iv=last.preview_iv,
+            )
+            chat_message_repo.db.commit()
+        except Exception:
+            chat_message_repo.db.rollback()
+            raise
+
+    async def _acquire(self, room_id: str, wait_seconds: float) -> str:
+        token = uuid.uuid4().hex
+        key = self.LOCK_KEY.format(room_id=room_id)
+        deadline = time.monotonic() + wait_seconds
+        while not await self.async_client.set(key, token, nx=True, px=self.LOCK_TTL_MS):
+            if time.monotonic() >= deadline:
+                raise RoomBusyError(room_id)
+            await asyncio.sleep(self.LOCK_POLL_SECONDS)
+        return token
+
+    async def _release(self, room_id: str, token: str) -> None:
+        # 본인이 잡은 락만 해제 (TTL 만료 후 다른 쪽이 잡은 락은 유지)
+        key = self.LOCK_KEY.format(room_id=room_id)
+        async with self.async_client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(key)
+                if await pipe.get(key) == token:
+                    pipe.multi()
+                    pipe.delete(key)
+                    await pipe.execute()
+            except redis.WatchError:
+                pass
+
+    # ------------------------------------------------------------------
+    # 워커 지원
+    # ------------------------------------------------------------------
+    def ensure_group(self) -> None:
+        try:
+            self.client.xgroup_create(self.STREAM_KEY, self.GROUP, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def read_batch(self, consumer: str, count: int, block_ms: int, min_idle_ms: int) -> list:
+        """재시도 대상(오래 ack 되지 않은 항목)을 먼저 가져오고, 없으면 새 항목을 기다린다"""
+        _, claimed, *_ = self.client.xautoclaim(
+            self.STREAM_KEY, self.GROUP, consumer, min_idle_time=min_idle_ms, start_id="0-0", count=count
+        )
+        entries = [(entry_id, fields) for entry_id, fields in claimed if fields]
+        if entries:
+            return entries
+
+        response = self.client.xreadgroup(
+            self.GROUP, consumer, {self.STREAM_KEY: ">"}, count=count, block=block_ms
+        )
+        return [entry for _, stream_entries in (response or []) for entry in stream_entries]
+
+    def ack(self, entry_ids: List[str]) -> None:
+        if not entry_ids:
+            return
+        pipe = self.client.pipeline(transaction=True)
+        pipe.xack(self.STREAM_KEY, self.GROUP, *entry_ids)
+        pipe.xdel(self.STREAM_KEY, *entry_ids)
+        pipe.hdel(self.ATTEMPTS_KEY, *entry_ids)
+        pipe.execute()
+
+    def record_failure(self, room_id: str, entries: list, error: Exception) -> None:
+        """실패 횟수를 올리고, 한도를 넘은 항목은 DLQ 로 옮긴 뒤 대기 목록에서 제거"""
+        pending_key = self.PENDING_KEY.format(room_id=room_id)
+        dead = []
+        for entry_id, fields in entries:
+            attempts = self.client.hincrby(self.ATTEMPTS_KEY, entry_id, 1)
+            if attempts < self.max_attempts:
+                continue
+            payload = self.client.hget(pending_key, fields["turn_id"]) or ""
+            pipe = self.client.pipeline(transaction=True)
+            pipe.xadd(self.DLQ_KEY, {
+                "room_id": room_id,
+                "turn_id": fields["turn_id"],
+                "payload": payload,
+                "error": repr(error)[:500],
+                "attempts": attempts,
+            })
+            pipe.hdel(pending_key, fields["turn_id"])
+            pipe.execute()
+            dead.append(entry_id)
+            logger.error("write-behind turn %s dead-lettered after %d attempts: %r",
+                         fields["turn_id"], attempts, error)
+        self.ack(dead)
+
+    def stats(self) -> Optional[dict]:
+        r = self.client
+        try:
+            pending = r.xpending(self.STREAM_KEY, self.GROUP)["pending"]
+        except redis.ResponseError:
+            pending = 0
+        return {
+            "stream_length": r.xlen(self.STREAM_KEY),
+            "unacked": pending,
+            "dead_letters": r.xlen(self.DLQ_KEY),
+        }
+
+
+class ChatWriteBehindWorker:
+    """
+    write-behind 스트림을 읽어 방 단위로 chat_msg 에 일괄 저장하는 백그라운드 워커.
+    실패한 항목은 ack 하지 않고 RETRY 시간 뒤 다시 가져오며, 한도를 넘으면 DLQ 로 보낸다.
+    """
+
+    BLOCK_MS = 1000
+
+    def __init__(self, write_behind: RedisChatWriteBehind, session_factory, usage_meter):
+        self.write_behind = write_behind
+        self.session_factory = session_factory
+        self.usage_meter = usage_meter
+        self.consumer = f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self.batch_size = settings.CHAT_WRITE_BEHIND_BATCH_SIZE
+        self.retry_seconds = settings.CHAT_WRITE_BEHIND_RETRY_SECONDS
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.write_behind.ensure_group()
+        self._task = asyncio.create_task(self._run(), name="chat-write-behind")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.process_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("write-behind batch failed")
+                await asyncio.sleep(self.retry_seconds)
+
+    async def process_batch(self) -> int:
+        entries = await asyncio.to_thread(
+            self.write_behind.read_batch,
+            self.consumer, self.batch_size, self.BLOCK_MS, self.retry_seconds * 1000,
+        )
+        if not entries:
+            return 0
+
+        by_room: "OrderedDict[str, list]" = OrderedDict()
+        for entry_id, fields in entries:
+            by_room.setdefault(fields["room_id"], []).append((entry_id, fields))
+
+        applied_count = 0
+        for room_id, room_entries in by_room.items():
+            db = self.session_factory()
+            try:
+                from app.conversation.infrastructure.repository.chat_message_repository_impl import \
+                    ChatMessageRepositoryImpl
+                from app.conversation.infrastructure.repository.chat_room_repository_impl import \
+                    ChatRoomRepositoryImpl
+
+                # 방의 대기 턴 전체를 한 트랜잭션으로 반영 (이미 요청 쪽에서 반영된 턴은 해시에 없음)
+                turns = await self.write_behind.drain_room(
+                    room_id, ChatRoomRepositoryImpl(db), ChatMessageRepositoryImpl(db), wait_seconds=0
+                )
+            except RoomBusyError:
+                # 다른 쪽이 반영 중이면 ack 하지 않고 다음 재시도에 맡긴다
+                continue
+            except Exception as e:
+                logger.warning("write-behind room %s failed: %r", room_id, e)
+                self.write_behind.record_failure(room_id, room_entries, e)
+                continue
+            finally:
+                db.close()
+
+            self.write_behind.ack([entry_id for entry_id, _ in room_entries])
+            for turn in turns:
+                await self.usage_meter.record_usage(turn.account_id, turn.input_length, turn.output_length)
+            applied_count += len(turns)
+
+        return applied_count
+
+
+# 워커 단위 싱글톤 인스턴스
+chat_write_behind = RedisChatWriteBehind()
@@ -1,9 +1,18 @@
-from sqlalchemy.orm import Session
+from typing import Optional
+
+from sqlalchemy import literal, select
+from sqlalchemy.orm import Session, aliased
 from Crypto.Random import get_random_bytes
 
+from app.conversation.application.port.out.chat_message_repository_port import ChatHistoryRow
+from app.conversation.domain.chat_message.entity import ChatMessage
+from app.conversation.domain.chat_message.enums import ContentType, MessageRole
+from app.conversation.domain.chat_message.value_object import EncryptedContent
 from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
 from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
 
+_CONTENT_TYPES = {t.value: t for t in ContentType}
+
 
 class ChatMessageRepositoryImpl:
     def __init__(self, session: Session):
@@ -15,12 +24,7 @@ class ChatMessageRepositoryImpl:
             if not kwargs.get('iv'):
                 kwargs['iv'] = get_random_bytes(16)
 
-            # 2. parent_id 유효성 검사
-            parent_id = kwargs.get('parent_id')
-            if parent_id is not None:
-                exists = self.db.query(ChatMessageOrm).filter(ChatMessageOrm.id == parent_id).first()
-                if not exists:
-                    kwargs['parent_id'] = None
+            # 2. parent_id 는 호출자가 채팅방 head(last_message_id)에서 가져온 값을 그대로 사용 (별도 조회 없음)
 
             # 3. file_urls 처리
             file_urls = kwargs.get('file_urls')
@@ -36,13 +40,114 @@ class ChatMessageRepositoryImpl:
             self.db.rollback()
             raise e
 
-    async def find_by_room_id(self, room_id: str):
+    async def save_turn(self, user: dict, assistant: dict, parent_id: int | None):
+        """
+        한 턴의 유저/AI 메시지를 한 번의 flush 로 저장.
+        parent_id 는 채팅방 head 이며, AI 메시지의 부모는 같은 flush 에서 생성된 유저 메시지 id 로 채워진다.
+        """
+        try:
+            user_msg = ChatMessageOrm(parent_id=parent_id, **user)
+            assistant_msg = ChatMessageOrm(parent=user_msg, **assistant)
+            self.db.add_all([user_msg, assistant_msg])
+            self.db.flush()
+            return user_msg, assistant_msg
+
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    async def find_saved_turn_ids(self, room_id: str, turn_ids: list[str]) -> set[str]:
+        if not turn_ids:
+            return set()
+        rows = self.db.execute(
+            select(ChatMessageOrm.turn_id)
+            .where(ChatMessageOrm.room_id == room_id, ChatMessageOrm.turn_id.in_(turn_ids))
+        )
+        return {turn_id for (turn_id,) in rows}
+
+    async def find_in_room(self, room_id: str, message_id: int):
+        """방에 속한 메시지 한 건 (다른 방 메시지로 분기/재생성하는 것을 막기 위해 room_id 로 한정)"""
         return (
             self.db.query(ChatMessageOrm)
-            .filter(ChatMessageOrm.room_id == room_id)
+            .filter(ChatMessageOrm.room_id == room_id, ChatMessageOrm.id == message_id)
+            .first()
+        )
+
+    @staticmethod
+    def _path_cte(room_id: str, head_id: int):
+        """head 메시지에서 parent_id 를 따라 루트까지 올라가는 재귀 CTE (경로 길이만큼만 읽는다)"""
+        path = (
+            select(ChatMessageOrm.id, ChatMessageOrm.parent_id, literal(1).label("depth"))
+            .where(ChatMessageOrm.room_id == room_id, ChatMessageOrm.id == head_id)
+            .cte("msg_path", recursive=True)
+        )
+        parent = aliased(ChatMessageOrm)
+        return path.union_all(
+            select(parent.id, parent.parent_id, path.c.depth + 1)
+            .where(parent.id == path.c.parent_id, parent.room_id == room_id)
+        )
+
+    @staticmethod
+    def _message_select():
+        """ORM 객체 대신 ChatMessage 엔티티로 매핑할 컬럼만 투영"""
+        return select(
+            ChatMessageOrm.id,
+            ChatMessageOrm.room_id,
+            ChatMessageOrm.account_id,
+            ChatMessageOrm.role,
+            ChatMessageOrm.content_enc,
+            ChatMessageOrm.iv,
+            ChatMessageOrm.enc_version,
+            ChatMessageOrm.contents_type,
+            ChatMessageOrm.created_at,
+            ChatMessageOrm.parent_id,
+            ChatMessageOrm.file_urls,
+        )
+
+    @staticmethod
+    def _to_entity(row) -> ChatMessage:
+        (message_id, room_id, account_id, role, content_enc, iv,
+         enc_version, contents_type, created_at, parent_id, file_urls) = row
+        return ChatMessage(
+            message_id=message_id,
+            room_id=room_id,
+            account_id=account_id,
+            role=MessageRole.ASSISTANT if str(role).upper() == "ASSISTANT" else MessageRole.USER,
+            content=EncryptedContent(content_enc=content_enc, iv=iv, enc_version=enc_version),
+            # 클라이언트가 보낸 임의의 contents_type 은 TEXT 로 취급
+            content_type=_CONTENT_TYPES.get(contents_type, ContentType.TEXT),
+            created_at=created_at,
+            parent_id=parent_id,
+            file_urls=file_urls,
+        )
+
+    async def find_path(self, room_id: str, head_id: int) -> list[ChatMessage]:
+        """루트 -> head 순서의 활성 경로 메시지 (다른 분기의 메시지는 읽지 않는다)"""
+        path = self._path_cte(room_id, head_id)
+        stmt = (
+            self._message_select()
+            .join(path, ChatMessageOrm.id == path.c.id)
+            .order_by(path.c.depth.desc())
+        )
+        return [self._to_entity(row) for row in self.db.execute(stmt)]
+
+    async def find_history_path(self, room_id: str, account_id: int, head_id: int) -> list[ChatHistoryRow]:
+        """활성 경로만 피드백과 함께 조회 (루트 -> head 순서)"""
+        path = self._path_cte(room_id, head_id)
+        stmt = (
+            self._history_select(room_id, account_id)
+            .join(path, ChatMessageOrm.id == path.c.id)
+            .order_by(path.c.depth.desc())
+        )
+        return [ChatHistoryRow(*row) for row in self.db.execute(stmt)]
+
+    async def find_by_room_id(self, room_id: str) -> list[ChatMessage]:
+        stmt = (
+            self._message_select()
+            .where(ChatMessageOrm.room_id == room_id)
             .order_by(ChatMessageOrm.id.asc())
-            .all()
         )
+        return [self._to_entity(row) for row in self.db.execute(stmt)]
 
     async def find_by_room_id_with_feedback(self, room_id: str, account_id: int):
         from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
@@ -57,4 +162,61 @@ class ChatMessageRepositoryImpl:
             .filter(ChatMessageOrm.room_id == room_id)
             .order_by(ChatMessageOrm.id.asc())
             .all()
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def _history_select(room_id: str, account_id: int):
+        return (
+            select(
+                ChatMessageOrm.id,
+                ChatMessageOrm.room_id,
+                ChatMessageOrm.account_id,
+                ChatMessageOrm.role,
+                ChatMessageOrm.content_enc,
+                ChatMessageOrm.iv,
+                ChatMessageOrm.enc_version,
+                ChatMessageOrm.contents_type,
+                ChatMessageOrm.file_urls,
+                ChatMessageOrm.created_at,
+                ChatFeedbackOrm.satisfaction,
+            )
+            .outerjoin(
+                ChatFeedbackOrm,
+                (ChatMessageOrm.id == ChatFeedbackOrm.message_id) &
+                (ChatFeedbackOrm.account_id == account_id)
+            )
+            .where(ChatMessageOrm.room_id == room_id)
+        )
+
+    async def find_history(self, room_id: str, account_id: int) -> list[ChatHistoryRow]:
+        stmt = self._history_select(room_id, account_id).order_by(ChatMessageOrm.id.asc())
+        return [ChatHistoryRow(*row) for row in self.db.execute(stmt)]
+
+    async def find_history_page(
+            self,
+            room_id: str,
+            account_id: int,
+            limit: int,
+            before: Optional[int] = None,
+            after: Optional[int] = None,
+    ) -> tuple[list[ChatHistoryRow], bool]:
+        """
+        (room_id, id) 인덱스를 타는 keyset 페이지 조회.
+        after 가 있으면 그 이후(더 최신) 메시지를, 아니면 before 이전(없으면 가장 최신) 메시지를 가져온다.
+        반환: (id 오름차순 행 목록, 해당 방향으로 더 있는지 여부)
+        """
+        stmt = self._history_select(room_id, account_id)
+        if after is not None:
+            stmt = stmt.where(ChatMessageOrm.id > after).order_by(ChatMessageOrm.id.asc())
+        else:
+            if before is not None:
+                stmt = stmt.where(ChatMessageOrm.id < before)
+            stmt = stmt.order_by(ChatMessageOrm.id.desc())
+
+        # 한 건 더 읽어서 다음 페이지 존재 여부 판단
+        rows = [ChatHistoryRow(*row) for row in self.db.execute(stmt.limit(limit + 1))]
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if after is None:
+            rows.reverse()
+        return rows, has_more
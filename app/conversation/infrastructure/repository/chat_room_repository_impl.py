@@ -1,12 +1,24 @@
+from datetime import datetime
+from typing import Optional
+
 from app.config.database.session import get_db_session
-from app.conversation.application.port.out.chat_room_repository_port import ChatRoomRepositoryPort
+from app.conversation.application.port.out.chat_room_repository_port import (
+    ChatRoomMeta,
+    ChatRoomRepositoryPort,
+    ChatRoomSummaryRow,
+)
+from app.conversation.infrastructure.cache.room_meta_cache import RoomMetaCache, room_meta_cache
 from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.orm import Session
 
 class ChatRoomRepositoryImpl(ChatRoomRepositoryPort):
 
-    def __init__(self, session: Session | None = None):
+    def __init__(self, session: Session | None = None, meta_cache: RoomMetaCache | None = None):
         self.db: Session = session or get_db_session()
+        self._meta_cache = meta_cache or room_meta_cache
+        # 요청 단위 memo (레포지토리는 요청마다 생성되므로 한 요청에서 같은 방을 두 번 읽지 않는다)
+        self._meta_memo: dict[str, Optional[ChatRoomMeta]] = {}
 
     async def create(self, room_id, account_id, title, category, division, out_api):
         room = ChatRoomOrm(
@@ -17,13 +29,39 @@ class ChatRoomRepositoryImpl(ChatRoomRepositoryPort):
             division=division,
             out_api=out_api,
             status="ACTIVE",
+            last_message_at=datetime.utcnow(),
+            message_count=0,
         )
         self.db.add(room)
         self.db.commit()
+        self._meta_memo[room_id] = ChatRoomMeta(room_id, account_id, "ACTIVE", title, None)
 
     async def find_by_id(self, room_id):
         return self.db.get(ChatRoomOrm, room_id)
 
+    async def find_meta(self, room_id: str) -> Optional[ChatRoomMeta]:
+        if room_id not in self._meta_memo:
+            self._meta_memo[room_id] = await self._meta_cache.get(room_id, self._load_meta)
+        return self._meta_memo[room_id]
+
+    def _load_meta(self, room_id: str) -> Optional[ChatRoomMeta]:
+        row = (
+            self.db.query(
+                ChatRoomOrm.account_id,
+                ChatRoomOrm.status,
+                ChatRoomOrm.title,
+                ChatRoomOrm.last_message_id,
+            )
+            .filter(ChatRoomOrm.room_id == room_id)
+            .first()
+        )
+        return ChatRoomMeta(room_id, *row) if row else None
+
+    def _invalidate_meta(self, room_id: str) -> None:
+        """다음 커밋 직후 공유 캐시를 무효화하고, 이 요청의 memo 도 버린다"""
+        self._meta_memo.pop(room_id, None)
+        self._meta_cache.invalidate_after_commit(self.db, room_id)
+
     async def end_room(self, room_id: str) -> bool:
         room = self.db.get(ChatRoomOrm, room_id)
 
@@ -32,6 +70,7 @@ class ChatRoomRepositoryImpl(ChatRoomRepositoryPort):
 
         room.status = "ENDED"
         self.db.add(room)
+        self._invalidate_meta(room_id)
         self.db.commit()
         self.db.refresh(room)
         return True
@@ -54,6 +93,7 @@ class ChatRoomRepositoryImpl(ChatRoomRepositoryPort):
 
             # 2. 방 삭제 (이때 연관된 메시지들이 CASCADE 설정에 의해 자동 삭제됨)
             self.db.delete(room)
+            self._invalidate_meta(room_id)
             self.db.commit()
             return True
 
@@ -62,13 +102,62 @@ class ChatRoomRepositoryImpl(ChatRoomRepositoryPort):
             raise e
 
     async def find_status_by_room_id(self, room_id: str, account_id: int) -> str | None:
-        room = (
-            self.db.query(ChatRoomOrm.status)
-            .filter(
-                ChatRoomOrm.room_id == room_id,
-                ChatRoomOrm.account_id == account_id,
+        meta = await self.find_meta(room_id)
+        return meta.status if meta and meta.account_id == account_id else None
+
+    async def touch_activity(
+        self,
+        room_id: str,
+        last_message_id: int,
+        last_message_at: datetime,
+        added_count: int,
+        preview_enc: Optional[bytes],
+        preview_iv: Optional[bytes],
+    ) -> None:
+        # head 가 바뀌므로 호출자의 커밋 직후 메타데이터 캐시 무효화
+        self._invalidate_meta(room_id)
+        self.db.execute(
+            update(ChatRoomOrm)
+            .where(ChatRoomOrm.room_id == room_id)
+            .values(
+                last_message_id=last_message_id,
+                last_message_at=last_message_at,
+                updated_at=last_message_at,
+                message_count=ChatRoomOrm.message_count + added_count,
+                preview_enc=preview_enc,
+                preview_iv=preview_iv,
             )
-            .first()
+            .execution_options(synchronize_session=False)
+        )
+
+    async def find_page_by_account_id(
+        self,
+        account_id: int,
+        limit: int,
+        cursor: Optional[tuple[datetime, str]] = None,
+    ) -> tuple[list[ChatRoomSummaryRow], bool]:
+        stmt = (
+            select(
+                ChatRoomOrm.room_id,
+                ChatRoomOrm.title,
+                ChatRoomOrm.status,
+                ChatRoomOrm.category,
+                ChatRoomOrm.created_at,
+                ChatRoomOrm.last_message_id,
+                ChatRoomOrm.last_message_at,
+                ChatRoomOrm.message_count,
+                ChatRoomOrm.preview_enc,
+                ChatRoomOrm.preview_iv,
+            )
+            .where(ChatRoomOrm.account_id == account_id)
         )
-        # room은 (status,) 튜플 형태
-        return room[0] if room else None
+        if cursor is not None:
+            last_at, last_room_id = cursor
+            stmt = stmt.where(or_(
+                ChatRoomOrm.last_message_at < last_at,
+                and_(ChatRoomOrm.last_message_at == last_at, ChatRoomOrm.room_id < last_room_id),
+            ))
+        stmt = stmt.order_by(ChatRoomOrm.last_message_at.desc(), ChatRoomOrm.room_id.desc()).limit(limit + 1)
+
+        rows = [ChatRoomSummaryRow(*row) for row in self.db.execute(stmt)]
+        return rows[:limit], len(rows) > limit
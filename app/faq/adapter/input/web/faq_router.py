@@ -1,9 +1,11 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.auth.adapter.input.web.dependencies import verify_admin_role
-from app.config.database.session import get_db_session
+from app.config.database.session import SessionLocal, get_db_session
+from app.config.settings import settings
 
 from app.faq.adapter.input.web.request.create_faq_request import (
     CreateFAQRequest,
@@ -18,11 +20,49 @@ from app.faq.application.usecase.get_faq_detail_usecase import GetFAQDetailUseCa
 from app.faq.application.usecase.create_faq_usecase import CreateFAQUseCase
 from app.faq.application.usecase.update_faq_usecase import UpdateFAQUseCase
 from app.faq.application.usecase.delete_faq_usecase import DeleteFAQUseCase
+from app.faq.infrastructure.cache.faq_list_cache import faq_list_cache
+from app.faq.infrastructure.cache.faq_view_buffer import faq_view_buffer
 from app.faq.infrastructure.repository.faq_repository_impl import FAQRepositoryImpl
 
 
 router = APIRouter(prefix="/faqs", tags=["faq"])
 
+_FAQ_LIST_ADAPTER = TypeAdapter(List[FAQResponse])
+# 브라우저/CDN 은 저장하되 매번 ETag 로 재검증 (변경이 바로 보이도록)
+FAQ_LIST_CACHE_CONTROL = "public, no-cache"
+PREWARM_PAGE_LIMIT = 20  # 목록 기본 limit 과 같게
+
+
+def _serialize_public_faqs(db: Session, category: Optional[FAQCategory], offset: int, limit: int) -> bytes:
+    faqs = GetPublicFAQsUseCase(FAQRepositoryImpl(db)).execute(
+        category=category,
+        offset=offset,
+        limit=limit,
+    )
+    return _FAQ_LIST_ADAPTER.dump_json([FAQResponse.model_validate(faq) for faq in faqs])
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def prewarm_public_faqs() -> int:
+    """시작 시 공개 목록 첫 페이지(전체 + 카테고리별)를 캐시에 채운다"""
+    db = SessionLocal()
+    try:
+        return faq_list_cache.prewarm({
+            (category, 0, PREWARM_PAGE_LIMIT): (
+                lambda c=category: _serialize_public_faqs(db, c, 0, PREWARM_PAGE_LIMIT)
+            )
+            for category in (None, *FAQCategory)
+        })
+    finally:
+        db.close()
+
 
 # ===========================================
 # 공개 API (인증 불필요)
@@ -33,33 +73,18 @@ def get_public_faqs(
     category: Optional[FAQCategory] = Query(None),
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db_session),
 ):
-    """공개 FAQ 목록 조회 (카테고리 필터 가능)"""
-    faq_repo = FAQRepositoryImpl(db)
-    usecase = GetPublicFAQsUseCase(faq_repo)
-
-    faqs = usecase.execute(
-        category=category,
-        offset=offset,
-        limit=limit,
+    """공개 FAQ 목록 조회 (카테고리 필터 가능, 직렬화된 응답 캐시 + ETag / If-None-Match 304)"""
+    page = faq_list_cache.get(
+        (category, offset, limit),
+        lambda: _serialize_public_faqs(db, category, offset, limit),
     )
-
-    return [
-        FAQResponse(
-            id=faq.id,
-            category=faq.category,
-            question=faq.question,
-            answer=faq.answer,
-            display_order=faq.display_order,
-            is_published=faq.is_published,
-            view_count=faq.view_count,
-            created_by=faq.created_by,
-            created_at=faq.created_at,
-            updated_at=faq.updated_at,
-        )
-        for faq in faqs
-    ]
+    headers = {"ETag": page.etag, "Cache-Control": FAQ_LIST_CACHE_CONTROL}
+    if _etag_matches(if_none_match, page.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=page.body, media_type="application/json", headers=headers)
 
 
 @router.get("/search", response_model=List[FAQResponse])
@@ -103,7 +128,10 @@ def get_faq_detail(
 ):
     """FAQ 상세 조회 (조회수 증가)"""
     faq_repo = FAQRepositoryImpl(db)
-    usecase = GetFAQDetailUseCase(faq_repo)
+    usecase = GetFAQDetailUseCase(
+        faq_repo,
+        view_counter=faq_view_buffer if settings.FAQ_VIEW_BUFFER_ENABLED else None,
+    )
 
     try:
         faq = usecase.execute(faq_id=faq_id, increment_view=True)
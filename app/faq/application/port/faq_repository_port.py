@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List
 from app.faq.domain.entity.faq import FAQ
 from app.faq.domain.entity.faq_enums import FAQCategory
 
@@ -43,6 +43,11 @@ class FAQRepositoryPort(ABC):
     def increment_view_count(self, faq_id: int) -> bool:
         pass
 
+    @abstractmethod
+    def add_view_counts(self, deltas: Dict[int, int]) -> int:
+        """{faq_id: 증가분} 을 한 번의 UPDATE 로 반영하고 갱신된 행 수를 반환"""
+        pass
+
     @abstractmethod
     def delete(self, faq_id: int) -> bool:
         pass
\ No newline at end of file
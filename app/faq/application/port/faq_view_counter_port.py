@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class FAQViewCounterPort(ABC):
+    @abstractmethod
+    def record_view(self, faq_id: int) -> Optional[int]:
+        """
+        조회 1회를 버퍼에 기록하고, 아직 DB 에 반영되지 않은 조회수(이번 조회 포함)를 반환한다.
+        버퍼를 쓸 수 없으면 None (호출 측이 DB 에 직접 반영)
+        """
+        pass
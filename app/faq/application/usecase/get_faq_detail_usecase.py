@@ -1,11 +1,15 @@
+from typing import Optional
+
 from app.faq.domain.entity.faq import FAQ
 from app.faq.domain.exception import FAQNotFoundException
 from app.faq.application.port.faq_repository_port import FAQRepositoryPort
+from app.faq.application.port.faq_view_counter_port import FAQViewCounterPort
 
 
 class GetFAQDetailUseCase:
-    def __init__(self, faq_repo: FAQRepositoryPort):
+    def __init__(self, faq_repo: FAQRepositoryPort, view_counter: Optional[FAQViewCounterPort] = None):
         self.faq_repo = faq_repo
+        self.view_counter = view_counter
 
     def execute(self, faq_id: int, increment_view: bool = True) -> FAQ:
         # Find FAQ
@@ -15,7 +19,12 @@ class GetFAQDetailUseCase:
 
         # Increment view count if requested
         if increment_view:
-            self.faq_repo.increment_view_count(faq_id)
-            faq.increment_view_count()
+            pending = self.view_counter.record_view(faq_id) if self.view_counter else None
+            if pending is None:
+                self.faq_repo.increment_view_count(faq_id)
+                faq.increment_view_count()
+            else:
+                # DB 에 반영된 조회수 + 버퍼에 쌓인 증가분 (이번 조회 포함)
+                faq.add_pending_views(pending)
 
-        return faq
\ No newline at end of file
+        return faq
@@ -43,6 +43,9 @@ class FAQ:
     def increment_view_count(self) -> None:
         self.view_count += 1
 
+    def add_pending_views(self, pending: int) -> None:
+        self.view_count += pending
+
     def update_content(self, question: str, answer: str, category: FAQCategory) -> None:
         self.question = question
         self.answer = answer
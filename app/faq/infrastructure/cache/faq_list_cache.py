@@ -0,0 +1,139 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
+
+import redis
+
+from app.config.redis_config import get_redis
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedFAQPage:
+    """직렬화된 응답 본문과 ETag (본문 해시)"""
+    body: bytes
+    etag: str
+
+    @classmethod
+    def of(cls, body: bytes) -> "CachedFAQPage":
+        return cls(body=body, etag=f'"{hashlib.sha1(body).hexdigest()[:20]}"')
+
+
+class FAQListCache:
+    """
+    공개 FAQ 목록 응답(카테고리/페이지별)의 프로세스 내 캐시.
+
+    - 키에 전역 FAQ 버전(Redis faq:version)을 포함한다. 생성/수정/삭제 시 bump_version() 이 INCR 하고,
+      다른 워커는 version_poll_seconds 주기로 버전을 확인하여 바뀌면 캐시를 비운다.
+    - 버전 확인과 별개로 항목은 ttl_seconds 뒤 만료된다 (목록의 조회수 등 버전을 올리지 않는 변경 반영).
+    - Redis 오류 시 마지막으로 확인한 버전으로 계속 응답한다.
+    요청 스레드(동기 엔드포인트)에서 호출되므로 동기 Redis 클라이언트를 쓴다.
+    """
+
+    VERSION_KEY = "faq:version"
+
+    def __init__(
+        self,
+        redis_factory=get_redis,
+        ttl_seconds: Optional[int] = None,
+        version_poll_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self._redis_factory = redis_factory
+        self._ttl = ttl_seconds or settings.FAQ_LIST_CACHE_TTL_SECONDS
+        self._poll = version_poll_seconds or settings.FAQ_LIST_VERSION_POLL_SECONDS
+        self._max_entries = max_entries or settings.FAQ_LIST_CACHE_MAX_ENTRIES
+        self.enabled = settings.FAQ_LIST_CACHE_ENABLED if enabled is None else enabled
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, tuple[float, CachedFAQPage]]" = OrderedDict()
+        self._version = 0
+        self._checked_at = float("-inf")
+        self.stats = {"hits": 0, "loads": 0, "version_changes": 0, "redis_errors": 0}
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._redis_factory()
+
+    def get(self, key: Hashable, loader: Callable[[], bytes]) -> CachedFAQPage:
+        """key(카테고리/페이지) 의 응답, 없으면 loader 로 직렬화한 본문을 캐시한다"""
+        if not self.enabled:
+            return CachedFAQPage.of(loader())
+
+        version = self.current_version()
+        cache_key = (version, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(cache_key)
+                self.stats["hits"] += 1
+                return entry[1]
+
+        page = CachedFAQPage.of(loader())
+        with self._lock:
+            self.stats["loads"] += 1
+            if version == self._version:
+                self._entries[cache_key] = (now + self._ttl, page)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return page
+
+    def current_version(self) -> int:
+        """poll 주기마다 Redis 의 전역 버전을 확인한다"""
+        now = time.monotonic()
+        if now - self._checked_at < self._poll:
+            return self._version
+        self._checked_at = now
+        try:
+            version = int(self.client.get(self.VERSION_KEY) or 0)
+        except (redis.RedisError, OSError, ValueError) as e:
+            self.stats["redis_errors"] += 1
+            logger.warning("faq version check failed, keeping version %s: %r", self._version, e)
+            return self._version
+        self._set_version(version)
+        return version
+
+    def bump_version(self) -> None:
+        """FAQ 변경 커밋 후 호출: 전역 버전을 올리고 이 워커의 캐시를 즉시 비운다"""
+        try:
+            version = int(self.client.incr(self.VERSION_KEY))
+        except (redis.RedisError, OSError) as e:
+            # 다른 워커는 TTL 이 지나야 반영된다
+            self.stats["redis_errors"] += 1
+            logger.warning("faq version bump failed: %r", e)
+            version = self._version + 1
+        self._checked_at = time.monotonic()
+        self._set_version(version)
+
+    def prewarm(self, pages: dict[Hashable, Callable[[], bytes]]) -> int:
+        """시작 시 자주 요청되는 페이지를 미리 채운다 (실패한 페이지는 건너뜀)"""
+        if not self.enabled:
+            return 0
+        warmed = 0
+        for key, loader in pages.items():
+            try:
+                self.get(key, loader)
+                warmed += 1
+            except Exception:
+                logger.exception("faq cache prewarm failed for %s", key)
+        return warmed
+
+    def _set_version(self, version: int) -> None:
+        with self._lock:
+            if version == self._version:
+                return
+            self._version = version
+            self._entries.clear()
+            self.stats["version_changes"] += 1
+
+
+# 워커 단위 싱글톤 인스턴스 (lifespan 에서 prewarm)
+faq_list_cache = FAQListCache()
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import uuid
+from typing import Callable, Dict, Optional
+
+import redis
+
+from app.config.redis_config import get_redis
+from app.config.settings import settings
+from app.faq.application.port.faq_view_counter_port import FAQViewCounterPort
+
+logger = logging.getLogger(__name__)
+
+
+class FAQViewBuffer(FAQViewCounterPort):
+    """
+    FAQ 조회수를 Redis 해시(faq:views:pending, 필드 = FAQ id)에 HINCRBY 로 모았다가
+    flush() 가 한 번의 UPDATE 로 faq.view_count 에 반영한다.
+
+    - flush 는 pending 해시를 faq:views:flushing 으로 RENAME 하여 그 시점의 누적분만 가져간다.
+      반영 중에도 새 조회는 새 pending 해시에 쌓인다.
+    - DB 반영이 실패하면 flushing 해시를 그대로 두고 다음 flush 가 먼저 다시 시도한다
+      (커밋 직후 DEL 전에 프로세스가 죽으면 그 구간의 조회수가 한 번 더 더해질 수 있다).
+    - 여러 워커가 동시에 flush 하지 않도록 락 키를 잡는다.
+    요청 스레드(동기 엔드포인트)에서 호출되므로 동기 Redis 클라이언트를 쓴다.
+    """
+
+    PENDING_KEY = "faq:views:pending"
+    FLUSHING_KEY = "faq:views:flushing"
+    LOCK_KEY = "faq:views:flush-lock"
+    LOCK_TTL_MS = 60_000
+
+    def __init__(self, redis_factory=get_redis):
+        self._redis_factory = redis_factory
+        self.stats = {"recorded": 0, "flushes": 0, "flushed_views": 0, "redis_errors": 0, "flush_errors": 0}
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._redis_factory()
+
+    def record_view(self, faq_id: int) -> Optional[int]:
+        # 반영 중인(flushing) 몫도 아직 DB 에 없으므로 함께 더해 돌려준다 (왕복 1회)
+        field = str(faq_id)
+        try:
+            with self.client.pipeline(transaction=False) as pipe:
+                pipe.hincrby(self.PENDING_KEY, field, 1)
+                pipe.hget(self.FLUSHING_KEY, field)
+                pending, in_flight = pipe.execute()
+        except (redis.RedisError, OSError) as e:
+            self.stats["redis_errors"] += 1
+            logger.warning("faq view buffer unavailable, writing view of %s directly: %r", faq_id, e)
+            return None
+        self.stats["recorded"] += 1
+        return int(pending) + int(in_flight or 0)
+
+    def flush(self, apply: Callable[[Dict[int, int]], None]) -> int:
+        """
+        누적된 조회수를 apply({faq_id: 증가분}) 로 DB 에 반영하고 반영한 조회 수를 반환한다.
+        다른 워커가 flush 중이면 0.
+        """
+        token = uuid.uuid4().hex
+        if not self.client.set(self.LOCK_KEY, token, nx=True, px=self.LOCK_TTL_MS):
+            return 0
+        try:
+            if not self.client.exists(self.FLUSHING_KEY):
+                try:
+                    self.client.rename(self.PENDING_KEY, self.FLUSHING_KEY)
+                except redis.ResponseError:
+                    return 0  # 쌓인 조회가 없음
+
+            deltas = {
+                int(faq_id): int(count)
+                for faq_id, count in self.client.hgetall(self.FLUSHING_KEY).items()
+                if int(count) > 0
+            }
+            if deltas:
+                try:
+                    apply(deltas)
+                except Exception:
+                    self.stats["flush_errors"] += 1
+                    raise
+            self.client.delete(self.FLUSHING_KEY)
+        finally:
+            self._release(token)
+
+        flushed = sum(deltas.values())
+        self.stats["flushes"] += 1
+        self.stats["flushed_views"] += flushed
+        return flushed
+
+    def _release(self, token: str) -> None:
+        # 본인이 잡은 락만 해제 (TTL 만료 후 다른 워커가 잡은 락은 유지)
+        with self.client.pipeline(transaction=True) as pipe:
+            try:
+                pipe.watch(self.LOCK_KEY)
+                if pipe.get(self.LOCK_KEY) == token:
+                    pipe.multi()
+                    pipe.delete(self.LOCK_KEY)
+                    pipe.execute()
+            except redis.WatchError:
+                pass
+
+
+class FAQViewFlusher:
+    """FAQ_VIEW_FLUSH_SECONDS 마다 조회수 버퍼를 DB 에 반영하는 백그라운드 작업"""
+
+    def __init__(self, buffer: FAQViewBuffer, session_factory, interval_seconds: Optional[float] = None):
+        self.buffer = buffer
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds or settings.FAQ_VIEW_FLUSH_SECONDS
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="faq-view-flush")
+
+    async def stop(self) -> None:
+        # 남은 누적분은 Redis 에 있으므로 다음 flush (다른 워커 또는 재시작 후) 가 반영한다
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await asyncio.to_thread(self.flush_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("faq view flush failed")
+
+    def flush_once(self) -> int:
+        from app.faq.infrastructure.repository.faq_repository_impl import FAQRepositoryImpl
+
+        return self.buffer.flush(lambda deltas: FAQRepositoryImpl(self.session_factory()).add_view_counts(deltas))
+
+
+# 워커 단위 싱글톤 인스턴스 (flush 작업은 lifespan 에서 시작)
+faq_view_buffer = FAQViewBuffer()
@@ -0,0 +1,203 @@
+import logging
+import math
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, List, Optional
+
+import redis
+
+from app.config.database.session import SessionLocal
+from app.config.redis_config import get_redis
+from app.config.redis_pubsub import RedisSubscriber
+from app.config.settings import settings
+from app.conversation.application.port.out.faq_matcher_port import FaqMatch, FaqMatcherPort
+from app.faq.infrastructure.orm.faq_model import FAQModel
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def _load_published_faqs() -> List[tuple]:
+    db = SessionLocal()
+    try:
+        return (
+            db.query(FAQModel.id, FAQModel.question, FAQModel.answer)
+            .filter(FAQModel.is_published == True)
+            .all()
+        )
+    finally:
+        db.close()
+
+
+class FAQMatchIndex(FaqMatcherPort):
+    """
+    공개 FAQ 질문에 대한 인메모리 문자 bigram TF-IDF 인덱스.
+
+    - match() 는 DB 를 읽지 않는다 (스트리밍 중인 이벤트 루프를 막지 않도록).
+      인덱스가 오래되면 백그라운드 스레드가 다시 빌드해 통째로 교체하고,
+      그동안은 기존 인덱스로 답한다 (첫 빌드 전에는 매칭하지 않음).
+    - FAQ 가 변경되면 커밋 후 invalidate() 가 CHANNEL 로 알려 모든 워커가 바로 다시 빌드한다.
+      구독이 (재)연결될 때도 놓친 변경이 있을 수 있으므로 다시 빌드한다.
+    - refresh_seconds 주기의 재빌드는 이벤트가 유실된 경우의 보정으로 남긴다.
+    """
+
+    CHANNEL = "faq:index:events"
+    RETRY_SECONDS = 5.0  # 빌드 실패 후 다시 시도하기까지의 간격
+
+    def __init__(
+        self,
+        loader: Callable[[], List[tuple]] = _load_published_faqs,
+        threshold: float | None = None,
+        refresh_seconds: int | None = None,
+        redis_factory=get_redis,
+    ):
+        self._loader = loader
+        self.threshold = threshold or settings.FAQ_SHORTCUT_THRESHOLD
+        self.refresh_seconds = refresh_seconds or settings.FAQ_INDEX_REFRESH_SECONDS
+        self._redis_factory = redis_factory
+
+        self._build_lock = threading.Lock()  # 빌드 스레드는 하나만
+        self._generation = 0  # mark_stale() 마다 증가
+        self._built_generation = -1  # 인덱스를 읽기 시작한 시점의 세대
+        self._built_at = 0.0
+        self._retry_at = 0.0
+
+        # (faqs, postings, idf) 를 한 번에 교체해 match() 가 섞인 상태를 보지 않게 한다
+        self._snapshot: tuple[List[tuple], dict[str, list[tuple[int, float]]], dict[str, float]] = ([], {}, {})
+
+        self._lookups = 0
+        self._matches = 0
+
+    @staticmethod
+    def _bigrams(text: str) -> dict[str, int]:
+        compact = _NON_WORD_RE.sub("", text.lower())
+        grams: dict[str, int] = defaultdict(int)
+        if len(compact) == 1:
+            grams[compact] += 1
+        for i in range(len(compact) - 1):
+            grams[compact[i:i + 2]] += 1
+        return grams
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._redis_factory()
+
+    def attach(self, subscriber: RedisSubscriber) -> None:
+        """워커의 pub/sub 구독에 등록한다 (subscriber.start() 전에)"""
+        subscriber.subscribe(self.CHANNEL, lambda _: self.mark_stale(), on_connect=self.mark_stale)
+
+    def invalidate(self) -> None:
+        """FAQ 변경 커밋 후 호출: 이 워커와 다른 모든 워커의 인덱스를 다시 빌드한다"""
+        self.mark_stale()
+        try:
+            self.client.publish(self.CHANNEL, "1")
+        except (redis.RedisError, OSError) as e:
+            # 다른 워커는 refresh_seconds 안에 반영된다
+            logger.warning("faq index invalidation publish failed: %r", e)
+
+    def mark_stale(self) -> None:
+        """이 워커의 인덱스만 무효화하고 백그라운드 재빌드를 시작한다"""
+        self._generation += 1
+        self._schedule_refresh()
+
+    def refresh(self) -> None:
+        """오래된 인덱스를 호출한 스레드에서 다시 빌드한다 (이미 빌드 중이면 기다린다)"""
+        with self._build_lock:
+            self._refresh_locked()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._built_generation == self._generation
+            and time.monotonic() - self._built_at < self.refresh_seconds
+        )
+
+    def _schedule_refresh(self) -> None:
+        if time.monotonic() < self._retry_at or not self._build_lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(target=self._refresh_in_background, name="faq-index-refresh", daemon=True).start()
+        except Exception:
+            self._build_lock.release()
+            raise
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self._refresh_locked()
+        except Exception:
+            self._retry_at = time.monotonic() + self.RETRY_SECONDS
+            logger.exception("faq index rebuild failed")
+        finally:
+            self._build_lock.release()
+
+    def _refresh_locked(self) -> None:
+        # 읽는 도중 커밋된 변경은 세대가 달라지므로 한 번 더 빌드한다
+        while not self._is_fresh():
+            generation = self._generation
+            self._build(self._loader())
+            self._built_generation = generation
+
+    def _build(self, faqs: List[tuple]) -> None:
+        docs = [self._bigrams(question) for _, question, _ in faqs]
+
+        df: dict[str, int] = defaultdict(int)
+        for grams in docs:
+            for g in grams:
+                df[g] += 1
+
+        n = len(docs)
+        idf = {g: math.log((n + 1) / (c + 1)) + 1.0 for g, c in df.items()}
+
+        postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        for doc_id, grams in enumerate(docs):
+            weights = {g: tf * idf[g] for g, tf in grams.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for g, w in weights.items():
+                postings[g].append((doc_id, w / norm))
+
+        self._snapshot = (list(faqs), dict(postings), idf)
+        self._built_at = time.monotonic()
+
+    def match(self, message: str) -> Optional[FaqMatch]:
+        if not self._is_fresh():
+            self._schedule_refresh()
+        faqs, postings, idf = self._snapshot
+        self._lookups += 1
+
+        if not faqs:
+            return None
+
+        grams = self._bigrams(message)
+        weights = {g: tf * idf[g] for g, tf in grams.items() if g in idf}
+        # 인덱스에 없는 bigram 도 메시지 벡터 크기에는 반영 (긴 상담 메시지가 과대평가되지 않도록)
+        unseen = sum(tf for g, tf in grams.items() if g not in idf)
+        norm = math.sqrt(sum(w * w for w in weights.values()) + unseen) or 1.0
+
+        scores: dict[int, float] = defaultdict(float)
+        for g, w in weights.items():
+            for doc_id, doc_w in postings[g]:
+                scores[doc_id] += (w / norm) * doc_w
+
+        if not scores:
+            return None
+
+        doc_id, score = max(scores.items(), key=lambda kv: kv[1])
+        if score < self.threshold:
+            return None
+
+        self._matches += 1
+        faq_id, question, answer = faqs[doc_id]
+        return FaqMatch(faq_id=faq_id, question=question, answer=answer, score=round(score, 4))
+
+    def stats(self) -> dict:
+        return {
+            "indexed_faqs": len(self._snapshot[0]),
+            "lookups": self._lookups,
+            "llm_calls_avoided": self._matches,
+        }
+
+
+# 워커 단위 싱글톤 인스턴스
+faq_match_index = FAQMatchIndex()
@@ -1,12 +1,14 @@
-from typing import Optional, List
+from typing import Dict, Optional, List
 from sqlalchemy.orm import Session as DBSession
-from sqlalchemy import text
+from sqlalchemy import case, text, update
 from app.config.database.session import get_db_session
 
 from app.faq.domain.entity.faq import FAQ
 from app.faq.domain.entity.faq_enums import FAQCategory
 from app.faq.application.port.faq_repository_port import FAQRepositoryPort
 from app.faq.infrastructure.orm.faq_model import FAQModel
+from app.faq.infrastructure.cache.faq_list_cache import faq_list_cache
+from app.faq.infrastructure.index.faq_match_index import faq_match_index
 
 
 class FAQRepositoryImpl(FAQRepositoryPort):
@@ -14,6 +16,13 @@ class FAQRepositoryImpl(FAQRepositoryPort):
         self._session: DBSession = db_session or get_db_session()
 
     def save(self, faq: FAQ) -> FAQ:
+        saved = self._save(faq)
+        # 커밋 후 무효화해야 다른 요청이 커밋 전 FAQ 로 인덱스/목록을 다시 채우지 않는다
+        faq_match_index.invalidate()
+        faq_list_cache.bump_version()
+        return saved
+
+    def _save(self, faq: FAQ) -> FAQ:
         try:
             if faq.id is None:
                 model = self._to_model(faq)
@@ -33,7 +42,8 @@ class FAQRepositoryImpl(FAQRepositoryPort):
                     model.answer = faq.answer
                     model.display_order = faq.display_order
                     model.is_published = faq.is_published
-                    model.view_count = faq.view_count
+                    # view_count 는 increment_view_count / add_view_counts 로만 바꾼다
+                    # (읽어 둔 값으로 덮어쓰면 그 사이 flush 된 조회수가 사라짐)
                     model.updated_at = faq.updated_at
                     self._session.commit()
                     self._session.refresh(model)
@@ -154,6 +164,26 @@ class FAQRepositoryImpl(FAQRepositoryPort):
         finally:
             self._session.close()
 
+    def add_view_counts(self, deltas: Dict[int, int]) -> int:
+        if not deltas:
+            return 0
+        try:
+            # UPDATE faq SET view_count = view_count + CASE id WHEN .. THEN .. END WHERE id IN (..)
+            # 조회는 내용 변경이 아니므로 updated_at 은 그대로 둔다 (onupdate 적용 방지)
+            result = self._session.execute(
+                update(FAQModel)
+                .where(FAQModel.id.in_(list(deltas)))
+                .values(
+                    view_count=FAQModel.view_count + case(deltas, value=FAQModel.id, else_=0),
+                    updated_at=FAQModel.updated_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            self._session.commit()
+            return result.rowcount
+        finally:
+            self._session.close()
+
     def delete(self, faq_id: int) -> bool:
         try:
             model = (
@@ -164,6 +194,8 @@ class FAQRepositoryImpl(FAQRepositoryPort):
             if model:
                 self._session.delete(model)
                 self._session.commit()
+                faq_match_index.invalidate()
+                faq_list_cache.bump_version()
                 return True
             return False
         finally:
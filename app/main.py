@@ -23,7 +23,7 @@ from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
 from app.inquiry.infrastructure.orm.inquiry_model import InquiryModel  # noqa: F401
 from app.inquiry.infrastructure.orm.inquiry_reply_model import InquiryReplyModel  # noqa: F401
 from app.faq.infrastructure.orm.faq_model import FAQModel  # noqa: F401
-from app.config.database.session import Base, engine
+from app.config.database.session import Base, SessionLocal, engine
 from app.config.settings import settings
 
 
@@ -31,13 +31,73 @@ from app.config.settings import settings
 async def lifespan(app: FastAPI):
     """Application lifespan handler.
 
-    Startup: Initialize database tables.
-    Shutdown: Cleanup resources if needed.
+    Startup: Initialize database tables, start the chat write-behind worker,
+    the FAQ view-count flusher, the Redis pub/sub subscriber (auth blacklist
+    and account profile caches, FAQ match index) and the pooled OAuth HTTP client, and
+    pre-warm the public FAQ list cache.
+    Shutdown: Stop the worker (unacked entries are retried by the next worker),
+    the flusher (buffered views stay in Redis for the next flush) and the
+    subscriber, then close the OAuth client and the async Redis pool.
     """
     # Startup
     Base.metadata.create_all(bind=engine)
+
+    from app.auth.infrastructure.oauth.http_client import oauth_http_client
+
+    oauth_http_client.start()
+
+    from app.config.redis_pubsub import redis_subscriber
+
+    if settings.AUTH_BLACKLIST_CACHE_ENABLED:
+        from app.auth.infrastructure.cache.cached_token_blacklist import token_blacklist_cache
+
+        token_blacklist_cache.attach(redis_subscriber)
+    if settings.ACCOUNT_PROFILE_CACHE_ENABLED:
+        from app.account.infrastructure.cache.account_profile_cache import account_profile_cache
+
+        account_profile_cache.attach(redis_subscriber)
+    if settings.FAQ_SHORTCUT_ENABLED:
+        from app.faq.infrastructure.index.faq_match_index import faq_match_index
+
+        faq_match_index.attach(redis_subscriber)
+    redis_subscriber.start()
+
+    if settings.FAQ_LIST_CACHE_ENABLED:
+        from app.faq.adapter.input.web.faq_router import prewarm_public_faqs
+
+        prewarm_public_faqs()
+
+    write_behind_worker = None
+    if settings.CHAT_WRITE_BEHIND_ENABLED:
+        from app.conversation.infrastructure.queue.chat_write_behind_impl import (
+            ChatWriteBehindWorker,
+            chat_write_behind,
+        )
+        from app.conversation.infrastructure.repository.usage_meter_impl import UsageMeterImpl
+
+        write_behind_worker = ChatWriteBehindWorker(chat_write_behind, SessionLocal, UsageMeterImpl())
+        write_behind_worker.start()
+
+    faq_view_flusher = None
+    if settings.FAQ_VIEW_BUFFER_ENABLED:
+        from app.faq.infrastructure.cache.faq_view_buffer import FAQViewFlusher, faq_view_buffer
+
+        faq_view_flusher = FAQViewFlusher(faq_view_buffer, SessionLocal)
+        faq_view_flusher.start()
+
     yield
-    # Shutdown (cleanup if needed)
+
+    # Shutdown
+    if write_behind_worker is not None:
+        await write_behind_worker.stop()
+    if faq_view_flusher is not None:
+        await faq_view_flusher.stop()
+    redis_subscriber.stop()
+
+    from app.config.redis_config import close_async_redis
+
+    await oauth_http_client.aclose()
+    await close_async_redis()
 
 
 app = FastAPI(
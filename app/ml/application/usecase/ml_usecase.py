@@ -1,20 +1,13 @@
-import base64
 import hashlib
 import json
 import logging
-import os
 
-from dotenv import load_dotenv
-
-from app.common.infrastructure.encryption import AESEncryption
 from app.config.anonymizer import Anonymizer
+from app.config.security.message_crypto import AESEncryption
 from app.ml.application.port.ml_repository_port import MLRepositoryPort
 # from app.ml.application.port.vector_db_port import VectorDBPort
 # from app.ml.infrastructure.vector_db.embedding_service import EmbeddingService
 
-load_dotenv()
-AES_KEY = base64.b64decode(os.getenv("AES_KEY"))
-
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +28,8 @@ class MLUseCase:
 
         ## 유저 정보 가져오기
         anonymizer = Anonymizer()
+        # chat_msg 는 enc_version 에 따라 CBC(기존)/GCM 으로 저장되어 있으므로 메시지 암호화 엔진으로 복호화
+        crypto = AESEncryption()
 
         # USER 메시지 맵
         user_map = {}
@@ -43,10 +38,10 @@ class MLUseCase:
             if row["role"] != "USER":
                 continue
 
-            decrypted = AESEncryption.decrypt(
-                encrypted_data_base64=row["message"],
-                iv_base64=row["iv"],
-                key=AES_KEY
+            decrypted = crypto.decrypt(
+                ciphertext=row["message"],
+                iv=row["iv"],
+                enc_version=row["enc_version"],
             )
 
             user_map[row["id"]] = anonymizer.anonymize(decrypted)
@@ -61,10 +56,10 @@ class MLUseCase:
             if not user_content:
                 continue
 
-            decrypted = AESEncryption.decrypt(
-                encrypted_data_base64=row["message"],
-                iv_base64=row["iv"],
-                key=AES_KEY
+            decrypted = crypto.decrypt(
+                ciphertext=row["message"],
+                iv=row["iv"],
+                enc_version=row["enc_version"],
             )
 
             assistant_content = anonymizer.anonymize(decrypted)
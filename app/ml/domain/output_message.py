@@ -5,7 +5,8 @@ class CounselRow(TypedDict):
     id: int
     account_id: int
     role: str
-    message: str
+    message: bytes
     parent: Optional[int]
-    iv: str
+    iv: bytes
+    enc_version: Optional[int]
     created_at: datetime
\ No newline at end of file
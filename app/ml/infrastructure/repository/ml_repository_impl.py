@@ -51,6 +51,7 @@ class MLRepositoryImpl(MLRepositoryPort):
                     m1.content_enc.label("message"),
                     literal(None).label("parent"),
                     m1.iv.label("iv"),
+                    m1.enc_version.label("enc_version"),
                     m1.created_at.label("created_at"),
                 )
                 .join(m2, m1.room_id == m2.room_id)
@@ -73,6 +74,7 @@ class MLRepositoryImpl(MLRepositoryPort):
                     m2.content_enc.label("message"),
                     m2.parent_id.label("parent"),
                     m2.iv.label("iv"),
+                    m2.enc_version.label("enc_version"),
                     m2.created_at.label("created_at"),
                 )
                 .join(m1, m1.room_id == m2.room_id)
@@ -97,6 +99,7 @@ class MLRepositoryImpl(MLRepositoryPort):
                     "message": row.message,
                     "parent": row.parent,
                     "iv": row.iv,
+                    "enc_version": row.enc_version,
                     "created_at": row.created_at
                 }
                 for row in rows
@@ -0,0 +1,154 @@
+"""
+계정 프로필 조회 벤치마크 (관리자 권한 확인 / 채팅 턴의 MBTI·성별 조회).
+
+실행: python -m benchmark.bench_account_profile [--accounts 1000] [--ops 5000] [--rtt-ms 0.3]
+임시 SQLite DB 에 계정을 채운 뒤 계정 하나당 조회 지연과 Redis 왕복 수를 비교한다.
+- legacy find_by_id : 변경 전 (전체 컬럼 SELECT + Account 엔티티 생성)
+- profile, no cache : find_profile, 캐시 꺼짐 (프로필 컬럼만 SELECT)
+- profile, redis    : Redis 계층 적중 (pub/sub 구독 전이라 로컬 계층 미사용)
+- profile, local    : 워커 로컬 계층 적중
+마지막으로 워커 두 개(각자 RedisSubscriber)를 띄워 한쪽의 save() 가 다른 워커의 로컬 사본을 지우기까지 걸린 시간을 잰다.
+Redis 는 fakeredis 이고, 왕복마다 --rtt-ms 만큼 대기하여 네트워크 왕복을 흉내 낸다.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/gugudan_bench_account_profile.db")
+
+from benchmark.loadtest.env import apply_harness_env  # noqa: E402
+
+apply_harness_env()
+
+import fakeredis  # noqa: E402
+
+from app.account.domain.entity.account_enums import Gender, Mbti  # noqa: E402
+from app.account.infrastructure.cache.account_profile_cache import AccountProfileCache  # noqa: E402
+from app.account.infrastructure.orm.account_model import AccountModel  # noqa: E402
+from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl  # noqa: E402
+from app.config.database.session import Base, SessionLocal, engine  # noqa: E402
+from app.config.redis_pubsub import RedisSubscriber  # noqa: E402
+from benchmark.redis_probe import CountingRedis  # noqa: E402
+
+
+def seed(accounts: int) -> None:
+    engine.echo = False
+    Base.metadata.drop_all(bind=engine, tables=[AccountModel.__table__])
+    Base.metadata.create_all(bind=engine, tables=[AccountModel.__table__])
+    mbtis, genders = list(Mbti), list(Gender)
+    db = SessionLocal()
+    try:
+        db.bulk_insert_mappings(AccountModel, [dict(
+            id=i, email=f"user{i}@example.com", nickname=f"user{i}", terms_agreed=True,
+            role="ADMIN" if i % 100 == 0 else "USER", plan="FREE", status="ACTIVE",
+            mbti=mbtis[i % len(mbtis)].value, gender=genders[i % len(genders)].value,
+        ) for i in range(1, accounts + 1)])
+        db.commit()
+    finally:
+        db.close()
+
+
+def _line(label: str, samples: list[float], round_trips: float) -> None:
+    samples.sort()
+    print(f"  {label:<20} mean {statistics.fmean(samples) * 1e6:8.1f} µs   p50 {samples[len(samples) // 2] * 1e6:8.1f} µs"
+          f"   p99 {samples[int(len(samples) * 0.99)] * 1e6:8.1f} µs   redis round-trips {round_trips:.2f}")
+
+
+def _time(fn, ids: list[int], counter: CountingRedis) -> tuple[list[float], float]:
+    counter.commands = 0
+    samples = []
+    for account_id in ids:
+        started = time.perf_counter()
+        fn(account_id)
+        samples.append(time.perf_counter() - started)
+    return samples, counter.commands / len(ids)
+
+
+def _per_lookup(args, server: fakeredis.FakeServer) -> None:
+    counter = CountingRedis(fakeredis.FakeRedis(server=server, decode_responses=True), args.rtt_ms / 1000)
+    ids = [random.randint(1, args.accounts) for _ in range(args.ops)]
+    db = SessionLocal()
+    try:
+        disabled = AccountRepositoryImpl(db, AccountProfileCache(lambda: counter, enabled=False))
+        redis_tier = AccountRepositoryImpl(db, AccountProfileCache(lambda: counter, enabled=True))
+        local_cache = AccountProfileCache(lambda: counter, enabled=True)
+        local_cache._on_connect()  # 구독 완료 상태로 간주 (로컬 계층 사용)
+        local_tier = AccountRepositoryImpl(db, local_cache)
+        for account_id in range(1, args.accounts + 1):  # 두 캐시 모두 미리 채움
+            redis_tier.find_profile(account_id)
+            local_tier.find_profile(account_id)
+
+        print(f"per lookup, {args.ops} random accounts of {args.accounts}")
+        _line("legacy find_by_id", *_time(disabled.find_by_id, ids, counter))
+        _line("profile, no cache", *_time(disabled.find_profile, ids, counter))
+        _line("profile, redis", *_time(redis_tier.find_profile, ids, counter))
+        _line("profile, local", *_time(local_tier.find_profile, ids, counter))
+    finally:
+        db.close()
+
+
+def _propagation(args, server: fakeredis.FakeServer) -> None:
+    def factory():
+        client = fakeredis.FakeRedis(server=server, decode_responses=True)
+        return lambda: client
+
+    workers = []
+    for _ in range(2):
+        redis_factory = factory()
+        cache = AccountProfileCache(redis_factory, enabled=True)
+        subscriber = RedisSubscriber(redis_factory)
+        subscriber.POLL_SECONDS = 0.01
+        cache.attach(subscriber)
+        subscriber.start()
+        workers.append((cache, subscriber))
+    (cache_a, _), (cache_b, _) = workers
+    deadline = time.monotonic() + 5
+    while not (cache_a._subscribed and cache_b._subscribed) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    db = SessionLocal()
+    try:
+        repo_a, repo_b = AccountRepositoryImpl(db, cache_a), AccountRepositoryImpl(db, cache_b)
+        delays = []
+        for i in range(args.updates):
+            account_id = 1 + i % args.accounts
+            repo_b.find_profile(account_id)  # 워커 B 로컬 사본
+            account = repo_a.find_by_id(account_id)
+            account.mbti = Mbti.INTJ if account.mbti != Mbti.INTJ else Mbti.ENFP
+            started = time.perf_counter()
+            repo_a.save(account)
+            while cache_b._get_local(account_id) is not None:
+                time.sleep(0.0005)
+            delays.append(time.perf_counter() - started)
+            assert repo_b.find_profile(account_id).mbti == account.mbti
+        delays.sort()
+        print(f"invalidation reaching the other worker, {args.updates} updates:"
+              f" p50 {delays[len(delays) // 2] * 1e3:.2f} ms   max {delays[-1] * 1e3:.2f} ms"
+              f"   (save commit + tombstone SET/PUBLISH included)")
+    finally:
+        db.close()
+        for _, subscriber in workers:
+            subscriber.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--accounts", type=int, default=1000)
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--updates", type=int, default=50)
+    parser.add_argument("--rtt-ms", type=float, default=0.3)
+    args = parser.parse_args()
+
+    seed(args.accounts)
+    print(f"fakeredis, simulated RTT {args.rtt_ms} ms, SQLite {os.environ['DATABASE_URL']}")
+    server = fakeredis.FakeServer()
+    _per_lookup(args, server)
+    _propagation(args, server)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
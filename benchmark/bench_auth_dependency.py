@@ -0,0 +1,210 @@
+"""
+인증 의존성 오버헤드 벤치마크 (FastAPI 의존성 해석 + 스레드풀 전환 포함, ASGI 직접 호출).
+
+실행: python -m benchmark.bench_auth_dependency [--requests 5000] [--rtt-ms 0.3] [--redis-url redis://...]
+get_current_account_id 하나에 의존하는 엔드포인트를 세 가지 구성으로 호출하여 요청당 지연(µs)과 Redis 왕복 수를 출력한다.
+- legacy        : 변경 전 의존성 그래프 (요청마다 서비스 생성, 동기 의존성, 동기 Redis EXISTS 블랙리스트)
+- single-pass   : 현재 의존성 (싱글톤 서비스, request.state 캐시) + 비동기 Redis EXISTS 블랙리스트
+- single+cache  : 현재 의존성 + 프로세스 내 블랙리스트 사본 (CachedTokenBlacklist)
+요청은 Bearer 토큰만 보내므로(세션 쿠키 없음) legacy 의 세션 조회는 쿠키 확인에서 끝난다.
+--redis-url 이 없으면 fakeredis 를 쓰고, 왕복마다 --rtt-ms 만큼 대기하여 네트워크 왕복을 흉내 낸다.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("AUTH_BLACKLIST_CACHE_ENABLED", "true")
+
+from benchmark.loadtest.env import apply_harness_env  # noqa: E402
+
+apply_harness_env()
+
+import redis  # noqa: E402
+import redis.asyncio as aioredis  # noqa: E402
+from fastapi import Depends, FastAPI, HTTPException, Request  # noqa: E402
+
+from app.account.adapter.input.web.account_router import get_current_account_id  # noqa: E402
+from app.auth.adapter.input.web.dependencies import get_jwt_service as current_get_jwt_service  # noqa: E402
+from app.auth.application.usecase.session_usecase import SessionUseCase  # noqa: E402
+from app.auth.infrastructure.cache.cached_token_blacklist import token_blacklist_cache  # noqa: E402
+from app.auth.infrastructure.cache.session_repository_impl import SessionRepositoryImpl  # noqa: E402
+from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl  # noqa: E402
+from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService  # noqa: E402
+from app.config import redis_config  # noqa: E402
+from app.config.redis_pubsub import RedisSubscriber  # noqa: E402
+from benchmark.redis_probe import CountingAsyncRedis, CountingRedis  # noqa: E402
+
+
+def _run_to_completion(coro):
+    """I/O 를 기다리지 않는 코루틴(블랙리스트 없는 JWT 검증)을 동기 의존성 안에서 실행"""
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise RuntimeError("coroutine awaited I/O")
+
+
+def legacy_account_dependency(sync_redis: CountingRedis):
+    """변경 전 dependencies.py / account_router.py 의 의존성 그래프와 동일한 구성 (블랙리스트는 동기 EXISTS)"""
+
+    def get_token_blacklist():
+        return sync_redis
+
+    def get_jwt_service(blacklist=Depends(get_token_blacklist)):
+        return JWTTokenService(), blacklist
+
+    def get_optional_jwt_payload(request: Request, services=Depends(get_jwt_service)):
+        jwt_service, blacklist = services
+        token = request.cookies.get("access_token")
+        if not token:
+            auth_header = request.headers.get("Authorization")
+            if auth_header and auth_header.startswith("Bearer "):
+                token = auth_header[7:]
+        if not token:
+            return None
+        payload = _run_to_completion(jwt_service.validate_token(token))
+        if payload is None or blacklist.exists(f"{TokenBlacklistImpl.KEY_PREFIX}{payload.jti}") > 0:
+            return None
+        return payload
+
+    def get_session_repository():
+        return SessionRepositoryImpl()
+
+    def get_session_usecase(session_repo=Depends(get_session_repository)):
+        return SessionUseCase(session_repo)
+
+    def get_optional_session(request: Request, session_usecase=Depends(get_session_usecase)):
+        session_id = request.cookies.get("session_id")
+        if not session_id:
+            return None
+        raise NotImplementedError("benchmark requests carry no session cookie")
+
+    def get_account_id(jwt_payload=Depends(get_optional_jwt_payload), session=Depends(get_optional_session)) -> int:
+        if jwt_payload:
+            return jwt_payload.account_id
+        if session:
+            return session.account_id
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    return get_account_id
+
+
+def _app(account_dependency, jwt_service: JWTTokenService | None = None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(account_id: int = Depends(account_dependency)):
+        return {"account_id": account_id}
+
+    if jwt_service is not None:
+        async def override_jwt_service() -> JWTTokenService:
+            return jwt_service
+
+        app.dependency_overrides[current_get_jwt_service] = override_jwt_service
+    return app
+
+
+async def _call(app: FastAPI, token: str) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/me", "raw_path": b"/me", "root_path": "", "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _measure(label: str, app: FastAPI, requests: int, counters, token: str, revoked: str):
+    assert await _call(app, revoked) == 401, "revoked token accepted"
+    assert await _call(app, token) == 200
+    for _ in range(200):  # warm-up
+        await _call(app, token)
+
+    for counter in counters:
+        counter.commands = 0
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await _call(app, token)
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    commands = sum(counter.commands for counter in counters)
+    print(
+        f"  {label:<12} mean {statistics.fmean(samples) * 1e6:8.1f} µs   p50 {samples[len(samples) // 2] * 1e6:8.1f} µs"
+        f"   p99 {samples[int(len(samples) * 0.99)] * 1e6:8.1f} µs   redis round-trips/request "
+        f"{commands / requests:.2f}"
+    )
+
+
+async def _run(args, sync_counter: CountingRedis, async_counter: CountingAsyncRedis, token: str, revoked: str):
+    counters = (sync_counter, async_counter)
+    await _measure("legacy", _app(legacy_account_dependency(sync_counter)), args.requests, counters, token, revoked)
+    await _measure("single-pass", _app(get_current_account_id, JWTTokenService(blacklist=TokenBlacklistImpl())),
+                   args.requests, counters, token, revoked)
+    await _measure("single+cache", _app(get_current_account_id, JWTTokenService(blacklist=token_blacklist_cache)),
+                   args.requests, counters, token, revoked)
+    await redis_config.close_async_redis()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    parser.add_argument("--redis-url")
+    args = parser.parse_args()
+
+    if args.redis_url:
+        raw = redis.Redis.from_url(args.redis_url, decode_responses=True)
+        async_raw = aioredis.Redis.from_url(args.redis_url, decode_responses=True)
+        rtt = 0.0
+    else:
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        raw = fakeredis.FakeRedis(server=server, decode_responses=True)
+        async_raw = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        rtt = args.rtt_ms / 1000
+    sync_counter = CountingRedis(raw, rtt)
+    async_counter = CountingAsyncRedis(async_raw, rtt)
+    # 싱글톤 서비스가 호출 시점에 사용하는 공용 클라이언트
+    redis_config._redis_instance = sync_counter
+    redis_config._async_redis_instance = async_counter
+
+    service = JWTTokenService()
+    token = service.create_token(account_id=42, provider="GOOGLE").access_token
+    revoked = service.create_token(account_id=43, provider="GOOGLE").access_token
+    raw.set(f"{TokenBlacklistImpl.KEY_PREFIX}{service.decode_without_verification(revoked)['jti']}", "1", ex=3600)
+
+    subscriber = RedisSubscriber(lambda: raw)
+    token_blacklist_cache.attach(subscriber)
+    subscriber.start()
+    deadline = time.monotonic() + 5
+    while not token_blacklist_cache.ready and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    print(f"GET /me with get_current_account_id, {args.requests} requests"
+          f" ({'redis ' + args.redis_url if args.redis_url else f'fakeredis, simulated RTT {args.rtt_ms} ms'})")
+    try:
+        asyncio.run(_run(args, sync_counter, async_counter, token, revoked))
+    finally:
+        subscriber.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""
+긴 채팅방의 대화 로드 + LLM payload 변환 벤치마크.
+
+실행: python -m benchmark.bench_chat_rows [--messages 2000] [--repeat 5]
+임시 SQLite DB 에 한 방의 메시지를 채운 뒤 StreamChatUsecase 와 같은 경로
+(ChatMessageRepositoryImpl.find_path / find_by_room_id -> Conversation.to_llm_payload)를
+새 세션으로 반복 실행하여 단계별 지연 시간과 로드 후 남아 있는 행 메모리(tracemalloc)를 출력한다.
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/gugudan_bench_chat_rows.db")
+
+from benchmark.loadtest.env import apply_harness_env  # noqa: E402
+
+apply_harness_env()
+
+from app.config.database.session import Base, SessionLocal, engine  # noqa: E402
+from app.config.security.message_crypto import AESEncryption  # noqa: E402
+from app.conversation.domain.conversation.aggregate import Conversation  # noqa: E402
+from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm  # noqa: E402
+from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm  # noqa: E402
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm  # noqa: E402
+from app.conversation.infrastructure.repository.chat_message_repository_impl import \
+    ChatMessageRepositoryImpl  # noqa: E402
+
+ROOM_ID = "bench-room"
+USER_TEXT = "요즘 남자친구랑 연락 문제로 자주 다퉈요. 제가 너무 예민한 걸까요? 어떻게 이야기를 꺼내야 할지 모르겠어요."
+ASSISTANT_TEXT = (
+    "연락 빈도에 대한 기대가 서로 다를 때 서운함이 쌓이기 쉬워요. 예민하다기보다는 관계에서 안정감을 "
+    "원하는 마음이 크신 것 같아요. 비난보다는 '나는 이럴 때 불안해'처럼 내 감정을 중심으로 이야기해 보세요."
+)
+
+
+def seed(messages: int) -> int:
+    engine.echo = False
+    tables = [ChatRoomOrm.__table__, ChatMessageOrm.__table__, ChatFeedbackOrm.__table__]
+    Base.metadata.drop_all(bind=engine, tables=tables)
+    Base.metadata.create_all(bind=engine, tables=tables)
+
+    crypto = AESEncryption()
+    base_time = datetime(2026, 1, 1)
+    db = SessionLocal()
+    try:
+        db.add(ChatRoomOrm(
+            room_id=ROOM_ID, account_id=1, title="bench", category="GENERAL", division="DEFAULT",
+            out_api="FALSE", status="ACTIVE", message_count=messages,
+        ))
+        rows = []
+        for n in range(1, messages + 1):
+            role = "USER" if n % 2 else "ASSISTANT"
+            enc, iv = crypto.encrypt(USER_TEXT if role == "USER" else ASSISTANT_TEXT)
+            rows.append(dict(
+                id=n, room_id=ROOM_ID, account_id=1, role=role, content_enc=enc, iv=iv,
+                enc_version=crypto.get_version(), contents_type="TEXT", file_urls=[],
+                parent_id=n - 1 or None, created_at=base_time + timedelta(seconds=n),
+            ))
+        db.execute(ChatMessageOrm.__table__.insert(), rows)
+        db.query(ChatRoomOrm).filter(ChatRoomOrm.room_id == ROOM_ID).update({"last_message_id": messages})
+        db.commit()
+    finally:
+        db.close()
+    return messages
+
+
+def _load(repo, loader: str, head_id: int):
+    if loader == "path":
+        return asyncio.run(repo.find_path(ROOM_ID, head_id))
+    return asyncio.run(repo.find_by_room_id(ROOM_ID))
+
+
+def _run_once(loader: str, head_id: int, crypto) -> dict:
+    db = SessionLocal()
+    try:
+        repo = ChatMessageRepositoryImpl(db)
+        room = db.get(ChatRoomOrm, ROOM_ID)
+        gc.collect()
+
+        started = time.perf_counter()
+        messages = _load(repo, loader, head_id)
+        loaded = time.perf_counter()
+        payload = Conversation(room=room, messages=messages).to_llm_payload(crypto)
+        finished = time.perf_counter()
+        assert len(payload) == len(messages)
+    finally:
+        db.close()
+
+    # 메모리는 시간 측정과 분리하여 별도 세션으로 측정 (tracemalloc 오버헤드 제외)
+    db = SessionLocal()
+    try:
+        repo = ChatMessageRepositoryImpl(db)
+        gc.collect()
+        tracemalloc.start()
+        messages = _load(repo, loader, head_id)
+        rows_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del messages
+    finally:
+        db.close()
+
+    return {
+        "load_ms": (loaded - started) * 1000,
+        "payload_ms": (finished - loaded) * 1000,
+        "rows_kib": rows_bytes / 1024,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    head_id = seed(args.messages)
+    crypto = AESEncryption()
+    print(f"room with {args.messages} messages (median of {args.repeat} runs)")
+    for loader in ("path", "room"):
+        _run_once(loader, head_id, crypto)  # warm-up
+        runs = [_run_once(loader, head_id, crypto) for _ in range(args.repeat)]
+        summary = {key: statistics.median(r[key] for r in runs) for key in runs[0]}
+        print(
+            f"  {loader:<5} load {summary['load_ms']:8.2f} ms   to_llm_payload {summary['payload_ms']:8.2f} ms"
+            f"   rows {summary['rows_kib']:9.1f} KiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,193 @@
+"""
+공개 FAQ 목록(GET /api/v1/faqs) 벤치마크 (ASGI 직접 호출, 스레드풀 전환 포함).
+
+실행: python -m benchmark.bench_faq_list [--requests 2000] [--faqs 60] [--db-rtt-ms 0.5] [--redis-rtt-ms 0.3]
+임시 SQLite DB 에 FAQ 를 채우고 같은 요청 분포(전체/카테고리별 첫 페이지)로 호출하여
+요청당 지연 / SQL 문 수 / Redis 왕복 수 / 응답 본문 크기를 비교한다.
+- legacy      : 변경 전 엔드포인트 (매 요청 SELECT + response_model 직렬화)
+- cached      : 버전 키 캐시 적중 (pre-warm 후)
+- cached 304  : If-None-Match 재검증 (본문 없음)
+마지막으로 FAQ 수정 후 ETag 가 바뀌는지, 다른 워커(별도 캐시 인스턴스)가 버전 변경을 몇 ms 안에 반영하는지 확인한다.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from typing import List, Optional
+
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/gugudan_bench_faq_list.db")
+os.environ.setdefault("FAQ_LIST_CACHE_ENABLED", "true")
+
+from benchmark.loadtest.env import apply_harness_env  # noqa: E402
+
+apply_harness_env()
+
+import fakeredis  # noqa: E402
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI, Query  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.account.infrastructure.orm.account_model import AccountModel  # noqa: E402
+from app.config import redis_config  # noqa: E402
+from app.config.database.session import Base, SessionLocal, engine, get_db_session  # noqa: E402
+from app.faq.adapter.input.web import faq_router  # noqa: E402
+from app.faq.adapter.input.web.response.faq_response import FAQResponse  # noqa: E402
+from app.faq.domain.entity.faq_enums import FAQCategory  # noqa: E402
+from app.faq.infrastructure.cache.faq_list_cache import FAQListCache, faq_list_cache  # noqa: E402
+from app.faq.infrastructure.orm.faq_model import FAQModel  # noqa: E402
+from app.faq.infrastructure.repository.faq_repository_impl import FAQRepositoryImpl  # noqa: E402
+from benchmark.redis_probe import CountingRedis  # noqa: E402
+
+
+class StatementCounter:
+    """SQL 문 수를 세고, 문마다 지정한 지연을 더한다"""
+
+    def __init__(self, rtt_seconds: float):
+        self.rtt = rtt_seconds
+        self.statements = 0
+        event.listen(engine, "before_cursor_execute", self._before)
+
+    def _before(self, *args) -> None:
+        self.statements += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+
+def seed(faqs: int) -> None:
+    engine.echo = False
+    tables = [AccountModel.__table__, FAQModel.__table__]
+    Base.metadata.drop_all(bind=engine, tables=tables)
+    Base.metadata.create_all(bind=engine, tables=tables)
+    categories = list(FAQCategory)
+    db = SessionLocal()
+    try:
+        db.add(AccountModel(id=1, email="admin@example.com", nickname="admin", role="ADMIN"))
+        db.flush()
+        db.bulk_insert_mappings(FAQModel, [dict(
+            category=categories[i % len(categories)].value,
+            question=f"자주 묻는 질문 {i}: 구독을 해지하면 남은 기간은 어떻게 되나요?",
+            answer="해지하더라도 결제한 기간이 끝날 때까지 모든 기능을 이용할 수 있어요. " * 4,
+            display_order=i, is_published=True, view_count=i * 3, created_by=1,
+        ) for i in range(faqs)])
+        db.commit()
+    finally:
+        db.close()
+
+
+def _legacy_app() -> FastAPI:
+    """변경 전 get_public_faqs 와 같은 구현"""
+    app = FastAPI()
+
+    @app.get("/api/v1/faqs", response_model=List[FAQResponse])
+    def get_public_faqs(
+        category: Optional[FAQCategory] = Query(None),
+        offset: int = Query(0, ge=0),
+        limit: int = Query(20, ge=1, le=100),
+        db: Session = Depends(get_db_session),
+    ):
+        faqs = FAQRepositoryImpl(db).find_published(category=category, offset=offset, limit=limit)
+        return [FAQResponse(
+            id=faq.id, category=faq.category, question=faq.question, answer=faq.answer,
+            display_order=faq.display_order, is_published=faq.is_published, view_count=faq.view_count,
+            created_by=faq.created_by, created_at=faq.created_at, updated_at=faq.updated_at,
+        ) for faq in faqs]
+
+    return app
+
+
+def _current_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(faq_router.router, prefix="/api/v1")
+    return app
+
+
+async def _measure(label, client, paths, args, statements, redis, revalidate: dict | None = None) -> None:
+    statements.statements, redis.commands = 0, 0
+    samples, body_bytes, not_modified = [], 0, 0
+    for path in paths:
+        headers = {"If-None-Match": revalidate[path]} if revalidate else {}
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        samples.append(time.perf_counter() - started)
+        body_bytes += len(response.content)
+        not_modified += response.status_code == 304
+    samples.sort()
+    n = len(paths)
+    print(f"  {label:<12} mean {statistics.fmean(samples) * 1e3:6.2f} ms   p50 {samples[n // 2] * 1e3:6.2f} ms"
+          f"   p99 {samples[int(n * 0.99)] * 1e3:6.2f} ms   SQL/req {statements.statements / n:.2f}"
+          f"   redis/req {redis.commands / n:.3f}   body {body_bytes / n:7.0f} B   304s {not_modified}")
+
+
+async def _invalidation(args, current: httpx.AsyncClient, server: fakeredis.FakeServer) -> None:
+    other_worker = FAQListCache(lambda: fakeredis.FakeRedis(server=server, decode_responses=True),
+                                version_poll_seconds=args.poll_seconds)
+    other_worker.get("probe", lambda: b"old")
+
+    before = await current.get("/api/v1/faqs")
+    repo = FAQRepositoryImpl(SessionLocal())
+    faq = repo.find_by_id(1)
+    faq.question = faq.question + " (수정)"
+    FAQRepositoryImpl(SessionLocal()).save(faq)
+    after = await current.get("/api/v1/faqs", headers={"If-None-Match": before.headers["etag"]})
+    assert after.status_code == 200 and after.headers["etag"] != before.headers["etag"]
+    assert "(수정)" in after.text
+
+    started = time.perf_counter()
+    while other_worker.get("probe", lambda: b"new").body == b"old":
+        await asyncio.sleep(0.005)
+    print(f"after an update: this worker served the new ETag immediately; another worker"
+          f" picked up the version in {(time.perf_counter() - started) * 1e3:.0f} ms"
+          f" (poll {args.poll_seconds * 1e3:.0f} ms)")
+
+
+async def _run(args) -> None:
+    server = fakeredis.FakeServer()
+    redis = CountingRedis(fakeredis.FakeRedis(server=server, decode_responses=True), args.redis_rtt_ms / 1000)
+    redis_config._redis_instance = redis
+    statements = StatementCounter(args.db_rtt_ms / 1000)
+
+    warmed = faq_router.prewarm_public_faqs()
+    print(f"pre-warmed {warmed} pages, {args.requests} requests, DB RTT {args.db_rtt_ms} ms,"
+          f" Redis RTT {args.redis_rtt_ms} ms, version poll {faq_list_cache._poll * 1e3:.0f} ms")
+
+    categories = [None, *FAQCategory]
+    paths = []
+    for _ in range(args.requests):
+        category = random.choice(categories)
+        paths.append("/api/v1/faqs" + (f"?category={category.value}" if category else ""))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=_legacy_app()), base_url="http://bench") as legacy, \
+            httpx.AsyncClient(transport=httpx.ASGITransport(app=_current_app()), base_url="http://bench") as current:
+        etags = {}
+        for path in set(paths):  # 응답이 변경 전과 같은지 확인하고 ETag 수집
+            old, new = await legacy.get(path), await current.get(path)
+            assert old.json() == new.json(), path
+            etags[path] = new.headers["etag"]
+
+        await _measure("legacy", legacy, paths, args, statements, redis)
+        await _measure("cached", current, paths, args, statements, redis)
+        await _measure("cached 304", current, paths, args, statements, redis, revalidate=etags)
+        print(f"cache stats {faq_list_cache.stats}")
+        await _invalidation(args, current, server)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--faqs", type=int, default=60)
+    parser.add_argument("--db-rtt-ms", type=float, default=0.5)
+    parser.add_argument("--redis-rtt-ms", type=float, default=0.3)
+    parser.add_argument("--poll-seconds", type=float, default=0.2, help="다른 워커 캐시의 버전 확인 주기")
+    args = parser.parse_args()
+
+    seed(args.faqs)
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,178 @@
+"""
+FAQ 상세 조회수 증가 벤치마크 (DB 직접 증가 vs Redis HINCRBY 버퍼 + 일괄 UPDATE).
+
+실행: python -m benchmark.bench_faq_views [--views 3000] [--faqs 60] [--db-rtt-ms 0.5] [--redis-rtt-ms 0.3] [--flush-every 1000]
+임시 SQLite DB 에 FAQ 를 채우고 인기 FAQ 에 몰리는 분포(1/순위)로 GetFAQDetailUseCase 를 호출하여
+조회당 지연 / SQL 문 수 / Redis 왕복 수를 비교한다.
+- legacy   : 변경 전 경로 (find_by_id SELECT + increment_view_count 의 SELECT + UPDATE + commit)
+- buffered : find_by_id SELECT + HINCRBY (flush-every 조회마다 한 번 일괄 UPDATE, flush 비용은 따로 표시)
+응답의 조회수가 legacy 와 같은 값(DB 반영분 + 대기 증가분)인지, flush 후 DB 값이 정확한지,
+DB 반영이 실패한 flush 의 누적분이 다음 flush 에서 유실/중복 없이 반영되는지 확인한다.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/gugudan_bench_faq_views.db")
+
+from benchmark.loadtest.env import apply_harness_env  # noqa: E402
+
+apply_harness_env()
+
+import fakeredis  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.account.infrastructure.orm.account_model import AccountModel  # noqa: E402
+from app.config.database.session import Base, SessionLocal, engine  # noqa: E402
+from app.faq.application.usecase.get_faq_detail_usecase import GetFAQDetailUseCase  # noqa: E402
+from app.faq.domain.entity.faq_enums import FAQCategory  # noqa: E402
+from app.faq.infrastructure.cache.faq_view_buffer import FAQViewBuffer, FAQViewFlusher  # noqa: E402
+from app.faq.infrastructure.orm.faq_model import FAQModel  # noqa: E402
+from app.faq.infrastructure.repository.faq_repository_impl import FAQRepositoryImpl  # noqa: E402
+from benchmark.redis_probe import CountingRedis  # noqa: E402
+
+
+class StatementCounter:
+    """SQL 문 수를 세고, 문마다 지정한 지연을 더한다"""
+
+    def __init__(self, rtt_seconds: float):
+        self.rtt = rtt_seconds
+        self.statements = 0
+        event.listen(engine, "before_cursor_execute", self._before)
+
+    def _before(self, *args) -> None:
+        self.statements += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+
+def seed(faqs: int) -> None:
+    engine.echo = False
+    tables = [AccountModel.__table__, FAQModel.__table__]
+    Base.metadata.drop_all(bind=engine, tables=tables)
+    Base.metadata.create_all(bind=engine, tables=tables)
+    categories = list(FAQCategory)
+    db = SessionLocal()
+    try:
+        db.add(AccountModel(id=1, email="admin@example.com", nickname="admin", role="ADMIN"))
+        db.flush()
+        db.bulk_insert_mappings(FAQModel, [dict(
+            category=categories[i % len(categories)].value,
+            question=f"자주 묻는 질문 {i}", answer="답변 " * 20,
+            display_order=i, is_published=True, view_count=i * 3, created_by=1,
+        ) for i in range(faqs)])
+        db.commit()
+    finally:
+        db.close()
+
+
+def db_counts() -> dict[int, int]:
+    db = SessionLocal()
+    try:
+        return dict(db.query(FAQModel.id, FAQModel.view_count).all())
+    finally:
+        db.close()
+
+
+def _line(label: str, samples: list[float], statements: int, redis_commands: int, n: int) -> None:
+    samples.sort()
+    print(f"  {label:<10} mean {statistics.fmean(samples) * 1e3:6.3f} ms   p50 {samples[n // 2] * 1e3:6.3f} ms"
+          f"   p99 {samples[int(n * 0.99)] * 1e3:6.3f} ms   SQL/view {statements / n:.2f}"
+          f"   redis/view {redis_commands / n:.2f}")
+
+
+def _legacy(ids: list[int], statements: StatementCounter, expected: dict[int, int]) -> None:
+    statements.statements = 0
+    samples = []
+    for faq_id in ids:
+        started = time.perf_counter()
+        faq = GetFAQDetailUseCase(FAQRepositoryImpl(SessionLocal())).execute(faq_id)
+        samples.append(time.perf_counter() - started)
+        expected[faq_id] += 1
+        assert faq.view_count == expected[faq_id], (faq_id, faq.view_count, expected[faq_id])
+    _line("legacy", samples, statements.statements, 0, len(ids))
+
+
+def _buffered(ids: list[int], args, statements: StatementCounter, redis: CountingRedis,
+              buffer: FAQViewBuffer, flusher: FAQViewFlusher, expected: dict[int, int]) -> None:
+    statements.statements, redis.commands = 0, 0
+    samples, flush_samples, flush_statements, flush_redis = [], [], 0, 0
+    for i, faq_id in enumerate(ids, 1):
+        started = time.perf_counter()
+        faq = GetFAQDetailUseCase(FAQRepositoryImpl(SessionLocal()), view_counter=buffer).execute(faq_id)
+        samples.append(time.perf_counter() - started)
+        expected[faq_id] += 1
+        assert faq.view_count == expected[faq_id], (faq_id, faq.view_count, expected[faq_id])
+
+        if i % args.flush_every == 0 or i == len(ids):
+            before_sql, before_redis = statements.statements, redis.commands
+            started = time.perf_counter()
+            flusher.flush_once()
+            flush_samples.append(time.perf_counter() - started)
+            flush_statements += statements.statements - before_sql
+            flush_redis += redis.commands - before_redis
+
+    n = len(ids)
+    _line("buffered", samples, statements.statements - flush_statements, redis.commands - flush_redis, n)
+    print(f"  flush      {len(flush_samples)} flushes, mean {statistics.fmean(flush_samples) * 1e3:.2f} ms,"
+          f" SQL/flush {flush_statements / len(flush_samples):.1f}, redis/flush {flush_redis / len(flush_samples):.1f}"
+          f"   -> amortized SQL/view {flush_statements / n:.4f}")
+    assert db_counts() == expected, "flush 후 DB 조회수 불일치"
+    print("  DB view_count after flush matches every served count")
+
+
+def _failed_flush(buffer: FAQViewBuffer, flusher: FAQViewFlusher, expected: dict[int, int]) -> None:
+    for faq_id in (1, 1, 2):
+        GetFAQDetailUseCase(FAQRepositoryImpl(SessionLocal()), view_counter=buffer).execute(faq_id)
+        expected[faq_id] += 1
+
+    def broken(deltas):
+        raise RuntimeError("db down")
+
+    try:
+        buffer.flush(broken)
+    except RuntimeError:
+        pass
+    # 반영 실패 중에 들어온 조회: 응답에는 재시도 대기분(flushing)까지 포함된다
+    faq = GetFAQDetailUseCase(FAQRepositoryImpl(SessionLocal()), view_counter=buffer).execute(1)
+    expected[1] += 1
+    assert faq.view_count == expected[1], (faq.view_count, expected[1])
+
+    flusher.flush_once()  # 실패한 누적분
+    flusher.flush_once()  # 실패 중에 쌓인 조회
+    assert db_counts() == expected, "실패한 flush 재시도 후 DB 조회수 불일치"
+    print("  a failed flush is retried by the next flush without losing or double-counting views")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--views", type=int, default=3000)
+    parser.add_argument("--faqs", type=int, default=60)
+    parser.add_argument("--db-rtt-ms", type=float, default=0.5)
+    parser.add_argument("--redis-rtt-ms", type=float, default=0.3)
+    parser.add_argument("--flush-every", type=int, default=1000, help="이 조회 수마다 한 번 flush (FAQ_VIEW_FLUSH_SECONDS 주기 대신)")
+    args = parser.parse_args()
+
+    seed(args.faqs)
+    statements = StatementCounter(args.db_rtt_ms / 1000)
+    redis = CountingRedis(fakeredis.FakeRedis(decode_responses=True), args.redis_rtt_ms / 1000)
+    buffer = FAQViewBuffer(lambda: redis)
+    flusher = FAQViewFlusher(buffer, SessionLocal, interval_seconds=1)
+
+    ids = list(db_counts())
+    ids = random.choices(ids, weights=[1 / rank for rank in range(1, len(ids) + 1)], k=args.views)
+    expected = db_counts()
+    print(f"{args.views} detail views over {args.faqs} FAQs (top FAQ {ids.count(1) / len(ids):.0%} of views),"
+          f" DB RTT {args.db_rtt_ms} ms, Redis RTT {args.redis_rtt_ms} ms")
+    _legacy(ids, statements, expected)
+    _buffered(ids, args, statements, redis, buffer, flusher, expected)
+    _failed_flush(buffer, flusher, expected)
+    print(f"buffer stats {buffer.stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
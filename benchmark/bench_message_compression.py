@@ -0,0 +1,210 @@
+"""
+메시지 압축(enc_version 방식 3: raw deflate + AES-GCM) 저장 공간 / 처리량 벤치마크.
+
+실행: python -m benchmark.bench_message_compression [--messages 5000] [--seconds 0.5] [--dictionary 사전 파일]
+합성 상담 말뭉치(사용자 질문 + AI 답변)를 만들어 방식 2(GCM, 무압축)와 방식 3의 암호문 크기 합계,
+압축 적용 비율, encrypt/decrypt 처리량(원문 기준 MB/s)을 출력한다.
+벤치마크 페이로드(benchmark/micro/payloads.py)는 말뭉치 생성기와 무관한 문장이라 따로 표시한다.
+--dictionary 를 주면 등록 전의 후보 사전으로 압축했을 때의 크기도 함께 표시한다.
+
+사전 학습: python -m benchmark.bench_message_compression --train-out app/config/security/message_zdict_vN.txt \\
+          --corpus 한 줄에 한 메시지인 텍스트 파일
+말뭉치는 운영 메시지 표본(복호화한 원문)이어야 한다. 합성 말뭉치로 학습한 사전은 이 생성기의 문장에만 맞으므로 쓰지 않는다.
+학습한 사전은 새 id(2 이상)로 message_compression.DICTIONARY_FILES 에 추가한다.
+"""
+
+import argparse
+import random
+import time
+import zlib
+
+from benchmark.loadtest.env import apply_harness_env
+
+apply_harness_env()
+
+from app.config.security.message_compression import train_dictionary  # noqa: E402
+from app.config.security.message_crypto import ENC_VERSION_GCM, ENC_VERSION_GCM_ZLIB, AESEncryption  # noqa: E402
+from benchmark.micro import payloads  # noqa: E402
+
+EVAL_SEED = 1
+
+_PARTNERS = ["남자친구", "여자친구", "남편", "아내", "애인", "예비 신랑", "예비 신부", "전 여자친구", "전 남자친구"]
+_DURATIONS = ["사귄 지 3개월", "연애한 지 1년", "만난 지 2년", "결혼한 지 5년", "동거한 지 반년", "연애 7년 차"]
+_SITUATIONS = [
+    "연락이 예전보다 많이 줄었어요",
+    "사소한 일로 자주 다퉈요",
+    "약속 시간에 자꾸 늦어요",
+    "친구들과 노는 걸 더 좋아하는 것 같아요",
+    "제 이야기를 잘 들어주지 않아요",
+    "양가 부모님 문제로 계속 부딪혀요",
+    "돈 쓰는 습관이 너무 달라요",
+    "휴대폰만 보고 대화를 잘 안 해요",
+    "기념일을 잊어버렸어요",
+    "집안일 분담 때문에 싸웠어요",
+    "이별을 통보받았어요",
+    "결혼 이야기를 꺼내면 피해요",
+]
+_FEELINGS = [
+    "너무 서운하고 속상해요",
+    "불안해서 잠이 안 와요",
+    "제가 예민한 건지 모르겠어요",
+    "화가 나다가도 미안해져요",
+    "지치고 외로워요",
+    "자존감이 많이 떨어졌어요",
+]
+_QUESTIONS = [
+    "어떻게 이야기를 꺼내야 할까요?",
+    "제가 먼저 연락해야 할까요?",
+    "헤어지는 게 맞을까요?",
+    "이 관계를 계속 이어가도 될까요?",
+    "어떻게 하면 마음이 좀 편해질까요?",
+    "상대 입장에서는 어떤 마음일까요?",
+]
+_EMPATHY = [
+    "말씀해 주셔서 고마워요.",
+    "많이 속상하셨겠어요.",
+    "그런 상황이라면 누구라도 서운할 수 있어요.",
+    "혼자서 오래 고민하셨을 것 같아요.",
+    "마음이 많이 복잡하시겠어요.",
+]
+_REFLECTIONS = [
+    "지금 느끼시는 감정은 관계에서 안정감을 원하는 자연스러운 마음이에요.",
+    "예민하다기보다는 그만큼 관계를 소중하게 생각하고 계신 것 같아요.",
+    "상대의 행동 자체보다 존중받지 못했다고 느낀 부분이 더 크게 다가왔을 수 있어요.",
+    "서로 기대하는 연락 빈도나 표현 방식이 다를 때 이런 갈등이 자주 생겨요.",
+    "반복되는 다툼 뒤에는 서로 채워지지 않은 욕구가 숨어 있는 경우가 많아요.",
+]
+_SUGGESTIONS = [
+    "비난보다는 '나는 이럴 때 불안해'처럼 내 감정을 중심으로 이야기해 보세요.",
+    "대화를 시작하기 전에 내가 정말 바라는 것이 무엇인지 먼저 정리해 보면 도움이 돼요.",
+    "감정이 격해졌을 때는 잠시 시간을 두고 차분해진 뒤에 다시 이야기하는 것도 방법이에요.",
+    "상대가 느꼈을 감정을 먼저 인정해 주면 방어적인 반응이 줄어들 수 있어요.",
+    "두 분이 함께 지킬 수 있는 작은 약속부터 정해 보는 건 어떨까요?",
+    "혼자 결론을 내리기보다는 상대의 생각도 직접 물어보세요.",
+]
+_CLOSINGS = [
+    "천천히 생각해 보시고 언제든 다시 이야기해 주세요.",
+    "어떤 선택을 하시든 스스로를 너무 탓하지 않으셨으면 해요.",
+    "지금 가장 마음에 걸리는 부분이 무엇인지 조금 더 들려주실 수 있을까요?",
+    "",
+]
+
+
+def synthetic_corpus(count: int, seed: int) -> list[str]:
+    """사용자 질문과 AI 답변이 번갈아 나오는 합성 상담 메시지"""
+    rng = random.Random(seed)
+    messages = []
+    for i in range(count):
+        if i % 2 == 0:
+            parts = [
+                f"{rng.choice(_DURATIONS)}인 {_subject(rng.choice(_PARTNERS))} 있는데 요즘 {rng.choice(_SITUATIONS)}.",
+                *(f"{rng.choice(_SITUATIONS)}." for _ in range(rng.randint(0, 2))),
+                f"{rng.choice(_FEELINGS)}.",
+                rng.choice(_QUESTIONS),
+            ]
+        else:
+            parts = [
+                rng.choice(_EMPATHY),
+                *rng.sample(_REFLECTIONS, rng.randint(1, 3)),
+                *rng.sample(_SUGGESTIONS, rng.randint(1, 4)),
+                rng.choice(_CLOSINGS),
+            ]
+        messages.append(" ".join(p for p in parts if p))
+    return messages
+
+
+def _subject(word: str) -> str:
+    """받침 유무에 따라 주격 조사 이/가 를 붙인다"""
+    last = ord(word[-1]) - 0xAC00
+    return word + ("이" if 0 <= last < 11172 and last % 28 else "가")
+
+
+def _throughput(fn, seconds: float) -> float:
+    fn()
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        fn()
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+def _storage(crypto: AESEncryption, texts: list[str]) -> tuple[list, int]:
+    rows = [(ct, iv, crypto.get_version()) for ct, iv in crypto.encrypt_many(texts)]
+    total = sum(len(ct) for ct, _, _ in rows)
+    return rows, total
+
+
+def _report(title: str, texts: list[str], gcm: AESEncryption, compressed: AESEncryption, seconds: float,
+            dictionary: bytes | None) -> None:
+    raw_bytes = sum(len(t.encode("utf-8")) for t in texts)
+    gcm_rows, gcm_total = _storage(gcm, texts)
+    zlib_rows, zlib_total = _storage(compressed, texts)
+    encoded = [t.encode("utf-8") for t in texts]
+    packed = sum(1 for data in encoded if compressed.compressor.pack(data)[0] != 0)
+
+    print(f"{title}: {len(texts)} messages, {raw_bytes / 1024:.1f} KiB UTF-8")
+    print(f"  content_enc total  GCM {gcm_total / 1024:9.1f} KiB   GCM+zlib {zlib_total / 1024:9.1f} KiB"
+          f"   saved {1 - zlib_total / gcm_total:6.1%}")
+    if dictionary is not None:
+        # 같은 임계값으로 후보 사전을 써서 압축했을 때의 크기 (헤더 1 + 본문 + GCM 태그 16)
+        def _with_dictionary(data: bytes) -> int:
+            if len(data) < compressed.compressor.min_bytes:
+                return len(data)
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -15, zdict=dictionary)
+            return min(len(data), len(compressor.compress(data) + compressor.flush()))
+
+        dict_total = sum(1 + _with_dictionary(data) + 16 for data in encoded)
+        print(f"  candidate dictionary would save {1 - dict_total / gcm_total:.1%}")
+    print(f"  compressed rows    {packed}/{len(texts)} (min {compressed.compressor.min_bytes} bytes)")
+
+    mb = raw_bytes / 1_000_000
+    enc_gcm = _throughput(lambda: gcm.encrypt_many(texts), seconds) * mb
+    enc_zlib = _throughput(lambda: compressed.encrypt_many(texts), seconds) * mb
+    dec_gcm = _throughput(lambda: gcm.decrypt_many(gcm_rows), seconds) * mb
+    dec_zlib = _throughput(lambda: compressed.decrypt_many(zlib_rows), seconds) * mb
+    print(f"  encrypt            GCM {enc_gcm:8.1f} MB/s   GCM+zlib {enc_zlib:8.1f} MB/s")
+    print(f"  decrypt            GCM {dec_gcm:8.1f} MB/s   GCM+zlib {dec_zlib:8.1f} MB/s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--seconds", type=float, default=0.5)
+    parser.add_argument("--train-out", help="사전을 학습해 이 경로에 저장하고 종료")
+    parser.add_argument("--corpus", help="사전 학습용 운영 메시지 표본 (한 줄에 한 메시지)")
+    parser.add_argument("--dictionary", help="크기를 비교할 후보 사전 파일")
+    args = parser.parse_args()
+
+    if args.train_out:
+        if not args.corpus:
+            parser.error("--train-out requires --corpus (sampled production messages)")
+        with open(args.corpus, encoding="utf-8") as f:
+            samples = [line.strip() for line in f if line.strip()]
+        dictionary = train_dictionary(samples)
+        with open(args.train_out, "wb") as f:
+            f.write(dictionary)
+        print(f"dictionary {len(dictionary)} bytes from {len(samples)} samples -> {args.train_out}")
+        return 0
+
+    gcm = AESEncryption(compression=False)
+    compressed = AESEncryption(compression=True)
+    assert gcm.get_version() % 10 == ENC_VERSION_GCM and compressed.get_version() % 10 == ENC_VERSION_GCM_ZLIB
+    candidate = None
+    if args.dictionary:
+        with open(args.dictionary, "rb") as f:
+            candidate = f.read()
+    active = compressed.compressor.dictionary
+    print(f"active dictionary: {f'{len(active)} bytes' if active is not None else 'none'}"
+          + (f", candidate {len(candidate)} bytes" if candidate is not None else ""))
+
+    _report("synthetic corpus", synthetic_corpus(args.messages, EVAL_SEED), gcm, compressed, args.seconds, candidate)
+    fixed = [payloads.SHORT_MESSAGE, payloads.MEDIUM_MESSAGE, payloads.LONG_MESSAGE, payloads.PII_MESSAGE,
+             payloads.ASSISTANT_REPLY] * 200
+    _report("benchmark payloads", fixed, gcm, compressed, args.seconds, candidate)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+"""
+채팅 메시지 암호화 처리량 벤치마크: 기존 구현(AES-CBC, 호출마다 Cipher/패더 생성) vs 현재 엔진.
+
+실행: python -m benchmark.bench_message_crypto [--seconds 0.5]
+메시지 길이별 encrypt/decrypt 단건과 200건 히스토리의 encrypt_many/decrypt_many 처리량(ops/s, MB/s)을 출력한다.
+"""
+
+import argparse
+import base64
+import os
+import time
+
+from benchmark.loadtest.env import apply_harness_env
+
+apply_harness_env()
+
+from cryptography.hazmat.backends import default_backend  # noqa: E402
+from cryptography.hazmat.primitives import padding  # noqa: E402
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes  # noqa: E402
+
+from app.config.security.message_crypto import ENC_VERSION_CBC, AESEncryption  # noqa: E402
+from benchmark.micro import payloads  # noqa: E402
+
+HISTORY_SIZE = 200
+
+
+class LegacyCBCEncryption:
+    """변경 전 message_crypto.AESEncryption 의 encrypt/decrypt 와 동일한 구현 (비교 기준)"""
+
+    def __init__(self):
+        self.key = base64.b64decode(os.environ["AES_KEY"])
+        self.iv = base64.b64decode(os.environ["AES_IV"])
+
+    def encrypt(self, plaintext: str) -> tuple[bytes, bytes]:
+        padder = padding.PKCS7(128).padder()
+        padded_data = padder.update(plaintext.encode('utf-8')) + padder.finalize()
+        cipher = Cipher(algorithms.AES(self.key), modes.CBC(self.iv), backend=default_backend())
+        encryptor = cipher.encryptor()
+        return encryptor.update(padded_data) + encryptor.finalize(), self.iv
+
+    def decrypt(self, ciphertext: bytes, iv: bytes = None) -> str:
+        cipher = Cipher(algorithms.AES(self.key), modes.CBC(iv or self.iv), backend=default_backend())
+        decryptor = cipher.decryptor()
+        decrypted_padded = decryptor.update(ciphertext) + decryptor.finalize()
+        unpadder = padding.PKCS7(128).unpadder()
+        return (unpadder.update(decrypted_padded) + unpadder.finalize()).decode('utf-8')
+
+
+def _throughput(fn, seconds: float) -> float:
+    """seconds 동안 반복 실행한 초당 호출 수"""
+    fn()
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        fn()
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+def _row(label: str, ops: float, payload_bytes: int, baseline_ops: float | None = None) -> str:
+    mb_s = ops * payload_bytes / 1_000_000
+    speedup = f"  x{ops / baseline_ops:4.2f}" if baseline_ops else ""
+    return f"  {label:<34} {ops:12,.0f} ops/s {mb_s:8.2f} MB/s{speedup}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=0.5, help="측정 항목별 실행 시간")
+    args = parser.parse_args()
+
+    legacy = LegacyCBCEncryption()
+    engine = AESEncryption()
+
+    for name, text in (
+            ("short", payloads.SHORT_MESSAGE),
+            ("medium", payloads.MEDIUM_MESSAGE),
+            ("long", payloads.LONG_MESSAGE),
+    ):
+        size = len(text.encode("utf-8"))
+        print(f"{name} message ({size} bytes)")
+
+        legacy_ct, legacy_iv = legacy.encrypt(text)
+        gcm_ct, gcm_nonce = engine.encrypt(text)
+
+        base_enc = _throughput(lambda: legacy.encrypt(text), args.seconds)
+        print(_row("legacy CBC encrypt", base_enc, size))
+        print(_row("GCM encrypt", _throughput(lambda: engine.encrypt(text), args.seconds), size, base_enc))
+
+        base_dec = _throughput(lambda: legacy.decrypt(legacy_ct, legacy_iv), args.seconds)
+        print(_row("legacy CBC decrypt", base_dec, size))
+        print(_row(
+            "CBC decrypt via enc_version",
+            _throughput(lambda: engine.decrypt(legacy_ct, legacy_iv, ENC_VERSION_CBC), args.seconds),
+            size, base_dec,
+        ))
+        print(_row(
+            "GCM decrypt",
+            _throughput(lambda: engine.decrypt(gcm_ct, gcm_nonce, engine.get_version()), args.seconds),
+            size, base_dec,
+        ))
+
+    texts = [payloads.MEDIUM_MESSAGE if i % 2 == 0 else payloads.ASSISTANT_REPLY for i in range(HISTORY_SIZE)]
+    history_bytes = sum(len(t.encode("utf-8")) for t in texts)
+    legacy_rows = [legacy.encrypt(t) for t in texts]
+    gcm_rows = [(ct, nonce, engine.get_version()) for ct, nonce in engine.encrypt_many(texts)]
+
+    print(f"history of {HISTORY_SIZE} messages ({history_bytes} bytes)")
+    base_enc = _throughput(lambda: [legacy.encrypt(t) for t in texts], args.seconds)
+    print(_row("legacy CBC encrypt loop", base_enc, history_bytes))
+    print(_row("GCM encrypt_many", _throughput(lambda: engine.encrypt_many(texts), args.seconds),
+               history_bytes, base_enc))
+    base_dec = _throughput(lambda: [legacy.decrypt(ct, iv) for ct, iv in legacy_rows], args.seconds)
+    print(_row("legacy CBC decrypt loop", base_dec, history_bytes))
+    print(_row("GCM decrypt_many", _throughput(lambda: engine.decrypt_many(gcm_rows), args.seconds),
+               history_bytes, base_dec))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,326 @@
+"""
+OAuth 로그인 콜백의 외부 호출 구간 지연 벤치마크 (토큰 교환 + 사용자 정보 조회 또는 ID 토큰 검증).
+
+실행: python -m benchmark.bench_oauth_callback [--logins 200] [--concurrency 20] [--rtt-ms 20] [--server-ms 5]
+로컬 가짜 OAuth 서버(hypercorn, TLS, ALPN h2/http1.1) 앞에 지연 프록시를 두어 네트워크 왕복을 흉내 낸다.
+프록시는 새 연결마다 TCP 핸드셰이크 1 RTT 를 더하고, 모든 데이터를 편도 RTT/2 만큼 늦게 전달한다.
+- legacy      : 변경 전 방식 (호출마다 provider 생성, 요청마다 새 httpx.AsyncClient → 매번 TCP + TLS)
+- pooled h1   : 공유 OAuthHttpClient, HTTP/1.1 keep-alive
+- pooled h2   : 공유 OAuthHttpClient, HTTP/2 (ALPN 협상)
+- h2 id_token : pooled h2 + provider.authenticate() — 토큰 응답의 ID 토큰을 캐시된 JWKS 로 로컬 검증, userinfo 생략
+순차 로그인과 --concurrency 개 동시 로그인 각각의 p50/p90/p99 와 새로 연 연결 수를 출력한다.
+가짜 서버는 로컬에서 만든 RSA 키로 ID 토큰에 서명하고 /jwks 로 공개키를 내려준다.
+마지막으로 서명 키를 교체(kid 변경)했을 때 JWKS 를 한 번만 다시 받는지 확인한다.
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import os
+import ssl
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmark.loadtest.env import apply_harness_env
+
+apply_harness_env()
+os.environ.setdefault("GOOGLE_CLIENT_ID", "bench-client")  # ID 토큰 aud
+os.environ.setdefault("OAUTH_JWKS_MIN_REFRESH_SECONDS", "1")  # 키 교체 확인을 위해 짧게
+
+import httpx  # noqa: E402
+import jwt  # noqa: E402
+from cryptography import x509  # noqa: E402
+from cryptography.hazmat.primitives import hashes, serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec, rsa  # noqa: E402
+from cryptography.x509.oid import NameOID  # noqa: E402
+from fastapi import FastAPI, Form, Header  # noqa: E402
+
+from app.auth.infrastructure.oauth.factory import OAuthProviderFactory  # noqa: E402
+from app.auth.infrastructure.oauth.google import GoogleOAuthProvider  # noqa: E402
+from app.auth.infrastructure.oauth.http_client import OAuthHttpClient  # noqa: E402
+from app.auth.infrastructure.oauth.jwks_cache import get_jwks_cache  # noqa: E402
+from app.config.settings import settings  # noqa: E402
+
+
+def _self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / "cert.pem", directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    return cert_path, key_path
+
+
+class SigningKeys:
+    """가짜 서버의 ID 토큰 서명 키 (rotate() 로 새 kid 의 키로 교체)"""
+
+    def __init__(self):
+        self.generation = 0
+        self.rotate()
+
+    def rotate(self) -> None:
+        self.generation += 1
+        self.kid = f"bench-key-{self.generation}"
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def jwks(self) -> dict:
+        jwk = jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key(), as_dict=True)
+        return {"keys": [{**jwk, "kid": self.kid, "use": "sig", "alg": "RS256"}]}
+
+    def id_token(self, issuer: str, audience: str, sub: str) -> str:
+        now = int(time.time())
+        claims = {"iss": issuer, "aud": audience, "sub": sub, "iat": now, "exp": now + 3600,
+                  "email": f"user{sub}@example.com", "name": f"user {sub}"}
+        return jwt.encode(claims, self.private_key, algorithm="RS256", headers={"kid": self.kid})
+
+
+def _fake_oauth_app(server_seconds: float, keys: SigningKeys) -> FastAPI:
+    app = FastAPI()
+    app.state.issuer = ""
+
+    @app.post("/token")
+    async def token(code: str = Form(...), client_id: str = Form("")):
+        if server_seconds:
+            await asyncio.sleep(server_seconds)
+        return {"access_token": f"access-{code}", "token_type": "Bearer", "expires_in": 3599,
+                "id_token": keys.id_token(app.state.issuer, client_id, code)}
+
+    @app.get("/jwks")
+    async def jwks():
+        if server_seconds:
+            await asyncio.sleep(server_seconds)
+        return keys.jwks()
+
+    @app.get("/userinfo")
+    async def userinfo(authorization: str = Header(...)):
+        if server_seconds:
+            await asyncio.sleep(server_seconds)
+        sub = authorization.removeprefix("Bearer access-")
+        return {"sub": sub, "email": f"user{sub}@example.com", "name": f"user {sub}", "picture": None}
+
+    return app
+
+
+class LatencyProxy:
+    """새 연결에 1 RTT, 데이터에 편도 RTT/2 지연을 더하는 TCP 프록시 (연결 수 집계)"""
+
+    def __init__(self, upstream_port: int, rtt_seconds: float):
+        self._upstream_port = upstream_port
+        self._rtt = rtt_seconds
+        self.connections = 0
+        self.port = 0
+
+    async def start(self) -> None:
+        server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = server.sockets[0].getsockname()[1]
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        await asyncio.sleep(self._rtt)  # TCP 핸드셰이크
+        up_reader, up_writer = await asyncio.open_connection("127.0.0.1", self._upstream_port)
+        await asyncio.gather(self._pipe(reader, up_writer), self._pipe(up_reader, writer), return_exceptions=True)
+
+    async def _pipe(self, reader, writer) -> None:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def deliver():
+            while True:
+                due, data = await queue.get()
+                if data is None:
+                    break
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                writer.write(data)
+                await writer.drain()
+
+        task = asyncio.create_task(deliver())
+        try:
+            while data := await reader.read(65536):
+                queue.put_nowait((loop.time() + self._rtt / 2, data))
+        finally:
+            queue.put_nowait((0, None))
+            try:
+                await task
+            finally:
+                writer.close()
+
+
+def _start_server(args, cert: Path, key: Path, keys: SigningKeys) -> tuple[LatencyProxy, threading.Event]:
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    ready, stop = threading.Event(), threading.Event()
+    holder: dict = {}
+
+    async def main():
+        config = Config()
+        config.bind = ["127.0.0.1:0"]
+        config.certfile, config.keyfile = str(cert), str(key)
+        config.errorlog = None
+        stopped = asyncio.Event()
+        sockets = config.create_sockets()
+        port = sockets.secure_sockets[0].getsockname()[1]
+        config.bind = [f"127.0.0.1:{port}"]
+        for sock in sockets.secure_sockets:
+            sock.close()
+        app = _fake_oauth_app(args.server_ms / 1000, keys)
+        serve_task = asyncio.create_task(serve(app, config, shutdown_trigger=stopped.wait))
+        proxy = LatencyProxy(port, args.rtt_ms / 1000)
+        await proxy.start()
+        app.state.issuer = f"https://127.0.0.1:{proxy.port}"
+        holder["proxy"] = proxy
+        ready.set()
+        while not stop.is_set():
+            await asyncio.sleep(0.05)
+        stopped.set()
+        await serve_task
+
+    threading.Thread(target=lambda: asyncio.run(main()), name="fake-oauth", daemon=True).start()
+    ready.wait(10)
+    return holder["proxy"], stop
+
+
+async def _legacy_login(base_url: str, verify: ssl.SSLContext, code: str) -> str:
+    """변경 전 BaseOAuthProvider 와 같이 호출마다 provider 와 클라이언트를 새로 만든다"""
+    provider = GoogleOAuthProvider()
+    async with httpx.AsyncClient(verify=verify) as client:
+        response = await client.post(f"{base_url}/token", data={
+            "client_id": provider.client_id, "client_secret": provider.client_secret, "code": code,
+            "redirect_uri": provider.redirect_uri, "grant_type": "authorization_code",
+        }, headers={"Accept": "application/json"})
+        response.raise_for_status()
+        access_token = response.json().get("access_token", "")
+    async with httpx.AsyncClient(verify=verify) as client:
+        response = await client.get(f"{base_url}/userinfo", headers={"Authorization": f"Bearer {access_token}"})
+        response.raise_for_status()
+        return response.json()["email"]
+
+
+def _pooled_login(base_url: str, http_client: OAuthHttpClient):
+    async def login(code: str) -> str:
+        provider = OAuthProviderFactory.get_provider("google")
+        provider.TOKEN_URL, provider.USERINFO_URL = f"{base_url}/token", f"{base_url}/userinfo"
+        provider.http_client = http_client
+        access_token = await provider.exchange_code_for_token(code)
+        return (await provider.get_user_info(access_token)).email
+
+    return login
+
+
+def _id_token_login(base_url: str, http_client: OAuthHttpClient):
+    async def login(code: str) -> str:
+        provider = OAuthProviderFactory.get_provider("google")
+        provider.TOKEN_URL, provider.USERINFO_URL = f"{base_url}/token", f"{base_url}/userinfo"
+        provider.JWKS_URL, provider.ID_TOKEN_ISSUERS = f"{base_url}/jwks", (base_url,)
+        provider.http_client = http_client
+        return (await provider.authenticate(code)).email
+
+    return login
+
+
+def _percentiles(samples: list[float]) -> str:
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(len(samples) * q))] * 1e3  # noqa: E731
+    return f"p50 {pick(0.5):7.1f} ms   p90 {pick(0.9):7.1f} ms   p99 {pick(0.99):7.1f} ms"
+
+
+async def _measure(label: str, login, proxy: LatencyProxy, args) -> None:
+    await login("warmup")
+    connections = proxy.connections
+
+    sequential = []
+    for i in range(args.logins):
+        started = time.perf_counter()
+        assert (await login(str(i))) == f"user{i}@example.com"
+        sequential.append(time.perf_counter() - started)
+    sequential_connections = proxy.connections - connections
+
+    concurrent = []
+
+    async def timed(code: str):
+        started = time.perf_counter()
+        await login(code)
+        concurrent.append(time.perf_counter() - started)
+
+    connections = proxy.connections
+    for round_ in range(max(1, args.logins // args.concurrency)):
+        await asyncio.gather(*(timed(f"{round_}-{i}") for i in range(args.concurrency)))
+    print(f"  {label:<12} sequential {_percentiles(sequential)}   mean {statistics.fmean(sequential) * 1e3:7.1f} ms"
+          f"   new connections {sequential_connections}")
+    print(f"  {'':<12} concurrent {_percentiles(concurrent)}   mean {statistics.fmean(concurrent) * 1e3:7.1f} ms"
+          f"   new connections {proxy.connections - connections}")
+
+
+async def _key_rotation(base_url: str, http_client: OAuthHttpClient, keys: SigningKeys) -> None:
+    login = _id_token_login(base_url, http_client)
+    cache = get_jwks_cache(f"{base_url}/jwks")
+    await asyncio.sleep(settings.OAUTH_JWKS_MIN_REFRESH_SECONDS)  # 직전 fetch 후 최소 간격이 지나야 새 kid 로 다시 받는다
+    keys.rotate()
+    before = dict(cache.stats)
+    for i in range(20):
+        assert (await login(f"rotated-{i}")) == f"userrotated-{i}@example.com"
+    delta = {name: cache.stats[name] - before[name] for name in before}
+    print(f"key rotation ({keys.kid}), 20 logins: JWKS fetches {delta['fetches']},"
+          f" unknown-kid refetches {delta['rotations']}, errors {delta['errors']}")
+
+
+async def _run(args, proxy: LatencyProxy, verify: ssl.SSLContext, keys: SigningKeys) -> None:
+    base_url = f"https://127.0.0.1:{proxy.port}"
+    await _measure("legacy", lambda code: _legacy_login(base_url, verify, code), proxy, args)
+    for label, http2 in (("pooled h1", False), ("pooled h2", True)):
+        http_client = OAuthHttpClient(http2=http2, verify=verify)
+        probe = await http_client.client.get(f"{base_url}/userinfo", headers={"Authorization": "Bearer access-0"})
+        await _measure(f"{label}", _pooled_login(base_url, http_client), proxy, args)
+        print(f"  {'':<12} negotiated {probe.http_version}")
+        await http_client.aclose()
+
+    http_client = OAuthHttpClient(http2=True, verify=verify)
+    await _measure("h2 id_token", _id_token_login(base_url, http_client), proxy, args)
+    await _key_rotation(base_url, http_client, keys)
+    await http_client.aclose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=20.0, help="가짜 OAuth 서버까지의 왕복 시간")
+    parser.add_argument("--server-ms", type=float, default=5.0, help="가짜 OAuth 서버의 응답 처리 시간")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = _self_signed_cert(Path(tmp))
+        verify = ssl.create_default_context(cafile=str(cert))
+        keys = SigningKeys()
+        proxy, stop = _start_server(args, cert, key, keys)
+        print(f"OAuth callback (token exchange + userinfo / ID token), {args.logins} logins,"
+              f" RTT {args.rtt_ms} ms, server {args.server_ms} ms, concurrency {args.concurrency}")
+        try:
+            asyncio.run(_run(args, proxy, verify, keys))
+        finally:
+            stop.set()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
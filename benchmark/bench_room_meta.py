@@ -0,0 +1,159 @@
+"""
+채팅방 메타데이터 조회 벤치마크 (스트림 요청 사전 조회 / 상태 조회 / 삭제 권한 확인).
+
+실행: python -m benchmark.bench_room_meta [--requests 2000] [--rooms 500] [--db-rtt-ms 0.5] [--redis-rtt-ms 0.3]
+요청마다 새 DB 세션과 레포지토리를 만들어 라우터 + 유스케이스와 같은 순서로 방을 조회하고,
+요청당 SQL 문 수 / Redis 왕복 수 / 지연을 비교한다.
+- legacy : 변경 전 (find_by_id ORM 로드, 상태는 별도 SELECT)
+- cached : find_meta (요청 memo + Redis 공유 캐시, 적중 시 SQL 없음)
+SQLite 는 로컬이므로 SQL 문마다 --db-rtt-ms, Redis(fakeredis) 왕복마다 --redis-rtt-ms 를 더해 네트워크를 흉내 낸다.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/gugudan_bench_room_meta.db")
+
+from benchmark.loadtest.env import apply_harness_env  # noqa: E402
+
+apply_harness_env()
+
+import fakeredis  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.config.database.session import Base, SessionLocal, engine  # noqa: E402
+from app.conversation.infrastructure.cache.room_meta_cache import RoomMetaCache  # noqa: E402
+from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm  # noqa: E402
+from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm  # noqa: E402
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm  # noqa: E402
+from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl  # noqa: E402
+from benchmark.redis_probe import CountingAsyncRedis, CountingRedis  # noqa: E402
+
+
+class StatementCounter:
+    """SQL 문 수를 세고, 문마다 지정한 지연을 더한다"""
+
+    def __init__(self, rtt_seconds: float):
+        self.rtt = rtt_seconds
+        self.statements = 0
+        event.listen(engine, "before_cursor_execute", self._before)
+
+    def _before(self, *args) -> None:
+        self.statements += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+
+def seed(rooms: int) -> None:
+    engine.echo = False
+    tables = [ChatRoomOrm.__table__, ChatMessageOrm.__table__, ChatFeedbackOrm.__table__]
+    Base.metadata.drop_all(bind=engine, tables=tables)
+    Base.metadata.create_all(bind=engine, tables=tables)
+    db = SessionLocal()
+    try:
+        db.bulk_insert_mappings(ChatRoomOrm, [dict(
+            room_id=f"room-{i}", account_id=i % 50 + 1, title=f"상담 {i}", category="GENERAL", division="DEFAULT",
+            out_api="FALSE", status="ACTIVE", last_message_id=i * 10, message_count=10,
+        ) for i in range(rooms)])
+        db.commit()
+    finally:
+        db.close()
+
+
+async def legacy_stream(repo: ChatRoomRepositoryImpl, room_id: str, account_id: int) -> None:
+    assert await repo.find_by_id(room_id)  # stream_chat_auto
+    room = await repo.find_by_id(room_id)  # StreamChatUsecase.execute
+    assert room.last_message_id is not None
+
+
+async def cached_stream(repo: ChatRoomRepositoryImpl, room_id: str, account_id: int) -> None:
+    assert await repo.find_meta(room_id)
+    room = await repo.find_meta(room_id)
+    assert room.last_message_id is not None
+
+
+async def legacy_status(repo: ChatRoomRepositoryImpl, room_id: str, account_id: int) -> None:
+    row = repo.db.query(ChatRoomOrm.status).filter(
+        ChatRoomOrm.room_id == room_id, ChatRoomOrm.account_id == account_id).first()
+    assert row
+
+
+async def cached_status(repo: ChatRoomRepositoryImpl, room_id: str, account_id: int) -> None:
+    assert await repo.find_status_by_room_id(room_id, account_id)
+
+
+async def legacy_owner(repo: ChatRoomRepositoryImpl, room_id: str, account_id: int) -> None:
+    room = await repo.find_by_id(room_id)  # DeleteChatUseCase 권한 확인 (삭제 자체는 제외)
+    assert room.account_id == account_id
+
+
+async def cached_owner(repo: ChatRoomRepositoryImpl, room_id: str, account_id: int) -> None:
+    room = await repo.find_meta(room_id)
+    assert room.account_id == account_id
+
+
+async def _measure(label, request, args, cache, statements: StatementCounter, redis: CountingAsyncRedis) -> None:
+    rooms = [(f"room-{i}", i % 50 + 1) for i in (random.randrange(args.rooms) for _ in range(args.requests))]
+    statements.statements, redis.commands = 0, 0
+    samples = []
+    for room_id, account_id in rooms:
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            await request(ChatRoomRepositoryImpl(db, cache), room_id, account_id)
+            samples.append(time.perf_counter() - started)
+        finally:
+            db.close()
+    samples.sort()
+    print(f"  {label:<16} mean {statistics.fmean(samples) * 1e3:6.2f} ms   p50 {samples[len(samples) // 2] * 1e3:6.2f} ms"
+          f"   p99 {samples[int(len(samples) * 0.99)] * 1e3:6.2f} ms"
+          f"   SQL/request {statements.statements / len(rooms):.2f}   redis/request {redis.commands / len(rooms):.2f}")
+
+
+async def _run(args) -> None:
+    server = fakeredis.FakeServer()
+    sync_redis = CountingRedis(fakeredis.FakeRedis(server=server, decode_responses=True), args.redis_rtt_ms / 1000)
+    async_redis = CountingAsyncRedis(fakeredis.FakeAsyncRedis(server=server, decode_responses=True),
+                                     args.redis_rtt_ms / 1000)
+    cache = RoomMetaCache(lambda: sync_redis, lambda: async_redis, enabled=True)
+    disabled = RoomMetaCache(lambda: sync_redis, lambda: async_redis, enabled=False)
+    statements = StatementCounter(args.db_rtt_ms / 1000)
+
+    for room_id in (f"room-{i}" for i in range(args.rooms)):  # 캐시 예열
+        db = SessionLocal()
+        try:
+            await ChatRoomRepositoryImpl(db, cache).find_meta(room_id)
+        finally:
+            db.close()
+
+    print(f"{args.requests} requests over {args.rooms} rooms, DB RTT {args.db_rtt_ms} ms, Redis RTT {args.redis_rtt_ms} ms")
+    for name, legacy, cached in (
+        ("stream preflight", legacy_stream, cached_stream),
+        ("room status", legacy_status, cached_status),
+        ("delete ownership", legacy_owner, cached_owner),
+    ):
+        print(name)
+        await _measure("legacy", legacy, args, disabled, statements, async_redis)
+        await _measure("cached (warm)", cached, args, cache, statements, async_redis)
+    print(f"cache stats {cache.stats}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rooms", type=int, default=500)
+    parser.add_argument("--db-rtt-ms", type=float, default=0.5)
+    parser.add_argument("--redis-rtt-ms", type=float, default=0.3)
+    args = parser.parse_args()
+
+    seed(args.rooms)
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
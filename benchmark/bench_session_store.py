@@ -0,0 +1,180 @@
+"""
+세션 / 블랙리스트 저장소 Redis 지연 벤치마크 (동기 JSON 세션 vs 비동기 해시 세션).
+
+실행: python -m benchmark.bench_session_store [--ops 2000] [--rtt-ms 0.3] [--concurrency 100] [--redis-url redis://...]
+- 연산별 지연과 Redis 왕복 수: save / find_by_id / extend_ttl / is_blacklisted
+  legacy 는 변경 전 구현(ISO 시각 JSON, 동기 클라이언트, extend_ttl = EXISTS + GET + SETEX)을 그대로 옮긴 것이다.
+- 세션 하나의 저장 크기 (JSON 문자열 vs 해시 필드 + 값)
+- 동시 요청: 이벤트 루프에서 --concurrency 개 요청이 세션 조회 + 블랙리스트 확인을 동시에 할 때의 총 소요 시간.
+  동기 클라이언트는 왕복 동안 루프를 막으므로 요청이 직렬화된다.
+--redis-url 이 없으면 fakeredis 를 쓰고, 왕복마다 --rtt-ms 만큼 대기하여 네트워크 왕복을 흉내 낸다.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Optional
+
+from benchmark.loadtest.env import apply_harness_env
+
+apply_harness_env()
+
+import redis  # noqa: E402
+import redis.asyncio as aioredis  # noqa: E402
+
+from app.auth.domain.entity.session import Session  # noqa: E402
+from app.auth.infrastructure.cache.session_repository_impl import SessionRepositoryImpl  # noqa: E402
+from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl  # noqa: E402
+from app.config.settings import settings  # noqa: E402
+from benchmark.redis_probe import CountingAsyncRedis, CountingRedis  # noqa: E402
+
+
+class LegacySessionRepository:
+    """변경 전 SessionRepositoryImpl (동기 클라이언트, JSON 문자열)"""
+
+    KEY_PREFIX = "legacy-session:"
+
+    def __init__(self, client, ttl_seconds: int):
+        self._redis = client
+        self._ttl = ttl_seconds
+
+    def save(self, session: Session) -> None:
+        self._redis.setex(f"{self.KEY_PREFIX}{session.session_id}", self._ttl, json.dumps(session.to_dict()))
+
+    def find_by_id(self, session_id: str) -> Optional[Session]:
+        data = self._redis.get(f"{self.KEY_PREFIX}{session_id}")
+        if data is None:
+            return None
+        session = Session.from_dict(json.loads(data))
+        return None if session.is_expired() else session
+
+    def extend_ttl(self, session_id: str, ttl_seconds: int) -> bool:
+        if not self._redis.exists(f"{self.KEY_PREFIX}{session_id}"):
+            return False
+        session = self.find_by_id(session_id)
+        if session:
+            session.extend(hours=ttl_seconds // 3600)
+            self.save(session)
+            return True
+        return False
+
+    def is_blacklisted(self, jti: str) -> bool:
+        return self._redis.exists(f"{TokenBlacklistImpl.KEY_PREFIX}{jti}") > 0
+
+
+def _line(label: str, samples: list[float], round_trips: float) -> None:
+    samples.sort()
+    print(f"  {label:<28} mean {statistics.fmean(samples) * 1e6:8.1f} µs   p50 {samples[len(samples) // 2] * 1e6:8.1f} µs"
+          f"   p99 {samples[int(len(samples) * 0.99)] * 1e6:8.1f} µs   round-trips {round_trips:.1f}")
+
+
+def _time_sync(fn, ops: int, counter: CountingRedis) -> tuple[list[float], float]:
+    counter.commands = 0
+    samples = []
+    for i in range(ops):
+        started = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - started)
+    return samples, counter.commands / ops
+
+
+async def _time_async(fn, ops: int, counter: CountingAsyncRedis) -> tuple[list[float], float]:
+    counter.commands = 0
+    samples = []
+    for i in range(ops):
+        started = time.perf_counter()
+        await fn(i)
+        samples.append(time.perf_counter() - started)
+    return samples, counter.commands / ops
+
+
+async def _per_operation(args, legacy: LegacySessionRepository, repo: SessionRepositoryImpl,
+                         blacklist: TokenBlacklistImpl, sync_counter: CountingRedis,
+                         async_counter: CountingAsyncRedis) -> None:
+    sessions = [Session(account_id=i + 1, csrf_token=f"csrf-{i:040d}") for i in range(args.ops)]
+    ids = [s.session_id for s in sessions]
+    ttl = settings.SESSION_TTL_SECONDS
+
+    print(f"per operation, {args.ops} ops each")
+    for name, legacy_fn, async_fn in (
+        ("save", lambda i: legacy.save(sessions[i]), lambda i: repo.save(sessions[i])),
+        ("find_by_id", lambda i: legacy.find_by_id(ids[i]), lambda i: repo.find_by_id(ids[i])),
+        ("extend_ttl", lambda i: legacy.extend_ttl(ids[i], ttl), lambda i: repo.extend_ttl(ids[i], ttl)),
+        ("is_blacklisted", lambda i: legacy.is_blacklisted(ids[i]), lambda i: blacklist.is_blacklisted(ids[i])),
+    ):
+        _line(f"{name:<14} legacy sync", *_time_sync(legacy_fn, args.ops, sync_counter))
+        _line(f"{name:<14} async", *await _time_async(async_fn, args.ops, async_counter))
+
+    legacy_bytes = len(json.dumps(sessions[0].to_dict()))
+    fields = {"a": sessions[0].account_id, "c": int(sessions[0].created_at.timestamp()), "t": sessions[0].csrf_token}
+    hash_bytes = sum(len(k) + len(str(v)) for k, v in fields.items())
+    print(f"stored value per session: JSON {legacy_bytes} bytes, hash fields + values {hash_bytes} bytes")
+
+
+async def _concurrent(args, legacy: LegacySessionRepository, repo: SessionRepositoryImpl,
+                      blacklist: TokenBlacklistImpl) -> None:
+    session = Session(account_id=1, csrf_token="csrf")
+    legacy.save(session)
+    await repo.save(session)
+
+    async def legacy_request():
+        # 변경 전: async 핸들러 안에서 동기 클라이언트 호출
+        legacy.find_by_id(session.session_id)
+        legacy.is_blacklisted("jti")
+
+    async def async_request():
+        await repo.find_by_id(session.session_id)
+        await blacklist.is_blacklisted("jti")
+
+    print(f"{args.concurrency} concurrent requests (session lookup + blacklist check) on one event loop")
+    for label, request in (("legacy sync", legacy_request), ("async", async_request)):
+        walls = []
+        for _ in range(5):
+            started = time.perf_counter()
+            await asyncio.gather(*(request() for _ in range(args.concurrency)))
+            walls.append(time.perf_counter() - started)
+        print(f"  {label:<12} wall {statistics.median(walls) * 1e3:8.2f} ms")
+
+
+async def _run(args, sync_client, async_client, rtt: float) -> None:
+    sync_counter = CountingRedis(sync_client, rtt)
+    async_counter = CountingAsyncRedis(async_client, rtt)
+    legacy = LegacySessionRepository(sync_counter, settings.SESSION_TTL_SECONDS)
+    repo = SessionRepositoryImpl(async_counter)
+    blacklist = TokenBlacklistImpl(async_counter)
+    try:
+        await _per_operation(args, legacy, repo, blacklist, sync_counter, async_counter)
+        await _concurrent(args, legacy, repo, blacklist)
+    finally:
+        await async_client.aclose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--redis-url")
+    args = parser.parse_args()
+
+    if args.redis_url:
+        sync_client = redis.Redis.from_url(args.redis_url, decode_responses=True)
+        async_client = aioredis.Redis.from_url(args.redis_url, decode_responses=True)
+        rtt = 0.0
+    else:
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        sync_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+        async_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        rtt = args.rtt_ms / 1000
+
+    print(f"{'redis ' + args.redis_url if args.redis_url else f'fakeredis, simulated RTT {args.rtt_ms} ms'}")
+    asyncio.run(_run(args, sync_client, async_client, rtt))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,13 @@
+"""
+/conversation/chat/stream-auto 등 주요 엔드포인트 부하 테스트 하니스.
+
+외부 의존성 없이 실행할 수 있도록 OpenAI/S3/Redis/MySQL 을 로컬 대체물로 바꾼다.
+  - fake_openai: TTFT/초당 토큰 수를 조절할 수 있는 OpenAI 스트리밍 호환 서버
+  - stand_ins:   인프로세스 S3 대체 구현, fakeredis 주입
+  - seed:        암호화된 채팅방/메시지 및 JWT 생성
+  - server:      대체물을 주입한 앱 실행 + 이벤트 루프 지연 측정
+  - loadgen:     asyncio 부하 생성기 (RPS / TTFT / p50·p95·p99 / 루프 지연)
+  - run:         위 단계를 한 번에 실행하고 결과를 JSON 으로 저장
+
+실행: python -m benchmark.loadtest.run --duration 30 --concurrency 20
+"""
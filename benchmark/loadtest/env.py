@@ -0,0 +1,44 @@
+"""부하 테스트 공통 환경 변수 기본값 (이미 설정된 값은 덮어쓰지 않음)"""
+
+import base64
+import os
+
+DEFAULT_DB_PATH = "/tmp/gugudan_loadtest.db"
+DEFAULT_FIXTURE_PATH = "/tmp/gugudan_loadtest_fixture.json"
+DEFAULT_APP_PORT = 18000
+DEFAULT_OPENAI_PORT = 18001
+
+# 고정 키를 사용해야 seed 프로세스와 server 프로세스가 같은 암호화 키를 공유한다
+_HARNESS_DEFAULTS = {
+    "DATABASE_URL": f"sqlite:///{DEFAULT_DB_PATH}",
+    "MYSQL_HOST": "localhost",
+    "MYSQL_USER": "loadtest",
+    "MYSQL_PASSWORD": "loadtest",
+    "MYSQL_DATABASE": "loadtest",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DB": "0",
+    "REDIS_PASSWORD": "",
+    "CORS_ALLOWED_FRONTEND_URL": "http://localhost:3000",
+    "FRONTEND_URL": "http://localhost:3000",
+    "CSRF_SECRET_KEY": "loadtest-csrf-secret",
+    "JWT_SECRET_KEY": "loadtest-jwt-secret-loadtest-jwt-secret",
+    "JWT_ENCRYPTION_KEY": "loadtest-jwt-encryption-key",
+    "AWS_ACCESS_KEY_ID": "loadtest",
+    "AWS_SECRET_ACCESS_KEY": "loadtest",
+    "AWS_REGION": "ap-northeast-2",
+    "AWS_S3_BUCKET": "loadtest",
+    "CLOUDFRONT_DOMAIN": "cdn.loadtest.local",
+    "CLOUDFRONT_KEY_ID": "loadtest",
+    "CLOUDFRONT_PRIVATE_KEY_PATH": "/dev/null",
+    "AES_KEY": base64.b64encode(b"L" * 32).decode(),
+    "AES_IV": base64.b64encode(b"I" * 16).decode(),
+    "MAX_TOKENS": "1000",
+    "OPENAI_API_KEY": "sk-loadtest",
+    "OPENAI_BASE_URL": f"http://127.0.0.1:{DEFAULT_OPENAI_PORT}/v1",
+}
+
+
+def apply_harness_env() -> None:
+    for key, value in _HARNESS_DEFAULTS.items():
+        os.environ.setdefault(key, value)
@@ -0,0 +1,81 @@
+"""
+OpenAI Chat Completions 스트리밍 호환 가짜 서버.
+
+실행: python -m benchmark.loadtest.fake_openai --port 18001 --ttft-ms 400 --tokens-per-sec 60
+앱은 OPENAI_BASE_URL=http://127.0.0.1:18001/v1 로 이 서버를 바라본다.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+# 상담 응답과 비슷한 길이/문자 분포를 갖는 토큰열
+_REPLY_TOKENS = (
+    "말씀해 주셔서 고마워요. 그런 상황이라면 서운한 마음이 드는 게 자연스러워요. "
+    "상대방도 나름의 사정이 있었을 수 있지만, 지금 느끼는 감정을 먼저 알아주는 게 중요해요. "
+    "대화를 시작할 때는 비난보다는 '나는 이렇게 느꼈어'처럼 내 감정을 중심으로 이야기해 보세요. "
+    "혹시 최근에 두 분이 차분하게 이야기를 나눠 본 적이 있나요?"
+).split(" ")
+
+
+def create_app(ttft_ms: float, tokens_per_sec: float, max_tokens: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "gpt-4.1")
+        limit = min(int(body.get("max_tokens") or max_tokens), max_tokens)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        def _chunk(delta: dict, finish_reason=None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        async def _stream():
+            await asyncio.sleep(ttft_ms / 1000)
+            yield _chunk({"role": "assistant", "content": ""})
+
+            interval = 1.0 / tokens_per_sec if tokens_per_sec > 0 else 0
+            for i in range(limit):
+                token = _REPLY_TOKENS[i % len(_REPLY_TOKENS)]
+                yield _chunk({"content": token + " "})
+                if interval:
+                    await asyncio.sleep(interval)
+
+            yield _chunk({}, finish_reason="stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(_stream(), media_type="text/event-stream")
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="fake OpenAI streaming server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18001)
+    parser.add_argument("--ttft-ms", type=float, default=400.0)
+    parser.add_argument("--tokens-per-sec", type=float, default=60.0)
+    parser.add_argument("--max-tokens", type=int, default=120, help="응답당 최대 토큰 수")
+    args = parser.parse_args()
+
+    app = create_app(args.ttft_ms, args.tokens_per_sec, args.max_tokens)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
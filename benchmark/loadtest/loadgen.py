@@ -0,0 +1,212 @@
+"""
+asyncio 부하 생성기.
+
+chat(스트리밍) / history / auth 시나리오를 가중치대로 섞어 호출하고
+RPS, TTFT, p50/p95/p99, 서버 이벤트 루프 지연을 JSON 으로 출력한다.
+결과에 git 커밋이 함께 기록되므로 커밋 간 비교가 가능하다.
+
+실행: python -m benchmark.loadtest.loadgen --duration 30 --concurrency 20 --out result.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+import httpx
+
+from benchmark.loadtest.env import DEFAULT_APP_PORT, DEFAULT_FIXTURE_PATH
+
+CHAT_MESSAGES = [
+    "요즘 애인이랑 대화가 줄어서 고민이에요.",
+    "제가 너무 예민하게 반응한 걸까요?",
+    "싸운 뒤에 어떻게 화해하면 좋을지 알려주세요.",
+    "상대가 약속을 자주 잊어버려서 속상해요.",
+]
+
+
+@dataclass
+class ScenarioStats:
+    latencies_ms: list = field(default_factory=list)
+    ttft_ms: list = field(default_factory=list)
+    errors: int = 0
+    status_codes: dict = field(default_factory=lambda: defaultdict(int))
+
+
+def percentile(values: list, pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return round(ordered[index], 2)
+
+
+def summarize(values: list) -> dict:
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 2) if values else None,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": round(max(values), 2) if values else None,
+    }
+
+
+def git_commit() -> dict:
+    def _git(*args) -> str:
+        try:
+            return subprocess.check_output(["git", *args], stderr=subprocess.DEVNULL, text=True).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {"sha": _git("rev-parse", "HEAD"), "dirty": bool(_git("status", "--porcelain", "--untracked-files=no"))}
+
+
+class LoadGenerator:
+    def __init__(self, base_url: str, fixture: dict, weights: dict, seed: int = 7):
+        self.base_url = base_url
+        self.accounts = fixture["accounts"]
+        self.weights = weights
+        self.rng = random.Random(seed)
+        self.stats: dict[str, ScenarioStats] = defaultdict(ScenarioStats)
+
+    def _pick_scenario(self) -> str:
+        names = list(self.weights)
+        return self.rng.choices(names, weights=[self.weights[n] for n in names])[0]
+
+    async def _chat(self, client: httpx.AsyncClient, account: dict, stats: ScenarioStats) -> int:
+        payload = {
+            "message": self.rng.choice(CHAT_MESSAGES),
+            "room_id": self.rng.choice(account["room_ids"]),
+        }
+        started = time.perf_counter()
+        async with client.stream(
+                "POST", "/conversation/chat/stream-auto",
+                json=payload, headers={"Authorization": f"Bearer {account['token']}"},
+        ) as response:
+            first = None
+            async for chunk in response.aiter_bytes():
+                if chunk and first is None:
+                    first = time.perf_counter()
+            if first is not None and response.status_code == 200:
+                stats.ttft_ms.append((first - started) * 1000)
+            return response.status_code
+
+    async def _history(self, client: httpx.AsyncClient, account: dict, stats: ScenarioStats) -> int:
+        room_id = self.rng.choice(account["room_ids"])
+        response = await client.get(
+            f"/conversation/rooms/{room_id}/messages",
+            headers={"Authorization": f"Bearer {account['token']}"},
+        )
+        return response.status_code
+
+    async def _auth(self, client: httpx.AsyncClient, account: dict, stats: ScenarioStats) -> int:
+        response = await client.get(
+            "/api/v1/auth/me", headers={"Authorization": f"Bearer {account['token']}"}
+        )
+        return response.status_code
+
+    async def _worker(self, client: httpx.AsyncClient, deadline: float) -> None:
+        handlers = {"chat": self._chat, "history": self._history, "auth": self._auth}
+        while time.perf_counter() < deadline:
+            name = self._pick_scenario()
+            account = self.rng.choice(self.accounts)
+            stats = self.stats[name]
+            started = time.perf_counter()
+            try:
+                status = await handlers[name](client, account, stats)
+            except httpx.HTTPError:
+                stats.errors += 1
+                continue
+            stats.latencies_ms.append((time.perf_counter() - started) * 1000)
+            stats.status_codes[status] += 1
+            if status >= 400:
+                stats.errors += 1
+
+    async def run(self, duration: float, concurrency: int, warmup: float) -> dict:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=self.base_url, limits=limits, timeout=60) as client:
+            if warmup > 0:
+                await asyncio.gather(*(self._worker(client, time.perf_counter() + warmup) for _ in range(concurrency)))
+                self.stats.clear()
+
+            await client.post("/__loadtest/reset")
+            started = time.perf_counter()
+            deadline = started + duration
+            await asyncio.gather(*(self._worker(client, deadline) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+            loop_lag = (await client.get("/__loadtest/metrics")).json()["loop_lag_ms"]
+
+        return {
+            "elapsed_sec": round(elapsed, 2),
+            "total_rps": round(sum(len(s.latencies_ms) for s in self.stats.values()) / elapsed, 2),
+            "scenarios": {
+                name: {
+                    "requests": len(s.latencies_ms),
+                    "errors": s.errors,
+                    "rps": round(len(s.latencies_ms) / elapsed, 2),
+                    "status_codes": dict(s.status_codes),
+                    "latency_ms": summarize(s.latencies_ms),
+                    **({"ttft_ms": summarize(s.ttft_ms)} if name == "chat" else {}),
+                }
+                for name, s in sorted(self.stats.items())
+            },
+            "server_loop_lag_ms": summarize(loop_lag),
+        }
+
+
+def parse_weights(raw: str) -> dict:
+    weights = {}
+    for part in raw.split(","):
+        name, _, value = part.partition("=")
+        weights[name.strip()] = float(value or 1)
+    return weights
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="load generator for chat/history/auth endpoints")
+    parser.add_argument("--base-url", default=f"http://127.0.0.1:{DEFAULT_APP_PORT}")
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE_PATH)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--mix", default="chat=3,history=5,auth=2", help="시나리오 가중치")
+    parser.add_argument("--label", default="", help="결과 식별용 라벨")
+    parser.add_argument("--out", default="", help="결과 JSON 저장 경로 (미지정 시 stdout)")
+    args = parser.parse_args()
+
+    with open(args.fixture, encoding="utf-8") as f:
+        fixture = json.load(f)
+
+    generator = LoadGenerator(args.base_url, fixture, parse_weights(args.mix))
+    results = asyncio.run(generator.run(args.duration, args.concurrency, args.warmup))
+
+    report = {
+        "label": args.label,
+        "git": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "mix": args.mix,
+            "accounts": len(fixture["accounts"]),
+        },
+        **results,
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
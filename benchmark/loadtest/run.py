@@ -0,0 +1,104 @@
+"""
+부하 테스트 일괄 실행: seed -> 가짜 OpenAI 서버 -> 앱 서버 -> 부하 생성 -> 결과 JSON.
+
+실행: python -m benchmark.loadtest.run --duration 30 --concurrency 20 --out loadtest.json
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmark.loadtest.env import apply_harness_env
+
+
+def _free_port() -> int:
+    # 고정 포트를 쓰면 이전 실행에서 남은 프로세스를 측정할 수 있으므로 매번 빈 포트를 받는다
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _check_alive(procs: list) -> None:
+    for proc in procs:
+        if proc.poll() is not None:
+            raise RuntimeError(f"{proc.args[2]} exited with code {proc.returncode}")
+
+
+def _wait_until_ready(url: str, procs: list, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        _check_alive(procs)
+        try:
+            httpx.get(url, timeout=1.0)
+            # 응답한 것이 방금 띄운 프로세스인지 확인 (포트 충돌로 바로 종료된 경우)
+            _check_alive(procs)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server not ready: {url}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="run the full load-test pipeline")
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--rooms", type=int, default=3)
+    parser.add_argument("--messages", type=int, default=40)
+    parser.add_argument("--ttft-ms", type=float, default=400.0)
+    parser.add_argument("--tokens-per-sec", type=float, default=60.0)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--mix", default="chat=3,history=5,auth=2")
+    parser.add_argument("--label", default="")
+    parser.add_argument("--out", default="loadtest-result.json")
+    args = parser.parse_args()
+
+    apply_harness_env()
+    openai_port, app_port = _free_port(), _free_port()
+    env = dict(os.environ, OPENAI_BASE_URL=f"http://127.0.0.1:{openai_port}/v1")
+    python = sys.executable
+
+    subprocess.run(
+        [python, "-m", "benchmark.loadtest.seed",
+         "--accounts", str(args.accounts), "--rooms", str(args.rooms), "--messages", str(args.messages)],
+        env=env, check=True,
+    )
+
+    procs = [
+        subprocess.Popen(
+            [python, "-m", "benchmark.loadtest.fake_openai", "--port", str(openai_port),
+             "--ttft-ms", str(args.ttft_ms), "--tokens-per-sec", str(args.tokens_per_sec)],
+            env=env,
+        ),
+        subprocess.Popen(
+            [python, "-m", "benchmark.loadtest.server", "--port", str(app_port)],
+            env=env,
+        ),
+    ]
+    try:
+        _wait_until_ready(f"http://127.0.0.1:{openai_port}/docs", procs)
+        _wait_until_ready(f"http://127.0.0.1:{app_port}/health", procs)
+
+        result = subprocess.run(
+            [python, "-m", "benchmark.loadtest.loadgen", "--base-url", f"http://127.0.0.1:{app_port}",
+             "--duration", str(args.duration), "--warmup", str(args.warmup),
+             "--concurrency", str(args.concurrency), "--mix", args.mix,
+             "--label", args.label, "--out", args.out],
+            env=env,
+        )
+        _check_alive(procs)  # 측정 도중 서버가 죽었으면 결과를 믿을 수 없다
+        return result.returncode
+    finally:
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
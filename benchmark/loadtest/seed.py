@@ -0,0 +1,152 @@
+"""
+부하 테스트용 데이터 생성기.
+
+계정/채팅방/암호화된 메시지를 만들고, 계정별 JWT 와 채팅방 ID 를 fixture JSON 으로 저장한다.
+실행: python -m benchmark.loadtest.seed --accounts 50 --rooms 3 --messages 40
+"""
+
+import argparse
+import json
+import random
+import uuid
+from datetime import datetime, timedelta
+
+from benchmark.loadtest.env import DEFAULT_FIXTURE_PATH, apply_harness_env
+
+apply_harness_env()
+
+from sqlalchemy import func  # noqa: E402
+
+import app.main  # noqa: E402,F401  (모든 ORM 모델 등록)
+from app.account.infrastructure.orm.account_model import AccountModel  # noqa: E402
+from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService  # noqa: E402
+from app.config.database.session import Base, SessionLocal, engine  # noqa: E402
+from app.config.security.message_crypto import AESEncryption  # noqa: E402
+from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm  # noqa: E402
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm  # noqa: E402
+
+USER_MESSAGES = [
+    "남자친구가 요즘 연락이 너무 뜸해요. 제가 뭘 잘못한 걸까요?",
+    "어제 여자친구랑 크게 싸웠는데 먼저 연락해야 할지 모르겠어요.",
+    "결혼 준비하면서 양가 부모님 의견이 달라서 너무 지쳐요.",
+    "연애 3년 차인데 설렘이 사라진 것 같아서 불안해요.",
+    "상대가 제 말을 잘 안 들어주는 것 같아 서운해요. 어떻게 말하면 좋을까요?",
+    "친구들이랑 있을 때 애인이 저를 대하는 태도가 달라져서 신경 쓰여요.",
+]
+ASSISTANT_MESSAGES = [
+    "그런 상황이라면 서운한 마음이 드는 게 자연스러워요. 최근에 두 분 사이에 달라진 점이 있었나요?",
+    "감정이 격해진 뒤에는 잠시 시간을 두는 것도 좋아요. 먼저 연락한다면 사과보다 내 감정을 전하는 데 집중해 보세요.",
+    "양쪽 의견을 모두 존중하려다 보면 지치기 쉬워요. 두 분이 먼저 합의한 기준을 세워 보는 건 어떨까요?",
+    "설렘이 줄어드는 건 관계가 안정되었다는 신호이기도 해요. 새로운 경험을 함께 해 보는 것도 도움이 돼요.",
+]
+
+
+def seed(accounts: int, rooms_per_account: int, messages_per_room: int, fixture_path: str) -> dict:
+    # 로컬 SQLite 파일만 초기화한다 (MySQL 을 가리키는 경우 기존 데이터에 추가)
+    if engine.dialect.name == "sqlite":
+        Base.metadata.drop_all(bind=engine)
+        # 읽기와 쓰기가 서로 막지 않도록 WAL 모드 (DB 파일에 유지됨)
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    Base.metadata.create_all(bind=engine)
+
+    engine.echo = False
+    crypto = AESEncryption()
+    jwt_service = JWTTokenService()
+    rng = random.Random(42)
+
+    db = SessionLocal()
+    fixture = {"accounts": []}
+    try:
+        account_models = [
+            AccountModel(
+                email=f"loadtest{i}@example.com",
+                nickname=f"부하테스트{i}",
+                terms_agreed=True,
+                mbti=rng.choice(["INFP", "ENFJ", "ISTJ", "ESTP", None]),
+                gender=rng.choice(["MALE", "FEMALE", None]),
+            )
+            for i in range(accounts)
+        ]
+        db.add_all(account_models)
+        db.flush()
+
+        next_msg_id = (db.query(func.max(ChatMessageOrm.id)).scalar() or 0) + 1
+        base_time = datetime.utcnow() - timedelta(days=7)
+
+        for account in account_models:
+            room_ids = []
+            for _ in range(rooms_per_account):
+                room_id = str(uuid.uuid4())
+                room_ids.append(room_id)
+                room = ChatRoomOrm(
+                    room_id=room_id,
+                    account_id=account.id,
+                    title=rng.choice(USER_MESSAGES)[:20],
+                    category="GENERAL",
+                    division="DEFAULT",
+                    out_api="FALSE",
+                    status="ACTIVE",
+                    created_at=base_time,
+                    last_message_at=base_time,
+                    message_count=0,
+                )
+                db.add(room)
+
+                parent_id = None
+                rows = []
+                for n in range(messages_per_room):
+                    role = "USER" if n % 2 == 0 else "ASSISTANT"
+                    text = rng.choice(USER_MESSAGES if role == "USER" else ASSISTANT_MESSAGES)
+                    enc, iv = crypto.encrypt(text)
+                    rows.append(ChatMessageOrm(
+                        id=next_msg_id,
+                        room_id=room_id,
+                        account_id=account.id,
+                        role=role,
+                        content_enc=enc,
+                        iv=iv,
+                        enc_version=crypto.get_version(),
+                        contents_type="TEXT",
+                        file_urls=[],
+                        parent_id=parent_id,
+                        created_at=base_time + timedelta(minutes=n),
+                    ))
+                    parent_id = next_msg_id
+                    next_msg_id += 1
+                db.add_all(rows)
+
+                if rows:
+                    last = rows[-1]
+                    room.last_message_id = last.id
+                    room.last_message_at = last.created_at
+                    room.message_count = len(rows)
+                    room.preview_enc, room.preview_iv = crypto.encrypt(text, versioned=False)
+
+            token = jwt_service.create_token(account.id, "GOOGLE").access_token
+            fixture["accounts"].append({"account_id": account.id, "token": token, "room_ids": room_ids})
+
+        db.commit()
+    finally:
+        db.close()
+
+    with open(fixture_path, "w", encoding="utf-8") as f:
+        json.dump(fixture, f)
+    return fixture
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="seed load-test data")
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--rooms", type=int, default=3, help="계정당 채팅방 수")
+    parser.add_argument("--messages", type=int, default=40, help="채팅방당 메시지 수")
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE_PATH)
+    args = parser.parse_args()
+
+    fixture = seed(args.accounts, args.rooms, args.messages, args.fixture)
+    total_rooms = sum(len(a["room_ids"]) for a in fixture["accounts"])
+    print(f"seeded {len(fixture['accounts'])} accounts, {total_rooms} rooms -> {args.fixture}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+대체물(fakeredis, 인메모리 S3)을 주입한 앱 실행기.
+
+이벤트 루프 지연을 주기적으로 측정하여 /__loadtest/metrics 로 노출한다.
+실행: python -m benchmark.loadtest.server --port 18000
+"""
+
+import argparse
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from benchmark.loadtest.env import apply_harness_env
+
+apply_harness_env()
+
+import uvicorn  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.config.database.session import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from benchmark.loadtest.stand_ins import install_stand_ins  # noqa: E402
+
+LOOP_LAG_INTERVAL = 0.05  # seconds
+
+
+class LoopLagMonitor:
+    """asyncio.sleep 이 예정보다 늦게 깨어난 시간을 이벤트 루프 지연으로 기록"""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL):
+        self.interval = interval
+        self.samples: list[float] = []
+
+    async def run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append((time.perf_counter() - started - self.interval) * 1000)
+
+    def reset(self) -> None:
+        self.samples = []
+
+
+monitor = LoopLagMonitor()
+
+
+@app.post("/__loadtest/reset")
+async def reset_metrics():
+    monitor.reset()
+    return {"ok": True}
+
+
+@app.get("/__loadtest/metrics")
+async def get_metrics():
+    return {"loop_lag_ms": list(monitor.samples)}
+
+
+_app_lifespan = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def _lifespan_with_monitor(application):
+    async with _app_lifespan(application) as state:
+        task = asyncio.create_task(monitor.run())
+        try:
+            yield state
+        finally:
+            task.cancel()
+
+
+app.router.lifespan_context = _lifespan_with_monitor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="run app with load-test stand-ins")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18000)
+    parser.add_argument("--sql-echo", action="store_true", help="SQL 로그 출력 유지")
+    args = parser.parse_args()
+
+    install_stand_ins()
+    engine.echo = args.sql_echo
+    if engine.dialect.name == "sqlite":
+        # SQLite 는 DB 단위 쓰기 잠금이라, 스트리밍 중 열린 트랜잭션이 다른 요청을 busy-wait 시키며
+        # 이벤트 루프를 막는다. MySQL 의 행 잠금과 비슷한 조건을 위해 문장 단위로 커밋한다.
+        @event.listens_for(engine, "connect")
+        def _sqlite_autocommit(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""외부 서비스(S3, Redis) 인프로세스 대체 구현"""
+
+import hashlib
+
+from fastapi import UploadFile
+
+
+class InMemoryS3Service:
+    """S3Service 와 동일한 인터페이스의 메모리 저장소 (프로세스 단위 공유)"""
+
+    _objects: dict[str, bytes] = {}
+    cf_domain = "cdn.loadtest.local"
+
+    def get_signed_url(self, file_path: str, expire_minutes: int = 60) -> str:
+        if not file_path:
+            return ""
+        if file_path.startswith("http"):
+            return file_path
+        signature = hashlib.sha1(file_path.encode()).hexdigest()[:16]
+        return f"https://{self.cf_domain}/{file_path.lstrip('/')}?Signature={signature}"
+
+    async def upload_file(self, file: UploadFile, account_id: int) -> str:
+        content = await file.read()
+        key = f"uploads/{account_id}/{hashlib.sha1(content).hexdigest()}_{file.filename}"
+        self._objects[key] = content
+        return f"https://{self.cf_domain}/{key}"
+
+    async def read_file_content(self, file_path: str) -> str:
+        path = file_path.split(f"{self.cf_domain}/")[-1].lstrip("/")
+        raw = self._objects.get(path)
+        if raw is None:
+            return f"[파일 로드 실패: {file_path}]"
+        return raw.decode("utf-8", errors="replace")
+
+
+def install_stand_ins() -> None:
+    """앱 모듈을 import 한 뒤 호출: S3Service 와 Redis 클라이언트를 대체물로 바꾼다."""
+    import fakeredis
+
+    from app.config import redis_config
+    from app.conversation.adapter.input.web import conversation_router
+
+    server = fakeredis.FakeServer()  # 동기/비동기 클라이언트가 같은 데이터를 보도록 공유
+    redis_config._redis_instance = fakeredis.FakeRedis(server=server, decode_responses=True)
+    redis_config._async_redis_instance = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    conversation_router.S3Service = InMemoryS3Service
@@ -0,0 +1,13 @@
+"""
+CPU 핫패스 마이크로 벤치마크.
+
+암호화/익명화/프롬프트 구성/JWT·CSRF 검증/세션 역직렬화를 실제와 비슷한 한국어 페이로드로 측정하고,
+저장된 기준값(baseline.json)과 비교해 임계값 이상 느려지면 실패한다.
+
+  python -m benchmark.micro run                      # 측정 결과 출력
+  python -m benchmark.micro save                     # baseline.json 갱신
+  python -m benchmark.micro compare --threshold 0.25 # 기준 대비 25% 이상 느려지면 exit 1
+
+비교는 절대 시간이 아니라 고정 기준 작업 대비 배수(relative)로 하여 러너 속도 변동을 줄인다.
+그래도 머신/파이썬 버전이 바뀌면 baseline 을 같은 환경(CI 러너 등)에서 다시 저장해야 한다.
+"""
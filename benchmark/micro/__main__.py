@@ -0,0 +1,150 @@
+"""마이크로 벤치마크 실행/기준값 저장/비교 CLI"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmark.loadtest.env import apply_harness_env
+
+apply_harness_env()
+
+from benchmark.micro.cases import CASES  # noqa: E402
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+MIN_RUN_SECONDS = 0.05  # 1회 측정 구간의 최소 길이
+DEFAULT_REPEAT = 7
+
+
+def _calibrate(fn) -> int:
+    """1회 측정이 MIN_RUN_SECONDS 이상 걸리도록 반복 횟수 결정"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - started >= MIN_RUN_SECONDS:
+            return number
+        number *= 2
+
+
+def measure(fn, repeat: int) -> dict:
+    number = _calibrate(fn)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number * 1e9)
+    # 최소값은 잡음(스케줄링/GC)에 가장 덜 민감하므로 비교 기준으로 사용
+    return {
+        "ns_per_op": round(min(samples), 1),
+        "median_ns": round(statistics.median(samples), 1),
+        "loops": number,
+    }
+
+
+def _reference_workload():
+    """머신 속도 기준점: 케이스와 무관한 고정 순수 파이썬 작업"""
+    data = [str(i) for i in range(200)]
+    return lambda: sorted(data, key=lambda x: x[::-1])
+
+
+def run_all(pattern: str, repeat: int) -> dict:
+    reference = measure(_reference_workload(), repeat)["ns_per_op"]
+    results = {}
+    for name, setup in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        result = measure(setup(), repeat)
+        # 같은 러너라도 CPU 클럭/부하에 따라 전체 속도가 변하므로 기준 작업 대비 배수도 기록
+        result["relative"] = round(result["ns_per_op"] / reference, 4)
+        results[name] = result
+    return results
+
+
+def _git_sha() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _report(results: dict) -> dict:
+    return {
+        "git": _git_sha(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": results,
+    }
+
+
+def _print_table(results: dict, baseline: dict | None = None) -> None:
+    for name, r in results.items():
+        line = f"{name:<36} {r['ns_per_op'] / 1000:>10.2f} µs/op"
+        if baseline and name in baseline:
+            ratio = r["relative"] / baseline[name]["relative"]
+            line += f"   baseline {baseline[name]['ns_per_op'] / 1000:>9.2f} µs  ({ratio - 1:+.1%})"
+        print(line)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """기준 대비 threshold 비율 이상 느려진 케이스 목록 (기준 작업 대비 배수로 비교)"""
+    regressions = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if base and r["relative"] > base["relative"] * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmark.micro", description="CPU hot-path micro benchmarks")
+    parser.add_argument("command", choices=["run", "save", "compare"])
+    parser.add_argument("--filter", default="", help="이름에 포함된 케이스만 실행")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=0.25, help="허용 감속 비율 (0.25 = 25%%)")
+    parser.add_argument("--out", type=Path, help="측정 결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    results = run_all(args.filter, args.repeat)
+    report = _report(results)
+
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.command == "run":
+        _print_table(results)
+        return 0
+
+    if args.command == "save":
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        _print_table(results)
+        print(f"baseline saved -> {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["cases"]
+    _print_table(results, baseline)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        # 일시적인 잡음을 거르기 위해 느려진 케이스만 한 번 더 측정
+        retry = {}
+        for name in regressions:
+            retry.update(run_all(name, args.repeat))
+        regressions = compare(retry, baseline, args.threshold)
+    if regressions:
+        print(f"\nregressed beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"\nno regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
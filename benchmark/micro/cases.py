@@ -0,0 +1,146 @@
+"""벤치마크 대상 경로 등록. 각 케이스는 준비 작업 후 측정할 무인자 함수를 반환한다."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable
+
+from benchmark.micro import payloads
+
+CASES: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def case(name: str):
+    def register(setup: Callable[[], Callable[[], object]]):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+def _complete(coro):
+    """I/O 를 기다리지 않는 코루틴을 이벤트 루프 없이 끝까지 실행 (루프 오버헤드를 측정에서 제외)"""
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise RuntimeError("coroutine awaited I/O")
+
+
+@case("message_crypto.encrypt.medium")
+def _message_encrypt():
+    from app.config.security.message_crypto import AESEncryption
+
+    crypto = AESEncryption()
+    return lambda: crypto.encrypt(payloads.MEDIUM_MESSAGE)
+
+
+@case("message_crypto.decrypt.medium")
+def _message_decrypt():
+    from app.config.security.message_crypto import AESEncryption
+
+    crypto = AESEncryption()
+    ciphertext, iv = crypto.encrypt(payloads.MEDIUM_MESSAGE)
+    return lambda: crypto.decrypt(ciphertext, iv)
+
+
+@case("message_crypto.decrypt.long")
+def _message_decrypt_long():
+    from app.config.security.message_crypto import AESEncryption
+
+    crypto = AESEncryption()
+    ciphertext, iv = crypto.encrypt(payloads.LONG_MESSAGE)
+    return lambda: crypto.decrypt(ciphertext, iv)
+
+
+@case("common_encryption.encrypt")
+def _common_encrypt():
+    from app.common.infrastructure.encryption import AESEncryption
+
+    key = AESEncryption.generate_key()
+    return lambda: AESEncryption.encrypt(payloads.MEDIUM_MESSAGE, key)
+
+
+@case("common_encryption.decrypt")
+def _common_decrypt():
+    from app.common.infrastructure.encryption import AESEncryption
+
+    key = AESEncryption.generate_key()
+    encrypted, iv = AESEncryption.encrypt(payloads.MEDIUM_MESSAGE, key)
+    return lambda: AESEncryption.decrypt(encrypted, iv, key)
+
+
+@case("anonymizer.anonymize.medium")
+def _anonymize_medium():
+    from app.config.anonymizer import Anonymizer
+
+    anonymizer = Anonymizer()
+    return lambda: anonymizer.anonymize(payloads.MEDIUM_MESSAGE)
+
+
+@case("anonymizer.anonymize.pii")
+def _anonymize_pii():
+    from app.config.anonymizer import Anonymizer
+
+    anonymizer = Anonymizer()
+    return lambda: anonymizer.anonymize(payloads.PII_MESSAGE)
+
+
+def _conversation(turns: int):
+    from app.config.security.message_crypto import AESEncryption
+    from app.conversation.domain.conversation.aggregate import Conversation
+
+    from app.conversation.domain.chat_message.entity import ChatMessage
+    from app.conversation.domain.chat_message.enums import ContentType, MessageRole
+    from app.conversation.domain.chat_message.value_object import EncryptedContent
+
+    crypto = AESEncryption()
+    messages = []
+    for i in range(turns):
+        role = MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT
+        text = payloads.MEDIUM_MESSAGE if role is MessageRole.USER else payloads.ASSISTANT_REPLY
+        ciphertext, iv = crypto.encrypt(text)
+        messages.append(ChatMessage(
+            message_id=i + 1, room_id="bench", account_id=1, role=role,
+            content=EncryptedContent(content_enc=ciphertext, iv=iv, enc_version=crypto.get_version()),
+            content_type=ContentType.TEXT, created_at=datetime(2026, 1, 1),
+        ))
+    room = SimpleNamespace(status="ACTIVE")
+    return Conversation(room, messages), crypto
+
+
+@case("conversation.to_llm_payload")
+def _to_llm_payload():
+    conversation, crypto = _conversation(payloads.HISTORY_TURNS)
+    return lambda: conversation.to_llm_payload(crypto)
+
+
+@case("conversation.get_prompt_context")
+def _get_prompt_context():
+    conversation, crypto = _conversation(payloads.HISTORY_TURNS)
+    return lambda: conversation.get_prompt_context(crypto)
+
+
+@case("jwt.validate_token")
+def _jwt_validate():
+    from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
+
+    service = JWTTokenService()
+    token = service.create_token(account_id=42, provider="GOOGLE").access_token
+    return lambda: _complete(service.validate_token(token))
+
+
+@case("csrf.validate_token")
+def _csrf_validate():
+    from app.auth.application.usecase.csrf_usecase import CSRFUseCase
+
+    usecase = CSRFUseCase()
+    token = usecase.generate_token()
+    return lambda: usecase.validate_token(token, token)
+
+
+@case("session.from_dict")
+def _session_from_dict():
+    from app.auth.domain.entity.session import Session
+
+    data = Session(account_id=42, csrf_token="csrf-token").to_dict()
+    return lambda: Session.from_dict(data)
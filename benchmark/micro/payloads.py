@@ -0,0 +1,32 @@
+"""벤치마크용 한국어 상담 페이로드"""
+
+SHORT_MESSAGE = "요즘 남자친구가 연락이 뜸해서 불안해요."
+
+MEDIUM_MESSAGE = (
+    "어제 여자친구랑 저녁을 먹다가 크게 다퉜어요. 제가 회사 일 때문에 약속 시간에 30분 늦었는데, "
+    "미리 연락을 못 한 게 화근이었던 것 같아요. 집에 와서 사과 문자를 보냈는데 아직 답이 없어요. "
+    "제가 먼저 전화를 해야 할지, 아니면 시간을 좀 더 줘야 할지 모르겠어요."
+)
+
+LONG_MESSAGE = (
+    "결혼을 6개월 앞두고 있는데 요즘 너무 지쳐요. 양가 부모님이 예식장, 예단, 신혼집 문제로 의견이 계속 갈리고 "
+    "저희 둘은 중간에서 눈치만 보고 있어요. 예비 신랑은 자기 부모님 말씀을 거절하지 못하고, 저는 그게 서운해서 "
+    "자꾸 날카롭게 말하게 돼요. 지난 주말에는 신혼집 위치 때문에 서울 강남구 쪽이냐 경기 성남시 쪽이냐로 "
+    "한참을 싸웠는데, 결국 아무것도 정하지 못하고 각자 집으로 돌아갔어요. 친구들은 결혼 준비할 때 다 그렇다고 "
+    "하는데, 이렇게 계속 부딪히다 보면 결혼하고 나서도 같은 문제로 싸울 것 같아 불안해요. "
+    "연락처는 010-1234-5678 이고 메일은 bride2025@example.com 이에요. 민지씨가 상담을 추천해 줬어요."
+) * 2
+
+PII_MESSAGE = (
+    "제 번호는 010-9876-5432, 회사 번호는 02-345-6789 예요. 메일은 counsel.user@example.co.kr 이고 "
+    "부산 해운대구 우동 근처에 살아요. 지훈아 라고 부르면 돼요."
+)
+
+ASSISTANT_REPLY = (
+    "말씀해 주셔서 고마워요. 약속에 늦은 상황 자체보다 미리 연락을 받지 못해 존중받지 못했다고 느꼈을 수 있어요. "
+    "사과할 때는 변명보다는 상대가 느꼈을 감정을 먼저 인정해 주는 게 좋아요. "
+    "예를 들어 '기다리게 해서 많이 속상했겠다'처럼요. 지금은 답장을 재촉하기보다는 한 번 더 진심을 전하고 "
+    "상대가 준비될 때까지 기다려 주는 건 어떨까요?"
+)
+
+HISTORY_TURNS = 20  # to_llm_payload 벤치마크의 대화 길이 (메시지 수)
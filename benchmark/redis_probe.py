@@ -0,0 +1,150 @@
+"""
+벤치마크용 Redis 클라이언트 래퍼: 왕복(round-trip) 수를 세고, 왕복마다 지정한 지연을 더해 네트워크를 흉내 낸다.
+파이프라인은 execute() 한 번을 왕복 한 번으로 센다.
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import threading
+import time
+
+
+class CountingRedis:
+    """동기 redis.Redis 래퍼 (지연은 time.sleep 이므로 이벤트 루프에서 호출하면 루프를 막는다)"""
+
+    def __init__(self, client, rtt_seconds: float):
+        self._client = client
+        self._rtt = rtt_seconds
+        self.commands = 0
+
+    def _round_trip(self) -> None:
+        self.commands += 1
+        if self._rtt:
+            time.sleep(self._rtt)
+
+    def pipeline(self, *args, **kwargs):
+        return _CountingSyncPipeline(self, self._client.pipeline(*args, **kwargs))
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name in ("pubsub", "scan_iter") or not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self._round_trip()
+            return attr(*args, **kwargs)
+
+        return call
+
+
+class _CountingSyncPipeline:
+    """execute() 만 왕복으로 센다 (WATCH 중의 즉시 명령은 세지 않음)"""
+
+    def __init__(self, owner: CountingRedis, pipe):
+        self._owner = owner
+        self._pipe = pipe
+
+    def __enter__(self):
+        self._pipe.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._pipe.__exit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+    def execute(self, *args, **kwargs):
+        self._owner._round_trip()
+        return self._pipe.execute(*args, **kwargs)
+
+
+class _LatencyTimer:
+    """
+    지정한 시각에 future 를 완료시키는 타이머 스레드 하나.
+    소켓 응답처럼 루프를 깨우므로 동시에 기다리는 왕복 수에 제한이 없다
+    (asyncio.sleep 은 epoll 타임아웃이 ms 단위로 올림되어 1ms 미만 지연을 흉내 낼 수 없다).
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def wait(self, seconds: float) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="redis-probe-latency", daemon=True)
+                self._thread.start()
+            heapq.heappush(self._heap, (time.perf_counter() + seconds, next(self._seq), loop, future))
+            self._cond.notify()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                deadline, _, loop, future = self._heap[0]
+                remaining = deadline - time.perf_counter()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+            loop.call_soon_threadsafe(_resolve, future)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_latency_timer = _LatencyTimer()
+
+
+class CountingAsyncRedis:
+    """redis.asyncio.Redis 래퍼 (지연은 타이머 스레드가 끝내므로 루프를 막지 않고 동시 요청의 왕복이 겹친다)"""
+
+    def __init__(self, client, rtt_seconds: float):
+        self._client = client
+        self._rtt = rtt_seconds
+        self.commands = 0
+
+    async def _round_trip(self, awaitable):
+        self.commands += 1
+        if self._rtt:
+            await _latency_timer.wait(self._rtt)
+        return await awaitable
+
+    def pipeline(self, *args, **kwargs):
+        return _CountingPipeline(self, self._client.pipeline(*args, **kwargs))
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name in ("pubsub", "aclose") or not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if not inspect.isawaitable(result):
+                return result
+            return self._round_trip(result)
+
+        return call
+
+
+class _CountingPipeline:
+    def __init__(self, owner: CountingAsyncRedis, pipe):
+        self._owner = owner
+        self._pipe = pipe
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+    async def execute(self, *args, **kwargs):
+        return await self._owner._round_trip(self._pipe.execute(*args, **kwargs))
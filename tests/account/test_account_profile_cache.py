@@ -0,0 +1,104 @@
+"""Account profile cache invalidation races against fakeredis."""
+
+import json
+
+import fakeredis
+import pytest
+
+from app.account.domain.entity.account_enums import AccountPlan, AccountRole
+from app.account.domain.entity.account_profile import AccountProfile
+from app.account.infrastructure.cache.account_profile_cache import AccountProfileCache
+
+ACCOUNT_ID = 7
+OLD = AccountProfile(account_id=ACCOUNT_ID, role=AccountRole.USER, plan=AccountPlan.FREE)
+NEW = AccountProfile(account_id=ACCOUNT_ID, role=AccountRole.ADMIN, plan=AccountPlan.PRO)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _cache(server) -> AccountProfileCache:
+    """A subscribed worker cache, so the local tier is in use."""
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    cache = AccountProfileCache(
+        redis_factory=lambda: client,
+        ttl_seconds=300,
+        local_ttl_seconds=30,
+        local_max_entries=100,
+        tombstone_seconds=5,
+        enabled=True,
+    )
+    cache._on_connect()
+    return cache
+
+
+def _redis_value(server):
+    return fakeredis.FakeRedis(server=server, decode_responses=True).get(f"{AccountProfileCache.KEY_PREFIX}{ACCOUNT_ID}")
+
+
+def test_fills_both_tiers_on_miss(server):
+    cache = _cache(server)
+
+    assert cache.get(ACCOUNT_ID, lambda _: OLD) == OLD
+    assert json.loads(_redis_value(server)) == OLD.to_dict()
+    assert cache.get(ACCOUNT_ID, lambda _: pytest.fail("loader called on a local hit")) == OLD
+    assert cache.stats == {"local_hits": 1, "redis_hits": 0, "loads": 1, "invalidations": 0, "redis_errors": 0}
+
+
+def test_load_racing_local_invalidate_writes_nothing_back(server):
+    cache = _cache(server)
+
+    def racing_loader(account_id):
+        # The row was read before the plan/role change committed
+        cache.invalidate(account_id)
+        return OLD
+
+    assert cache.get(ACCOUNT_ID, racing_loader) == OLD
+    assert _redis_value(server) == AccountProfileCache.TOMBSTONE
+    assert cache._get_local(ACCOUNT_ID) is None
+
+    # The next request loads the committed row and does not fill past the tombstone
+    assert cache.get(ACCOUNT_ID, lambda _: NEW) == NEW
+    assert _redis_value(server) == AccountProfileCache.TOMBSTONE
+    assert cache.stats["loads"] == 2
+
+
+def test_load_racing_invalidate_from_another_worker_writes_nothing_back(server):
+    reader = _cache(server)
+    writer = _cache(server)
+
+    def racing_loader(account_id):
+        writer.invalidate(account_id)
+        reader._on_event(str(account_id))  # the event reaches the reader mid-load
+        return OLD
+
+    assert reader.get(ACCOUNT_ID, racing_loader) == OLD
+    assert _redis_value(server) == AccountProfileCache.TOMBSTONE
+    assert reader._get_local(ACCOUNT_ID) is None
+    assert reader.stats["invalidations"] == 1
+
+
+def test_invalidate_drops_cached_entries_everywhere(server):
+    reader = _cache(server)
+    writer = _cache(server)
+    reader.get(ACCOUNT_ID, lambda _: OLD)
+
+    writer.invalidate(ACCOUNT_ID)
+    reader._on_event(str(ACCOUNT_ID))
+
+    assert reader.get(ACCOUNT_ID, lambda _: NEW) == NEW
+    assert reader.stats["local_hits"] == 0
+
+
+def test_local_tier_unused_while_disconnected(server):
+    cache = _cache(server)
+    cache.get(ACCOUNT_ID, lambda _: OLD)
+
+    cache._on_disconnect()
+
+    assert cache._get_local(ACCOUNT_ID) is None
+    assert cache.get(ACCOUNT_ID, lambda _: pytest.fail("loader called on a Redis hit")) == OLD
+    assert cache._get_local(ACCOUNT_ID) is None
+    assert cache.stats["redis_hits"] == 1
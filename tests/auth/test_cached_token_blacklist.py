@@ -0,0 +1,167 @@
+"""Cached token blacklist against a shared fakeredis server."""
+
+import asyncio
+import time
+
+import fakeredis
+
+from app.auth.infrastructure.cache.cached_token_blacklist import CachedTokenBlacklist
+from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
+
+TTL = 600
+
+
+def _run(scenario) -> None:
+    """Run an async scenario with sync/async fakeredis clients on one server."""
+
+    async def main():
+        server = fakeredis.FakeServer()
+        sync_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+        async_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        try:
+            await scenario(sync_client, async_client)
+        finally:
+            await async_client.aclose()
+            sync_client.close()
+
+    asyncio.run(main())
+
+
+def _cache(sync_client, async_client) -> CachedTokenBlacklist:
+    return CachedTokenBlacklist(
+        redis_factory=lambda: sync_client,
+        reconcile_seconds=60,
+        async_redis_factory=lambda: async_client,
+    )
+
+
+def _deliver(pubsub, cache: CachedTokenBlacklist) -> int:
+    """Feed every pending channel message to the cache like the subscriber thread."""
+    delivered = 0
+    while (message := pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1)) is not None:
+        cache._on_event(message["data"])
+        delivered += 1
+    return delivered
+
+
+def test_falls_back_to_redis_exists_until_ready():
+    async def scenario(sync_client, async_client):
+        cache = _cache(sync_client, async_client)
+        await async_client.set(f"{TokenBlacklistImpl.KEY_PREFIX}revoked", "1", ex=TTL)
+
+        assert not cache.ready
+        assert await cache.is_blacklisted("revoked") is True
+        assert await cache.is_blacklisted("valid") is False
+        assert cache.stats["redis_fallbacks"] == 2
+        assert cache.stats["local_hits"] == 0
+
+    _run(scenario)
+
+
+def test_reconcile_loads_keys_with_remaining_ttl():
+    async def scenario(sync_client, async_client):
+        prefix = TokenBlacklistImpl.KEY_PREFIX
+        sync_client.set(f"{prefix}short", "1", ex=30)
+        sync_client.set(f"{prefix}long", "1", ex=TTL)
+        sync_client.set(f"{prefix}forever", "1")
+        sync_client.set("session:unrelated", "1")
+        cache = _cache(sync_client, async_client)
+
+        before = time.time()
+        cache.reconcile()
+
+        assert cache.ready
+        assert cache.stats["reconciles"] == 1
+        assert set(cache._revoked) == {"short", "long", "forever"}
+        assert before + 28 <= cache._revoked["short"] <= time.time() + 30
+        assert before + TTL - 2 <= cache._revoked["long"] <= time.time() + TTL
+        assert cache._revoked["forever"] == float("inf")
+
+        # Answered from the local copy now; Redis is no longer consulted
+        sync_client.delete(f"{prefix}long")
+        assert await cache.is_blacklisted("long") is True
+        assert await cache.is_blacklisted("unrelated") is False
+        assert cache.stats["redis_fallbacks"] == 0
+        assert cache.stats["local_hits"] == 2
+
+    _run(scenario)
+
+
+def test_reconcile_drops_entries_missing_from_redis():
+    async def scenario(sync_client, async_client):
+        cache = _cache(sync_client, async_client)
+        cache._revoked["gone"] = time.time() + TTL
+
+        cache.reconcile()
+
+        assert await cache.is_blacklisted("gone") is False
+
+    _run(scenario)
+
+
+def test_add_and_remove_events_reach_other_workers():
+    async def scenario(sync_client, async_client):
+        writer = _cache(sync_client, async_client)
+        reader = _cache(sync_client, async_client)
+        writer.reconcile()
+        reader.reconcile()
+
+        pubsub = sync_client.pubsub()
+        pubsub.subscribe(CachedTokenBlacklist.CHANNEL)
+        pubsub.get_message(timeout=0.1)  # subscribe confirmation
+        try:
+            await writer.add_to_blacklist("jti-1", TTL)
+            assert sync_client.ttl(f"{TokenBlacklistImpl.KEY_PREFIX}jti-1") > 0
+            assert await reader.is_blacklisted("jti-1") is False
+
+            assert _deliver(pubsub, reader) == 1
+            assert await reader.is_blacklisted("jti-1") is True
+            assert await writer.is_blacklisted("jti-1") is True
+
+            await writer.remove_from_blacklist("jti-1")
+            assert _deliver(pubsub, reader) == 1
+            assert await reader.is_blacklisted("jti-1") is False
+            assert not sync_client.exists(f"{TokenBlacklistImpl.KEY_PREFIX}jti-1")
+            assert reader.stats["events"] == 2
+            assert reader.stats["redis_fallbacks"] == 0
+        finally:
+            pubsub.close()
+
+    _run(scenario)
+
+
+def test_expired_event_entry_is_not_blacklisted():
+    async def scenario(sync_client, async_client):
+        cache = _cache(sync_client, async_client)
+        cache.reconcile()
+
+        cache._on_event('{"op": "add", "jti": "old", "exp": %f}' % (time.time() - 1))
+        cache._on_event("not json")
+
+        assert await cache.is_blacklisted("old") is False
+        assert "old" not in cache._revoked
+        assert cache.stats["events"] == 1
+
+    _run(scenario)
+
+
+def test_mark_stale_sends_lookups_back_to_redis():
+    async def scenario(sync_client, async_client):
+        cache = _cache(sync_client, async_client)
+        cache.reconcile()
+
+        # Another worker revokes while the subscription is down (event lost)
+        cache._mark_stale()
+        await async_client.set(f"{TokenBlacklistImpl.KEY_PREFIX}missed", "1", ex=TTL)
+
+        assert not cache.ready
+        assert await cache.is_blacklisted("missed") is True
+        assert cache.stats["redis_fallbacks"] == 1
+
+        # Resubscribing reconciles and restores the local copy
+        cache.reconcile()
+        assert await cache.is_blacklisted("missed") is True
+        assert cache.stats["redis_fallbacks"] == 1
+        assert cache.stats["local_hits"] == 1
+
+    _run(scenario)
@@ -0,0 +1,225 @@
+"""ID token verification against a cached JWKS, with mocked provider endpoints."""
+
+import asyncio
+import time
+import types
+from collections import Counter
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from app.auth.infrastructure.oauth import jwks_cache
+from app.auth.infrastructure.oauth.base import BaseOAuthProvider
+from app.auth.infrastructure.oauth.google import GoogleOAuthProvider
+from app.auth.infrastructure.oauth.http_client import OAuthHttpClient
+
+CLIENT_ID = "test-client-id"
+ISSUER = "https://accounts.google.com"
+MIN_REFRESH = 60.0
+
+
+def _rsa_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+SIGNING_KEY = _rsa_key()
+ROTATED_KEY = _rsa_key()
+FORGER_KEY = _rsa_key()
+
+
+def _jwk(private_key: rsa.RSAPrivateKey, kid: str) -> dict:
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update(kid=kid, use="sig", alg="RS256")
+    return jwk
+
+
+def _id_token(private_key: rsa.RSAPrivateKey = SIGNING_KEY, kid: str = "k1", **overrides) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": ISSUER,
+        "aud": CLIENT_ID,
+        "sub": "1234567890",
+        "email": "user@example.com",
+        "name": "Token User",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+class _Google:
+    """Mocked Google endpoints; counts requests per URL path."""
+
+    def __init__(self):
+        self.keys = [_jwk(SIGNING_KEY, "k1")]
+        self.jwks_status = 200
+        self.id_token = _id_token()
+        self.requests = Counter()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url.copy_with(query=None))
+        self.requests[url] += 1
+        if url == GoogleOAuthProvider.TOKEN_URL:
+            return httpx.Response(200, json={"access_token": "access", "id_token": self.id_token})
+        if url == GoogleOAuthProvider.JWKS_URL:
+            if self.jwks_status != 200:
+                return httpx.Response(self.jwks_status)
+            return httpx.Response(200, json={"keys": self.keys}, headers={"Cache-Control": "public, max-age=3600"})
+        if url == GoogleOAuthProvider.USERINFO_URL:
+            return httpx.Response(200, json={"email": "userinfo@example.com", "name": "Userinfo User"})
+        return httpx.Response(404)
+
+    @property
+    def jwks_fetches(self) -> int:
+        return self.requests[GoogleOAuthProvider.JWKS_URL]
+
+    @property
+    def userinfo_calls(self) -> int:
+        return self.requests[GoogleOAuthProvider.USERINFO_URL]
+
+
+class _Provider(GoogleOAuthProvider):
+    """Google provider with test credentials and an injected HTTP client."""
+
+    def __init__(self, http_client: OAuthHttpClient):
+        BaseOAuthProvider.__init__(self, CLIENT_ID, "secret", "https://app.test/callback", http_client)
+
+
+class _Clock:
+    """Monotonic clock for the JWKS cache that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(jwks_cache, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(jwks_cache, "_caches", {})
+    monkeypatch.setattr(jwks_cache.settings, "OAUTH_JWKS_MIN_REFRESH_SECONDS", MIN_REFRESH)
+    monkeypatch.setattr(jwks_cache.settings, "OAUTH_ID_TOKEN_VERIFY_ENABLED", True)
+    return clock
+
+
+def _run(google: _Google, scenario) -> None:
+    """Run an async scenario with a provider whose HTTP calls hit ``google``."""
+
+    async def main():
+        http_client = OAuthHttpClient(http2=False)
+        http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(google.handler))
+        try:
+            await scenario(_Provider(http_client))
+        finally:
+            await http_client.aclose()
+
+    asyncio.run(main())
+
+
+def test_valid_id_token_skips_userinfo(clock):
+    google = _Google()
+
+    async def scenario(provider):
+        for _ in range(3):
+            user = await provider.authenticate("code")
+            assert user.email == "user@example.com"
+            assert user.name == "Token User"
+            assert user.provider == "google"
+
+    _run(google, scenario)
+    assert google.userinfo_calls == 0
+    assert google.jwks_fetches == 1
+
+
+def test_forged_signature_falls_back_to_userinfo(clock):
+    google = _Google()
+    google.id_token = _id_token(FORGER_KEY, kid="k1")
+
+    async def scenario(provider):
+        user = await provider.authenticate("code")
+        assert user.email == "userinfo@example.com"
+
+    _run(google, scenario)
+    assert google.userinfo_calls == 1
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"aud": "another-client"},
+        {"iss": "https://evil.example.com"},
+        {"exp": int(time.time()) - 3600},
+    ],
+    ids=["wrong-aud", "wrong-iss", "expired"],
+)
+def test_invalid_claims_fall_back_to_userinfo(clock, overrides):
+    google = _Google()
+    google.id_token = _id_token(**overrides)
+
+    async def scenario(provider):
+        user = await provider.authenticate("code")
+        assert user.email == "userinfo@example.com"
+
+    _run(google, scenario)
+    assert google.userinfo_calls == 1
+    assert google.jwks_fetches == 1
+
+
+def test_new_kid_refetches_exactly_once(clock):
+    google = _Google()
+
+    async def scenario(provider):
+        assert (await provider.authenticate("code")).email == "user@example.com"
+        assert google.jwks_fetches == 1
+
+        # The provider rotates to k2 after the minimum refresh interval
+        clock.now += MIN_REFRESH + 1
+        google.keys = [_jwk(SIGNING_KEY, "k1"), _jwk(ROTATED_KEY, "k2")]
+        google.id_token = _id_token(ROTATED_KEY, kid="k2")
+        for _ in range(3):
+            assert (await provider.authenticate("code")).email == "user@example.com"
+
+    _run(google, scenario)
+    assert google.jwks_fetches == 2
+    assert google.userinfo_calls == 0
+
+
+def test_unknown_kid_within_min_interval_does_not_refetch(clock):
+    google = _Google()
+
+    async def scenario(provider):
+        await provider.authenticate("code")
+
+        google.id_token = _id_token(FORGER_KEY, kid="forged")
+        for _ in range(5):
+            assert (await provider.authenticate("code")).email == "userinfo@example.com"
+
+    _run(google, scenario)
+    assert google.jwks_fetches == 1
+    assert google.userinfo_calls == 5
+
+
+def test_failing_jwks_is_not_refetched_on_every_login(clock):
+    google = _Google()
+    google.jwks_status = 503
+
+    async def scenario(provider):
+        for _ in range(5):
+            assert (await provider.authenticate("code")).email == "userinfo@example.com"
+        assert google.jwks_fetches == 1
+
+        # Retried once the interval has passed, and used once it recovers
+        clock.now += MIN_REFRESH
+        google.jwks_status = 200
+        assert (await provider.authenticate("code")).email == "user@example.com"
+
+    _run(google, scenario)
+    assert google.jwks_fetches == 2
+    assert google.userinfo_calls == 5
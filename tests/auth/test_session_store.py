@@ -0,0 +1,174 @@
+"""Session and token blacklist stores against fakeredis."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import fakeredis
+
+from app.auth.domain.entity.session import Session
+from app.auth.infrastructure.cache.session_repository_impl import SessionRepositoryImpl
+from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
+
+TTL = 3600
+
+
+def _run(scenario) -> None:
+    """Run an async scenario with a fresh fakeredis client on its own loop."""
+
+    async def main():
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        try:
+            await scenario(client)
+        finally:
+            await client.aclose()
+
+    asyncio.run(main())
+
+
+def test_save_and_find_round_trip():
+    async def scenario(client):
+        repo = SessionRepositoryImpl(client, ttl_seconds=TTL)
+        session = Session(account_id=42, csrf_token="csrf-token")
+        await repo.save(session)
+
+        key = f"{SessionRepositoryImpl.KEY_PREFIX}{session.session_id}"
+        assert await client.type(key) == "hash"
+        assert 0 < await client.ttl(key) <= TTL
+
+        found = await repo.find_by_id(session.session_id)
+        assert found is not None
+        assert found.session_id == session.session_id
+        assert found.account_id == 42
+        assert found.csrf_token == "csrf-token"
+        assert found.created_at == session.created_at.replace(microsecond=0)
+        assert found.expires_at <= datetime.now() + timedelta(seconds=TTL)
+
+    _run(scenario)
+
+
+def test_save_without_csrf_token_omits_field():
+    async def scenario(client):
+        repo = SessionRepositoryImpl(client, ttl_seconds=TTL)
+        session = Session(account_id=1)
+        await repo.save(session)
+
+        assert "t" not in await client.hgetall(f"{SessionRepositoryImpl.KEY_PREFIX}{session.session_id}")
+        assert (await repo.find_by_id(session.session_id)).csrf_token is None
+
+    _run(scenario)
+
+
+def test_find_missing_session_returns_none():
+    async def scenario(client):
+        assert await SessionRepositoryImpl(client, ttl_seconds=TTL).find_by_id("missing") is None
+
+    _run(scenario)
+
+
+def test_legacy_json_session_is_upgraded_to_hash():
+    async def scenario(client):
+        repo = SessionRepositoryImpl(client, ttl_seconds=TTL)
+        legacy = Session(account_id=7, csrf_token="legacy-csrf")
+        key = f"{SessionRepositoryImpl.KEY_PREFIX}{legacy.session_id}"
+        await client.set(key, json.dumps(legacy.to_dict()), ex=600)
+
+        found = await repo.find_by_id(legacy.session_id)
+        assert found is not None
+        assert found.account_id == 7
+        assert found.csrf_token == "legacy-csrf"
+        # The key TTL was shorter than the JSON expiry, so it wins
+        assert found.expires_at <= datetime.now() + timedelta(seconds=600)
+
+        assert await client.type(key) == "hash"
+        assert 0 < await client.ttl(key) <= 600
+        assert (await repo.find_by_id(legacy.session_id)).account_id == 7
+
+    _run(scenario)
+
+
+def test_expired_legacy_session_is_deleted():
+    async def scenario(client):
+        repo = SessionRepositoryImpl(client, ttl_seconds=TTL)
+        created = datetime.now() - timedelta(days=2)
+        legacy = Session(account_id=7, created_at=created, expires_at=created + timedelta(days=1))
+        key = f"{SessionRepositoryImpl.KEY_PREFIX}{legacy.session_id}"
+        await client.set(key, json.dumps(legacy.to_dict()))
+
+        assert await repo.find_by_id(legacy.session_id) is None
+        assert not await client.exists(key)
+
+    _run(scenario)
+
+
+def test_save_already_expired_session_stores_nothing():
+    async def scenario(client):
+        repo = SessionRepositoryImpl(client, ttl_seconds=TTL)
+        created = datetime.now() - timedelta(hours=2)
+        session = Session(account_id=3, created_at=created, expires_at=created + timedelta(hours=1))
+        await repo.save(session)
+
+        assert not await client.exists(f"{SessionRepositoryImpl.KEY_PREFIX}{session.session_id}")
+        assert await repo.find_by_id(session.session_id) is None
+
+    _run(scenario)
+
+
+def test_save_caps_ttl_at_session_expiry():
+    async def scenario(client):
+        repo = SessionRepositoryImpl(client, ttl_seconds=TTL)
+        session = Session(account_id=3, expires_at=datetime.now() + timedelta(seconds=120))
+        await repo.save(session)
+
+        assert 0 < await client.ttl(f"{SessionRepositoryImpl.KEY_PREFIX}{session.session_id}") <= 120
+
+    _run(scenario)
+
+
+def test_extend_ttl():
+    async def scenario(client):
+        repo = SessionRepositoryImpl(client, ttl_seconds=60)
+        session = Session(account_id=5)
+        await repo.save(session)
+
+        assert await repo.extend_ttl(session.session_id, 7200) is True
+        assert await client.ttl(f"{SessionRepositoryImpl.KEY_PREFIX}{session.session_id}") > 60
+
+    _run(scenario)
+
+
+def test_extend_ttl_on_missing_session_does_not_create_it():
+    async def scenario(client):
+        repo = SessionRepositoryImpl(client, ttl_seconds=TTL)
+
+        assert await repo.extend_ttl("missing", 7200) is False
+        assert not await client.exists(f"{SessionRepositoryImpl.KEY_PREFIX}missing")
+
+    _run(scenario)
+
+
+def test_delete_session():
+    async def scenario(client):
+        repo = SessionRepositoryImpl(client, ttl_seconds=TTL)
+        session = Session(account_id=5)
+        await repo.save(session)
+        await repo.delete(session.session_id)
+
+        assert await repo.find_by_id(session.session_id) is None
+
+    _run(scenario)
+
+
+def test_token_blacklist():
+    async def scenario(client):
+        blacklist = TokenBlacklistImpl(client)
+        assert await blacklist.is_blacklisted("jti-1") is False
+
+        await blacklist.add_to_blacklist("jti-1", 300)
+        assert await blacklist.is_blacklisted("jti-1") is True
+        assert 0 < await client.ttl(f"{TokenBlacklistImpl.KEY_PREFIX}jti-1") <= 300
+
+        await blacklist.remove_from_blacklist("jti-1")
+        assert await blacklist.is_blacklisted("jti-1") is False
+
+    _run(scenario)
@@ -0,0 +1,153 @@
+"""메시지 암호화: 방식(enc_version)별 왕복, 버전 없는 행, 변조 검출, decrypt_many 오류 처리"""
+
+import base64
+import os
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from app.config.security.message_crypto import (
+    ENC_VERSION_CBC,
+    ENC_VERSION_GCM,
+    ENC_VERSION_GCM_ZLIB,
+    AESEncryption,
+    make_enc_version,
+)
+
+SHORT = "안녕하세요"
+LONG = "요즘 남자친구랑 연락 문제로 자주 다퉈요. 제가 너무 예민한 걸까요? " * 8
+ROTATED_KEY = base64.b64encode(b"R" * 32).decode()
+
+
+def _cbc_encrypt(text: str, iv: bytes) -> bytes:
+    """변경 전 코드와 같은 AES-256-CBC + PKCS7 (enc_version 1 행)"""
+    padder = padding.PKCS7(128).padder()
+    data = padder.update(text.encode("utf-8")) + padder.finalize()
+    encryptor = Cipher(algorithms.AES(base64.b64decode(os.environ["AES_KEY"])), modes.CBC(iv)).encryptor()
+    return encryptor.update(data) + encryptor.finalize()
+
+
+def _tampered(ciphertext: bytes) -> bytes:
+    return ciphertext[:-1] + bytes((ciphertext[-1] ^ 0x01,))
+
+
+@pytest.fixture
+def rotated(monkeypatch):
+    """키 1 이 활성인 키링 (키 0 = AES_KEY 는 이전 행 복호화용으로 남음)"""
+    monkeypatch.setenv("AES_KEYRING", f"1:{ROTATED_KEY}")
+    monkeypatch.setenv("AES_ACTIVE_KEY_ID", "1")
+    return AESEncryption(compression=False)
+
+
+@pytest.mark.parametrize("text", ["", SHORT, LONG])
+def test_cbc_rows_decrypt(text):
+    crypto = AESEncryption(compression=False)
+    iv = os.urandom(16)
+
+    assert crypto.decrypt(_cbc_encrypt(text, iv), iv, ENC_VERSION_CBC) == text
+    # 오래된 행은 iv 대신 환경 변수 AES_IV 로 암호화되어 있다
+    assert crypto.decrypt(_cbc_encrypt(text, crypto.iv), None, ENC_VERSION_CBC) == text
+
+
+@pytest.mark.parametrize("text", [SHORT, LONG])
+def test_gcm_round_trip(text):
+    crypto = AESEncryption(compression=False)
+
+    ciphertext, nonce = crypto.encrypt(text)
+
+    assert crypto.get_version() == ENC_VERSION_GCM
+    assert len(nonce) == 12
+    assert crypto.decrypt(ciphertext, nonce, ENC_VERSION_GCM) == text
+
+
+@pytest.mark.parametrize("text", [SHORT, LONG])
+def test_gcm_zlib_round_trip(text):
+    crypto = AESEncryption(compression=True)
+
+    ciphertext, nonce = crypto.encrypt(text)
+
+    assert crypto.get_version() == ENC_VERSION_GCM_ZLIB
+    assert crypto.decrypt(ciphertext, nonce, ENC_VERSION_GCM_ZLIB) == text
+    if text == LONG:
+        assert len(ciphertext) < len(text.encode("utf-8"))
+
+
+def test_encrypt_many_matches_single_decrypt():
+    crypto = AESEncryption(compression=True)
+
+    items = crypto.encrypt_many([SHORT, LONG])
+
+    assert [crypto.decrypt(c, n, crypto.version) for c, n in items] == [SHORT, LONG]
+
+
+def test_rows_without_version():
+    crypto = AESEncryption(compression=False)
+    cbc_iv = os.urandom(16)
+    gcm, nonce = crypto.encrypt(SHORT, versioned=False)
+
+    assert crypto.decrypt(_cbc_encrypt(SHORT, cbc_iv), cbc_iv) == SHORT
+    assert crypto.decrypt(gcm, nonce) == SHORT
+
+
+def test_rotated_keyring_reads_every_older_row(rotated):
+    legacy = AESEncryption(compression=True)
+    old_gcm, old_nonce = legacy.encrypt(LONG)
+    old_preview, preview_nonce = legacy.encrypt(SHORT, versioned=False)
+    cbc_iv = os.urandom(16)
+
+    new_gcm, new_nonce = rotated.encrypt(SHORT)
+
+    assert rotated.get_version() == make_enc_version(1, ENC_VERSION_GCM)
+    assert rotated.decrypt(new_gcm, new_nonce, rotated.version) == SHORT
+    assert rotated.decrypt(old_gcm, old_nonce, legacy.version) == LONG
+    assert rotated.decrypt(_cbc_encrypt(SHORT, cbc_iv), cbc_iv, ENC_VERSION_CBC) == SHORT
+    # 버전 없는 GCM 값: 활성 키가 아니어도 태그 검증에 성공하는 키로 읽는다
+    assert rotated.decrypt(old_preview, preview_nonce) == SHORT
+
+
+def test_unknown_key_or_scheme_is_rejected():
+    crypto = AESEncryption(compression=False)
+    ciphertext, nonce = crypto.encrypt(SHORT)
+
+    with pytest.raises(ValueError, match="Unknown encryption key id"):
+        crypto.decrypt(ciphertext, nonce, make_enc_version(9, ENC_VERSION_GCM))
+    with pytest.raises(ValueError, match="Unsupported enc_version"):
+        crypto.decrypt(ciphertext, nonce, make_enc_version(1, ENC_VERSION_CBC))
+
+
+@pytest.mark.parametrize("compression, version", [(False, ENC_VERSION_GCM), (True, ENC_VERSION_GCM_ZLIB)])
+def test_tampered_tag_raises(compression, version):
+    crypto = AESEncryption(compression=compression)
+    ciphertext, nonce = crypto.encrypt(LONG)
+
+    with pytest.raises(InvalidTag):
+        crypto.decrypt(_tampered(ciphertext), nonce, version)
+
+
+def test_tampered_unversioned_value_raises():
+    crypto = AESEncryption(compression=False)
+    ciphertext, nonce = crypto.encrypt(SHORT, versioned=False)
+
+    with pytest.raises(ValueError, match="No key in the keyring"):
+        crypto.decrypt(_tampered(ciphertext), nonce)
+
+
+def test_decrypt_many_on_error():
+    crypto = AESEncryption(compression=True)
+    good, good_nonce = crypto.encrypt(LONG)
+    bad, bad_nonce = crypto.encrypt(SHORT)
+    cbc_iv = os.urandom(16)
+    items = [
+        (good, good_nonce, crypto.version),
+        (_tampered(bad), bad_nonce, crypto.version),
+        (b"", None, crypto.version),
+        (_cbc_encrypt(SHORT, cbc_iv), cbc_iv, ENC_VERSION_CBC),
+        (good, good_nonce, make_enc_version(9, ENC_VERSION_GCM)),
+    ]
+
+    assert crypto.decrypt_many(items, on_error="[복호화 오류]") == [
+        LONG, "[복호화 오류]", "", SHORT, "[복호화 오류]",
+    ]
+    assert crypto.decrypt_many(items) == [LONG, None, "", SHORT, None]
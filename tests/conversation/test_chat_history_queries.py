@@ -0,0 +1,125 @@
+"""대화 히스토리 조회가 방 크기와 무관하게 페이지당 고정된 수의 쿼리만 실행하는지 확인"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.config.security.message_crypto import AESEncryption
+from app.conversation.application.usecase.get_chat_message_usecase import GetChatMessagesUseCase
+from app.conversation.domain.chat_feedback.enums import Satisfaction
+from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
+from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+
+ROOM_ID = "room-1"
+ACCOUNT_ID = 7
+PAGE = 20
+
+crypto = AESEncryption()
+
+
+def _seed(session_factory, messages: int) -> None:
+    base_time = datetime(2026, 1, 1)
+    db = session_factory()
+    try:
+        db.add(ChatRoomOrm(room_id=ROOM_ID, account_id=ACCOUNT_ID, title="t", status="ACTIVE"))
+        db.flush()
+        rows = []
+        for n in range(1, messages + 1):
+            enc, iv = crypto.encrypt(f"message {n}")
+            rows.append(dict(
+                id=n, room_id=ROOM_ID, account_id=ACCOUNT_ID, role="USER" if n % 2 else "ASSISTANT",
+                content_enc=enc, iv=iv, enc_version=crypto.version, contents_type="TEXT",
+                file_urls=[], created_at=base_time + timedelta(seconds=n), parent_id=n - 1 or None,
+            ))
+        db.bulk_insert_mappings(ChatMessageOrm, rows)
+        # 피드백이 있어도 메시지별 추가 쿼리가 없어야 한다
+        db.bulk_insert_mappings(ChatFeedbackOrm, [
+            dict(account_id=ACCOUNT_ID, message_id=n, satisfaction=Satisfaction.LIKE)
+            for n in range(2, messages + 1, 4)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def _repo(session_factory) -> ChatMessageRepositoryImpl:
+    return ChatMessageRepositoryImpl(session_factory())
+
+
+@pytest.mark.parametrize("messages", [0, 1, PAGE, PAGE + 1, 250])
+def test_find_history_is_one_statement(db, statements, messages):
+    _seed(db, messages)
+    statements.reset()
+
+    rows = asyncio.run(_repo(db).find_history(ROOM_ID, ACCOUNT_ID))
+
+    assert len(statements.statements) == 1
+    assert [row.id for row in rows] == list(range(1, messages + 1))
+    assert sum(row.satisfaction is not None for row in rows) == len(range(2, messages + 1, 4))
+
+
+@pytest.mark.parametrize("messages", [0, PAGE - 1, PAGE, PAGE + 1, 2 * PAGE + 1, 250])
+def test_each_older_page_is_one_statement(db, statements, messages):
+    _seed(db, messages)
+    seen, before, pages = [], None, 0
+
+    while True:
+        statements.reset()
+        rows, has_more = asyncio.run(_repo(db).find_history_page(ROOM_ID, ACCOUNT_ID, limit=PAGE, before=before))
+        pages += 1
+        assert len(statements.statements) == 1
+        assert len(rows) <= PAGE
+        seen = [row.id for row in rows] + seen
+        if not has_more:
+            break
+        before = rows[0].id
+
+    assert seen == list(range(1, messages + 1))
+    # limit+1 로 읽어 다음 페이지 여부를 판단하므로 빈 마지막 페이지를 요청하지 않는다
+    assert pages == max(1, -(-messages // PAGE))
+
+
+@pytest.mark.parametrize("messages, has_more", [(PAGE, False), (PAGE + 1, True)])
+def test_keyset_limit_plus_one_edge(db, statements, messages, has_more):
+    _seed(db, messages)
+    statements.reset()
+
+    rows, more = asyncio.run(_repo(db).find_history_page(ROOM_ID, ACCOUNT_ID, limit=PAGE))
+
+    assert len(statements.statements) == 1
+    assert "LIMIT" in statements.statements[0]
+    assert more is has_more
+    assert [row.id for row in rows] == list(range(messages - PAGE + 1, messages + 1))
+
+
+def test_newer_pages_are_one_statement_each(db, statements):
+    _seed(db, 3 * PAGE + 5)
+    after, seen = 0, []
+
+    while True:
+        statements.reset()
+        rows, has_more = asyncio.run(_repo(db).find_history_page(ROOM_ID, ACCOUNT_ID, limit=PAGE, after=after))
+        assert len(statements.statements) == 1
+        seen += [row.id for row in rows]
+        if not has_more:
+            break
+        after = rows[-1].id
+
+    assert seen == list(range(1, 3 * PAGE + 6))
+
+
+@pytest.mark.parametrize("messages", [5, 250])
+def test_usecase_page_is_one_statement_and_decrypts(db, statements, messages):
+    _seed(db, messages)
+    usecase = GetChatMessagesUseCase(_repo(db), crypto)
+    statements.reset()
+
+    page = asyncio.run(usecase.execute_page(ROOM_ID, ACCOUNT_ID, limit=PAGE))
+
+    assert len(statements.statements) == 1
+    assert page["messages"][-1]["content"] == f"message {messages}"
+    assert page["has_older"] is (messages > PAGE)
+    assert page["has_newer"] is False
@@ -0,0 +1,168 @@
+"""키 교체 재암호화 작업: 청크 단위 중단/재개, 행당 한 번만 쓰기, iv 가 바뀐 행은 건너뛰기"""
+
+import base64
+
+import fakeredis
+import pytest
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from sqlalchemy import event
+
+from app.config.security.message_crypto import ENC_VERSION_GCM, AESEncryption, make_enc_version
+from app.conversation.infrastructure.job.chat_reencryption_job import (
+    PHASE_DONE,
+    PHASE_MESSAGES,
+    ChatReencryptionJob,
+    ReencryptionBusyError,
+    ReencryptionCheckpoint,
+)
+from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+
+MESSAGES = 25
+ROOMS = 3
+CHUNK = 10
+NEW_KEY = b"N" * 32
+NEW_VERSION = make_enc_version(1, ENC_VERSION_GCM)
+
+
+@pytest.fixture
+def legacy():
+    return AESEncryption(compression=False)
+
+
+@pytest.fixture
+def rotated(monkeypatch):
+    monkeypatch.setenv("AES_KEYRING", f"1:{base64.b64encode(NEW_KEY).decode()}")
+    monkeypatch.setenv("AES_ACTIVE_KEY_ID", "1")
+    return AESEncryption(compression=False)
+
+
+@pytest.fixture
+def seeded(db, legacy):
+    session = db()
+    try:
+        for r in range(ROOMS):
+            preview, preview_iv = legacy.encrypt(f"preview {r}", versioned=False)
+            session.add(ChatRoomOrm(
+                room_id=f"room-{r}", account_id=1, title="t", status="ACTIVE",
+                preview_enc=preview, preview_iv=preview_iv,
+            ))
+        session.flush()
+        for n in range(1, MESSAGES + 1):
+            enc, iv = legacy.encrypt(f"message {n}")
+            session.add(ChatMessageOrm(
+                id=n, room_id=f"room-{n % ROOMS}", account_id=1, role="USER",
+                content_enc=enc, iv=iv, enc_version=legacy.version, contents_type="TEXT",
+            ))
+        session.commit()
+    finally:
+        session.close()
+    return db
+
+
+def _job(crypto, session_factory, redis_client, written):
+    job = ChatReencryptionJob(
+        crypto,
+        session_factory,
+        checkpoint=ReencryptionCheckpoint(crypto.get_version(), redis_factory=lambda: redis_client),
+        chunk_size=CHUNK,
+        workers=2,
+        pause_ms=0,
+    )
+    slice_reencrypt = job._reencrypt_slice
+
+    def recording(rows, versioned=True):
+        result = slice_reencrypt(rows, versioned)
+        written.extend(("chat_msg" if versioned else "chat_room", u["b_id"]) for u in result[0])
+        return result
+
+    job._reencrypt_slice = recording
+    return job
+
+
+def _messages(session_factory) -> dict:
+    session = session_factory()
+    try:
+        return {m.id: (m.content_enc, m.iv, m.enc_version) for m in session.query(ChatMessageOrm)}
+    finally:
+        session.close()
+
+
+def test_resume_finishes_on_the_active_key_without_rewriting_rows(seeded, rotated):
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    written = []
+
+    state = _job(rotated, seeded, redis_client, written).run(max_chunks=1)
+
+    assert (state["phase"], state["message_cursor"], state["updated"]) == (PHASE_MESSAGES, CHUNK, CHUNK)
+    versions = {row_id: version for row_id, (_, _, version) in _messages(seeded).items()}
+    assert {v for i, v in versions.items() if i <= CHUNK} == {NEW_VERSION}
+    assert {v for i, v in versions.items() if i > CHUNK} == {ENC_VERSION_GCM}
+    assert redis_client.get(ReencryptionCheckpoint.LOCK_KEY) is None
+
+    # 새 프로세스가 체크포인트에서 이어서 처리
+    state = _job(rotated, seeded, redis_client, written).run()
+
+    assert state["phase"] == PHASE_DONE
+    assert state["updated"] == MESSAGES + ROOMS
+    assert state["failed"] == 0
+    assert len(written) == len(set(written)) == MESSAGES + ROOMS
+
+    new_key = AESGCM(NEW_KEY)
+    for row_id, (content_enc, iv, version) in _messages(seeded).items():
+        assert version == NEW_VERSION
+        assert new_key.decrypt(iv, content_enc, None).decode() == f"message {row_id}"
+    session = seeded()
+    try:
+        for room in session.query(ChatRoomOrm):
+            assert new_key.decrypt(room.preview_iv, room.preview_enc, None).decode() == f"preview {room.room_id[-1]}"
+    finally:
+        session.close()
+
+    # 처음부터 다시 검사해도 더 바꿀 행이 없다
+    job = _job(rotated, seeded, redis_client, written)
+    job.checkpoint.reset()
+    assert job.run()["updated"] == 0
+
+
+def test_row_whose_iv_changed_after_the_read_is_left_alone(seeded, rotated):
+    from app.config.database.session import engine
+
+    target = 7
+    edited_enc, edited_iv = rotated.encrypt("edited concurrently")
+    done = []
+
+    def concurrent_edit(conn, cursor, statement, parameters, context, executemany):
+        # 작업이 읽은 뒤, UPDATE 직전에 다른 요청이 같은 행을 새 iv 로 고쳐 쓴 상황
+        if statement.startswith("UPDATE chat_msg") and not done:
+            done.append(True)
+            cursor.connection.execute(
+                "UPDATE chat_msg SET content_enc = ?, iv = ?, enc_version = ? WHERE id = ?",
+                (edited_enc, edited_iv, NEW_VERSION, target),
+            )
+
+    event.listen(engine, "before_cursor_execute", concurrent_edit)
+    try:
+        state = _job(rotated, seeded, fakeredis.FakeRedis(decode_responses=True), []).run()
+    finally:
+        event.remove(engine, "before_cursor_execute", concurrent_edit)
+
+    assert state["phase"] == PHASE_DONE
+    rows = _messages(seeded)
+    assert rows[target] == (edited_enc, edited_iv, NEW_VERSION)
+    assert rotated.decrypt(*rows[target]) == "edited concurrently"
+    assert {version for _, _, version in rows.values()} == {NEW_VERSION}
+    assert rotated.decrypt(*rows[target + 1]) == f"message {target + 1}"
+
+
+def test_second_job_is_rejected_while_one_holds_the_lock(seeded, rotated):
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    running = _job(rotated, seeded, redis_client, [])
+    running.checkpoint.acquire()
+    try:
+        with pytest.raises(ReencryptionBusyError):
+            _job(rotated, seeded, redis_client, []).run()
+    finally:
+        running.checkpoint.release()
+
+    assert {version for _, _, version in _messages(seeded).values()} == {ENC_VERSION_GCM}
@@ -0,0 +1,225 @@
+"""write-behind 큐: 적재/반영, turn_id 멱등 재반영, 재시도 한도 초과 시 DLQ"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import fakeredis
+import pytest
+
+from app.conversation.application.port.out.chat_write_behind_port import PendingChatMessage, PendingTurn
+from app.conversation.infrastructure.cache.room_meta_cache import RoomMetaCache
+from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+from app.conversation.infrastructure.queue.chat_write_behind_impl import (
+    ChatWriteBehindWorker,
+    RedisChatWriteBehind,
+    _dumps,
+)
+from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
+
+ROOM_ID = "room-1"
+ACCOUNT_ID = 7
+BASE_TIME = datetime(2026, 1, 1)
+
+
+class FakeUsageMeter:
+    def __init__(self):
+        self.recorded = []
+
+    async def record_usage(self, account_id, input_length, output_length):
+        self.recorded.append((account_id, input_length, output_length))
+
+
+def _turn(n: int) -> PendingTurn:
+    at = BASE_TIME + timedelta(minutes=n)
+    return PendingTurn(
+        turn_id=uuid.uuid4().hex,
+        room_id=ROOM_ID,
+        account_id=ACCOUNT_ID,
+        contents_type="TEXT",
+        enc_version=2,
+        user=PendingChatMessage("USER", f"user-{n}".encode(), b"u" * 12, at),
+        assistant=PendingChatMessage("ASSISTANT", f"assistant-{n}".encode(), b"a" * 12, at + timedelta(seconds=1)),
+        preview_enc=f"preview-{n}".encode(),
+        preview_iv=b"p" * 12,
+        input_length=10 * n,
+        output_length=20 * n,
+    )
+
+
+@pytest.fixture
+def room(db):
+    session = db()
+    try:
+        session.add(ChatRoomOrm(room_id=ROOM_ID, account_id=ACCOUNT_ID, title="t", status="ACTIVE", message_count=0))
+        session.commit()
+    finally:
+        session.close()
+    return db
+
+
+def _run(scenario, max_attempts: int = 3) -> None:
+    """sync/async fakeredis 클라이언트가 같은 서버를 보도록 묶어 시나리오를 실행"""
+    server = fakeredis.FakeServer()
+    sync_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+
+    async def main():
+        async_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        queue = RedisChatWriteBehind(
+            redis_factory=lambda: sync_client,
+            async_redis_factory=lambda: async_client,
+            max_attempts=max_attempts,
+        )
+        try:
+            await scenario(queue, sync_client)
+        finally:
+            await async_client.aclose()
+
+    asyncio.run(main())
+
+
+def _repos(session):
+    return ChatRoomRepositoryImpl(session, meta_cache=RoomMetaCache(enabled=False)), ChatMessageRepositoryImpl(session)
+
+
+def _rows(session_factory) -> list:
+    session = session_factory()
+    try:
+        return [
+            (m.id, m.role, m.content_enc.decode(), m.parent_id, m.turn_id)
+            for m in session.query(ChatMessageOrm).order_by(ChatMessageOrm.id)
+        ]
+    finally:
+        session.close()
+
+
+def _room(session_factory) -> ChatRoomOrm:
+    session = session_factory()
+    try:
+        return session.get(ChatRoomOrm, ROOM_ID)
+    finally:
+        session.close()
+
+
+def test_enqueue_then_drain(room):
+    turns = [_turn(2), _turn(1)]
+
+    def no_sync_client():
+        raise AssertionError("request path must not use the sync Redis client")
+
+    async def scenario(queue, sync_client):
+        queue._redis_factory = no_sync_client
+        for turn in turns:
+            await queue.enqueue(turn)
+
+        assert sync_client.xlen(RedisChatWriteBehind.STREAM_KEY) == 2
+        pending = await queue.pending_for_room(ROOM_ID)
+        assert [t.turn_id for t in pending] == [turns[1].turn_id, turns[0].turn_id]  # 작성 순
+        assert pending[0] == turns[1]  # 직렬화 왕복
+
+        session = room()
+        try:
+            drained = await queue.drain_room(ROOM_ID, *_repos(session))
+        finally:
+            session.close()
+
+        assert [t.turn_id for t in drained] == [turns[1].turn_id, turns[0].turn_id]
+        assert await queue.pending_for_room(ROOM_ID) == []
+
+    _run(scenario)
+
+    assert _rows(room) == [
+        (1, "USER", "user-1", None, turns[1].turn_id),
+        (2, "ASSISTANT", "assistant-1", 1, None),
+        (3, "USER", "user-2", 2, turns[0].turn_id),
+        (4, "ASSISTANT", "assistant-2", 3, None),
+    ]
+    saved_room = _room(room)
+    assert (saved_room.last_message_id, saved_room.message_count) == (4, 4)
+    assert saved_room.preview_enc == b"preview-2"
+
+
+def test_replaying_a_saved_turn_writes_nothing(room):
+    turn = _turn(1)
+
+    async def scenario(queue, sync_client):
+        await queue.enqueue(turn)
+        session = room()
+        try:
+            await queue.drain_room(ROOM_ID, *_repos(session))
+        finally:
+            session.close()
+
+        # 커밋 후 해시 삭제 전에 중단된 경우: 같은 턴이 대기 목록에 다시 남아 있다
+        sync_client.hset(RedisChatWriteBehind.PENDING_KEY.format(room_id=ROOM_ID), turn.turn_id, _dumps(turn))
+        session = room()
+        try:
+            replayed = await queue.drain_room(ROOM_ID, *_repos(session))
+        finally:
+            session.close()
+
+        assert [t.turn_id for t in replayed] == [turn.turn_id]
+        assert await queue.pending_for_room(ROOM_ID) == []
+
+    _run(scenario)
+
+    assert len(_rows(room)) == 2
+    assert _room(room).message_count == 2
+
+
+def test_worker_applies_and_acks(room):
+    turn = _turn(1)
+    usage = FakeUsageMeter()
+
+    async def scenario(queue, sync_client):
+        await queue.enqueue(turn)
+        worker = ChatWriteBehindWorker(queue, room, usage)
+        queue.ensure_group()
+
+        assert await worker.process_batch() == 1
+        assert queue.stats() == {"stream_length": 0, "unacked": 0, "dead_letters": 0}
+
+    _run(scenario)
+
+    assert [row[1] for row in _rows(room)] == ["USER", "ASSISTANT"]
+    assert usage.recorded == [(ACCOUNT_ID, 10, 20)]
+
+
+def test_dead_letter_after_max_attempts(room, monkeypatch):
+    turn = _turn(1)
+    usage = FakeUsageMeter()
+
+    async def broken_apply(*args):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(RedisChatWriteBehind, "_apply", staticmethod(broken_apply))
+
+    async def scenario(queue, sync_client):
+        await queue.enqueue(turn)
+        worker = ChatWriteBehindWorker(queue, room, usage)
+        worker.retry_seconds = 0  # 실패한 항목을 바로 다시 가져오도록
+        queue.ensure_group()
+
+        for attempt in range(1, queue.max_attempts):
+            assert await worker.process_batch() == 0
+            assert sync_client.hget(RedisChatWriteBehind.ATTEMPTS_KEY, sync_client.xrange(
+                RedisChatWriteBehind.STREAM_KEY)[0][0]) == str(attempt)
+            assert len(await queue.pending_for_room(ROOM_ID)) == 1
+
+        assert await worker.process_batch() == 0
+
+        assert await queue.pending_for_room(ROOM_ID) == []
+        assert queue.stats() == {"stream_length": 0, "unacked": 0, "dead_letters": 1}
+        assert sync_client.hlen(RedisChatWriteBehind.ATTEMPTS_KEY) == 0
+        (_, dead), = sync_client.xrange(RedisChatWriteBehind.DLQ_KEY)
+        assert dead["turn_id"] == turn.turn_id
+        assert dead["attempts"] == str(queue.max_attempts)
+        assert "db down" in dead["error"]
+        assert dead["payload"] == _dumps(turn)
+
+    _run(scenario, max_attempts=3)
+
+    assert _rows(room) == []
+    assert usage.recorded == []
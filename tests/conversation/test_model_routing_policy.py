@@ -0,0 +1,54 @@
+"""모델 라우팅: 경로별 모델/사유와 max_tokens 상한"""
+
+import pytest
+
+from app.conversation.application.policy.model_routing_policy import ModelRoutingPolicy
+
+DEFAULT, FAST = "gpt-default", "gpt-fast"
+
+
+def _policy(max_tokens=1000, enabled=True):
+    return ModelRoutingPolicy(DEFAULT, FAST, enabled=enabled, max_tokens=max_tokens)
+
+
+@pytest.mark.parametrize("kwargs, model, reason", [
+    (dict(message="안녕하세요~", history_depth=0, has_images=False), FAST, "trivial"),
+    (dict(message="고마워 ㅎㅎ", history_depth=3, has_images=False), FAST, "trivial"),
+    (dict(message="안녕", history_depth=0, has_images=True), DEFAULT, "images"),
+    (dict(message="응", history_depth=ModelRoutingPolicy.DEEP_HISTORY_DEPTH, has_images=False), DEFAULT, "deep_history"),
+    (dict(message="남자친구와 다퉜어요. " * 200, history_depth=0, has_images=False), DEFAULT, "long_message"),
+    (dict(message="남자친구가 연락을 잘 안 해요", history_depth=2, has_images=False), DEFAULT, "default"),
+])
+def test_route_reasons(kwargs, model, reason):
+    route = _policy().route(plan="PRO", **kwargs)
+
+    assert (route.model, route.reason) == (model, reason)
+
+
+def test_disabled_always_uses_default_model_and_env_budget():
+    route = _policy(enabled=False).route("FREE", "안녕", 0, False)
+
+    assert (route.model, route.max_tokens, route.reason) == (DEFAULT, None, "disabled")
+
+
+@pytest.mark.parametrize("plan, expected", [("FREE", 800), (None, 800), ("PRO", None), ("TEAM", None)])
+def test_plan_caps_below_the_global_limit(plan, expected):
+    route = _policy(max_tokens=1000).route(plan, "남자친구가 연락을 잘 안 해요", 0, False)
+
+    assert route.max_tokens == expected
+
+
+def test_caps_are_clamped_to_the_global_limit():
+    policy = _policy(max_tokens=200)
+
+    assert policy.route("FREE", "남자친구가 연락을 잘 안 해요", 0, False).max_tokens == 200
+    assert policy.route("FREE", "안녕하세요", 0, False).max_tokens == 200
+    assert policy.route("FREE", "사진 봐줘", 0, True).max_tokens == 200
+    # PRO/TEAM 은 전역 값(None -> MAX_TOKENS)을 그대로 쓰므로 FREE 보다 커질 수 없다
+    assert policy.route("PRO", "남자친구가 연락을 잘 안 해요", 0, False).max_tokens is None
+
+
+def test_fast_path_cap_is_kept_when_lower():
+    route = _policy(max_tokens=1000).route("PRO", "ㅇㅋ", 0, False)
+
+    assert route.max_tokens == ModelRoutingPolicy.FAST_MAX_TOKENS
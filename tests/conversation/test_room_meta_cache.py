@@ -0,0 +1,134 @@
+"""채팅방 메타 캐시: 커밋 직후 tombstone 으로 무효화되고, 옛 head 를 NX 로 다시 써넣지 못하는지 확인"""
+
+import asyncio
+from datetime import datetime
+
+import fakeredis
+import pytest
+
+from app.conversation.infrastructure.cache.room_meta_cache import RoomMetaCache
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
+
+ROOM_ID = "room-1"
+ACCOUNT_ID = 7
+KEY = f"{RoomMetaCache.KEY_PREFIX}{ROOM_ID}"
+
+
+@pytest.fixture
+def room(db):
+    session = db()
+    try:
+        session.add(ChatRoomOrm(
+            room_id=ROOM_ID, account_id=ACCOUNT_ID, title="t", status="ACTIVE",
+            last_message_id=2, message_count=2,
+        ))
+        session.commit()
+    finally:
+        session.close()
+    return db
+
+
+def _run(scenario) -> None:
+    """sync/async fakeredis 클라이언트가 같은 서버를 보도록 묶어 시나리오를 실행"""
+    server = fakeredis.FakeServer()
+    sync_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+
+    async def main():
+        async_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        cache = RoomMetaCache(
+            redis_factory=lambda: sync_client,
+            async_redis_factory=lambda: async_client,
+            ttl_seconds=300,
+            tombstone_seconds=5,
+            enabled=True,
+        )
+        try:
+            await scenario(cache, sync_client)
+        finally:
+            await async_client.aclose()
+
+    asyncio.run(main())
+
+
+class _Request:
+    """요청 하나 = 세션 하나 + 레포지토리 하나 (요청 단위 memo 포함)"""
+
+    def __init__(self, session_factory, cache: RoomMetaCache):
+        self.db = session_factory()
+        self.repo = ChatRoomRepositoryImpl(self.db, cache)
+
+    async def __aenter__(self) -> ChatRoomRepositoryImpl:
+        return self.repo
+
+    async def __aexit__(self, *exc) -> None:
+        self.db.close()
+
+
+async def _touch(repo: ChatRoomRepositoryImpl, head: int) -> None:
+    await repo.touch_activity(ROOM_ID, head, datetime(2026, 1, 1), 2, None, None)
+
+
+def test_touch_activity_commit_makes_next_request_read_new_head(room):
+    async def scenario(cache, sync_client):
+        async with _Request(room, cache) as repo:
+            assert (await repo.find_meta(ROOM_ID)).last_message_id == 2
+        async with _Request(room, cache) as repo:
+            assert (await repo.find_meta(ROOM_ID)).last_message_id == 2
+        assert cache.stats["hits"] == 1
+
+        async with _Request(room, cache) as repo:
+            await _touch(repo, 4)
+            assert sync_client.get(KEY) != RoomMetaCache.TOMBSTONE  # 커밋 전에는 무효화하지 않는다
+            repo.db.commit()
+        assert sync_client.get(KEY) == RoomMetaCache.TOMBSTONE
+
+        async with _Request(room, cache) as repo:
+            assert (await repo.find_meta(ROOM_ID)).last_message_id == 4
+        assert cache.stats == {"hits": 1, "loads": 2, "invalidations": 1, "redis_errors": 0}
+        # tombstone 이 남아 있는 동안에는 채우지 않는다
+        assert sync_client.get(KEY) == RoomMetaCache.TOMBSTONE
+
+    _run(scenario)
+
+
+def test_load_overlapping_commit_cannot_write_old_head_back(room):
+    async def scenario(cache, sync_client):
+        async with _Request(room, cache) as reader, _Request(room, cache) as writer:
+            load = reader._load_meta
+
+            def racing_loader(room_id):
+                # 옛 head 를 읽은 뒤, 값을 채우기 전에 다른 요청이 커밋한다
+                meta = load(room_id)
+                writer.db.execute(
+                    ChatRoomOrm.__table__.update()
+                    .where(ChatRoomOrm.room_id == room_id)
+                    .values(last_message_id=4)
+                )
+                cache.invalidate_after_commit(writer.db, room_id)
+                writer.db.commit()
+                return meta
+
+            assert (await cache.get(ROOM_ID, racing_loader)).last_message_id == 2
+
+        assert sync_client.get(KEY) == RoomMetaCache.TOMBSTONE
+        async with _Request(room, cache) as repo:
+            assert (await repo.find_meta(ROOM_ID)).last_message_id == 4
+
+    _run(scenario)
+
+
+def test_rollback_keeps_cached_meta(room):
+    async def scenario(cache, sync_client):
+        async with _Request(room, cache) as repo:
+            await repo.find_meta(ROOM_ID)
+
+        async with _Request(room, cache) as repo:
+            await _touch(repo, 4)
+            repo.db.rollback()
+            repo.db.commit()  # 롤백으로 취소된 무효화가 다음 커밋에 실행되지 않아야 한다
+
+        assert sync_client.get(KEY) != RoomMetaCache.TOMBSTONE
+        assert cache.stats["invalidations"] == 0
+
+    _run(scenario)
@@ -0,0 +1,147 @@
+"""채팅 한 턴이 실행하는 SQL: 방 메타, 경로 CTE, 프로필, 한 번의 flush 로 INSERT 2건, 활동 UPDATE 1건"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.account.infrastructure.cache.account_profile_cache import AccountProfileCache
+from app.account.infrastructure.orm.account_model import AccountModel
+from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+from app.config.security.message_crypto import AESEncryption
+from app.conversation.application.usecase.stream_chat_usecase import StreamChatUsecase
+from app.conversation.infrastructure.cache.room_meta_cache import RoomMetaCache
+from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
+from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
+
+ROOM_ID = "room-1"
+ACCOUNT_ID = 7
+REPLY = "그런 마음이 드는 건 자연스러워요."
+
+crypto = AESEncryption()
+
+
+class FakeLLM:
+    def __init__(self):
+        self.prompts = []
+
+    async def call_gpt(self, prompt, file_urls=None, **options):
+        self.prompts.append(prompt)
+        for i in range(0, len(REPLY), 5):
+            yield REPLY[i:i + 5]
+
+
+class FakeUsageMeter:
+    def __init__(self):
+        self.recorded = []
+
+    async def check_available(self, account_id):
+        return None
+
+    async def record_usage(self, account_id, input_length, output_length):
+        self.recorded.append((account_id, input_length, output_length))
+
+
+def _seed(session_factory, history: int) -> None:
+    db = session_factory()
+    try:
+        db.add(AccountModel(id=ACCOUNT_ID, email="user@example.com", nickname="user", mbti="INFP"))
+        db.add(ChatRoomOrm(
+            room_id=ROOM_ID, account_id=ACCOUNT_ID, title="t", status="ACTIVE",
+            last_message_id=history or None, message_count=history,
+        ))
+        db.flush()
+        for n in range(1, history + 1):
+            enc, iv = crypto.encrypt(f"이전 메시지 {n}")
+            db.add(ChatMessageOrm(
+                id=n, room_id=ROOM_ID, account_id=ACCOUNT_ID, role="USER" if n % 2 else "ASSISTANT",
+                content_enc=enc, iv=iv, enc_version=crypto.version, contents_type="TEXT",
+                file_urls=[], parent_id=n - 1 or None, created_at=datetime(2026, 1, 1),
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _kind(statement: str) -> str:
+    for prefix, kind in (
+        ("SELECT chat_room.account_id", "room meta"),
+        ("WITH RECURSIVE msg_path", "path CTE"),
+        ("SELECT account.role", "profile"),
+        ("INSERT INTO chat_msg", "INSERT chat_msg"),
+        ("UPDATE chat_room", "UPDATE chat_room"),
+    ):
+        if statement.startswith(prefix):
+            return kind
+    return statement
+
+
+def _run_turn(session_factory, statements):
+    db = session_factory()
+    llm, usage = FakeLLM(), FakeUsageMeter()
+    usecase = StreamChatUsecase(
+        chat_room_repo=ChatRoomRepositoryImpl(db, meta_cache=RoomMetaCache(enabled=False)),
+        chat_message_repo=ChatMessageRepositoryImpl(db),
+        account_repo=AccountRepositoryImpl(db, profile_cache=AccountProfileCache(enabled=False)),
+        llm_chat_port=llm,
+        usage_meter=usage,
+        crypto_service=crypto,
+        s3_service=None,
+    )
+    # flush 경계를 같은 로그에 남겨 INSERT 2건이 한 flush 에서 나갔는지 확인한다
+    event.listen(db, "after_flush", lambda *_: statements.statements.append("FLUSH"))
+
+    async def consume():
+        return b"".join([chunk async for chunk in usecase.execute(ROOM_ID, ACCOUNT_ID, "요즘 너무 외로워요", "TEXT")])
+
+    statements.reset()
+    try:
+        body = asyncio.run(consume())
+    finally:
+        db.close()
+    return body, llm, usage
+
+
+@pytest.mark.parametrize("history", [2, 40])
+def test_turn_statement_sequence(db, statements, history):
+    _seed(db, history)
+
+    body, llm, usage = _run_turn(db, statements)
+
+    assert body.decode("utf-8") == REPLY
+    assert [_kind(s) for s in statements.statements] == [
+        "room meta",
+        "path CTE",
+        "profile",
+        "INSERT chat_msg",
+        "INSERT chat_msg",
+        "FLUSH",
+        "UPDATE chat_room",
+    ]
+    assert f"이전 메시지 {history}" in llm.prompts[0]
+    assert usage.recorded == [(ACCOUNT_ID, len("요즘 너무 외로워요"), len(REPLY))]
+
+
+def test_turn_links_parents_and_moves_the_room_head(db, statements):
+    _seed(db, 2)
+
+    _run_turn(db, statements)
+
+    check = db()
+    try:
+        user_msg, assistant_msg = (
+            check.query(ChatMessageOrm).filter(ChatMessageOrm.id > 2).order_by(ChatMessageOrm.id).all()
+        )
+        room = check.get(ChatRoomOrm, ROOM_ID)
+        assert (user_msg.role, assistant_msg.role) == ("USER", "ASSISTANT")
+        assert user_msg.parent_id == 2
+        assert assistant_msg.parent_id == user_msg.id
+        assert room.last_message_id == assistant_msg.id
+        assert room.message_count == 4
+        assert crypto.decrypt(assistant_msg.content_enc, assistant_msg.iv, assistant_msg.enc_version) == REPLY
+        assert crypto.decrypt(room.preview_enc, room.preview_iv) == REPLY
+    finally:
+        check.close()
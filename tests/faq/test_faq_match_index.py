@@ -0,0 +1,112 @@
+"""FAQ 매칭 인덱스: 백그라운드 재빌드와 pub/sub 무효화"""
+
+import threading
+
+import fakeredis
+
+from app.faq.infrastructure.index.faq_match_index import FAQMatchIndex
+
+FAQS = [(1, "환불은 어떻게 하나요", "결제 내역에서 환불을 요청하세요."),
+        (2, "비밀번호를 잊어버렸어요", "로그인 화면에서 재설정하세요.")]
+
+
+class _Loader:
+    def __init__(self, faqs):
+        self.faqs = list(faqs)
+        self.threads = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self):
+        self.threads.append(threading.current_thread())
+        self.release.wait(5)
+        return list(self.faqs)
+
+
+class _Subscriber:
+    def __init__(self):
+        self.handlers = {}
+
+    def subscribe(self, channel, handler, on_connect=None, on_disconnect=None):
+        self.handlers[channel] = (handler, on_connect)
+
+
+def _index(loader, redis_client=None):
+    client = redis_client or fakeredis.FakeRedis(decode_responses=True)
+    return FAQMatchIndex(loader=loader, threshold=0.5, refresh_seconds=300, redis_factory=lambda: client)
+
+
+def test_match_never_loads_on_the_calling_thread():
+    loader = _Loader(FAQS)
+    loader.release.clear()
+    index = _index(loader)
+
+    assert index.match("환불은 어떻게 하나요") is None  # 첫 빌드 전: 매칭하지 않고 빌드만 시작
+    loader.release.set()
+    index.refresh()  # 백그라운드 빌드가 끝날 때까지 기다림
+
+    match = index.match("환불은 어떻게 하나요?")
+    assert match is not None and match.faq_id == 1
+    assert loader.threads and threading.current_thread() not in loader.threads
+    assert len(loader.threads) == 1
+
+
+def test_stale_index_keeps_answering_until_the_rebuild_swaps_in():
+    loader = _Loader(FAQS)
+    index = _index(loader)
+    index.refresh()
+
+    loader.faqs = FAQS[1:]
+    with index._build_lock:  # 재빌드가 끝나지 않은 상태
+        index._generation += 1
+        assert index.match("환불은 어떻게 하나요").faq_id == 1
+    index.mark_stale()
+    index.refresh()
+
+    assert index.match("환불은 어떻게 하나요") is None
+    assert index.stats()["indexed_faqs"] == 1
+
+
+def test_invalidate_publishes_and_other_workers_rebuild():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    writer = _index(_Loader(FAQS), client)
+    reader_loader = _Loader(FAQS)
+    reader = _index(reader_loader, client)
+    subscriber = _Subscriber()
+    reader.attach(subscriber)
+    handler, on_connect = subscriber.handlers[FAQMatchIndex.CHANNEL]
+
+    on_connect()
+    reader.refresh()
+    assert reader.match("비밀번호를 잊어버렸어요").faq_id == 2
+
+    pubsub = client.pubsub()
+    pubsub.subscribe(FAQMatchIndex.CHANNEL)
+    pubsub.get_message(timeout=1)
+    reader_loader.faqs = FAQS[:1]
+    writer.invalidate()
+    message = pubsub.get_message(timeout=1)
+    assert message["type"] == "message"
+
+    handler(message["data"])
+    reader.refresh()
+    assert reader.match("비밀번호를 잊어버렸어요") is None
+    assert len(reader_loader.threads) == 2
+
+
+def test_failed_build_is_not_retried_on_every_match():
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise RuntimeError("db down")
+
+    index = _index(broken)
+    assert index.match("환불") is None
+    with index._build_lock:
+        pass
+    for _ in range(20):
+        assert index.match("환불") is None
+    with index._build_lock:
+        pass
+    assert len(calls) == 1
@@ -0,0 +1,161 @@
+"""FAQ 조회수 버퍼: HINCRBY 누적, RENAME 후 반영, 실패한 flush 재반영, updated_at/view_count 보존"""
+
+from datetime import datetime
+
+import fakeredis
+import pytest
+
+from app.account.infrastructure.orm.account_model import AccountModel
+from app.faq.domain.entity.faq_enums import FAQCategory
+from app.faq.infrastructure.cache.faq_view_buffer import FAQViewBuffer, FAQViewFlusher
+from app.faq.infrastructure.orm.faq_model import FAQModel
+from app.faq.infrastructure.repository import faq_repository_impl
+from app.faq.infrastructure.repository.faq_repository_impl import FAQRepositoryImpl
+
+UPDATED_AT = datetime(2026, 1, 1, 9, 0, 0)
+
+
+class _Invalidations:
+    """save() 가 호출하는 인덱스/목록 캐시 무효화 기록 (Redis 없이 실행)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invalidate(self) -> None:
+        self.calls += 1
+
+    def bump_version(self) -> None:
+        self.calls += 1
+
+
+@pytest.fixture
+def faqs(db, monkeypatch):
+    monkeypatch.setattr(faq_repository_impl, "faq_match_index", _Invalidations())
+    monkeypatch.setattr(faq_repository_impl, "faq_list_cache", _Invalidations())
+    session = db()
+    try:
+        session.add(AccountModel(id=1, email="admin@example.com", nickname="admin", role="ADMIN"))
+        session.flush()
+        for faq_id in (1, 2, 3):
+            session.add(FAQModel(
+                id=faq_id, category=FAQCategory.GENERAL.value, question=f"질문 {faq_id}", answer="답변",
+                view_count=10 * faq_id, created_by=1, updated_at=UPDATED_AT,
+            ))
+        session.commit()
+    finally:
+        session.close()
+    return db
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def flusher(faqs, redis_client):
+    return FAQViewFlusher(FAQViewBuffer(lambda: redis_client), faqs, interval_seconds=60)
+
+
+def _rows(session_factory) -> dict[int, tuple[int, datetime]]:
+    session = session_factory()
+    try:
+        return {
+            faq_id: (view_count, updated_at)
+            for faq_id, view_count, updated_at in session.query(FAQModel.id, FAQModel.view_count, FAQModel.updated_at)
+        }
+    finally:
+        session.close()
+
+
+def _view_counts(session_factory) -> dict[int, int]:
+    return {faq_id: view_count for faq_id, (view_count, _) in _rows(session_factory).items()}
+
+
+def test_record_view_buffers_with_hincrby(flusher, redis_client, faqs):
+    buffer = flusher.buffer
+
+    assert [buffer.record_view(1) for _ in range(3)] == [1, 2, 3]
+    assert buffer.record_view(2) == 1
+
+    assert redis_client.hgetall(FAQViewBuffer.PENDING_KEY) == {"1": "3", "2": "1"}
+    assert _view_counts(faqs) == {1: 10, 2: 20, 3: 30}  # DB 에는 아직 반영하지 않는다
+
+
+def test_flush_renames_pending_and_applies_one_update(flusher, redis_client, faqs):
+    for faq_id in (1, 1, 3):
+        flusher.buffer.record_view(faq_id)
+    seen = {}
+
+    def apply(deltas):
+        # 반영 중에는 flushing 해시만 있고, 새 조회는 새 pending 해시에 쌓인다
+        seen["exists"] = [redis_client.exists(key) for key in (FAQViewBuffer.PENDING_KEY, FAQViewBuffer.FLUSHING_KEY)]
+        assert flusher.buffer.record_view(1) == 1 + 2
+        FAQRepositoryImpl(faqs()).add_view_counts(deltas)
+
+    assert flusher.buffer.flush(apply) == 3
+    assert seen["exists"] == [0, 1]
+    assert not redis_client.exists(FAQViewBuffer.FLUSHING_KEY)
+    assert redis_client.hgetall(FAQViewBuffer.PENDING_KEY) == {"1": "1"}
+    assert _view_counts(faqs) == {1: 12, 2: 20, 3: 31}
+
+    assert flusher.flush_once() == 1
+    assert flusher.flush_once() == 0  # 쌓인 조회가 없음
+    assert _view_counts(faqs) == {1: 13, 2: 20, 3: 31}
+
+
+def test_failed_flush_is_applied_by_the_next_flush(flusher, redis_client, faqs):
+    flusher.buffer.record_view(1)
+    flusher.buffer.record_view(2)
+
+    def crash(deltas):
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        flusher.buffer.flush(crash)
+    assert redis_client.hgetall(FAQViewBuffer.FLUSHING_KEY) == {"1": "1", "2": "1"}
+    assert not redis_client.exists(FAQViewBuffer.LOCK_KEY)
+    assert flusher.buffer.stats["flush_errors"] == 1
+
+    # 실패 후 들어온 조회는 pending 에 쌓이고, 남은 flushing 몫도 응답 값에 포함된다
+    assert flusher.buffer.record_view(1) == 2
+
+    assert flusher.flush_once() == 2  # 남은 flushing 해시를 먼저 반영
+    assert _view_counts(faqs) == {1: 11, 2: 21, 3: 30}
+    assert flusher.flush_once() == 1
+    assert _view_counts(faqs) == {1: 12, 2: 21, 3: 30}
+    assert redis_client.keys("faq:views:*") == []
+
+
+def test_flush_skips_while_another_worker_holds_the_lock(flusher, redis_client, faqs):
+    flusher.buffer.record_view(1)
+    redis_client.set(FAQViewBuffer.LOCK_KEY, "other-worker", px=FAQViewBuffer.LOCK_TTL_MS)
+
+    assert flusher.flush_once() == 0
+    assert redis_client.hgetall(FAQViewBuffer.PENDING_KEY) == {"1": "1"}
+    assert redis_client.get(FAQViewBuffer.LOCK_KEY) == "other-worker"
+
+
+def test_add_view_counts_keeps_updated_at(faqs):
+    assert FAQRepositoryImpl(faqs()).add_view_counts({1: 5, 3: 2, 99: 1}) == 2
+
+    assert _rows(faqs) == {1: (15, UPDATED_AT), 2: (20, UPDATED_AT), 3: (32, UPDATED_AT)}
+
+
+def test_save_does_not_overwrite_flushed_view_count(flusher, faqs):
+    faq = FAQRepositoryImpl(faqs()).find_by_id(1)
+    assert faq.view_count == 10
+
+    # 관리자가 수정하는 사이 조회수가 flush 된다
+    for _ in range(4):
+        flusher.buffer.record_view(1)
+    assert flusher.flush_once() == 4
+
+    faq.question = "수정된 질문"
+    saved = FAQRepositoryImpl(faqs()).save(faq)
+
+    assert saved.question == "수정된 질문"
+    assert saved.view_count == 14
+    assert _view_counts(faqs)[1] == 14
+    assert faq_repository_impl.faq_match_index.calls == 1
+    assert faq_repository_impl.faq_list_cache.calls == 1